@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+# Contributors:
+#    Antonio López Martínez-Carrasco <antoniolopezmc1995@gmail.com>
+
+"""Benchmark of the pruning power of the optimistic estimates of the WRAcc and BinomialTest quality measures.
+
+For each bundled dataset, each quality measure and each optimistic estimate, this script runs the VLSD and the SDMapStar algorithms and prints (1) the number of visited nodes, (2) the number of pruned nodes (only for SDMapStar: the pruned subgroups plus the pruned branches of the conditional FPTrees), (3) the number of selected subgroups and (4) the execution time. Only the first attributes of each dataset are used, because the exhaustive search with the loosest optimistic estimates does not finish in a reasonable time with all of them. Usage (from the root folder of the repository):
+
+    python benchmarks/optimistic_estimates.py
+"""
+
+from subgroups.algorithms.subgroup_sets.vlsd import VLSD
+from subgroups.algorithms.subgroup_sets.sdmapstar import SDMapStar
+from subgroups.quality_measures.wracc import WRAcc
+from subgroups.quality_measures.wracc_optimistic_estimate_1 import WRAccOptimisticEstimate1
+from subgroups.quality_measures.wracc_optimistic_estimate_2 import WRAccOptimisticEstimate2
+from subgroups.quality_measures.binomial_test import BinomialTest
+from subgroups.quality_measures.binomial_test_optimistic_estimate_1 import BinomialTestOptimisticEstimate1
+from subgroups.quality_measures.binomial_test_optimistic_estimate_2 import BinomialTestOptimisticEstimate2
+from subgroups.quality_measures.quality_measure import QualityMeasure
+from subgroups.datasets import load_mushroom_csv, load_sick_csv
+from pandas import DataFrame
+from time import perf_counter
+
+# (dataset name, loading function, target, minimum quality threshold of VLSD for each quality measure).
+DATASETS = [("mushroom", load_mushroom_csv, ("class", "p"), {"WRAcc" : 0.05, "BinomialTest" : 20.0}), \
+            ("sick", load_sick_csv, ("class", "sick"), {"WRAcc" : 0.01, "BinomialTest" : 5.0})]
+
+# (quality measure, list of optimistic estimates).
+QUALITY_MEASURES = [(WRAcc(), [WRAccOptimisticEstimate1(), WRAccOptimisticEstimate2()]), \
+                    (BinomialTest(), [BinomialTestOptimisticEstimate1(), BinomialTestOptimisticEstimate2()])]
+
+# Number of attributes of each dataset which are used (the target attribute is always used).
+NUMBER_OF_ATTRIBUTES = 12
+
+# Number of subgroups of SDMapStar (the top-k threshold is used to prune).
+NUM_SUBGROUPS = 10
+
+# Minimum n threshold of SDMapStar.
+MINIMUM_N = 10
+
+def run_vlsd(dataset : DataFrame, target : tuple[str, str], quality_measure : QualityMeasure, q_minimum_threshold : float, optimistic_estimate : QualityMeasure) -> tuple[int, int, int, float]:
+    vlsd = VLSD(quality_measure, q_minimum_threshold, optimistic_estimate, q_minimum_threshold)
+    start = perf_counter()
+    vlsd.fit(dataset, target)
+    elapsed_time = perf_counter() - start
+    # VLSD does not count the pruned nodes.
+    return vlsd.visited_nodes, -1, vlsd.selected_subgroups, elapsed_time
+
+def run_sdmapstar(dataset : DataFrame, target : tuple[str, str], quality_measure : QualityMeasure, optimistic_estimate : QualityMeasure) -> tuple[int, int, int, float]:
+    sdmapstar = SDMapStar(quality_measure, optimistic_estimate, float("-inf"), minimum_n = MINIMUM_N, num_subgroups = NUM_SUBGROUPS)
+    start = perf_counter()
+    sdmapstar.fit(dataset, target)
+    elapsed_time = perf_counter() - start
+    return sdmapstar.visited_nodes, sdmapstar.pruned_subgroups + sdmapstar.conditional_pruned_branches, sdmapstar.selected_subgroups, elapsed_time
+
+def main() -> None:
+    print("dataset;algorithm;quality_measure;optimistic_estimate;visited_nodes;pruned_nodes;selected_subgroups;seconds")
+    for (dataset_name, load_dataset, target, q_minimum_thresholds) in DATASETS:
+        dataset = load_dataset()
+        dataset = dataset[[column for column in dataset.columns if column != target[0]][:NUMBER_OF_ATTRIBUTES] + [target[0]]]
+        for (quality_measure, optimistic_estimates) in QUALITY_MEASURES:
+            q_minimum_threshold = q_minimum_thresholds[quality_measure.get_name()]
+            for optimistic_estimate in optimistic_estimates:
+                results = [("VLSD", run_vlsd(dataset, target, quality_measure, q_minimum_threshold, optimistic_estimate)), \
+                           ("SDMapStar", run_sdmapstar(dataset, target, quality_measure, optimistic_estimate))]
+                for (algorithm_name, (visited_nodes, pruned_nodes, selected_subgroups, elapsed_time)) in results:
+                    print(";".join([dataset_name, algorithm_name, quality_measure.get_name(), optimistic_estimate.get_name(), str(visited_nodes), str(pruned_nodes) if pruned_nodes >= 0 else "-", str(selected_subgroups), "%.2f" % elapsed_time]), flush = True)
+
+if __name__ == "__main__":
+    main()
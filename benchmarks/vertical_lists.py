@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+# Contributors:
+#    Antonio López Martínez-Carrasco <antoniolopezmc1995@gmail.com>
+
+"""Benchmark of the implementations of the Vertical Lists of the VLSD algorithm ("bitsets", "sets", "diffsets" and "roaring").
+
+For each bundled dataset and each implementation, this script runs the VLSD algorithm (with the same quality measure, optimistic estimate and thresholds) and prints (1) the number of visited nodes, (2) the number of selected subgroups, (3) the execution time and (4) the peak of memory allocated during the execution (measured with tracemalloc in a second execution, because tracemalloc slows down the execution). Only the first attributes of each dataset are used, because the exhaustive search does not finish in a reasonable time with all of them. In addition to the bundled datasets, a synthetic dataset with many rows and high-cardinality attributes (i.e., with selectors which cover few instances) is used. Usage (from the root folder of the repository):
+
+    python benchmarks/vertical_lists.py
+"""
+
+from subgroups.algorithms.subgroup_sets.vlsd import VLSD
+from subgroups.quality_measures.wracc import WRAcc
+from subgroups.quality_measures.wracc_optimistic_estimate_1 import WRAccOptimisticEstimate1
+from subgroups.datasets import load_mushroom_csv, load_sick_csv, load_car_evaluation_csv, load_tic_tac_toe_csv, load_credit_g_csv
+from pandas import DataFrame
+from numpy.random import default_rng
+from time import perf_counter
+import tracemalloc
+
+def load_sparse_synthetic_dataset() -> DataFrame:
+    random_generator = default_rng(0)
+    number_of_rows = 200000
+    dataset = {"at" + str(index) : random_generator.integers(0, 60, number_of_rows).astype(str) for index in range(3)}
+    dataset["class"] = random_generator.choice(["yes", "no"], number_of_rows, p = [0.3, 0.7])
+    return DataFrame(dataset)
+
+# (dataset name, loading function, target, minimum quality threshold).
+DATASETS = [("mushroom", load_mushroom_csv, ("class", "p"), 0.01), \
+            ("sick", load_sick_csv, ("class", "sick"), 0.001), \
+            ("car_evaluation", load_car_evaluation_csv, ("class", "unacc"), 0.001), \
+            ("tic_tac_toe", load_tic_tac_toe_csv, ("class", "positive"), 0.001), \
+            ("credit_g", load_credit_g_csv, ("class", "good"), 0.005), \
+            ("sparse_synthetic", load_sparse_synthetic_dataset, ("class", "yes"), 0.0)]
+
+# Number of attributes of each dataset which are used (the target attribute is always used).
+NUMBER_OF_ATTRIBUTES = 12
+
+def run_vlsd(dataset : DataFrame, target : tuple[str, str], minimum_threshold : float, vertical_lists_implementation : str, measure_memory : bool) -> tuple[int, int, float]:
+    vlsd = VLSD(WRAcc(), minimum_threshold, WRAccOptimisticEstimate1(), minimum_threshold, vertical_lists_implementation = vertical_lists_implementation)
+    if measure_memory:
+        tracemalloc.start()
+        vlsd.fit(dataset, target)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return vlsd.visited_nodes, vlsd.selected_subgroups, peak / (1024 * 1024)
+    start = perf_counter()
+    vlsd.fit(dataset, target)
+    return vlsd.visited_nodes, vlsd.selected_subgroups, perf_counter() - start
+
+def main() -> None:
+    print("dataset;vertical_lists_implementation;visited_nodes;selected_subgroups;seconds;peak_memory_mb")
+    for (dataset_name, load_dataset, target, minimum_threshold) in DATASETS:
+        dataset = load_dataset()
+        dataset = dataset[[column for column in dataset.columns if column != target[0]][:NUMBER_OF_ATTRIBUTES] + [target[0]]]
+        for vertical_lists_implementation in VLSD.VERTICAL_LISTS_IMPLEMENTATION:
+            visited_nodes, selected_subgroups, elapsed_time = run_vlsd(dataset, target, minimum_threshold, vertical_lists_implementation, False)
+            _, _, peak_memory = run_vlsd(dataset, target, minimum_threshold, vertical_lists_implementation, True)
+            print(";".join([dataset_name, vertical_lists_implementation, str(visited_nodes), str(selected_subgroups), "%.2f" % elapsed_time, "%.2f" % peak_memory]), flush = True)
+
+if __name__ == "__main__":
+    main()
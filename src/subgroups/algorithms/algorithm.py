@@ -8,6 +8,10 @@
 
 from abc import ABC, abstractmethod
 from pandas import DataFrame
+from math import nan
+
+# Python annotations.
+from typing import Union
 
 class Algorithm(ABC):
     """This abstract class defines the root class of all implemented algorithms.
@@ -24,3 +28,33 @@ class Algorithm(ABC):
         """
         raise NotImplementedError("The 'fit' method from the 'Algorithm' abstract class is an abstract method.")
     
+    def _bind_additional_quality_measures(self, TP : Union[int, float], FP : Union[int, float]) -> None:
+        """Private method to bind the additional quality measures to the subgroup parameters TP and FP of the dataset and to their additional parameters. IMPORTANT: this method (and the methods '_compute_additional_quality_measures' and '_write_additional_quality_measures') can only be used by the algorithms which have the attributes '_additional_quality_measures', '_additional_parameters_for_the_additional_quality_measures' and '_bound_additional_quality_measures'.
+        
+        :param TP: the true population TP of the dataset.
+        :param FP: the false population FP of the dataset.
+        """
+        self._bound_additional_quality_measures = [additional_quality_measure.bind(TP, FP, **self._additional_parameters_for_the_additional_quality_measures) for additional_quality_measure in self._additional_quality_measures]
+    
+    def _compute_additional_quality_measures(self, tp : Union[int, float], fp : Union[int, float]) -> dict[str, float]:
+        """Private method to compute the values of the additional quality measures of a subgroup from its subgroup parameters tp and fp (i.e., without additional passes over the dataset). The undefined values (e.g., 0/0) are nan.
+        
+        :param tp: the true positives tp of the subgroup.
+        :param fp: the false positives fp of the subgroup.
+        :return: a python dictionary in which the keys are the names of the additional quality measures and the values are their values (in the same order as the additional quality measures).
+        """
+        additional_quality_measure_values = dict()
+        for additional_quality_measure, bound_additional_quality_measure in zip(self._additional_quality_measures, self._bound_additional_quality_measures):
+            try:
+                additional_quality_measure_values[additional_quality_measure.get_name()] = bound_additional_quality_measure(tp, fp)
+            except ZeroDivisionError:
+                additional_quality_measure_values[additional_quality_measure.get_name()] = nan
+        return additional_quality_measure_values
+    
+    def _write_additional_quality_measures(self, additional_quality_measure_values : dict[str, float]) -> None:
+        """Private method to write in the file of the algorithm (i.e., the attribute '_file') the values of the additional quality measures of a subgroup.
+        
+        :param additional_quality_measure_values: the values of the additional quality measures of the subgroup (see the method '_compute_additional_quality_measures').
+        """
+        for name, additional_quality_measure_value in additional_quality_measure_values.items():
+            self._file.write("Quality Measure " + name + " = " + str(additional_quality_measure_value) + " ; ")
@@ -7,13 +7,16 @@
 """
 
 from subgroups.algorithms.subgroup_lists.psld import PSLD
-from subgroups.data_structures import SubgroupList
+from subgroups.data_structures import SubgroupList, RefinementIndex, EncodedDataset
 from pandas import DataFrame
 from subgroups.core import Operator, Selector, Pattern, Subgroup
 from bitarray import bitarray
 from pandas.api.types import is_string_dtype
 from subgroups.exceptions import DatasetAttributeTypeError
 
+# Python annotations.
+from typing import Union
+
 class DSLM(PSLD):
     """This class represents the DSLM algorithm.
     
@@ -94,12 +97,16 @@ class DSLM(PSLD):
             return 0.0
         return subgroup_sum/total_sum
     
-    def fit(self, pandas_dataframe : DataFrame, target : tuple[str, str]) -> None:
+    def fit(self, pandas_dataframe : Union[DataFrame, EncodedDataset], target : tuple[str, str]) -> None:
         """Main method to run the DSLM algorithm. This algorithm only supports nominal attributes (i.e., type 'str'). IMPORTANT: missing values are not supported.
         
-        :param pandas_dataframe: the DataFrame which is scanned. This algorithm only supports nominal attributes (i.e., type 'str'). IMPORTANT: missing values are not supported.
+        :param pandas_dataframe: the DataFrame which is scanned (or an EncodedDataset built from it with the same target). This algorithm only supports nominal attributes (i.e., type 'str'). IMPORTANT: missing values are not supported.
         :param target: a tuple with 2 elements: the target attribute name and the target value.
         """
+        # The EncodedDataset is decoded to a DataFrame in which each attribute is a pandas categorical (i.e., the values are not materialised for each instance).
+        if type(pandas_dataframe) is EncodedDataset:
+            pandas_dataframe.check_target(target)
+            pandas_dataframe = pandas_dataframe.to_dataframe()
         if type(pandas_dataframe) is not DataFrame:
             raise TypeError("The type of the parameter 'pandas_dataframe' must be 'DataFrame'.")
         # Get the dataset size (number of instances).
@@ -128,6 +135,8 @@ class DSLM(PSLD):
         self._output_file.write("\t- Total number of attributes (including the target): " + str(len(pandas_dataframe.columns)) + ".\n\n\n")
         # Load the candidates from the input file.
         subgroups, bitarrays_of_positives, bitarrays_of_negatives = self._load_candidates(number_of_dataset_instances)
+        # Inverted index of the candidates in order to get their refinements (and generalizations) without comparing the best candidate with all of them.
+        refinement_index = RefinementIndex([subgroup.description for subgroup in subgroups])
         # Iterate through the subgroup lists.
         for current_sl in sl_list:
             # Positive counter of subgroups (i.e., the number of subgroups that cover each positive instance).
@@ -184,13 +193,17 @@ class DSLM(PSLD):
                     subgroups[best_subgroup_index] = None
                     bitarrays_of_positives[best_subgroup_index] = None
                     bitarrays_of_negatives[best_subgroup_index] = None
-                    # Delete all refinements of the best subgroup candidate.
-                    for deletion_index in range(len(subgroups)):
-                        # refinement_of_itself=False -> in this case, the value does not matter, since the original subgroup was already deleted (i.e., both subgroups will not be equals).
-                        if (subgroups[deletion_index] is not None) and ( (best_subgroup.is_refinement(subgroups[deletion_index], refinement_of_itself=False)) or (subgroups[deletion_index].is_refinement(best_subgroup, refinement_of_itself=False)) ):
+                    refinement_index.remove(best_subgroup_index)
+                    # Delete all refinements and generalizations of the best subgroup candidate.
+                    # refinement_of_itself=False -> in this case, the value does not matter, since the original subgroup was already deleted (i.e., both subgroups will not be equals).
+                    # IMPORTANT: the index only contains the descriptions, so we also have to check the targets.
+                    deletion_indices = refinement_index.refinements_of(best_subgroup.description, refinement_of_itself=False) + refinement_index.generalizations_of(best_subgroup.description, generalization_of_itself=False)
+                    for deletion_index in deletion_indices:
+                        if (subgroups[deletion_index] is not None) and (subgroups[deletion_index].target == best_subgroup.target):
                             subgroups[deletion_index] = None
                             bitarrays_of_positives[deletion_index] = None
                             bitarrays_of_negatives[deletion_index] = None
+                            refinement_index.remove(deletion_index)
             self._handle_individual_result(current_sl)
         # Close the output file.
         self._output_file.close()
\ No newline at end of file
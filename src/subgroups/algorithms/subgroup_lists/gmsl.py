@@ -7,7 +7,7 @@
 """
 
 from subgroups.algorithms.algorithm import Algorithm
-from subgroups.data_structures import SubgroupList
+from subgroups.data_structures import SubgroupList, RefinementIndex, EncodedDataset
 from pandas import DataFrame, unique
 from subgroups.utils.mdl import universal_code_for_integer, log2_multinomial_with_recurrence
 from numpy import log2
@@ -16,6 +16,7 @@ from subgroups.core import Operator, Selector, Pattern, Subgroup
 from bitarray import bitarray
 from pandas.api.types import is_string_dtype
 from subgroups.exceptions import DatasetAttributeTypeError
+from subgroups.utils.subgroup_parser import SubgroupParser
 from re import compile
 from re import Pattern as rePattern
 
@@ -162,11 +163,13 @@ class GMSL(Algorithm):
         self._output_file.write("Reading input file.\n")
         line_number = 1
         read_subgroups = 0
+        # The same parser is used for all the lines, so each different selector substring is only parsed once.
+        subgroup_parser = SubgroupParser()
         with open(self._input_file_path, "r") as input_file:
             for line in input_file: # Read line by line.
                 match_object = GMSL._input_line_regex_object.fullmatch(line.rstrip("\n"))
                 if match_object:
-                    subgroup = Subgroup.generate_from_str( match_object.group("subgroup") )
+                    subgroup = subgroup_parser.parse_subgroup( match_object.group("subgroup") )
                     positive_bitarray = bitarray( match_object.group("positive_bitarray"), endian="big")
                     negative_bitarray = bitarray( match_object.group("negative_bitarray"), endian="big")
                     error_in_bitarays = False
@@ -191,12 +194,16 @@ class GMSL(Algorithm):
         self._output_file.write("Input file read.\n\n\n")
         return (list_of_subgroups, list_of_bitarrays_of_positives, list_of_bitarrays_of_negatives)
 
-    def fit(self, pandas_dataframe : DataFrame, target : tuple[str, str]) -> None:
+    def fit(self, pandas_dataframe : Union[DataFrame, EncodedDataset], target : tuple[str, str]) -> None:
         """Main method to run the GMSL algorithm. This algorithm only supports nominal attributes (i.e., type 'str'). IMPORTANT: missing values are not supported.
         
-        :param pandas_dataframe: the DataFrame which is scanned. This algorithm only supports nominal attributes (i.e., type 'str'). IMPORTANT: missing values are not supported.
+        :param pandas_dataframe: the DataFrame which is scanned (or an EncodedDataset built from it with the same target). This algorithm only supports nominal attributes (i.e., type 'str'). IMPORTANT: missing values are not supported.
         :param target: a tuple with 2 elements: the target attribute name and the target value.
         """
+        # The EncodedDataset is decoded to a DataFrame in which each attribute is a pandas categorical (i.e., the values are not materialised for each instance).
+        if type(pandas_dataframe) is EncodedDataset:
+            pandas_dataframe.check_target(target)
+            pandas_dataframe = pandas_dataframe.to_dataframe()
         if type(pandas_dataframe) is not DataFrame:
             raise TypeError("The type of the parameter 'pandas_dataframe' must be 'DataFrame'.")
         # Get the dataset size (number of instances).
@@ -225,6 +232,8 @@ class GMSL(Algorithm):
         self._output_file.write("\t- Total number of attributes (including the target): " + str(len(pandas_dataframe.columns)) + ".\n\n\n")
         # Load the candidates from the input file.
         subgroups, bitarrays_of_positives, bitarrays_of_negatives = self._load_candidates(number_of_dataset_instances)
+        # Inverted index of the candidates in order to get their refinements (and generalizations) without comparing the best candidate with all of them.
+        refinement_index = RefinementIndex([subgroup.description for subgroup in subgroups])
         # Iterate through the subgroup lists.
         for current_sl in sl_list:
             # We use the empty subgroup only to be able to enter to the loop the first time, because Python does not have do-while statement.
@@ -261,12 +270,16 @@ class GMSL(Algorithm):
                     subgroups[best_subgroup_index] = None
                     bitarrays_of_positives[best_subgroup_index] = None
                     bitarrays_of_negatives[best_subgroup_index] = None
+                    refinement_index.remove(best_subgroup_index)
                     # Delete all refinements of the best subgroup candidate.
-                    for deletion_index in range(len(subgroups)):
-                        if (subgroups[deletion_index] is not None) and (best_subgroup.is_refinement(subgroups[deletion_index], refinement_of_itself=False)): # refinement_of_itself=False -> in this case, the value does not matter, since the original subgroup was already deleted (i.e., both subgroups will not be equals).
+                    # refinement_of_itself=False -> in this case, the value does not matter, since the original subgroup was already deleted (i.e., both subgroups will not be equals).
+                    # IMPORTANT: the index only contains the descriptions, so we also have to check the targets.
+                    for deletion_index in refinement_index.refinements_of(best_subgroup.description, refinement_of_itself=False):
+                        if (subgroups[deletion_index].target == best_subgroup.target):
                             subgroups[deletion_index] = None
                             bitarrays_of_positives[deletion_index] = None
                             bitarrays_of_negatives[deletion_index] = None
+                            refinement_index.remove(deletion_index)
             self._handle_individual_result(current_sl)
         # Close the output file.
         self._output_file.close()
@@ -6,11 +6,14 @@
 """This file contains the implementation of the BSD algorithm.
 """
 
+from subgroups.data_structures.encoded_dataset import EncodedDataset
 from pandas import DataFrame
 from subgroups.algorithms.algorithm import Algorithm
 from subgroups.quality_measures.quality_measure import QualityMeasure
+from subgroups.data_structures.quality_measure_memo import QualityMeasureMemo
 from subgroups.data_structures.bitset_bsd import BitsetBSD, BitsetDictionary
 from subgroups.core.pattern import Pattern
+from subgroups.core.frozen_pattern import FrozenPattern
 from subgroups.core.operator import Operator
 from subgroups.core.selector import Selector
 from subgroups.core.subgroup import Subgroup
@@ -55,11 +58,14 @@ class BSD(Algorithm):
     :param additional_parameters_for_the_optimistic_estimate: if the optimistic estimate passed by parameter needs more parameters apart from tp, fp, TP and FP to be computed, they need to be specified here.
     :param write_results_in_file: whether the results obtained will be written in a file. By default, False.
     :param file_path: if 'write_results_in_file' is True, path of the file in which the results will be written.
+    :param memoize_quality_values: whether the values of the quality measure and of the optimistic estimate are memoized (see the class 'QualityMeasureMemo'). It is useful when many nodes of the search space have the same subgroup parameters tp and fp. By default, False.
+    :param additional_quality_measures: other quality measures which are computed for each selected subgroup from its subgroup parameters tp and fp (i.e., without additional passes over the dataset) and written in the file after the quality measure. By default, an empty list.
+    :param additional_parameters_for_the_additional_quality_measures: if the additional quality measures need more parameters apart from tp, fp, TP and FP to be computed, they need to be specified here.
     """
 
-    __slots__ = ('_maxDepth', '_min_support', '_quality_measure', '_optimistic_estimate', '_num_subgroups', '_k_subgroups', '_TP', '_FP', '_irrelevants', '_visited_subgroups', '_selected_subgroups', '_unselected_subgroups', '_additional_parameters_for_the_quality_measure', '_additional_parameters_for_the_optimistic_estimate', '_file_path' , '_file')
+    __slots__ = ('_maxDepth', '_min_support', '_quality_measure', '_optimistic_estimate', '_num_subgroups', '_k_subgroups', '_TP', '_FP', '_irrelevants', '_visited_subgroups', '_selected_subgroups', '_unselected_subgroups', '_additional_parameters_for_the_quality_measure', '_additional_parameters_for_the_optimistic_estimate', '_file_path' , '_file', '_bound_quality_measure', '_bound_optimistic_estimate', '_memoize_quality_values', '_quality_measure_memo', '_optimistic_estimate_memo', '_additional_quality_measures', '_additional_parameters_for_the_additional_quality_measures', '_bound_additional_quality_measures')
 
-    def __init__(self,min_support : Union[int,float] ,quality_measure : QualityMeasure , optimistic_estimate: QualityMeasure ,num_subgroups : int,max_depth: int, additional_parameters_for_the_quality_measure : dict[str, Union[int, float]] = dict(),additional_parameters_for_the_optimistic_estimate : dict[str, Union[int, float]] = dict(), write_results_in_file : bool = False, file_path : Union[str, None] = None) -> None: 
+    def __init__(self,min_support : Union[int,float] ,quality_measure : QualityMeasure , optimistic_estimate: QualityMeasure ,num_subgroups : int,max_depth: int, additional_parameters_for_the_quality_measure : dict[str, Union[int, float]] = dict(),additional_parameters_for_the_optimistic_estimate : dict[str, Union[int, float]] = dict(), write_results_in_file : bool = False, file_path : Union[str, None] = None, memoize_quality_values : bool = False, additional_quality_measures : list[QualityMeasure] = list(), additional_parameters_for_the_additional_quality_measures : dict[str, Union[int, float]] = dict()) -> None:
         """Method to initialize an object of type 'BSD'.
         """
         if not isinstance(quality_measure, QualityMeasure):
@@ -79,6 +85,12 @@ class BSD(Algorithm):
         # If 'write_results_in_file' is True, 'file_path' must not be None.
         if (write_results_in_file) and (file_path is None):
             raise ValueError("If the parameter 'write_results_in_file' is True, the parameter 'file_path' must not be None.")
+        if (type(additional_quality_measures) is not list) or (not all(isinstance(additional_quality_measure, QualityMeasure) for additional_quality_measure in additional_quality_measures)):
+            raise TypeError("The type of the parameter 'additional_quality_measures' must be 'list' and its elements must be instances of a subclass of the 'QualityMeasure' class.")
+        if (type(additional_parameters_for_the_additional_quality_measures) is not dict):
+            raise TypeError("The type of the parameter 'additional_parameters_for_the_additional_quality_measures' must be 'dict'")
+        if (type(memoize_quality_values) is not bool):
+            raise TypeError("The type of the parameter 'memoize_quality_values' must be 'bool'")
         # We check whether 'optimistic_estimate' is an optimistic estimate of 'quality_measure'.
         if quality_measure.get_name() not in optimistic_estimate.optimistic_estimate_of():
             raise ValueError("The quality measure " + optimistic_estimate.get_name() + " is not an optimistic estimate of the quality measure " + quality_measure.get_name() + ".")
@@ -98,6 +110,11 @@ class BSD(Algorithm):
         self._unselected_subgroups = 0
         self._additional_parameters_for_the_quality_measure = additional_parameters_for_the_quality_measure.copy()
         _delete_subgroup_parameters_from_a_dictionary(self._additional_parameters_for_the_quality_measure)
+        self._additional_quality_measures = list(additional_quality_measures)
+        self._additional_parameters_for_the_additional_quality_measures = additional_parameters_for_the_additional_quality_measures.copy()
+        _delete_subgroup_parameters_from_a_dictionary(self._additional_parameters_for_the_additional_quality_measures)
+        # The additional quality measures bound to TP, FP and their additional parameters (they are set in the 'fit' method).
+        self._bound_additional_quality_measures = []
         self._additional_parameters_for_the_optimistic_estimate = additional_parameters_for_the_optimistic_estimate.copy()
         _delete_subgroup_parameters_from_a_dictionary(self._additional_parameters_for_the_optimistic_estimate)
         # We only write the results in a file if the parameter 'write_results_in_file' is True.
@@ -106,7 +123,19 @@ class BSD(Algorithm):
         else:
             self._file_path = None
         self._file = None
+        # The quality measure and the optimistic estimate bound to TP, FP and their additional parameters (they are set in the 'fit' method).
+        self._bound_quality_measure = None
+        self._bound_optimistic_estimate = None
+        self._memoize_quality_values = memoize_quality_values
+        self._quality_measure_memo = None
+        self._optimistic_estimate_memo = None
 
+    def _get_additional_quality_measures(self) -> list[QualityMeasure]:
+        return self._additional_quality_measures
+    
+    def _get_additional_parameters_for_the_additional_quality_measures(self) -> dict[str, Union[int, float]]:
+        return self._additional_parameters_for_the_additional_quality_measures
+    
     def _get_minimum_support(self) -> Union[int,float]:
         return self._min_support
 
@@ -135,6 +164,21 @@ class BSD(Algorithm):
     unselected_subgroups = property(_get_unselected_subgroups, None , None , "The number of pruned subgroups.")
     selected_subgroups = property(_get_selected_subgroups, None , None , "The number of selected subgroups.")
     visited_subgroups = property(_get_visited_subgroups, None , None , "The number of visited subgroups.")
+    additional_quality_measures = property(_get_additional_quality_measures, None, None, "The other quality measures which are computed and written in the file for each selected subgroup.")
+    additional_parameters_for_the_additional_quality_measures = property(_get_additional_parameters_for_the_additional_quality_measures, None, None, "The additional needed parameters with which to compute the additional quality measures.")
+
+    def _get_memoize_quality_values(self) -> bool:
+        return self._memoize_quality_values
+
+    def _get_quality_measure_memo(self) -> Union[QualityMeasureMemo, None]:
+        return self._quality_measure_memo
+
+    def _get_optimistic_estimate_memo(self) -> Union[QualityMeasureMemo, None]:
+        return self._optimistic_estimate_memo
+
+    memoize_quality_values = property(_get_memoize_quality_values, None, None, "Whether the values of the quality measure and of the optimistic estimate are memoized.")
+    quality_measure_memo = property(_get_quality_measure_memo, None, None, "The memoization table of the quality measure values used in the last execution of the algorithm, with its counters of hits and misses (None if 'memoize_quality_values' is False or before executing the 'fit' method).")
+    optimistic_estimate_memo = property(_get_optimistic_estimate_memo, None, None, "The memoization table of the optimistic estimate values used in the last execution of the algorithm, with its counters of hits and misses (None if 'memoize_quality_values' is False or before executing the 'fit' method).")
 
     def _handle_individual_result(self, individual_result: tuple) -> tuple[BitsetDictionary,BitsetDictionary,list]:
         """Private method to handle each individual result generated by the algorithm.
@@ -210,6 +254,8 @@ class BSD(Algorithm):
             raise TypeError("Parameter 'depth' must be a int.")
         #List of relevant selectors to be evaluated with the current conditioned selectors (only used for next recursive calls)
         newSelRel = []
+        # The key of the conditioned selectors is computed only once (and not for each relevant selector).
+        frozenSelCond = FrozenPattern.from_pattern(selCond)
         for sCurr in selRel:
             #if selCond is empty
             if not selCond: 
@@ -217,8 +263,8 @@ class BSD(Algorithm):
                 cCurrNeg = CcondNeg[sCurr]
             else:
                 # Calculate cCurrPos and cCurrNeg as the intersection of the bitsets of the current conditioned selectors and the current selector
-                cCurrPos = self._logicalAnd(CcondPos[sCurr], CcondPos[selCond])
-                cCurrNeg = self._logicalAnd(CcondNeg[sCurr], CcondNeg[selCond])
+                cCurrPos = self._logicalAnd(CcondPos[sCurr], CcondPos[frozenSelCond])
+                cCurrNeg = self._logicalAnd(CcondNeg[sCurr], CcondNeg[frozenSelCond])
             # Calculate tp and fp
             tp = self._cardinality(cCurrPos)
             fp = self._cardinality(cCurrNeg)
@@ -227,12 +273,8 @@ class BSD(Algorithm):
                 self._unselected_subgroups += 1
                 continue
             # Calculate optimistic estimate and quality measure to handle the current pattern
-            dict_of_parameter_for_optimistic_estimate = {QualityMeasure.TRUE_POSITIVES : tp, QualityMeasure.FALSE_POSITIVES : fp, QualityMeasure.TRUE_POPULATION : self._TP, QualityMeasure.FALSE_POPULATION : self._FP}
-            dict_of_parameter_for_optimistic_estimate.update(self._additional_parameters_for_the_optimistic_estimate)
-            oe = self._optimistic_estimate.compute(dict_of_parameter_for_optimistic_estimate)
-            dict_of_parameters_for_quality_measure = {QualityMeasure.TRUE_POSITIVES: tp, QualityMeasure.FALSE_POSITIVES: fp,QualityMeasure.TRUE_POPULATION: self._TP, QualityMeasure.FALSE_POPULATION: self._FP}
-            dict_of_parameters_for_quality_measure.update(self._additional_parameters_for_the_quality_measure)
-            quality = self._quality_measure.compute(dict_of_parameters_for_quality_measure)
+            oe = self._bound_optimistic_estimate(tp, fp)
+            quality = self._bound_quality_measure(tp, fp)
             CcondPos,CcondNeg,newSelRel = self._handle_individual_result((selCond, sCurr, oe, quality,CcondPos,CcondNeg, cCurrPos, cCurrNeg,newSelRel,tp,fp))
         # Sort the selectors by their optimistic estimate
         newSelRel = sorted(newSelRel, reverse=True)
@@ -413,8 +455,8 @@ class BSD(Algorithm):
     def fit(self, pandas_dataframe, tuple_target_attribute_value):
         """Method to run the BSD algorithm and generate subgroups.
 
-        :type pandas_dataframe: pandas.DataFrame
-        :param pandas_dataframe: Input dataset. It is VERY IMPORTANT to respect the following conditions:
+        :type pandas_dataframe: pandas.DataFrame or EncodedDataset
+        :param pandas_dataframe: Input dataset (or an EncodedDataset built from it with the same target). It is VERY IMPORTANT to respect the following conditions:
           (1) the dataset must be a pandas dataframe,
           (2) the dataset must not contain missing values,
           (3) for each attribute, all its values must be of the same type.
@@ -427,6 +469,10 @@ class BSD(Algorithm):
         :rtype: list
         :return: a list of tuples with the best subgroups and its quality measures.
         """
+        # The EncodedDataset is decoded to a DataFrame in which each attribute is a pandas categorical (i.e., the values are not materialised for each instance).
+        if type(pandas_dataframe) is EncodedDataset:
+            pandas_dataframe.check_target(tuple_target_attribute_value)
+            pandas_dataframe = pandas_dataframe.to_dataframe()
         if type(pandas_dataframe) is not DataFrame:
             raise TypeError("Parameter 'pandas_dataframe' must be a pandas DataFrame.")
         if (type(tuple_target_attribute_value) is not tuple):
@@ -444,6 +490,15 @@ class BSD(Algorithm):
         FP = pandas_dataframe.shape[0] - TP
         self._TP = TP
         self._FP = FP
+        # Bind the quality measure and the optimistic estimate (TP, FP and the additional parameters do not change during the execution).
+        self._bound_quality_measure = self._quality_measure.bind(TP, FP, **self._additional_parameters_for_the_quality_measure)
+        self._bind_additional_quality_measures(TP, FP)
+        self._bound_optimistic_estimate = self._optimistic_estimate.bind(TP, FP, **self._additional_parameters_for_the_optimistic_estimate)
+        if self._memoize_quality_values:
+            self._quality_measure_memo = QualityMeasureMemo(self._bound_quality_measure, TP, FP)
+            self._bound_quality_measure = self._quality_measure_memo
+            self._optimistic_estimate_memo = QualityMeasureMemo(self._bound_optimistic_estimate, TP, FP)
+            self._bound_optimistic_estimate = self._optimistic_estimate_memo
         # Create an empty BitsetBSD.
         bitset = BitsetBSD()
         #generate frequent selector
@@ -479,6 +534,7 @@ class BSD(Algorithm):
             quality = element[0]
             self._file.write(str(subgroup) + " ; ")
             self._file.write("Quality Measure " + self._quality_measure.get_name() + " = " + str(quality) + " ; ")
+            self._write_additional_quality_measures(self._compute_additional_quality_measures(tp, fp))
             self._file.write("tp = " + str(tp) + " ; ")
             self._file.write("fp = " + str(fp) + " ; ")
             self._file.write("TP = " + str(self._TP) + " ; ")
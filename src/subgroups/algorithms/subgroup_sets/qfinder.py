@@ -8,11 +8,13 @@
 
 import itertools
 from typing import Union
-from pandas import DataFrame
+from subgroups.data_structures.encoded_dataset import EncodedDataset
+from pandas import DataFrame, CategoricalDtype
 from pandas.api.types import is_string_dtype
 from subgroups.algorithms.algorithm import Algorithm
 from subgroups.exceptions import DatasetAttributeTypeError
 from subgroups.core.pattern import Pattern
+from subgroups.core.frozen_pattern import FrozenPattern
 from subgroups.core.operator import Operator
 from subgroups.core.selector import Selector
 from subgroups.core.subgroup import Subgroup
@@ -35,7 +37,7 @@ class QFinder(Algorithm):
     :param num_subgroups: the number of top subgroups to return.
     """
 
-    __slots__ = ('_num_subgroups','_cats', '_max_complexity', '_thresholds','_credibility_values' , '_file', '_file_path' , '_df','_delta', '_num_subgroups', '_top_patterns', '_candidate_patterns')
+    __slots__ = ('_num_subgroups','_cats', '_max_complexity', '_thresholds','_credibility_values' , '_file', '_file_path' , '_df','_delta', '_num_subgroups', '_top_patterns', '_candidate_patterns', '_credibility_values_by_pattern')
 
     # A credibility criterion is a credibility measure and a threshold. Here we set if the credibility measure value
     # should be greater or equal than the threshold or less or equal than the threshold.
@@ -94,8 +96,10 @@ class QFinder(Algorithm):
         else:
             self._file_path = None
         self._file = None
+        # IMPORTANT: internally, the candidate patterns and the selected patterns are stored as FrozenPatterns.
         self._top_patterns = []
         self._candidate_patterns = []
+        self._credibility_values_by_pattern = {}
         # Thresholds for each credibility measure.
         self._thresholds = {
             "coverage" : coverage_thld,
@@ -118,7 +122,7 @@ class QFinder(Algorithm):
         return len(self._candidate_patterns)
 
     def _get_top_patterns(self) -> list[Pattern]:
-        return self._top_patterns
+        return [pattern.to_pattern() for pattern in self._top_patterns]
     
     selected_subgroups = property(_get_selected_subgrouops, None, None, "The number of selected subgroups.")
     unselected_subgroups = property(_get_unselected_subgroups, None, None, "The number of unselected subgroups.")
@@ -166,7 +170,13 @@ class QFinder(Algorithm):
                     for value in top_values:
                         simple_patterns.append(Pattern([Selector(column, Operator.EQUAL, value)]))
                     # We edit our copy of the dataset to set the "other" value to the rows which have a value that is not in the top_values.
-                    df_without_target.loc[df_without_target[column].isin(other_values), column] = other
+                    if isinstance(df_without_target[column].dtype, CategoricalDtype):
+                        # In a categorical attribute, the "other" value must be added as a category (and the grouped values are removed).
+                        df_without_target[column] = df_without_target[column].cat.add_categories([other])
+                        df_without_target.loc[df_without_target[column].isin(other_values), column] = other
+                        df_without_target[column] = df_without_target[column].cat.remove_unused_categories()
+                    else:
+                        df_without_target.loc[df_without_target[column].isin(other_values), column] = other
                     simple_patterns.append(Pattern([Selector(column, Operator.EQUAL, other)]))
             complex_patterns = []
             if (self._max_complexity == -1):
@@ -203,7 +213,7 @@ class QFinder(Algorithm):
                 rank = i+1
         return rank
 
-    def _redundant(self,p1: Pattern, p2: Pattern) -> bool:
+    def _redundant(self,p1: FrozenPattern, p2: FrozenPattern) -> bool:
         """Check if two patterns are redundant.
 
         :param p1: the first pattern.
@@ -213,19 +223,19 @@ class QFinder(Algorithm):
         # Since we are only using nominal attributes, we only need to check if one pattern is a refinement of the other. We consider a pattern to be a refinement of itself.
         return p1.is_refinement(p2,True) or p2.is_refinement(p1,True)
 
-    def _rank_patterns(self) -> list[Pattern]:
+    def _rank_patterns(self) -> list[FrozenPattern]:
         """Method to assing a rank to each of the candidate patterns.
 
         :return: the list of candidate patterns sorted by their rank.
         """
         # We first sort the patterns by their p_value. This sorting will be used in case of ties in the ranking.
-        sorted_patterns = sorted(self._candidate_patterns, key=lambda pattern: self._credibility_values["p_value"][str(pattern)])
+        sorted_patterns = sorted(self._candidate_patterns, key=lambda pattern: self._credibility_values_by_pattern[pattern]["p_value"])
         ranks = []
         for pattern in sorted_patterns:
             # We compute the credibility of each pattern. The credibility of a pattern is a list of booleans, where each boolean represents a criterion.
             credibility = []
             for cred in QFinder._credibility_criterions:
-                credibility.append(QFinder._credibility_criterions[cred](self._credibility_values[cred][str(pattern)],self._thresholds[cred]))
+                credibility.append(QFinder._credibility_criterions[cred](self._credibility_values_by_pattern[pattern][cred],self._thresholds[cred]))
             # We compute the rank of the pattern.
             rank = self._handle_individual_result(credibility)
             ranks.append(rank)
@@ -236,7 +246,7 @@ class QFinder(Algorithm):
         ranked_patterns = list(map(lambda x:x[0],sorted_patterns_ranks))
         return ranked_patterns
 
-    def _select_top_k(self, ranked_patterns) -> list[Pattern]:
+    def _select_top_k(self, ranked_patterns) -> list[FrozenPattern]:
         """Method to select the top-k patterns according to the ranking and the redundancy criterion.
 
         :param ranked_patterns: the list of candidate patterns sorted by their rank.
@@ -253,7 +263,7 @@ class QFinder(Algorithm):
         for length in sorted(ranked_patterns_by_length.keys()):
             for pattern in ranked_patterns_by_length[length]:
                 # If p-value(pattern) > max(p-value(top_k_patterns)) and |top_k_patterns| == k, we continue to the next length.
-                if (len(top_k_patterns) == self._num_subgroups) and (self._credibility_values["p_value"][str(pattern)] > max(map(lambda pattern: self._credibility_values["p_value"][str(pattern)], top_k_patterns))):
+                if (len(top_k_patterns) == self._num_subgroups) and (self._credibility_values_by_pattern[pattern]["p_value"] > max(map(lambda pattern: self._credibility_values_by_pattern[pattern]["p_value"], top_k_patterns))):
                     break
                 # We check the redundancy of the pattern with the patterns in top_k_patterns. Breaking the loop means that the pattern is redundant and we continue to the next pattern.
                 for top_pattern in top_k_patterns:
@@ -261,29 +271,33 @@ class QFinder(Algorithm):
                         if len(pattern) == len(top_pattern):
                             break
                         # If the effect size (odds_ratio) of the pattern is not significantly larger than the effect size of the top pattern, we continue to the next pattern.
-                        if len(pattern) > len(top_pattern) and self._credibility_values["odds_ratio"][str(pattern)] <= self._credibility_values["odds_ratio"][str(top_pattern)] + self._delta:
+                        if len(pattern) > len(top_pattern) and self._credibility_values_by_pattern[pattern]["odds_ratio"] <= self._credibility_values_by_pattern[top_pattern]["odds_ratio"] + self._delta:
                             break
                 else: 
                     # If we didn't break, the pattern is not redundant or we justify the redundancy with a high effect size.
                     # In this case, we remove the patterns in top_k_patterns that are redundant with the new pattern and we add the pattern to top_k_patterns.
                     for top_pattern in top_k_patterns:
                         if self._redundant(pattern,top_pattern) and len(pattern) > len(top_pattern) and \
-                            self._credibility_values["odds_ratio"][str(pattern)] > self._credibility_values["odds_ratio"][str(top_pattern)] + self._delta and \
-                                self._credibility_values["p_value"][str(pattern)] < self._credibility_values["p_value"][str(top_pattern)]:
+                            self._credibility_values_by_pattern[pattern]["odds_ratio"] > self._credibility_values_by_pattern[top_pattern]["odds_ratio"] + self._delta and \
+                                self._credibility_values_by_pattern[pattern]["p_value"] < self._credibility_values_by_pattern[top_pattern]["p_value"]:
                             top_k_patterns.remove(top_pattern)
                     top_k_patterns.append(pattern)
                     # If |top_k_patterns| > k, we remove the pattern with the highest p-value.
                     if len(top_k_patterns) > self._num_subgroups:
-                        max_p_val_pattern = max(top_k_patterns, key=lambda pattern: self._credibility_values["p_value"][str(pattern)])
+                        max_p_val_pattern = max(top_k_patterns, key=lambda pattern: self._credibility_values_by_pattern[pattern]["p_value"])
                         top_k_patterns.remove(max_p_val_pattern)
         return top_k_patterns
     
-    def fit(self, pandas_dataframe: DataFrame, tuple_target_attribute_value: tuple) -> None:
+    def fit(self, pandas_dataframe: Union[DataFrame, EncodedDataset], tuple_target_attribute_value: tuple) -> None:
         """Main method to run the QFinder algorithm. This algorithm only supports nominal attributes (i.e., type 'str'). IMPORTANT: missing values are not supported yet.
         
-        :param data: the DataFrame which is scanned. This algorithm only supports nominal attributes (i.e., type 'str'). IMPORTANT: missing values are not supported yet.
+        :param data: the DataFrame which is scanned (or an EncodedDataset built from it with the same target). This algorithm only supports nominal attributes (i.e., type 'str'). IMPORTANT: missing values are not supported yet.
         :param target: a tuple with 2 elements: the target attribute name and the target value.
         """
+        # The EncodedDataset is decoded to a DataFrame in which each attribute is a pandas categorical (i.e., the values are not materialised for each instance).
+        if type(pandas_dataframe) is EncodedDataset:
+            pandas_dataframe.check_target(tuple_target_attribute_value)
+            pandas_dataframe = pandas_dataframe.to_dataframe()
         if type(pandas_dataframe) is not DataFrame:
             raise TypeError("The dataset must be a pandas DataFrame.")
         if type(tuple_target_attribute_value) is not tuple:
@@ -298,8 +312,10 @@ class QFinder(Algorithm):
         # We compute the credibility measures for each candidate pattern using the bitset structure.
         qfinder_bitset = Bitset_QFinder()
         qfinder_bitset.generate_bitset(df, tuple_target_attribute_value, self._candidate_patterns)
-        self._candidate_patterns = qfinder_bitset.get_non_empty_patterns()
+        self._candidate_patterns = qfinder_bitset.get_non_empty_frozen_patterns()
         self._credibility_values = qfinder_bitset.compute_credibility_measures(df[tuple_target_attribute_value[0]] == tuple_target_attribute_value[1])
+        # The rows of 'self._credibility_values' are in the same order as the candidate patterns.
+        self._credibility_values_by_pattern = dict(zip(self._candidate_patterns, self._credibility_values.to_dict("records")))
         ranked_patterns = self._rank_patterns()
         self._top_patterns = self._select_top_k(ranked_patterns)
         if self._file_path is not None:
@@ -341,7 +357,7 @@ class QFinder(Algorithm):
         """
         self._file = open(file_path, "w")
         for pat in self._top_patterns:
-            subgroup = Subgroup(pat, Selector(target[0], Operator.EQUAL, target[1]))
+            subgroup = Subgroup(pat.to_pattern(), Selector(target[0], Operator.EQUAL, target[1]))
             self._file.write(str(subgroup) + " ; ")
             for cred in credibility_values:
                 self._file.write(cred + ": " + str(credibility_values[cred][str(pat)]) + " ; ")
@@ -10,8 +10,10 @@ from pandas import DataFrame
 from pandas.api.types import is_string_dtype
 from subgroups.algorithms.algorithm import Algorithm
 from subgroups.quality_measures.quality_measure import QualityMeasure
+from subgroups.data_structures.quality_measure_memo import QualityMeasureMemo
 from subgroups.exceptions import InconsistentMethodParametersError, DatasetAttributeTypeError
 from subgroups.data_structures.fp_tree_for_sdmapstar import FPTreeForSDMapStar
+from subgroups.data_structures.encoded_dataset import EncodedDataset
 from subgroups.core.pattern import Pattern
 from subgroups.core.operator import Operator
 from subgroups.core.selector import Selector
@@ -66,11 +68,14 @@ class SDMapStar(Algorithm):
     :param write_results_in_file: whether the results obtained will be written in a file. By default, False.
     :param file_path: if 'write_results_in_file' is True, path of the file in which the results will be written.
     :param num_subgroups: the number of subgroups used to prune the search space. By default, 0. This value is equivalent to using the SDMap algorithm.
+    :param memoize_quality_values: whether the values of the quality measure and of the optimistic estimate are memoized (see the class 'QualityMeasureMemo'). It is useful when many nodes of the search space have the same subgroup parameters tp and fp. By default, False.
+    :param additional_quality_measures: other quality measures which are computed for each selected subgroup from its subgroup parameters tp and fp (i.e., without additional passes over the dataset) and written in the file after the quality measure. By default, an empty list.
+    :param additional_parameters_for_the_additional_quality_measures: if the additional quality measures need more parameters apart from tp, fp, TP and FP to be computed, they need to be specified here.
     """
 
-    __slots__ = ("_quality_measure", "_optimistic_estimate" , "_minimum_quality_measure_value", "_minimum_tp", "_minimum_fp", "_minimum_n", "_additional_parameters_for_the_quality_measure", "_unselected_subgroups", "_selected_subgroups", "_file_path", "_file", "_num_subgroups","_additional_parameters_for_the_optimistic_estimate","_k_subgroups","_pruned_subgroups","_conditional_pruned_branches")
+    __slots__ = ("_quality_measure", "_optimistic_estimate" , "_minimum_quality_measure_value", "_minimum_tp", "_minimum_fp", "_minimum_n", "_additional_parameters_for_the_quality_measure", "_unselected_subgroups", "_selected_subgroups", "_file_path", "_file", "_num_subgroups","_additional_parameters_for_the_optimistic_estimate","_k_subgroups","_pruned_subgroups","_conditional_pruned_branches", "_bound_quality_measure", "_bound_optimistic_estimate", "_memoize_quality_values", "_quality_measure_memo", "_optimistic_estimate_memo", "_additional_quality_measures", "_additional_parameters_for_the_additional_quality_measures", "_bound_additional_quality_measures")
 
-    def __init__(self, quality_measure : QualityMeasure, optimistic_estimate: QualityMeasure, minimum_quality_measure_value : Union[int, float], minimum_tp : Union[int, None] = None, minimum_fp : Union[int, None] = None, minimum_n : Union[int, None] = None, additional_parameters_for_the_quality_measure : dict[str, Union[int, float]] = dict(), additional_parameters_for_the_optimistic_estimate : dict[str, Union[int, float]] = dict(), write_results_in_file : bool = False, file_path : Union[str, None] = None, num_subgroups : int = 0) -> None:
+    def __init__(self, quality_measure : QualityMeasure, optimistic_estimate: QualityMeasure, minimum_quality_measure_value : Union[int, float], minimum_tp : Union[int, None] = None, minimum_fp : Union[int, None] = None, minimum_n : Union[int, None] = None, additional_parameters_for_the_quality_measure : dict[str, Union[int, float]] = dict(), additional_parameters_for_the_optimistic_estimate : dict[str, Union[int, float]] = dict(), write_results_in_file : bool = False, file_path : Union[str, None] = None, num_subgroups : int = 0, memoize_quality_values : bool = False, additional_quality_measures : list[QualityMeasure] = list(), additional_parameters_for_the_additional_quality_measures : dict[str, Union[int, float]] = dict()) -> None:
         if not isinstance(quality_measure, QualityMeasure):
             raise TypeError("The parameter 'quality_measure' must be an instance of a subclass of the 'QualityMeasure' class.")
         if (type(minimum_quality_measure_value) is not int) and (type(minimum_quality_measure_value) is not float):
@@ -92,6 +97,12 @@ class SDMapStar(Algorithm):
         # If 'write_results_in_file' is True, 'file_path' must not be None.
         if (write_results_in_file) and (file_path is None):
             raise ValueError("If the parameter 'write_results_in_file' is True, the parameter 'file_path' must not be None.")
+        if (type(additional_quality_measures) is not list) or (not all(isinstance(additional_quality_measure, QualityMeasure) for additional_quality_measure in additional_quality_measures)):
+            raise TypeError("The type of the parameter 'additional_quality_measures' must be 'list' and its elements must be instances of a subclass of the 'QualityMeasure' class.")
+        if (type(additional_parameters_for_the_additional_quality_measures) is not dict):
+            raise TypeError("The type of the parameter 'additional_parameters_for_the_additional_quality_measures' must be 'dict'")
+        if (type(memoize_quality_values) is not bool):
+            raise TypeError("The type of the parameter 'memoize_quality_values' must be 'bool'")
         # We check whether 'optimistic_estimate' is an optimistic estimate of 'quality_measure'.
         if quality_measure.get_name() not in optimistic_estimate.optimistic_estimate_of():
             raise ValueError("The quality measure " + optimistic_estimate.get_name() + " is not an optimistic estimate of the quality measure " + quality_measure.get_name() + ".")
@@ -109,6 +120,11 @@ class SDMapStar(Algorithm):
             self._num_subgroups = num_subgroups
             self._additional_parameters_for_the_quality_measure = additional_parameters_for_the_quality_measure.copy()
             _delete_subgroup_parameters_from_a_dictionary(self._additional_parameters_for_the_quality_measure)
+            self._additional_quality_measures = list(additional_quality_measures)
+            self._additional_parameters_for_the_additional_quality_measures = additional_parameters_for_the_additional_quality_measures.copy()
+            _delete_subgroup_parameters_from_a_dictionary(self._additional_parameters_for_the_additional_quality_measures)
+            # The additional quality measures bound to TP, FP and their additional parameters (they are set in the 'fit' method).
+            self._bound_additional_quality_measures = []
             self._additional_parameters_for_the_optimistic_estimate = additional_parameters_for_the_optimistic_estimate.copy()
             _delete_subgroup_parameters_from_a_dictionary(self._additional_parameters_for_the_optimistic_estimate)
             #We only save the results in a file if 'write_results_in_file' is True.
@@ -122,6 +138,12 @@ class SDMapStar(Algorithm):
             self._pruned_subgroups = 0
             #pruned branches when building conditional fptrees
             self._conditional_pruned_branches = 0
+            # The quality measure and the optimistic estimate bound to TP, FP and their additional parameters (they are set in the 'fit' method).
+            self._bound_quality_measure = None
+            self._bound_optimistic_estimate = None
+            self._memoize_quality_values = memoize_quality_values
+            self._quality_measure_memo = None
+            self._optimistic_estimate_memo = None
         else:
             raise InconsistentMethodParametersError("If 'minimum_tp' and 'minimum_fp' have a value of type 'int', 'minimum_n' must be None; and if 'minimum_n' has a value of type 'int', 'minimum_tp' and 'minimum_fp' must be None.")
 
@@ -143,6 +165,12 @@ class SDMapStar(Algorithm):
     def _get_minimum_n(self) -> Union[int, None]:
         return self._minimum_n
     
+    def _get_additional_quality_measures(self) -> list[QualityMeasure]:
+        return self._additional_quality_measures
+    
+    def _get_additional_parameters_for_the_additional_quality_measures(self) -> dict[str, Union[int, float]]:
+        return self._additional_parameters_for_the_additional_quality_measures
+    
     def _get_additional_parameters_for_the_quality_measure(self) -> dict[str, Union[int, float]]:
         return self._additional_parameters_for_the_quality_measure
 
@@ -165,6 +193,8 @@ class SDMapStar(Algorithm):
     minimum_fp = property(_get_minimum_fp, None, None, "The minimum false positives (fp) threshold.")
     minimum_n = property(_get_minimum_n, None, None, "The minimum subgroup description size (n) threshold.")
     additional_parameters_for_the_quality_measure = property(_get_additional_parameters_for_the_quality_measure, None, None, "The additional needed parameters with which to compute the quality measure.")
+    additional_quality_measures = property(_get_additional_quality_measures, None, None, "The other quality measures which are computed and written in the file for each selected subgroup.")
+    additional_parameters_for_the_additional_quality_measures = property(_get_additional_parameters_for_the_additional_quality_measures, None, None, "The additional needed parameters with which to compute the additional quality measures.")
     k_subgroups = property(_get_k_subgroups, None, None, "The list of the k subgroups used to prune.")
     num_subgroups = property(_get_num_subgroups, None, None, "The maximum number of subgroups in 'k_subgroups'.")
     pruned_subgroups = property(_get_pruned_subgroups, None, None, "The number of pruned subgroups because of the top k threshold.")
@@ -183,6 +213,19 @@ class SDMapStar(Algorithm):
     selected_subgroups = property(_get_selected_subgroups, None, None, "Number of selected subgroups after executing the SDMapStar algorithm (before executing the 'fit' method, this attribute is 0).")
     visited_nodes = property(_get_visited_nodes, None, None, "Number of visited nodes after executing the SDMapStar algorithm (before executing the 'fit' method, this attribute is 0).")
 
+    def _get_memoize_quality_values(self) -> bool:
+        return self._memoize_quality_values
+
+    def _get_quality_measure_memo(self) -> Union[QualityMeasureMemo, None]:
+        return self._quality_measure_memo
+
+    def _get_optimistic_estimate_memo(self) -> Union[QualityMeasureMemo, None]:
+        return self._optimistic_estimate_memo
+
+    memoize_quality_values = property(_get_memoize_quality_values, None, None, "Whether the values of the quality measure and of the optimistic estimate are memoized.")
+    quality_measure_memo = property(_get_quality_measure_memo, None, None, "The memoization table of the quality measure values used in the last execution of the SDMapStar algorithm, with its counters of hits and misses (None if 'memoize_quality_values' is False or before executing the 'fit' method).")
+    optimistic_estimate_memo = property(_get_optimistic_estimate_memo, None, None, "The memoization table of the optimistic estimate values used in the last execution of the SDMapStar algorithm, with its counters of hits and misses (None if 'memoize_quality_values' is False or before executing the 'fit' method).")
+
     def _handle_individual_result(self, individual_result : tuple[Pattern, tuple[str, str], int, int, int, int]) -> None:
         """Private method to handle each individual result generated by the SDMapStar algorithm.
         
@@ -194,9 +237,7 @@ class SDMapStar(Algorithm):
         TP = individual_result[4]
         FP = individual_result[5]
         # Compute the quality measure of the frequent pattern along with the target (i.e., the quality measure of the subgroup).
-        dict_of_parameters = {QualityMeasure.TRUE_POSITIVES : tp, QualityMeasure.FALSE_POSITIVES : fp, QualityMeasure.TRUE_POPULATION : TP, QualityMeasure.FALSE_POPULATION : FP}
-        dict_of_parameters.update(self._additional_parameters_for_the_quality_measure)
-        quality_measure_value = self._quality_measure.compute(dict_of_parameters)
+        quality_measure_value = self._bound_quality_measure(tp, fp)
         # Add the subgroup only if the quality measure value is greater or equal than the threshold.
         if quality_measure_value >= self._minimum_quality_measure_value:
             # If applicable, write in the file defined in the __init__ method.
@@ -209,6 +250,7 @@ class SDMapStar(Algorithm):
                 # Write.
                 self._file.write(str(subgroup) + " ; ")
                 self._file.write("Quality Measure " + self._quality_measure.get_name() + " = " + str(quality_measure_value) + " ; ")
+                self._write_additional_quality_measures(self._compute_additional_quality_measures(tp, fp))
                 self._file.write("tp = " + str(tp) + " ; ")
                 self._file.write("fp = " + str(fp) + " ; ")
                 self._file.write("TP = " + str(TP) + " ; ")
@@ -227,6 +269,16 @@ class SDMapStar(Algorithm):
         :param TP: the true population of the dataset (i.e., the number of instances in which the target appears).
         :param FP: the false population of the dataset (i.e., the number of instances in which the target does not appear).
         """
+        # In the first call (i.e., alpha is None), bind the quality measure and the optimistic estimate (TP, FP and the additional parameters do not change during the execution).
+        if alpha is None:
+            self._bound_quality_measure = self._quality_measure.bind(TP, FP, **self._additional_parameters_for_the_quality_measure)
+            self._bind_additional_quality_measures(TP, FP)
+            self._bound_optimistic_estimate = self._optimistic_estimate.bind(TP, FP, **self._additional_parameters_for_the_optimistic_estimate)
+            if self._memoize_quality_values:
+                self._quality_measure_memo = QualityMeasureMemo(self._bound_quality_measure, TP, FP)
+                self._bound_quality_measure = self._quality_measure_memo
+                self._optimistic_estimate_memo = QualityMeasureMemo(self._bound_optimistic_estimate, TP, FP)
+                self._bound_optimistic_estimate = self._optimistic_estimate_memo
         # Check if fptree contains a single path.
         if fptree.there_is_a_single_path():
             # Generate all the combinations of the selectors in the single path.
@@ -256,9 +308,7 @@ class SDMapStar(Algorithm):
                     #update the K subgroups
                     self._updateKSubgroups(tp,fp,TP,FP)
                     # if k subgroups treshold is higher than the optimistic estimate, we omit the conditional tree
-                    dict_of_parameters = {QualityMeasure.TRUE_POSITIVES : tp, QualityMeasure.FALSE_POSITIVES : fp, QualityMeasure.TRUE_POPULATION : TP, QualityMeasure.FALSE_POPULATION : FP}
-                    dict_of_parameters.update(self._additional_parameters_for_the_optimistic_estimate)
-                    oe = self._optimistic_estimate.compute(dict_of_parameters)
+                    oe = self._bound_optimistic_estimate(tp, fp)
                     #k_subgroups is sorted, so the first element is the worst subgroup
                     if (self.k_subgroups[0] > oe):
                         self._pruned_subgroups += 1
@@ -273,9 +323,7 @@ class SDMapStar(Algorithm):
                     #calculate the optimistic estimate
                     tp = fptree.header_table[selector][0][0]
                     fp = fptree.header_table[selector][0][1]
-                    dict_of_parameters = {QualityMeasure.TRUE_POSITIVES : tp, QualityMeasure.FALSE_POSITIVES : fp, QualityMeasure.TRUE_POPULATION : TP, QualityMeasure.FALSE_POPULATION : FP}
-                    dict_of_parameters.update(self._additional_parameters_for_the_optimistic_estimate)
-                    oe = self._optimistic_estimate.compute(dict_of_parameters)
+                    oe = self._bound_optimistic_estimate(tp, fp)
                     #We store the optimistic estimate and the selector together to sort them
                     sorted_selectors.append((oe,selector))
                 # sort the selector by their optimistic estimate
@@ -299,9 +347,7 @@ class SDMapStar(Algorithm):
                     #update k subgroups (tp,fp)
                     self._updateKSubgroups(aux[0],aux[1],TP,FP)
                     # if k subgroups threshold is higher than the optimistic estimate, we omit the conditional tree
-                    dict_of_parameters = {QualityMeasure.TRUE_POSITIVES : aux[0], QualityMeasure.FALSE_POSITIVES : aux[1], QualityMeasure.TRUE_POPULATION : TP, QualityMeasure.FALSE_POPULATION : FP}
-                    dict_of_parameters.update(self._additional_parameters_for_the_optimistic_estimate)
-                    oe = self._optimistic_estimate.compute(dict_of_parameters)
+                    oe = self._bound_optimistic_estimate(aux[0], aux[1])
                     #k_subgroups is sorted, so the first element is the worst subgroup
                     if (self.k_subgroups[0] > oe):
                         self._pruned_subgroups += 1
@@ -314,7 +360,7 @@ class SDMapStar(Algorithm):
                 # Build the conditional FPTree.
                 if (self.num_subgroups > 0):
                     # Call conditionalFPTree with prune
-                    conditional_fptree, pruned_branches = fptree.generate_conditional_fp_tree_star(beta_as_list, minimum_tp=self.minimum_tp, minimum_fp=self.minimum_fp, minimum_n=self.minimum_n,min_optimistic_estimate =  self.k_subgroups[0], optimistic_estimate = self._optimistic_estimate, additional_parameters=self._additional_parameters_for_the_optimistic_estimate)
+                    conditional_fptree, pruned_branches = fptree.generate_conditional_fp_tree_star(beta_as_list, minimum_tp=self.minimum_tp, minimum_fp=self.minimum_fp, minimum_n=self.minimum_n,min_optimistic_estimate =  self.k_subgroups[0], optimistic_estimate = self._bound_optimistic_estimate)
                     self._conditional_pruned_branches += pruned_branches
                 else:
                     # Call conditionalFPTree wihtout prune
@@ -337,9 +383,7 @@ class SDMapStar(Algorithm):
             raise TypeError("Parameter 'TP' must be a int.",type(TP))
         if (type(FP) is not int):
             raise TypeError("Parameter 'FP' must be a int.")
-        dict_of_parameters = {QualityMeasure.TRUE_POSITIVES : tp, QualityMeasure.FALSE_POSITIVES : fp, QualityMeasure.TRUE_POPULATION : TP, QualityMeasure.FALSE_POPULATION : FP}
-        dict_of_parameters.update(self._additional_parameters_for_the_optimistic_estimate)
-        quality_value = self.quality_measure.compute(dict_of_parameters)
+        quality_value = self._bound_quality_measure(tp, fp)
         #if k-subgroups is not full
         if (len(self._k_subgroups) < self.num_subgroups):
             self._k_subgroups.append(quality_value)
@@ -349,23 +393,31 @@ class SDMapStar(Algorithm):
                 self._k_subgroups[0] = quality_value
                 self._k_subgroups.sort()
 
-    def fit(self, pandas_dataframe : DataFrame, target : tuple[str, str]) -> None:
+    def fit(self, pandas_dataframe : Union[DataFrame, EncodedDataset], target : tuple[str, str]) -> None:
         """Main method to run the SDMapStar algorithm. This algorithm only supports nominal attributes (i.e., type 'str'). IMPORTANT: missing values are not supported yet.
         
-        :param pandas_dataframe: the DataFrame which is scanned. This algorithm only supports nominal attributes (i.e., type 'str'). IMPORTANT: missing values are not supported yet.
+        :param pandas_dataframe: the DataFrame which is scanned (or an EncodedDataset built from it with the same target). This algorithm only supports nominal attributes (i.e., type 'str'). IMPORTANT: missing values are not supported yet.
         :param target: a tuple with 2 elements: the target attribute name and the target value.
         """
-        if type(pandas_dataframe) is not DataFrame:
-            raise TypeError("The type of the parameter 'pandas_dataframe' must be 'DataFrame'.")
-        if type(target) is not tuple:
-            raise TypeError("The type of the parameter 'target' must be 'tuple'.")
-        # IMPORTANT: this algorithm only supports nominal attributes (i.e., type 'str').
-        for column in pandas_dataframe.columns:
-            if not is_string_dtype(pandas_dataframe[column]):
-                raise DatasetAttributeTypeError("Error in attribute '" + str(column) + "'. This algorithm only supports nominal attributes (i.e., type 'str').")
+        if type(pandas_dataframe) is EncodedDataset:
+            # The attributes were already checked when the EncodedDataset was built.
+            pandas_dataframe.check_target(target)
+        else:
+            if type(pandas_dataframe) is not DataFrame:
+                raise TypeError("The type of the parameter 'pandas_dataframe' must be 'DataFrame' or 'EncodedDataset'.")
+            if type(target) is not tuple:
+                raise TypeError("The type of the parameter 'target' must be 'tuple'.")
+            # IMPORTANT: this algorithm only supports nominal attributes (i.e., type 'str').
+            for column in pandas_dataframe.columns:
+                if not is_string_dtype(pandas_dataframe[column]):
+                    raise DatasetAttributeTypeError("Error in attribute '" + str(column) + "'. This algorithm only supports nominal attributes (i.e., type 'str').")
         # Obtain TP and FP of the dataset.
-        TP = sum(pandas_dataframe[target[0]] == target[1])
-        FP = len(pandas_dataframe.index) - TP
+        if type(pandas_dataframe) is EncodedDataset:
+            TP = pandas_dataframe.TP
+            FP = pandas_dataframe.FP
+        else:
+            TP = sum(pandas_dataframe[target[0]] == target[1])
+            FP = len(pandas_dataframe.index) - TP
         # Create an empty FPTreeForSDMap.
         fptree = FPTreeForSDMapStar(TP,FP)
         # Generate the set of frequent selectors.
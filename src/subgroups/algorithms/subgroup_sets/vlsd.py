@@ -9,18 +9,29 @@
 from pandas import DataFrame
 from pandas.api.types import is_string_dtype
 from subgroups.algorithms.algorithm import Algorithm
+from math import nan
 from subgroups.quality_measures.quality_measure import QualityMeasure
 from subgroups.exceptions import DatasetAttributeTypeError
 from subgroups.data_structures.vertical_list import VerticalList
 from subgroups.data_structures.vertical_list_with_bitsets import VerticalListWithBitsets
 from subgroups.data_structures.vertical_list_with_sets import VerticalListWithSets
+from subgroups.data_structures.vertical_list_with_diffsets import VerticalListWithDiffsets
+from subgroups.data_structures.vertical_list_with_roaring_bitmaps import VerticalListWithRoaringBitmaps
+from subgroups.data_structures.encoded_dataset import EncodedDataset
 from subgroups.core.pattern import Pattern
 from subgroups.core.operator import Operator
 from subgroups.core.selector import Selector
 from subgroups.core.subgroup import Subgroup
+from heapq import heappush, heappop, heapreplace
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from os import cpu_count
+from copy import copy
+from numpy import ndarray, full, count_nonzero, nextafter, float32, inf
+from bitarray.util import count_and
 
 # Python annotations.
 from typing import Union, ClassVar
+from collections.abc import Iterator, Sequence, Collection
 
 def _delete_subgroup_parameters_from_a_dictionary(dict_of_parameters : dict[str, Union[int, float]]):
     """Private method to delete the subgroup parameters (i.e., tp, fp, TP and FP) from a dictionary of parameters. IMPORTANT: this method modifies the parameter, does not return a new dictionary.
@@ -44,21 +55,63 @@ def _delete_subgroup_parameters_from_a_dictionary(dict_of_parameters : dict[str,
     except KeyError:
         pass
 
-def _query_triangular_matrix(matrix : dict[Selector, dict[Selector, VerticalList]], index_a : Selector, index_b : Selector) -> Union[VerticalList, None]:
-    """Private method to query a triangular matrix.
+# State of each process of the pool which is used by the VLSD algorithm (see the parameter 'n_jobs').
+_worker_state : dict = dict()
+
+class _SelectedSubgroup(object):
+    """Private class which represents a selected subgroup found in a process of the pool which is used by the VLSD algorithm. It has the same attributes as a Vertical List which are used after the subgroup is selected (so, it can be used in its place), but the sequences of instances are None unless they are needed, so it is cheap to send it back to the main process.
     
-    :param matrix: the triangular matrix which is queried.
-    :param index_a: the first index in the query.
-    :param index_b: the second index in the query.
-    :return: either the Vertical List contained in matrix[index_a][index_b], or the Vertical List contained in matrix[index_b][index_a] if the firt one was None, or None if they were both None.
+    :param vertical_list: the Vertical List of the selected subgroup.
+    :param include_sequences_of_instances: whether the sequences of instances tp and fp are kept.
     """
-    try:
-        return matrix[index_a][index_b]
-    except KeyError:
-        try:
-            return matrix[index_b][index_a]
-        except KeyError:
-            return None
+    
+    __slots__ = ("list_of_selectors", "tp", "fp", "quality_value", "sequence_of_instances_tp", "sequence_of_instances_fp")
+    
+    def __init__(self, vertical_list : VerticalList, include_sequences_of_instances : bool) -> None:
+        self.list_of_selectors = vertical_list.list_of_selectors
+        self.tp = vertical_list.tp
+        self.fp = vertical_list.fp
+        self.quality_value = vertical_list.quality_value
+        self.sequence_of_instances_tp = vertical_list.sequence_of_instances_tp if include_sequences_of_instances else None
+        self.sequence_of_instances_fp = vertical_list.sequence_of_instances_fp if include_sequences_of_instances else None
+
+def _initialize_worker(vlsd : 'VLSD', S1 : list[VerticalList], M : ndarray, target : tuple[str, str], TP : int, FP : int) -> None:
+    """Private function to initialize each process of the pool which is used by the VLSD algorithm. The matrix M and the Vertical Lists are received only once per process.
+    
+    :param vlsd: a copy of the VLSD object without the file and without the bound functions.
+    :param S1: the list of Vertical Lists of size 1.
+    :param M: the 2-dimensional matrix M (in this case, a numpy array indexed by the positions of the Vertical Lists in S1).
+    :param target: a tuple with 2 elements: the target attribute name and the target value.
+    :param TP: the true population of the dataset.
+    :param FP: the false population of the dataset.
+    """
+    vlsd._bound_quality_measure = vlsd._quality_measure.bind(TP, FP, **vlsd._additional_parameters_for_the_quality_measure)
+    vlsd._bound_optimistic_estimate = vlsd._optimistic_estimate.bind(TP, FP, **vlsd._additional_parameters_for_the_optimistic_estimate)
+    vlsd._bind_additional_quality_measures(TP, FP)
+    _worker_state["vlsd"] = vlsd
+    _worker_state["S1"] = S1
+    _worker_state["M"] = M
+    _worker_state["target"] = target
+    _worker_state["TP"] = TP
+    _worker_state["FP"] = FP
+
+def _search_first_level_in_worker(index_x : int, return_selected_subgroups : bool, return_sequences_of_instances : bool) -> tuple[list[tuple[_SelectedSubgroup, float, dict[str, float]]], int, int]:
+    """Private function to run, in a process of the pool, the search from the Vertical Lists of size 2 whose first selector is the one of the Vertical List of size 1 in the position passed by parameter. The Vertical Lists are not returned: only their selectors, their subgroup parameters tp and fp, their quality values and (if applicable) their sequences of instances (see the class '_SelectedSubgroup').
+    
+    :param index_x: the position of the Vertical List of size 1 in S1 (i.e., the row of the matrix M).
+    :param return_selected_subgroups: whether the selected subgroups are returned (otherwise, an empty list is returned and only the counters are merged).
+    :param return_sequences_of_instances: whether the sequences of instances of the returned subgroups are also returned.
+    :return: a tuple with the selected subgroups (in order), the number of selected subgroups and the number of unselected subgroups.
+    """
+    vlsd = _worker_state["vlsd"]
+    # Each search starts with the counters at 0.
+    vlsd._selected_subgroups = 0
+    vlsd._unselected_subgroups = 0
+    selected_subgroups = []
+    for vertical_list, quality_measure_value, additional_quality_measure_values in vlsd._search_first_level(index_x, _worker_state["S1"], _worker_state["M"], _worker_state["target"], _worker_state["TP"], _worker_state["FP"]):
+        if return_selected_subgroups:
+            selected_subgroups.append((_SelectedSubgroup(vertical_list, return_sequences_of_instances), quality_measure_value, additional_quality_measure_values))
+    return (selected_subgroups, vlsd._selected_subgroups, vlsd._unselected_subgroups)
 
 class VLSD(Algorithm):
     """This class represents the VLSD algorithm.
@@ -71,8 +124,13 @@ class VLSD(Algorithm):
     :param additional_parameters_for_the_optimistic_estimate: if the optimistic estimate passed by parameter needs more parameters apart from tp, fp, TP and FP to be computed, they need to be specified here.
     :param sort_criterion_in_s1: the criterion to use in order to sort the Vertical Lists with only one selector. Three values are possible: "quality-ascending" (sort ascending by quality value), "quality-descending" (sort descending by quality value), and "no-order" (do not sort and maintain the generation order). By default, "no-order".
     :param sort_criterion_in_other_sizes: the criterion to use in order to sort the Vertical Lists with more than one selector. Three values are possible: "quality-ascending" (sort ascending by quality value), "quality-descending" (sort descending by quality value), and "no-order" (do not sort and maintain the generation order). By default, "no-order".
+    :param vertical_lists_implementation: the implementation of the Vertical Lists. Four values are possible: "bitsets" (the sequences of instances are bitsets), "sets" (the sequences of instances are python sets), "diffsets" (the sequences of instances are python sets which store the difference with respect to the parent Vertical List, as in the dEclat algorithm, when it is smaller than the sequences themselves) and "roaring" (the sequences of instances are Roaring Bitmaps, i.e., compressed bitsets whose size depends on the number of instances which they contain). By default, "bitsets".
     :param write_results_in_file: whether the results obtained will be written in a file. By default, False.
     :param file_path: if 'write_results_in_file' is True, path of the file in which the results will be written.
+    :param additional_quality_measures: other quality measures which are computed for each selected subgroup from its subgroup parameters tp and fp (i.e., without additional passes over the dataset). Their values are written in the file after the quality measure, yielded by the 'iter_fit' method and included in the property 'k_subgroups'. By default, an empty list.
+    :param additional_parameters_for_the_additional_quality_measures: if the additional quality measures need more parameters apart from tp, fp, TP and FP to be computed, they need to be specified here.
+    :param num_subgroups: if it is greater than 0, the algorithm runs in top-k mode: only the 'num_subgroups' best subgroups (according to the quality measure) are retained and, as soon as they are found, the quality of the worst of them is used as the minimum threshold for the optimistic estimate (if it is greater than 'oe_minimum_threshold'). In this mode, the best subgroups are written in the file (or yielded by the 'iter_fit' method) at the end of the execution, sorted in descending order by quality. By default, 0 (i.e., the top-k mode is not used).
+    :param n_jobs: the number of processes which are used to explore the search space. The search from each Vertical List of size 1 is independent of the others (it only reads the matrix M), so these searches are distributed across a pool of processes. The matrix M and the Vertical Lists are sent only once to each process (and they are not copied at all if the processes are created with 'fork'). The searches are merged in the sequential order and at most 2 * n_jobs of them are pending at the same time, and, among the pending ones, the largest searches are run first. The results and the counters are the same as with only one process. In top-k mode, the search is not parallelized, because the threshold rises with the subgroups found in all the searches. If it is -1, all the CPUs are used. By default, 1 (i.e., no additional processes are used).
     """
     
     SORT_CRITERION_QUALITY_ASCENDING : ClassVar[str] = "quality-ascending"
@@ -82,11 +140,17 @@ class VLSD(Algorithm):
     
     VERTICAL_LISTS_WITH_BITSETS : ClassVar[str] = "bitsets"
     VERTICAL_LISTS_WITH_SETS : ClassVar[str] = "sets"
-    VERTICAL_LISTS_IMPLEMENTATION : ClassVar[list[str]] = [VERTICAL_LISTS_WITH_BITSETS, VERTICAL_LISTS_WITH_SETS]
+    VERTICAL_LISTS_WITH_DIFFSETS : ClassVar[str] = "diffsets"
+    VERTICAL_LISTS_WITH_ROARING_BITMAPS : ClassVar[str] = "roaring"
+    VERTICAL_LISTS_IMPLEMENTATION : ClassVar[list[str]] = [VERTICAL_LISTS_WITH_BITSETS, VERTICAL_LISTS_WITH_SETS, VERTICAL_LISTS_WITH_DIFFSETS, VERTICAL_LISTS_WITH_ROARING_BITMAPS]
+    
+    # Minimum number of dataset instances and minimum number of joins to make the joins of Vertical Lists with bitsets in a batch (otherwise, the fixed cost of a batch is greater than the cost of the individual joins).
+    _MINIMUM_NUMBER_OF_DATASET_INSTANCES_FOR_BATCHED_JOINS : ClassVar[int] = 10000
+    _MINIMUM_NUMBER_OF_JOINS_IN_A_BATCH : ClassVar[int] = 16
 
-    __slots__ = ("_quality_measure", "_q_minimum_threshold", "_optimistic_estimate", "_oe_minimum_threshold", "_additional_parameters_for_the_quality_measure", "_additional_parameters_for_the_optimistic_estimate", "_unselected_subgroups", "_selected_subgroups", "_sort_criterion_in_s1", "_sort_criterion_in_other_sizes", "_vertical_lists_implementation", "_file_path", "_file")
+    __slots__ = ("_quality_measure", "_q_minimum_threshold", "_optimistic_estimate", "_oe_minimum_threshold", "_additional_parameters_for_the_quality_measure", "_additional_parameters_for_the_optimistic_estimate", "_unselected_subgroups", "_selected_subgroups", "_sort_criterion_in_s1", "_sort_criterion_in_other_sizes", "_vertical_lists_implementation", "_file_path", "_file", "_bound_quality_measure", "_bound_optimistic_estimate", "_additional_quality_measures", "_additional_parameters_for_the_additional_quality_measures", "_bound_additional_quality_measures", "_num_subgroups", "_k_subgroups", "_current_oe_minimum_threshold", "_n_jobs", "_indexes_in_M")
     
-    def __init__(self, quality_measure : QualityMeasure, q_minimum_threshold : Union[int, float], optimistic_estimate : QualityMeasure, oe_minimum_threshold : Union[int, float], additional_parameters_for_the_quality_measure : dict[str, Union[int, float]] = dict(), additional_parameters_for_the_optimistic_estimate : dict[str, Union[int, float]] = dict(), sort_criterion_in_s1 : str = SORT_CRITERION_NO_ORDER, sort_criterion_in_other_sizes : str = SORT_CRITERION_NO_ORDER, vertical_lists_implementation : str = VERTICAL_LISTS_WITH_BITSETS, write_results_in_file : bool = False, file_path : Union[str, None] = None) -> None:
+    def __init__(self, quality_measure : QualityMeasure, q_minimum_threshold : Union[int, float], optimistic_estimate : QualityMeasure, oe_minimum_threshold : Union[int, float], additional_parameters_for_the_quality_measure : dict[str, Union[int, float]] = dict(), additional_parameters_for_the_optimistic_estimate : dict[str, Union[int, float]] = dict(), sort_criterion_in_s1 : str = SORT_CRITERION_NO_ORDER, sort_criterion_in_other_sizes : str = SORT_CRITERION_NO_ORDER, vertical_lists_implementation : str = VERTICAL_LISTS_WITH_BITSETS, write_results_in_file : bool = False, file_path : Union[str, None] = None, additional_quality_measures : list[QualityMeasure] = list(), additional_parameters_for_the_additional_quality_measures : dict[str, Union[int, float]] = dict(), num_subgroups : int = 0, n_jobs : int = 1) -> None:
         if not isinstance(quality_measure, QualityMeasure):
             raise TypeError("The parameter 'quality_measure' must be an instance of a subclass of the 'QualityMeasure' class.")
         if (type(q_minimum_threshold) is not int) and (type(q_minimum_threshold) is not float):
@@ -115,12 +179,29 @@ class VLSD(Algorithm):
         # If 'write_results_in_file' is True, 'file_path' must not be None.
         if (write_results_in_file) and (file_path is None):
             raise ValueError("If the parameter 'write_results_in_file' is True, the parameter 'file_path' must not be None.")
+        if (type(additional_quality_measures) is not list) or (not all(isinstance(additional_quality_measure, QualityMeasure) for additional_quality_measure in additional_quality_measures)):
+            raise TypeError("The type of the parameter 'additional_quality_measures' must be 'list' and its elements must be instances of a subclass of the 'QualityMeasure' class.")
+        if (type(additional_parameters_for_the_additional_quality_measures) is not dict):
+            raise TypeError("The type of the parameter 'additional_parameters_for_the_additional_quality_measures' must be 'dict'")
+        if (type(num_subgroups) is not int):
+            raise TypeError("The type of the parameter 'num_subgroups' must be 'int'")
+        if (num_subgroups < 0):
+            raise ValueError("The value of the parameter 'num_subgroups' must be greater or equal than 0.")
+        if (type(n_jobs) is not int):
+            raise TypeError("The type of the parameter 'n_jobs' must be 'int'")
+        if (n_jobs < 1) and (n_jobs != -1):
+            raise ValueError("The value of the parameter 'n_jobs' must be greater or equal than 1 or -1 (all the CPUs).")
         self._quality_measure = quality_measure
         self._q_minimum_threshold = q_minimum_threshold
         self._optimistic_estimate = optimistic_estimate
         self._oe_minimum_threshold = oe_minimum_threshold
         self._additional_parameters_for_the_quality_measure = additional_parameters_for_the_quality_measure.copy()
         _delete_subgroup_parameters_from_a_dictionary(self._additional_parameters_for_the_quality_measure)
+        self._additional_quality_measures = list(additional_quality_measures)
+        self._additional_parameters_for_the_additional_quality_measures = additional_parameters_for_the_additional_quality_measures.copy()
+        _delete_subgroup_parameters_from_a_dictionary(self._additional_parameters_for_the_additional_quality_measures)
+        # The additional quality measures bound to TP, FP and their additional parameters (they are set in the 'fit' method).
+        self._bound_additional_quality_measures = []
         self._additional_parameters_for_the_optimistic_estimate = additional_parameters_for_the_optimistic_estimate.copy()
         _delete_subgroup_parameters_from_a_dictionary(self._additional_parameters_for_the_optimistic_estimate)
         self._unselected_subgroups = 0
@@ -133,6 +214,17 @@ class VLSD(Algorithm):
         else:
             self._file_path = None
         self._file = None
+        # The quality measure and the optimistic estimate bound to TP, FP and their additional parameters (they are set in the 'fit' method).
+        self._bound_quality_measure = None
+        self._bound_optimistic_estimate = None
+        self._num_subgroups = num_subgroups
+        # Min-heap with the best 'num_subgroups' subgroups (only used in top-k mode). Each element is a tuple (quality measure value, tie-breaker, Vertical List, subgroup).
+        self._k_subgroups = []
+        # The minimum threshold for the optimistic estimate which is used to prune (in top-k mode, it rises during the execution).
+        self._current_oe_minimum_threshold = oe_minimum_threshold
+        self._n_jobs = n_jobs
+        # Position in S1 (i.e., row and column of the matrix M) of each selector of the Vertical Lists of size 1 (it is set in the 'fit' method).
+        self._indexes_in_M = dict()
     
     def _get_quality_measure(self) -> QualityMeasure:
         return self._quality_measure
@@ -146,6 +238,12 @@ class VLSD(Algorithm):
     def _get_oe_minimum_threshold(self) -> Union[int, float]:
         return self._oe_minimum_threshold
     
+    def _get_additional_quality_measures(self) -> list[QualityMeasure]:
+        return self._additional_quality_measures
+    
+    def _get_additional_parameters_for_the_additional_quality_measures(self) -> dict[str, Union[int, float]]:
+        return self._additional_parameters_for_the_additional_quality_measures
+    
     def _get_additional_parameters_for_the_quality_measure(self) -> dict[str, Union[int, float]]:
         return self._additional_parameters_for_the_quality_measure
     
@@ -158,6 +256,8 @@ class VLSD(Algorithm):
     oe_minimum_threshold = property(_get_oe_minimum_threshold, None, None, "The minimum quality threshold for the optimistic estimate.")
     additional_parameters_for_the_quality_measure = property(_get_additional_parameters_for_the_quality_measure, None, None, "The additional needed parameters with which to compute the quality measure.")
     additional_parameters_for_the_optimistic_estimate = property(_get_additional_parameters_for_the_optimistic_estimate, None, None, "The additional needed parameters with which to compute the optimistic estimate.")
+    additional_quality_measures = property(_get_additional_quality_measures, None, None, "The other quality measures which are computed for each selected subgroup.")
+    additional_parameters_for_the_additional_quality_measures = property(_get_additional_parameters_for_the_additional_quality_measures, None, None, "The additional needed parameters with which to compute the additional quality measures.")
     
     def _get_unselected_subgroups(self) -> int:
         return self._unselected_subgroups
@@ -172,6 +272,19 @@ class VLSD(Algorithm):
     selected_subgroups = property(_get_selected_subgroups, None, None, "Number of selected subgroups after executing the VLSD algorithm (before executing the 'fit' method, this attribute is 0).")
     visited_nodes = property(_get_visited_nodes, None, None, "Number of visited nodes after executing the VLSD algorithm (before executing the 'fit' method, this attribute is 0).")
 
+    def _get_num_subgroups(self) -> int:
+        return self._num_subgroups
+    
+    def _get_k_subgroups(self) -> list[tuple[Subgroup, float, int, int, dict[str, float]]]:
+        return [(subgroup, quality_measure_value, vertical_list.tp, vertical_list.fp, self._compute_additional_quality_measures(vertical_list.tp, vertical_list.fp)) for quality_measure_value, _, vertical_list, subgroup in sorted(self._k_subgroups, key=lambda x : (x[0], -x[1]), reverse=True)]
+    
+    def _get_n_jobs(self) -> int:
+        return self._n_jobs
+    
+    num_subgroups = property(_get_num_subgroups, None, None, "The number of subgroups which are retained in top-k mode (if it is 0, the top-k mode is not used).")
+    n_jobs = property(_get_n_jobs, None, None, "The number of processes which are used to explore the search space.")
+    k_subgroups = property(_get_k_subgroups, None, None, "The best 'num_subgroups' subgroups after executing the VLSD algorithm in top-k mode, sorted in descending order by quality. Each element is a tuple (subgroup, quality measure value, tp, fp, values of the additional quality measures).")
+    
     def _get_sort_criterion_in_s1(self) -> str:
         return self._sort_criterion_in_s1
     
@@ -181,58 +294,89 @@ class VLSD(Algorithm):
     sort_criterion_in_s1 = property(_get_sort_criterion_in_s1, None, None, "The criterion to use in order to sort the Vertical Lists with only one selector.")
     sort_criterion_in_other_sizes = property(_get_sort_criterion_in_other_sizes, None, None, "The criterion to use in order to sort the Vertical Lists with more than one selector.")
     
-    def _handle_individual_result(self, individual_result : tuple[VerticalList, tuple[str, str], int, int]) -> None:
+    def _write_individual_result(self, vertical_list : VerticalList, target : tuple[str, str], quality_measure_value : float, additional_quality_measure_values : dict[str, float], TP : int, FP : int) -> None:
+        """Private method to write a selected subgroup in the file defined in the __init__ method.
+        
+        :param vertical_list: the Vertical List of the subgroup.
+        :param target: a tuple with 2 elements: the target attribute name and the target value.
+        :param quality_measure_value: the quality measure value of the subgroup.
+        :param additional_quality_measure_values: the values of the additional quality measures of the subgroup.
+        :param TP: the true population of the dataset.
+        :param FP: the false population of the dataset.
+        """
+        tp = vertical_list.tp
+        fp = vertical_list.fp
+        # Get the description and the target.
+        subgroup_description = Pattern(vertical_list.list_of_selectors)
+        # Create the subgroup.
+        subgroup = Subgroup(subgroup_description, Selector(target[0], Operator.EQUAL, target[1])) # Attribute name -> target[0], Attribute value -> target[1]
+        # Write.
+        self._file.write(str(subgroup) + " ; ")
+        self._file.write("Sequence of instances tp = " + str(vertical_list.sequence_of_instances_tp) + " ; ")
+        self._file.write("Sequence of instances fp = " + str(vertical_list.sequence_of_instances_fp) + " ; ")
+        self._file.write("Quality Measure " + self._quality_measure.get_name() + " = " + str(quality_measure_value) + " ; ")
+        self._write_additional_quality_measures(additional_quality_measure_values)
+        self._file.write("Optimistic Estimate " + self._optimistic_estimate.get_name() + " = " + str(vertical_list.quality_value) + " ; ")
+        self._file.write("tp = " + str(tp) + " ; ")
+        self._file.write("fp = " + str(fp) + " ; ")
+        self._file.write("TP = " + str(TP) + " ; ")
+        self._file.write("FP = " + str(FP) + "\n")
+    
+    def _update_k_subgroups(self, vertical_list : VerticalList, target : tuple[str, str], quality_measure_value : float) -> None:
+        """Private method to add a subgroup to the best 'num_subgroups' subgroups (if it is good enough) and to raise the minimum threshold for the optimistic estimate accordingly. It is only used in top-k mode.
+        
+        :param vertical_list: the Vertical List of the subgroup.
+        :param target: a tuple with 2 elements: the target attribute name and the target value.
+        :param quality_measure_value: the quality measure value of the subgroup.
+        """
+        if (len(self._k_subgroups) < self._num_subgroups):
+            subgroup = Subgroup(Pattern(vertical_list.list_of_selectors), Selector(target[0], Operator.EQUAL, target[1]))
+            # The number of selected subgroups is used as tie-breaker (i.e., in case of equal quality, the oldest subgroup is the worst one).
+            heappush(self._k_subgroups, (quality_measure_value, self._selected_subgroups, vertical_list, subgroup))
+        elif (self._k_subgroups[0][0] < quality_measure_value):
+            subgroup = Subgroup(Pattern(vertical_list.list_of_selectors), Selector(target[0], Operator.EQUAL, target[1]))
+            heapreplace(self._k_subgroups, (quality_measure_value, self._selected_subgroups, vertical_list, subgroup))
+        else:
+            return
+        # When the heap is full, no subgroup with an optimistic estimate lower than the quality of the worst subgroup in it can enter.
+        if (len(self._k_subgroups) == self._num_subgroups) and (self._k_subgroups[0][0] > self._current_oe_minimum_threshold):
+            self._current_oe_minimum_threshold = self._k_subgroups[0][0]
+    
+    def _handle_individual_result(self, individual_result : tuple[VerticalList, tuple[str, str], int, int]) -> Union[tuple[float, dict[str, float]], None]:
         """Private method to handle each individual result generated by the VLSD algorithm.
         
         :param individual_result: the individual result which is handled. In this case, it is a Vertical List, a target as a tuple and the subgroup parameters TP and FP.
+        :return: a tuple with the quality measure value and the values of the additional quality measures of the subgroup if it is selected (i.e., if its quality measure value is greater or equal than the threshold) and None otherwise. In top-k mode, None is always returned, because the best subgroups are only known at the end of the execution.
         """
-        # Get the subgroup parameters.
-        tp = individual_result[0].tp
-        fp = individual_result[0].fp
-        TP = individual_result[2]
-        FP = individual_result[3]
         # Compute the quality measure of the frequent pattern along with the target (i.e., the quality measure of the subgroup).
-        dict_of_parameters = {QualityMeasure.TRUE_POSITIVES : tp, QualityMeasure.FALSE_POSITIVES : fp, QualityMeasure.TRUE_POPULATION : TP, QualityMeasure.FALSE_POPULATION : FP}
-        dict_of_parameters.update(self._additional_parameters_for_the_quality_measure)
-        quality_measure_value = self._quality_measure.compute(dict_of_parameters)
+        quality_measure_value = self._bound_quality_measure(individual_result[0].tp, individual_result[0].fp)
         # Add the subgroup only if the quality measure value is greater or equal than the threshold.
         if quality_measure_value >= self._q_minimum_threshold:
-            # If applicable, write in the file defined in the __init__ method.
-            if self._file_path is not None:
-                # Get the description and the target.
-                subgroup_description = Pattern(individual_result[0].list_of_selectors)
-                target_as_tuple = individual_result[1] # Attribute name -> target_as_tuple[0], Attribute value -> target_as_tuple[1]
-                # Create the subgroup.
-                subgroup = Subgroup(subgroup_description, Selector(target_as_tuple[0], Operator.EQUAL, target_as_tuple[1]))
-                # Write.
-                self._file.write(str(subgroup) + " ; ")
-                self._file.write("Sequence of instances tp = " + str(individual_result[0].sequence_of_instances_tp) + " ; ")
-                self._file.write("Sequence of instances fp = " + str(individual_result[0].sequence_of_instances_fp) + " ; ")
-                self._file.write("Quality Measure " + self._quality_measure.get_name() + " = " + str(quality_measure_value) + " ; ")
-                self._file.write("Optimistic Estimate " + self._optimistic_estimate.get_name() + " = " + str(individual_result[0].quality_value) + " ; ")
-                self._file.write("tp = " + str(tp) + " ; ")
-                self._file.write("fp = " + str(fp) + " ; ")
-                self._file.write("TP = " + str(TP) + " ; ")
-                self._file.write("FP = " + str(FP) + "\n")
             # Increment the number of selected subgroups.
             self._selected_subgroups = self._selected_subgroups + 1
+            # In top-k mode, the subgroup is retained (if applicable) and it is handled at the end of the execution.
+            if (self._num_subgroups > 0):
+                self._update_k_subgroups(individual_result[0], individual_result[1], quality_measure_value)
+                return None
+            additional_quality_measure_values = self._compute_additional_quality_measures(individual_result[0].tp, individual_result[0].fp)
+            # If applicable, write in the file defined in the __init__ method.
+            if self._file_path is not None:
+                self._write_individual_result(individual_result[0], individual_result[1], quality_measure_value, additional_quality_measure_values, individual_result[2], individual_result[3])
+            return (quality_measure_value, additional_quality_measure_values)
         else: # If the quality measure is not greater or equal, increment the number of unselected subgroups.
             self._unselected_subgroups = self._unselected_subgroups + 1
+            return None
     
-    # IMPORTANT: although the subgroup parameters TP and FP can be computed from 'pandas_dataframe', we also pass them by parameter in this method to avoid computing them twice (in the 'fit' method and in this method).
-    def _generate_subgroups_s1(self, pandas_dataframe : DataFrame, target : tuple[str, str], TP : int, FP : int) -> list[VerticalList]:
-        """Private method to generate the list of Vertical Lists of size 1 (i.e., whose list of selectors has only one selector), prune it and sort it.
-        
-        :param pandas_dataframe: the DataFrame which is scanned. This algorithm only supports nominal attributes (i.e., type 'str') without missing values.
+    @staticmethod
+    def _generate_rows_of_selectors(pandas_dataframe : DataFrame, target : tuple[str, str]) -> Iterator[tuple[Selector, Sequence[int], Sequence[int]]]:
+        """Private method to generate, for each selector 'attribute = value' of the DataFrame (except the target attribute), the positions of the instances which are covered by it and by the target and the positions of the instances which are covered by it, but not by the target.
+
+        :param pandas_dataframe: the DataFrame which is scanned.
         :param target: a tuple with 2 elements: the target attribute name and the target value.
-        :param TP: the true population of the dataset. IMPORTANT: although it can be computed from 'pandas_dataframe', we pass it by parameter to avoid computing it twice (in the 'fit' method and in this method).
-        :param FP: the false population of the dataset. IMPORTANT: although it can be computed from 'pandas_dataframe', we pass it by parameter to avoid computing it twice (in the 'fit' method and in this method).
-        :return: a list in which each element is a Vertical List of size 1 (i.e., it only has one selector in its list of selectors). The list is pruned according to the threshold and sorted according to 'sort_criterion_in_s1' attribute.
+        :return: an iterator over the tuples (selector, positions of the true positives, positions of the false positives).
         """
         # Get the target column as a mask: True if the value is equal to the target value and False otherwise.
         target_attribute_as_a_mask = (pandas_dataframe[target[0]] == target[1])
-        # Result.
-        result = []
         # Iterate through the columns (except the target).
         for column in pandas_dataframe.columns.drop(target[0]):
             # Use the 'groupby' method in order to group each value depending on whether appears with the target or not.
@@ -256,22 +400,45 @@ class VLSD(Algorithm):
                         registers_fp = values_and_target_grouped[(value,False)]
                     except KeyError:
                         registers_fp = [] # Empty sequence.
-                    # Compute the optimistic estimate.
-                    dict_of_parameters = {QualityMeasure.TRUE_POSITIVES : len(registers_tp), QualityMeasure.FALSE_POSITIVES : len(registers_fp), QualityMeasure.TRUE_POPULATION : TP, QualityMeasure.FALSE_POPULATION : FP}
-                    dict_of_parameters.update(self._additional_parameters_for_the_optimistic_estimate)
-                    optimistic_estimate_value = self._optimistic_estimate.compute(dict_of_parameters)
-                    # Pruning: add the Vertical List only if the optimistic estimate value is greater or equal than the threshold.
-                    if optimistic_estimate_value >= self._oe_minimum_threshold:
-                        # Create the Vertical List (depending on the specified implementation).
-                        vl = None
-                        if (self._vertical_lists_implementation == VLSD.VERTICAL_LISTS_WITH_BITSETS):
-                            vl = VerticalListWithBitsets([Selector(column, Operator.EQUAL, value)], registers_tp, registers_fp, TP+FP, optimistic_estimate_value)
-                        elif (self._vertical_lists_implementation == VLSD.VERTICAL_LISTS_WITH_SETS):
-                            vl = VerticalListWithSets([Selector(column, Operator.EQUAL, value)], registers_tp, registers_fp, TP+FP, optimistic_estimate_value)
-                        # Add it to the final list.
-                        result.append(vl)
+                    yield (Selector(column, Operator.EQUAL, value), registers_tp, registers_fp)
                     # Finally, add the value to 'processed_values'.
                     processed_values.add(value)
+
+    # IMPORTANT: although the subgroup parameters TP and FP can be computed from 'pandas_dataframe', we also pass them by parameter in this method to avoid computing them twice (in the 'fit' method and in this method).
+    def _generate_subgroups_s1(self, pandas_dataframe : Union[DataFrame, EncodedDataset], target : tuple[str, str], TP : int, FP : int) -> list[VerticalList]:
+        """Private method to generate the list of Vertical Lists of size 1 (i.e., whose list of selectors has only one selector), prune it and sort it.
+        
+        :param pandas_dataframe: the DataFrame (or the EncodedDataset) which is scanned. This algorithm only supports nominal attributes (i.e., type 'str') without missing values.
+        :param target: a tuple with 2 elements: the target attribute name and the target value.
+        :param TP: the true population of the dataset. IMPORTANT: although it can be computed from 'pandas_dataframe', we pass it by parameter to avoid computing it twice (in the 'fit' method and in this method).
+        :param FP: the false population of the dataset. IMPORTANT: although it can be computed from 'pandas_dataframe', we pass it by parameter to avoid computing it twice (in the 'fit' method and in this method).
+        :return: a list in which each element is a Vertical List of size 1 (i.e., it only has one selector in its list of selectors). The list is pruned according to the threshold and sorted according to 'sort_criterion_in_s1' attribute.
+        """
+        # The EncodedDataset already contains the positions of the instances covered by each selector (they are obtained without the 'groupby' method).
+        if type(pandas_dataframe) is EncodedDataset:
+            rows_of_selectors = pandas_dataframe.generate_rows_of_selectors()
+        else:
+            rows_of_selectors = VLSD._generate_rows_of_selectors(pandas_dataframe, target)
+        rows_of_selectors = list(rows_of_selectors)
+        # Compute the optimistic estimate of all the selectors at once (vectorized).
+        optimistic_estimate_values = self._optimistic_estimate.compute_batch([len(registers_tp) for _, registers_tp, _ in rows_of_selectors], [len(registers_fp) for _, _, registers_fp in rows_of_selectors], TP, FP, self._additional_parameters_for_the_optimistic_estimate).tolist()
+        # Result.
+        result = []
+        for (selector, registers_tp, registers_fp), optimistic_estimate_value in zip(rows_of_selectors, optimistic_estimate_values):
+            # Pruning: add the Vertical List only if the optimistic estimate value is greater or equal than the threshold.
+            if optimistic_estimate_value >= self._oe_minimum_threshold:
+                # Create the Vertical List (depending on the specified implementation).
+                vl = None
+                if (self._vertical_lists_implementation == VLSD.VERTICAL_LISTS_WITH_BITSETS):
+                    vl = VerticalListWithBitsets([selector], registers_tp, registers_fp, TP+FP, optimistic_estimate_value)
+                elif (self._vertical_lists_implementation == VLSD.VERTICAL_LISTS_WITH_SETS):
+                    vl = VerticalListWithSets([selector], registers_tp, registers_fp, TP+FP, optimistic_estimate_value)
+                elif (self._vertical_lists_implementation == VLSD.VERTICAL_LISTS_WITH_DIFFSETS):
+                    vl = VerticalListWithDiffsets([selector], registers_tp, registers_fp, TP+FP, optimistic_estimate_value)
+                elif (self._vertical_lists_implementation == VLSD.VERTICAL_LISTS_WITH_ROARING_BITMAPS):
+                    vl = VerticalListWithRoaringBitmaps([selector], registers_tp, registers_fp, TP+FP, optimistic_estimate_value)
+                # Add it to the final list.
+                result.append(vl)
         # Sort by quality value (optimistic_estimate_value) according to 'sort_criterion_in_s1'.
         if (self._sort_criterion_in_s1 == VLSD.SORT_CRITERION_QUALITY_ASCENDING):
             result.sort(reverse=False, key=lambda x : x.quality_value)
@@ -280,15 +447,20 @@ class VLSD(Algorithm):
         # Return the list.
         return result
     
-    def _search(self, P : list[VerticalList], M : dict[Selector, dict[Selector, VerticalList]], target : tuple[str, str], TP : int, FP : int) -> None:
+    def _search(self, P : list[VerticalList], M : ndarray, target : tuple[str, str], TP : int, FP : int) -> Iterator[tuple[VerticalList, float, dict[str, float]]]:
         """Private search method.
         
         :param P: a list of Vertical Lists.
-        :param M: the 2-dimensional matrix M (in this case, it is a python dictionary).
+        :param M: the 2-dimensional matrix M (in this case, a numpy array indexed by the positions of the Vertical Lists in S1).
         :param target: a tuple with 2 elements: the target attribute name and the target value.
         :param TP: the true population of the dataset (i.e., the number of instances in which the target appears).
         :param FP: the false population of the dataset (i.e., the number of instances in which the target does not appear).
+        :return: an iterator over the tuples (Vertical List, quality measure value, values of the additional quality measures) of the selected subgroups.
         """
+        # The Vertical Lists with bitsets are joined in batches (only in large datasets, because a batch has a fixed cost and the individual joins of small bitsets are very cheap).
+        if (self._vertical_lists_implementation == VLSD.VERTICAL_LISTS_WITH_BITSETS) and ((TP + FP) >= VLSD._MINIMUM_NUMBER_OF_DATASET_INSTANCES_FOR_BATCHED_JOINS):
+            yield from self._search_with_batched_joins(P, M, target, TP, FP)
+            return
         index_x = 0
         # Main loop: while P list is not completely processed (the last element is never processed).
         while (index_x < (len(P)-1)):
@@ -298,26 +470,24 @@ class VLSD(Algorithm):
             #     in a python list is O(n), because all the elements at the right of the deleted element are moved one position to the left.
             P[index_x] = None
             index_x = index_x + 1
-            # Get the last selector of s_x.
-            s_x_last_selector = s_x.list_of_selectors[-1]
+            # Get the position in M of the last selector of s_x.
+            index_in_M_x = self._indexes_in_M[s_x.list_of_selectors[-1]]
             # List in which the children will be stored.
             V = []
             # Join between s_x and each node to its right.
             for index_y in range(index_x, len(P)): # In this case, it is not index_x+1 because the index was already increased.
                 s_y = P[index_y]
-                # Get the last selector of s_y.
-                s_y_last_selector = s_y.list_of_selectors[-1]
-                # Query M.
-                vertical_list_in_M = _query_triangular_matrix(M, s_x_last_selector, s_y_last_selector)
-                if (vertical_list_in_M is not None) and (vertical_list_in_M.quality_value >= self.oe_minimum_threshold):
-                    s_xy_dict_of_parameters = {QualityMeasure.TRUE_POPULATION : TP, QualityMeasure.FALSE_POPULATION : FP}
-                    s_xy_dict_of_parameters.update(self._additional_parameters_for_the_optimistic_estimate)
-                    s_xy = s_x.join(s_y, self._optimistic_estimate, s_xy_dict_of_parameters, return_None_if_n_is_0 = True)
-                    if (s_xy is not None) and (s_xy.quality_value >= self.oe_minimum_threshold):
+                # Query M with the last selectors of s_x and s_y (only the upper triangle of M is filled and the empty positions are nan, so they never reach the threshold).
+                index_in_M_y = self._indexes_in_M[s_y.list_of_selectors[-1]]
+                if (M[min(index_in_M_x, index_in_M_y), max(index_in_M_x, index_in_M_y)] >= self._current_oe_minimum_threshold):
+                    s_xy = s_x.join(s_y, self._bound_optimistic_estimate, {}, return_None_if_n_is_0 = True)
+                    if (s_xy is not None) and (s_xy.quality_value >= self._current_oe_minimum_threshold):
                         # Add s_xy to V list.
                         V.append(s_xy)
                         # Handle this result.
-                        self._handle_individual_result( (s_xy, target, TP, FP) )
+                        selected_subgroup_values = self._handle_individual_result( (s_xy, target, TP, FP) )
+                        if selected_subgroup_values is not None:
+                            yield (s_xy,) + selected_subgroup_values
             # Check whether V is not empty.
             if V:
                 # Sort by quality value (optimistic_estimate_value) according to 'sort_criterion_in_other_sizes'.
@@ -325,71 +495,307 @@ class VLSD(Algorithm):
                     V.sort(reverse=False, key=lambda x : x.quality_value)
                 elif (self._sort_criterion_in_other_sizes == VLSD.SORT_CRITERION_QUALITY_DESCENDING):
                     V.sort(reverse=True, key=lambda x : x.quality_value)
-                self._search(V, M, target, TP, FP)
+                yield from self._search(V, M, target, TP, FP)
     
-    def fit(self, pandas_dataframe : DataFrame, target : tuple[str, str]) -> None:
-        """Main method to run the VLSD algorithm. This algorithm only supports nominal attributes (i.e., type 'str'). IMPORTANT: missing values are not supported.
+    def _search_with_batched_joins(self, P : list[VerticalListWithBitsets], M : ndarray, target : tuple[str, str], TP : int, FP : int) -> Iterator[tuple[VerticalList, float, dict[str, float]]]:
+        """Private search method for the Vertical Lists with bitsets. It visits the same nodes in the same order as the method '_search', but each Vertical List is joined with all the nodes to its right at once (see the method 'join_batch' of the class 'VerticalListWithBitsets'). The sequences of instances of P are stacked into 2-dimensional arrays of words only once, the first time that they are needed. Since a batch has a fixed cost, the Vertical Lists are joined one by one when there are few nodes to join.
         
-        :param pandas_dataframe: the DataFrame which is scanned. This algorithm only supports nominal attributes (i.e., type 'str'). IMPORTANT: missing values are not supported.
+        :param P: a list of Vertical Lists with bitsets.
+        :param M: the 2-dimensional matrix M (in this case, a numpy array indexed by the positions of the Vertical Lists in S1).
         :param target: a tuple with 2 elements: the target attribute name and the target value.
+        :param TP: the true population of the dataset (i.e., the number of instances in which the target appears).
+        :param FP: the false population of the dataset (i.e., the number of instances in which the target does not appear).
+        :return: an iterator over the tuples (Vertical List, quality measure value, values of the additional quality measures) of the selected subgroups.
         """
-        if type(pandas_dataframe) is not DataFrame:
-            raise TypeError("The type of the parameter 'pandas_dataframe' must be 'DataFrame'.")
-        if type(target) is not tuple:
-            raise TypeError("The type of the parameter 'target' must be 'tuple'.")
-        # IMPORTANT: this algorithm only supports nominal attributes (i.e., type 'str').
-        for column in pandas_dataframe.columns:
-            if not is_string_dtype(pandas_dataframe[column]):
-                raise DatasetAttributeTypeError("Error in attribute '" + str(column) + "'. This algorithm only supports nominal attributes (i.e., type 'str').")
-        # Open the file if the path is not None.
-        if (self._file_path is not None):
-            self._file = open(self._file_path, "w")
-        # Obtain TP and FP of the dataset.
-        TP = sum(pandas_dataframe[target[0]] == target[1])
-        FP = len(pandas_dataframe.index) - TP
-        # Get the list of Vertical Lists of size 1 (i.e., only one selector in their lists of selectors).
-        S1 = self._generate_subgroups_s1(pandas_dataframe, target, TP, FP)
-        # Handle each individual result.
-        for s in S1:
-            self._handle_individual_result( (s, target, TP, FP) )
-        # Create 2-dimensional empty matrix M (in this case, it is a python dictionary).
-        M = dict()
-        # Double iteration through S1.
-        for index_x in range(len(S1)): # From 0 to len(S1)-1.
-            s_x = S1[index_x]
-            # Get the last selector of s_x. In this point, there is only one.
-            s_x_last_selector = s_x.list_of_selectors[-1]
-            for index_y in range(index_x+1, len(S1)): # IMPORTANT: x < y ==> From x+1 to len(S1)-1.
-                s_y = S1[index_y]
-                # Get the last selector of s_y. In this point, there is only one.
-                s_y_last_selector = s_y.list_of_selectors[-1]
-                # Get the quality value of the join of s_x and s_y.
-                s_xy_dict_of_parameters = {QualityMeasure.TRUE_POPULATION : TP, QualityMeasure.FALSE_POPULATION : FP}
-                s_xy_dict_of_parameters.update(self._additional_parameters_for_the_optimistic_estimate)
-                s_xy = s_x.join(s_y, self._optimistic_estimate, s_xy_dict_of_parameters, return_None_if_n_is_0 = True)
-                # Check whether n (i.e., tp+fp) is 0 or greater than 0 (in this case, 's_xy' will be None) and whether 's_xy' has quality enough.
-                if (s_xy is not None) and (s_xy.quality_value >= self._oe_minimum_threshold):
-                    # Add to the dictionary.
-                    if s_x_last_selector not in M:
-                        M[s_x_last_selector] = dict()
-                    # ---> IMPORTANT: M[s_x_last_selector][s_y_last_selector] is equal to M[s_y_last_selector][s_x_last_selector], but only one entry is added (to save memory). This will have to be kept in mind later.
-                    M[s_x_last_selector][s_y_last_selector] = s_xy
-        # Iterate through the Vertical Lists of size 2 and call to search method.
-        for index in range(len(S1)-1): # From 0 to len(S1)-2.
-            selector_i = S1[index].list_of_selectors[-1]
-            if (selector_i in M):
-                # Get all the values (in this case, Vertical Lists) from the corresponding dictionary.
-                P = list(M[selector_i].values())
+        # The sequences of instances of P[first_stacked_index:] (they are stacked the first time that they are needed).
+        stacked_sequences_of_instances_tp = None
+        stacked_sequences_of_instances_fp = None
+        first_stacked_index = 0
+        index_x = 0
+        # Main loop: while P list is not completely processed (the last element is never processed).
+        while (index_x < (len(P)-1)):
+            s_x = P[index_x]
+            # Simulate the "pop_first" method (see the method '_search').
+            P[index_x] = None
+            index_x = index_x + 1
+            # Get the position in M of the last selector of s_x.
+            index_in_M_x = self._indexes_in_M[s_x.list_of_selectors[-1]]
+            # Query M for each node to its right (the quality values in M are also stored, because the threshold could rise in top-k mode).
+            candidates = []
+            for index_y in range(index_x, len(P)): # In this case, it is not index_x+1 because the index was already increased.
+                index_in_M_y = self._indexes_in_M[P[index_y].list_of_selectors[-1]]
+                quality_value_in_M = M[min(index_in_M_x, index_in_M_y), max(index_in_M_x, index_in_M_y)]
+                if (quality_value_in_M >= self._current_oe_minimum_threshold):
+                    candidates.append((index_y, quality_value_in_M))
+            # List in which the children will be stored.
+            V = []
+            if (len(candidates) >= VLSD._MINIMUM_NUMBER_OF_JOINS_IN_A_BATCH):
+                if stacked_sequences_of_instances_tp is None:
+                    first_stacked_index = index_x
+                    stacked_sequences_of_instances_tp, stacked_sequences_of_instances_fp = VerticalListWithBitsets.stack_sequences_of_instances(P[first_stacked_index:])
+                stacked_indexes_y = [index_y - first_stacked_index for index_y, _ in candidates]
+                # Join between s_x and all the candidates at once. Only the joins with quality enough are created.
+                joins = s_x.join_batch([P[index_y] for index_y, _ in candidates], stacked_sequences_of_instances_tp[stacked_indexes_y], stacked_sequences_of_instances_fp[stacked_indexes_y], self._optimistic_estimate, TP, FP, self._additional_parameters_for_the_optimistic_estimate, self._current_oe_minimum_threshold)
+                for position, s_xy in joins:
+                    # In top-k mode, the threshold could have risen while the previous joins were handled.
+                    if (candidates[position][1] >= self._current_oe_minimum_threshold) and (s_xy.quality_value >= self._current_oe_minimum_threshold):
+                        # Add s_xy to V list.
+                        V.append(s_xy)
+                        # Handle this result.
+                        selected_subgroup_values = self._handle_individual_result( (s_xy, target, TP, FP) )
+                        if selected_subgroup_values is not None:
+                            yield (s_xy,) + selected_subgroup_values
+            else:
+                # Join between s_x and each candidate (as in the method '_search').
+                for index_y, quality_value_in_M in candidates:
+                    if (quality_value_in_M >= self._current_oe_minimum_threshold):
+                        s_xy = s_x.join(P[index_y], self._bound_optimistic_estimate, {}, return_None_if_n_is_0 = True)
+                        if (s_xy is not None) and (s_xy.quality_value >= self._current_oe_minimum_threshold):
+                            # Add s_xy to V list.
+                            V.append(s_xy)
+                            # Handle this result.
+                            selected_subgroup_values = self._handle_individual_result( (s_xy, target, TP, FP) )
+                            if selected_subgroup_values is not None:
+                                yield (s_xy,) + selected_subgroup_values
+            # Check whether V is not empty.
+            if V:
                 # Sort by quality value (optimistic_estimate_value) according to 'sort_criterion_in_other_sizes'.
                 if (self._sort_criterion_in_other_sizes == VLSD.SORT_CRITERION_QUALITY_ASCENDING):
-                    P.sort(reverse=False, key=lambda x : x.quality_value)
+                    V.sort(reverse=False, key=lambda x : x.quality_value)
                 elif (self._sort_criterion_in_other_sizes == VLSD.SORT_CRITERION_QUALITY_DESCENDING):
-                    P.sort(reverse=True, key=lambda x : x.quality_value)
-                # Handle each individual result.
-                for s in P:
-                    self._handle_individual_result( (s, target, TP, FP) )
-                self._search(P, M, target, TP, FP)
-        # Close the file if it was opened before.
+                    V.sort(reverse=True, key=lambda x : x.quality_value)
+                yield from self._search_with_batched_joins(V, M, target, TP, FP)
+    
+    def _prepare_fit(self, pandas_dataframe : Union[DataFrame, EncodedDataset], target : tuple[str, str]) -> tuple[int, int]:
+        """Private method to check the parameters of the 'fit' and 'iter_fit' methods, to obtain the subgroup parameters TP and FP of the dataset and to bind the quality measures and the optimistic estimate.
+        
+        :param pandas_dataframe: the DataFrame which is scanned (or an EncodedDataset built from it with the same target).
+        :param target: a tuple with 2 elements: the target attribute name and the target value.
+        :return: a tuple with the subgroup parameters TP and FP of the dataset.
+        """
+        if type(pandas_dataframe) is EncodedDataset:
+            # The attributes were already checked when the EncodedDataset was built.
+            pandas_dataframe.check_target(target)
+        else:
+            if type(pandas_dataframe) is not DataFrame:
+                raise TypeError("The type of the parameter 'pandas_dataframe' must be 'DataFrame' or 'EncodedDataset'.")
+            if type(target) is not tuple:
+                raise TypeError("The type of the parameter 'target' must be 'tuple'.")
+            # IMPORTANT: this algorithm only supports nominal attributes (i.e., type 'str').
+            for column in pandas_dataframe.columns:
+                if not is_string_dtype(pandas_dataframe[column]):
+                    raise DatasetAttributeTypeError("Error in attribute '" + str(column) + "'. This algorithm only supports nominal attributes (i.e., type 'str').")
+        # Obtain TP and FP of the dataset.
+        if type(pandas_dataframe) is EncodedDataset:
+            TP = pandas_dataframe.TP
+            FP = pandas_dataframe.FP
+        else:
+            TP = sum(pandas_dataframe[target[0]] == target[1])
+            FP = len(pandas_dataframe.index) - TP
+        # Bind the quality measure and the optimistic estimate (TP, FP and the additional parameters do not change during the execution).
+        self._bound_quality_measure = self._quality_measure.bind(TP, FP, **self._additional_parameters_for_the_quality_measure)
+        self._bind_additional_quality_measures(TP, FP)
+        self._bound_optimistic_estimate = self._optimistic_estimate.bind(TP, FP, **self._additional_parameters_for_the_optimistic_estimate)
+        # Initialize the top-k mode structures.
+        self._k_subgroups = []
+        self._current_oe_minimum_threshold = self._oe_minimum_threshold
+        return (TP, FP)
+    
+    def _search_first_level(self, index_x : int, S1 : list[VerticalList], M : ndarray, target : tuple[str, str], TP : int, FP : int) -> Iterator[tuple[VerticalList, float, dict[str, float]]]:
+        """Private method to create the Vertical Lists of size 2 which have the same first selector (i.e., the joins of a Vertical List of size 1 with the Vertical Lists of size 1 to its right which have quality enough in M), to handle them and to run the search from them. They are created here, and not when M is created, so that only the Vertical Lists of size 2 of one first selector are in memory at the same time.
+        
+        :param index_x: the position in S1 of the Vertical List of size 1 which is the first selector (i.e., the row of the matrix M).
+        :param S1: the list of Vertical Lists of size 1.
+        :param M: the 2-dimensional matrix M (in this case, a numpy array indexed by the positions of the Vertical Lists in S1).
+        :param target: a tuple with 2 elements: the target attribute name and the target value.
+        :param TP: the true population of the dataset.
+        :param FP: the false population of the dataset.
+        :return: an iterator over the tuples (Vertical List, quality measure value, values of the additional quality measures) of the selected subgroups.
+        """
+        s_x = S1[index_x]
+        row_of_M = M[index_x]
+        # Create the Vertical Lists of size 2 (in the same order as S1).
+        # --> IMPORTANT: in top-k mode, the threshold could have risen after creating M.
+        # --> IMPORTANT: the values in M are upper bounds of the quality values (see the method '_generate_selected_subgroups'), so the exact quality value of each join is checked again.
+        P = []
+        for index_y in range(index_x+1, len(S1)): # IMPORTANT: x < y ==> From x+1 to len(S1)-1.
+            if (row_of_M[index_y] >= self._current_oe_minimum_threshold):
+                s_xy = s_x.join(S1[index_y], self._bound_optimistic_estimate, {}, return_None_if_n_is_0 = True)
+                if (s_xy is not None) and (s_xy.quality_value >= self._current_oe_minimum_threshold):
+                    P.append(s_xy)
+        # Sort by quality value (optimistic_estimate_value) according to 'sort_criterion_in_other_sizes'.
+        if (self._sort_criterion_in_other_sizes == VLSD.SORT_CRITERION_QUALITY_ASCENDING):
+            P.sort(reverse=False, key=lambda x : x.quality_value)
+        elif (self._sort_criterion_in_other_sizes == VLSD.SORT_CRITERION_QUALITY_DESCENDING):
+            P.sort(reverse=True, key=lambda x : x.quality_value)
+        # Handle each individual result.
+        for s in P:
+            selected_subgroup_values = self._handle_individual_result( (s, target, TP, FP) )
+            if selected_subgroup_values is not None:
+                yield (s,) + selected_subgroup_values
+        yield from self._search(P, M, target, TP, FP)
+    
+    def _search_first_level_in_parallel(self, S1 : list[VerticalList], M : ndarray, target : tuple[str, str], TP : int, FP : int, n_jobs : int, yield_results : bool, include_sequences_of_instances : bool) -> Iterator[tuple[Union[VerticalList, _SelectedSubgroup], float, dict[str, float]]]:
+        """Private method to run the searches from the Vertical Lists of size 1 in a pool of processes (it is not used in top-k mode). The results are yielded and the counters are updated in the same order as in the sequential execution. Only the next 2 * n_jobs searches in that order can be pending at the same time (i.e., running or finished, but not merged yet), so that the results which are waiting to be merged are bounded. Among them, the largest searches (estimated by their number of Vertical Lists of size 2) are submitted first and only one search per process is submitted at the same time, so that a large search does not delay the merge when it could have been started earlier.
+        
+        :param S1: the list of Vertical Lists of size 1.
+        :param M: the 2-dimensional matrix M (in this case, a numpy array indexed by the positions of the Vertical Lists in S1).
+        :param target: a tuple with 2 elements: the target attribute name and the target value.
+        :param TP: the true population of the dataset.
+        :param FP: the false population of the dataset.
+        :param n_jobs: the number of processes.
+        :param yield_results: whether the selected subgroups are yielded. If it is False and there is no file, the selected subgroups are not sent back from the processes of the pool.
+        :param include_sequences_of_instances: whether the sequences of instances of the yielded subgroups are needed. If it is False and there is no file, they are not sent back from the processes of the pool.
+        :return: an iterator over the tuples (Vertical List or selected subgroup, quality measure value, values of the additional quality measures) of the selected subgroups (see the class '_SelectedSubgroup').
+        """
+        # The size of each search is estimated by the number of Vertical Lists of size 2 (i.e., entries of M with quality enough) from which it starts (it grows exponentially with it).
+        number_of_vertical_lists_of_size_2 = [count_nonzero(M[index_x, index_x+1:] >= self._current_oe_minimum_threshold) for index_x in range(len(S1))]
+        first_indexes = [index_x for index_x in range(len(S1)-1) if number_of_vertical_lists_of_size_2[index_x] > 0]
+        # The state of the algorithm which is sent to each process: a copy without the file and without the bound functions (they cannot be pickled and they are bound again in each process).
+        worker_vlsd = copy(self)
+        worker_vlsd._file_path = None
+        worker_vlsd._file = None
+        worker_vlsd._bound_quality_measure = None
+        worker_vlsd._bound_optimistic_estimate = None
+        worker_vlsd._bound_additional_quality_measures = []
+        return_selected_subgroups = yield_results or (self._file_path is not None)
+        return_sequences_of_instances = (yield_results and include_sequences_of_instances) or (self._file_path is not None)
+        maximum_number_of_pending_searches = 2 * n_jobs
+        number_of_processes = min(n_jobs, max(len(first_indexes), 1))
+        executor = ProcessPoolExecutor(max_workers=number_of_processes, initializer=_initialize_worker, initargs=(worker_vlsd, S1, M, target, TP, FP))
+        try:
+            # Heap with the pending searches which are not submitted yet (the largest first and, in case of a tie, in the sequential order).
+            searches_to_submit = []
+            number_of_pending_searches = 0 # The searches in the positions [position, number_of_pending_searches) of 'first_indexes' are pending.
+            futures = dict()
+            running_futures = set()
+            # The results are merged in the same order as in the sequential execution.
+            position = 0
+            while (position < len(first_indexes)):
+                while (number_of_pending_searches < len(first_indexes)) and (number_of_pending_searches < position + maximum_number_of_pending_searches):
+                    heappush(searches_to_submit, (-number_of_vertical_lists_of_size_2[first_indexes[number_of_pending_searches]], number_of_pending_searches))
+                    number_of_pending_searches = number_of_pending_searches + 1
+                running_futures = {future for future in running_futures if not future.done()}
+                while searches_to_submit and (len(running_futures) < number_of_processes):
+                    _, position_to_submit = heappop(searches_to_submit)
+                    futures[position_to_submit] = executor.submit(_search_first_level_in_worker, first_indexes[position_to_submit], return_selected_subgroups, return_sequences_of_instances)
+                    running_futures.add(futures[position_to_submit])
+                # Wait until any search finishes if the next one in the sequential order is not finished yet.
+                if (position not in futures) or (not futures[position].done()):
+                    wait(running_futures, return_when=FIRST_COMPLETED)
+                    continue
+                selected_subgroups, selected_subgroups_counter, unselected_subgroups_counter = futures.pop(position).result()
+                position = position + 1
+                self._selected_subgroups = self._selected_subgroups + selected_subgroups_counter
+                self._unselected_subgroups = self._unselected_subgroups + unselected_subgroups_counter
+                for vertical_list, quality_measure_value, additional_quality_measure_values in selected_subgroups:
+                    if self._file_path is not None:
+                        self._write_individual_result(vertical_list, target, quality_measure_value, additional_quality_measure_values, TP, FP)
+                    if yield_results:
+                        yield (vertical_list, quality_measure_value, additional_quality_measure_values)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+    
+    def _generate_selected_subgroups(self, pandas_dataframe : Union[DataFrame, EncodedDataset], target : tuple[str, str], TP : int, FP : int, yield_results : bool = True, include_sequences_of_instances : bool = True) -> Iterator[tuple[Union[VerticalList, _SelectedSubgroup], float, dict[str, float]]]:
+        """Private method to run the VLSD algorithm. It is a generator which yields the selected subgroups as they are found. The file (if applicable) is opened when the generator starts and it is closed when the generator finishes or when it is closed.
+        
+        :param pandas_dataframe: the DataFrame which is scanned (or an EncodedDataset built from it with the same target).
+        :param target: a tuple with 2 elements: the target attribute name and the target value.
+        :param TP: the true population of the dataset.
+        :param FP: the false population of the dataset.
+        :param yield_results: whether the selected subgroups found in the processes of the pool (see the parameter 'n_jobs') are yielded. It is only used to avoid sending them between processes when they are not needed.
+        :param include_sequences_of_instances: whether the sequences of instances of the yielded subgroups are needed. It is only used to avoid sending them between processes when they are not needed (otherwise, they are None in the subgroups found in the processes of the pool).
+        :return: an iterator over the tuples (Vertical List or selected subgroup, quality measure value, values of the additional quality measures) of the selected subgroups (see the class '_SelectedSubgroup').
+        """
+        # Open the file if the path is not None.
         if (self._file_path is not None):
-            self._file.close()
-            self._file = None
+            self._file = open(self._file_path, "w")
+        try:
+            # Get the list of Vertical Lists of size 1 (i.e., only one selector in their lists of selectors).
+            S1 = self._generate_subgroups_s1(pandas_dataframe, target, TP, FP)
+            # Handle each individual result.
+            for s in S1:
+                selected_subgroup_values = self._handle_individual_result( (s, target, TP, FP) )
+                if selected_subgroup_values is not None:
+                    yield (s,) + selected_subgroup_values
+            # Create 2-dimensional empty matrix M (in this case, a numpy array indexed by the positions of the Vertical Lists in S1).
+            # --> IMPORTANT: M only stores the quality values of the Vertical Lists of size 2 (not the Vertical Lists themselves, which are created again in the method '_search_first_level'), and the empty positions are nan.
+            # --> IMPORTANT: M is a float32 array to halve its memory, so each quality value is rounded up to the next float32 value (i.e., the values in M are upper bounds of the quality values and no node is pruned because of the rounding).
+            M = full((len(S1), len(S1)), nan, dtype = float32)
+            self._indexes_in_M = {s.list_of_selectors[-1] : index for index, s in enumerate(S1)}
+            # Double iteration through S1.
+            for index_x in range(len(S1)): # From 0 to len(S1)-1.
+                s_x = S1[index_x]
+                for index_y in range(index_x+1, len(S1)): # IMPORTANT: x < y ==> From x+1 to len(S1)-1.
+                    s_y = S1[index_y]
+                    # Get the quality value of the join of s_x and s_y (with bitsets, only the number of instances of the join is needed, so it is not created).
+                    if (self._vertical_lists_implementation == VLSD.VERTICAL_LISTS_WITH_BITSETS):
+                        tp = count_and(s_x.sequence_of_instances_tp, s_y.sequence_of_instances_tp)
+                        fp = count_and(s_x.sequence_of_instances_fp, s_y.sequence_of_instances_fp)
+                        quality_value = self._bound_optimistic_estimate(tp, fp) if ((tp + fp) > 0) else None
+                    else:
+                        s_xy = s_x.join(s_y, self._bound_optimistic_estimate, {}, return_None_if_n_is_0 = True)
+                        quality_value = s_xy.quality_value if (s_xy is not None) else None
+                    # Check whether n (i.e., tp+fp) is 0 or greater than 0 (in this case, 'quality_value' will be None) and whether it is enough.
+                    if (quality_value is not None) and (quality_value >= self._current_oe_minimum_threshold):
+                        # ---> IMPORTANT: M[index_x][index_y] is equal to M[index_y][index_x], so only the upper triangle is filled (i.e., M is always queried with M[min(i, j), max(i, j)]).
+                        M[index_x, index_y] = nextafter(float32(quality_value), float32(inf))
+            # Iterate through the Vertical Lists of size 1 and call to search method.
+            # --> IMPORTANT: in top-k mode, the search is not parallelized, because the threshold rises with the best subgroups found so far in all the searches (so, the counters would not be the same as in the sequential execution).
+            n_jobs = (cpu_count() or 1) if (self._n_jobs == -1) else self._n_jobs
+            if (n_jobs > 1) and (self._num_subgroups == 0):
+                yield from self._search_first_level_in_parallel(S1, M, target, TP, FP, n_jobs, yield_results, include_sequences_of_instances)
+            else:
+                for index in range(len(S1)-1): # From 0 to len(S1)-2.
+                    yield from self._search_first_level(index, S1, M, target, TP, FP)
+            # In top-k mode, the best subgroups are handled at the end of the execution.
+            for quality_measure_value, _, vertical_list, _ in sorted(self._k_subgroups, key=lambda x : (x[0], -x[1]), reverse=True):
+                additional_quality_measure_values = self._compute_additional_quality_measures(vertical_list.tp, vertical_list.fp)
+                if self._file_path is not None:
+                    self._write_individual_result(vertical_list, target, quality_measure_value, additional_quality_measure_values, TP, FP)
+                yield (vertical_list, quality_measure_value, additional_quality_measure_values)
+        finally:
+            # Close the file if it was opened before.
+            if (self._file is not None):
+                self._file.close()
+                self._file = None
+    
+    def fit(self, pandas_dataframe : Union[DataFrame, EncodedDataset], target : tuple[str, str]) -> None:
+        """Main method to run the VLSD algorithm. This algorithm only supports nominal attributes (i.e., type 'str'). IMPORTANT: missing values are not supported.
+        
+        :param pandas_dataframe: the DataFrame which is scanned (or an EncodedDataset built from it with the same target). This algorithm only supports nominal attributes (i.e., type 'str'). IMPORTANT: missing values are not supported.
+        :param target: a tuple with 2 elements: the target attribute name and the target value.
+        """
+        TP, FP = self._prepare_fit(pandas_dataframe, target)
+        for _ in self._generate_selected_subgroups(pandas_dataframe, target, TP, FP, yield_results = False):
+            pass
+    
+    def iter_fit(self, pandas_dataframe : Union[DataFrame, EncodedDataset], target : tuple[str, str], include_sequences_of_instances : bool = False) -> Iterator[tuple[Subgroup, float, int, int, Union[Collection[int], None], Union[Collection[int], None], dict[str, float]]]:
+        """Method to run the VLSD algorithm lazily: the selected subgroups are yielded as they are found (i.e., they do not need to be written in a file and parsed later). Only the Vertical Lists which are pending to be explored are kept in memory, like in the 'fit' method. The counters of the algorithm and the file (if applicable) are updated in the same way as in the 'fit' method. This algorithm only supports nominal attributes (i.e., type 'str'). IMPORTANT: missing values are not supported.
+        
+        :param pandas_dataframe: the DataFrame which is scanned (or an EncodedDataset built from it with the same target). This algorithm only supports nominal attributes (i.e., type 'str'). IMPORTANT: missing values are not supported.
+        :param target: a tuple with 2 elements: the target attribute name and the target value.
+        :param include_sequences_of_instances: whether the sequences of instances tp and fp of each subgroup are also yielded. Otherwise, None is yielded in their place. By default, False.
+        :return: an iterator over the tuples (subgroup, quality measure value, tp, fp, sequence of instances tp, sequence of instances fp, values of the additional quality measures) of the selected subgroups. The values of the additional quality measures are a python dictionary in which the keys are their names.
+        """
+        if (type(include_sequences_of_instances) is not bool):
+            raise TypeError("The type of the parameter 'include_sequences_of_instances' must be 'bool'")
+        # The parameters are checked when this method is called, not when the iteration starts.
+        TP, FP = self._prepare_fit(pandas_dataframe, target)
+        return self._iter_fit(pandas_dataframe, target, TP, FP, include_sequences_of_instances)
+    
+    def _iter_fit(self, pandas_dataframe : Union[DataFrame, EncodedDataset], target : tuple[str, str], TP : int, FP : int, include_sequences_of_instances : bool) -> Iterator[tuple[Subgroup, float, int, int, Union[Collection[int], None], Union[Collection[int], None], dict[str, float]]]:
+        """Private generator used by the 'iter_fit' method.
+        """
+        target_as_selector = Selector(target[0], Operator.EQUAL, target[1])
+        selected_subgroups = self._generate_selected_subgroups(pandas_dataframe, target, TP, FP, include_sequences_of_instances = include_sequences_of_instances)
+        try:
+            for vertical_list, quality_measure_value, additional_quality_measure_values in selected_subgroups:
+                subgroup = Subgroup(Pattern(vertical_list.list_of_selectors), target_as_selector)
+                if include_sequences_of_instances:
+                    yield (subgroup, quality_measure_value, vertical_list.tp, vertical_list.fp, vertical_list.sequence_of_instances_tp, vertical_list.sequence_of_instances_fp, additional_quality_measure_values)
+                else:
+                    yield (subgroup, quality_measure_value, vertical_list.tp, vertical_list.fp, None, None, additional_quality_measure_values)
+        finally:
+            # If the iteration is stopped before the end, the file (if applicable) is closed.
+            selected_subgroups.close()
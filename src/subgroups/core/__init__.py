@@ -2,3 +2,4 @@ from subgroups.core.operator import Operator
 from subgroups.core.selector import Selector
 from subgroups.core.pattern import Pattern
 from subgroups.core.subgroup import Subgroup
+from subgroups.core.frozen_pattern import FrozenPattern
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+
+# Contributors:
+#    Antonio López Martínez-Carrasco <antoniolopezmc1995@gmail.com>
+
+"""This file contains the implementation of a 'FrozenPattern'. A 'FrozenPattern' is an IMMUTABLE and hashable set of non-repeated selectors, which is internally represented by the sorted tuple of the identifiers of its selectors.
+"""
+
+from subgroups.core.selector import Selector
+from subgroups.core.pattern import Pattern
+from bisect import bisect_left
+
+# Python annotations.
+from typing import Iterator
+
+class FrozenPattern(object):
+    """This class represents a 'FrozenPattern'. A 'FrozenPattern' is an IMMUTABLE and hashable set of non-repeated selectors, which is internally represented by the sorted tuple of the identifiers of its selectors. Unlike a 'Pattern', it can be used as a key of a dictionary or as an element of a set, and its hash is computed only once.
+
+    IMPORTANT: the selectors of a FrozenPattern are sorted by their identifiers (and not by the order defined in the 'Selector' class). In order to get the canonical order, the FrozenPattern must be transformed to a 'Pattern' (see the method 'to_pattern').
+
+    :param list_of_selectors: a list of selectors. IMPORTANT: we assume that the list only contains selectors.
+    """
+
+    __slots__ = ("_ids", "_selectors", "_hash", "_bitmask")
+
+    def __init__(self, list_of_selectors : list[Selector]) -> None:
+        if type(list_of_selectors) is not list:
+            raise TypeError("The type of the parameter 'list_of_selectors' must be 'list'.")
+        # Dictionary id -> selector (it also deletes the duplicates).
+        selectors_by_id = {selector._id : selector for selector in list_of_selectors}
+        self._ids = tuple(sorted(selectors_by_id))
+        self._selectors = tuple(selectors_by_id[selector_id] for selector_id in self._ids)
+        self._hash = hash(self._ids)
+        self._bitmask = 0
+        for selector_id in self._ids:
+            self._bitmask = self._bitmask | (1 << selector_id)
+
+    @staticmethod
+    def _from_sorted_tuples(ids : tuple[int, ...], selectors : tuple[Selector, ...], bitmask : int) -> 'FrozenPattern':
+        # Private method to create a FrozenPattern without sorting (both tuples are already sorted by identifier).
+        new_frozen_pattern = object.__new__(FrozenPattern)
+        new_frozen_pattern._ids = ids
+        new_frozen_pattern._selectors = selectors
+        new_frozen_pattern._hash = hash(ids)
+        new_frozen_pattern._bitmask = bitmask
+        return new_frozen_pattern
+
+    @staticmethod
+    def from_pattern(pattern : Pattern) -> 'FrozenPattern':
+        """Static method to generate a FrozenPattern from a Pattern.
+
+        :param pattern: the Pattern from which to generate the FrozenPattern.
+        :return: the FrozenPattern generated from the Pattern.
+        """
+        if not isinstance(pattern, Pattern):
+            raise TypeError("The parameter 'pattern' must be an instance of the 'Pattern' class or of a subclass thereof.")
+        # The selectors of a Pattern are not repeated, so we only have to sort them by identifier.
+        selectors = tuple(sorted(pattern._list_of_selectors, key = Selector._get_id))
+        return FrozenPattern._from_sorted_tuples(tuple(selector._id for selector in selectors), selectors, pattern.bitmask)
+
+    def to_pattern(self) -> Pattern:
+        """Method to transform the FrozenPattern to a Pattern.
+
+        :return: a new Pattern with the same selectors (in the canonical order).
+        """
+        return Pattern(list(self._selectors))
+
+    def _get_ids(self) -> tuple[int, ...]:
+        return self._ids
+
+    def _get_bitmask(self) -> int:
+        return self._bitmask
+
+    ids = property(_get_ids, None, None, "The sorted tuple of the identifiers of the selectors.")
+    bitmask = property(_get_bitmask, None, None, "The bitmask of the pattern: an int in which the bit i is 1 if and only if the pattern contains the selector with identifier i (see the property 'bitmask' of the class 'Pattern').")
+
+    def extend(self, selector : Selector) -> 'FrozenPattern':
+        """Method to generate a new FrozenPattern with the selectors of this one and the selector passed by parameter. If the selector already exists, this method returns the same FrozenPattern.
+
+        :param selector: the selector which is added.
+        :return: the extended FrozenPattern.
+        """
+        if not isinstance(selector, Selector):
+            raise TypeError("The parameter 'selector' must be an instance of the 'Selector' class or of a subclass thereof.")
+        selector_id = selector._id
+        # We can use the bisection algorithm because the tuple is sorted.
+        index = bisect_left(self._ids, selector_id)
+        if (index < len(self._ids)) and (self._ids[index] == selector_id):
+            return self
+        return FrozenPattern._from_sorted_tuples(self._ids[:index] + (selector_id,) + self._ids[index:], self._selectors[:index] + (selector,) + self._selectors[index:], self._bitmask | (1 << selector_id))
+
+    def is_refinement(self, refinement_candidate : 'FrozenPattern', refinement_of_itself : bool) -> bool:
+        """Method to check whether 'refinement_candidate' is a refinement of this (i.e., of 'self').
+
+        :param refinement_candidate: pattern candidate to be a refinement of this (i.e., of 'self').
+        :param refinement_of_itself: is a pattern a refinement of itself? Sometimes it may be better to assume yes and sometimes no. Therefore, if both patterns are equal, then this method returns the value of 'refinement_of_itself'.
+        :return: whether 'refinement_candidate' is a refinement of this (i.e., 'self').
+        """
+        # 'refinement_candidate' is a refinement of 'self' if all the bits of 'self' are also in 'refinement_candidate'.
+        self_bitmask = self._bitmask
+        refinement_candidate_bitmask = refinement_candidate.bitmask
+        if self_bitmask == refinement_candidate_bitmask:
+            return refinement_of_itself
+        else:
+            return (self_bitmask & refinement_candidate_bitmask) == self_bitmask
+
+    def __eq__(self, other : 'FrozenPattern') -> bool:
+        if not isinstance(other, FrozenPattern):
+            raise TypeError("You are making a comparison with an object which is not an instance of the 'FrozenPattern' class or of a subclass thereof.")
+        return (self is other) or ((self._hash == other._hash) and (self._ids == other._ids))
+
+    def __ne__(self, other : 'FrozenPattern') -> bool:
+        if not isinstance(other, FrozenPattern):
+            raise TypeError("You are making a comparison with an object which is not an instance of the 'FrozenPattern' class or of a subclass thereof.")
+        return (self is not other) and ((self._hash != other._hash) or (self._ids != other._ids))
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __str__(self) -> str:
+        return str(self.to_pattern())
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, item : Selector) -> bool:
+        if not isinstance(item, Selector):
+            raise TypeError("You are using an object which is not an instance of the 'Selector' class or of a subclass thereof.")
+        # We can use the bisection algorithm because the tuple is sorted.
+        index = bisect_left(self._ids, item._id)
+        return (index < len(self._ids)) and (self._ids[index] == item._id)
+
+    def __iter__(self) -> Iterator[Selector]:
+        return iter(self._selectors)
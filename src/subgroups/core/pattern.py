@@ -19,7 +19,7 @@ class Pattern(object):
     :param list_of_selectors: a list of selectors. IMPORTANT: we assume that the list only contains selectors.
     """
     
-    __slots__ = ("_list_of_selectors")
+    __slots__ = ("_list_of_selectors", "_bitmask")
     
     def __init__(self, list_of_selectors : list[Selector]) -> None:
         if type(list_of_selectors) is not list:
@@ -34,6 +34,8 @@ class Pattern(object):
         for elem in temporal_list_of_selectors:
             if (len(self._list_of_selectors) == 0) or (self._list_of_selectors[-1] != elem):
                 self._list_of_selectors.append(elem)
+        # The bitmask of the pattern is computed lazily (see the property 'bitmask').
+        self._bitmask = None
     
     def add_selector(self, selector : Selector) -> None:
         """Method to add a selector to the pattern. If the selector already exists, this method does nothing.
@@ -48,6 +50,10 @@ class Pattern(object):
             self._list_of_selectors.append(selector)
         elif (self._list_of_selectors[index] != selector): # The list is not empty AND the element will not be inserted in the right side of the list.
             self._list_of_selectors.insert(index, selector)
+        else: # The selector already exists.
+            return
+        if self._bitmask is not None:
+            self._bitmask = self._bitmask | (1 << selector._id)
     
     def remove_selector(self, selector : Selector) -> None:
         """Method to remove a selector from the pattern. If the selector does not exist, this method does nothing.
@@ -60,6 +66,8 @@ class Pattern(object):
         index = bisect_left(self._list_of_selectors, selector)
         if (index < len(self._list_of_selectors)) and (self._list_of_selectors[index] == selector):
             self._list_of_selectors.pop(index)
+            if self._bitmask is not None:
+                self._bitmask = self._bitmask & ~(1 << selector._id)
     
     def remove_selector_by_index(self, index : int) -> None:
         """Method to remove a selector from the pattern by index. If the index is out of range, an 'IndexError' exception is raised.
@@ -68,7 +76,9 @@ class Pattern(object):
         """
         if type(index) is not int:
             raise TypeError("The type of the parameter 'index' must be 'int'.")
-        self._list_of_selectors.pop(index)
+        removed_selector = self._list_of_selectors.pop(index)
+        if self._bitmask is not None:
+            self._bitmask = self._bitmask & ~(1 << removed_selector._id)
     
     def get_selector(self, index : int) -> Selector:
         """Method to get a selector from the pattern by index. If the index is out of range, an 'IndexError' exception is raised.
@@ -87,8 +97,19 @@ class Pattern(object):
         new_list_of_selectors = self._list_of_selectors.copy()
         new_pattern = Pattern([]) # The list of selectors is already sorted. It is not needed to sort it in the __init__ method.
         new_pattern._list_of_selectors = new_list_of_selectors
+        new_pattern._bitmask = self._bitmask
         return new_pattern
     
+    def _get_bitmask(self) -> int:
+        if self._bitmask is None:
+            bitmask = 0
+            for selector in self._list_of_selectors:
+                bitmask = bitmask | (1 << selector._id)
+            self._bitmask = bitmask
+        return self._bitmask
+    
+    bitmask = property(_get_bitmask, None, None, "The bitmask of the pattern: an int in which the bit i is 1 if and only if the pattern contains the selector with identifier i. IMPORTANT: the size of the bitmask (and the cost of the operators '&' and '|' between bitmasks) depends on the largest identifier of its selectors, not on the length of the pattern, and the identifiers are bounded by the maximum number of selectors which have existed at the same time (see the property 'id' of the class 'Selector'). The identifiers of the selectors of a pattern are not reused while the pattern exists, because the pattern keeps them alive.")
+    
     def is_contained(self, pandas_dataframe : DataFrame) -> Series:
         """Method to check whether the pattern is contained in each row of the pandas.DataFrame passed by parameter. IMPORTANT: If an attribute name of a selector of the pattern is not in the pandas.DataFrame passed by parameter, a KeyError exception is raised.
         
@@ -97,7 +118,7 @@ class Pattern(object):
         """
         if type(pandas_dataframe) is not DataFrame:
             raise TypeError("The type of the parameter 'pandas_dataframe' must be 'pandas.DataFrame'.")
-        final_result = Series([True] * len(pandas_dataframe)) # The empty pattern is contained in all the rows of a pandas DataFrame.
+        final_result = Series(True, index = pandas_dataframe.index) # The empty pattern is contained in all the rows of a pandas DataFrame.
         # For each selector, we process the whole corresponding attribute (i.e., the complete Series).
         # If all the boolean values of 'final_result' are False, we can stop the process.
         current_index = 0
@@ -116,15 +137,13 @@ class Pattern(object):
         :param refinement_of_itself: is a pattern a refinement of itself? Sometimes it may be better to assume yes and sometimes no. Therefore, if both patterns are equal, then this method returns the value of 'refinement_of_itself'.
         :return: whether 'refinement_candidate' is a refinement of this (i.e., 'self').
         """
-        # TODO: implementing it more efficient (i.e., not using sets), and verifying whether it is actually more efficient. 
-        self_as_set = set(self._list_of_selectors)
-        refinement_candidate_as_set = set(refinement_candidate._list_of_selectors)
-        if (len(self_as_set) > len(refinement_candidate_as_set)):
-            return False
-        elif self_as_set == refinement_candidate_as_set:
+        # We use the bitmasks of both patterns: 'refinement_candidate' is a refinement of 'self' if all the bits of 'self' are also in 'refinement_candidate'.
+        self_bitmask = self.bitmask
+        refinement_candidate_bitmask = refinement_candidate.bitmask
+        if self_bitmask == refinement_candidate_bitmask:
             return refinement_of_itself
         else:
-            return self_as_set.issubset(refinement_candidate_as_set)
+            return (self_bitmask & refinement_candidate_bitmask) == self_bitmask
     
     @staticmethod
     def generate_from_str(input_str : str) -> 'Pattern':
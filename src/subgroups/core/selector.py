@@ -8,6 +8,7 @@
 
 from subgroups.core.operator import Operator
 from weakref import WeakValueDictionary
+from heapq import heappush, heappop
 from pandas import Series
 
 # Python annotations.
@@ -21,37 +22,49 @@ class Selector(object):
     :param value: the value.
     """
     
-    __slots__ = ("_attribute_name", "_operator", "_value", "__weakref__")
+    __slots__ = ("_attribute_name", "_operator", "_value", "_id", "_hash", "__weakref__")
     
     # We implement a selector pool using Weak References.
-    _dict_of_selectors : ClassVar[WeakValueDictionary[str, 'Selector']] = WeakValueDictionary()
+    _dict_of_selectors : ClassVar[WeakValueDictionary[tuple, 'Selector']] = WeakValueDictionary()
+    
+    # Each selector receives a dense integer identifier. When a selector is deleted, its identifier is released and reused by the next selector which is created (the smallest released identifier first), so the identifiers are bounded by the maximum number of selectors which exist at the same time.
+    _number_of_selector_ids : ClassVar[int] = 0
+    _released_selector_ids : ClassVar[list[int]] = []
     
     def __new__(cls, attribute_name : str, operator : Operator, value : Union[str, int, float]) -> 'Selector':
         if type(attribute_name) is not str:
             raise TypeError("The type of the parameter 'attribute_name' must be 'str'.")
         if type(operator) is not Operator:
             raise TypeError("The type of the parameter 'operator' must be 'Operator'.")
-        if (type(value) is not str) and (type(value) is not int) and (type(value) is not float):
+        value_type = type(value)
+        if (value_type is not str) and (value_type is not int) and (value_type is not float):
             raise TypeError("The type of the parameter 'value' must be 'str', 'int' or 'float'.")
-        if (type(value) is str) and (operator != Operator.EQUAL) and (operator != Operator.NOT_EQUAL):
+        if (value_type is str) and (operator != Operator.EQUAL) and (operator != Operator.NOT_EQUAL):
             raise ValueError("If the type of the parameter 'value' is 'str', only EQUAL and NOT EQUAL operators are available.")
-        # The key of the dictionary '_dict_of_selectors' will be a string representation of the selector.
-        # For this reason, we must check the value type in order to avoid errors.
-        # - EXAMPLE: The selectors Selector("a", Operator.EQUAL, 23) and Selector("a", Operator.EQUAL, "23") must be different.
-        # In order to solve this problem, we are going to add simple quotes to the values of type str, but not to the values of numeric types.
-        value_for_dictionary_key = value
-        if type(value_for_dictionary_key) is str:
-            value_for_dictionary_key = "\'" + value_for_dictionary_key + "\'"
-        key = attribute_name + " " + str(operator) + " " + str(value_for_dictionary_key)
-        if key in Selector._dict_of_selectors:
-            return Selector._dict_of_selectors[key]
+        # The key of the dictionary '_dict_of_selectors' is a tuple (it is cheaper to build and to hash than a string representation of the selector).
+        # We must include the value type in the key in order to avoid errors.
+        # - EXAMPLE: The selectors Selector("a", Operator.EQUAL, 23) and Selector("a", Operator.EQUAL, 23.0) must be different.
+        # IMPORTANT: NaN is not equal to itself, so we use its string representation in the key.
+        if value != value:
+            key = (attribute_name, operator, value_type, str(value))
+        else:
+            key = (attribute_name, operator, value_type, value)
+        existing_instance = Selector._dict_of_selectors.get(key)
+        if existing_instance is not None:
+            return existing_instance
+        new_instance = super().__new__(cls)
+        new_instance._attribute_name = attribute_name
+        new_instance._operator = operator
+        new_instance._value = value
+        if Selector._released_selector_ids:
+            new_instance._id = heappop(Selector._released_selector_ids)
         else:
-            new_instance = super().__new__(cls)
-            new_instance._attribute_name = attribute_name
-            new_instance._operator = operator
-            new_instance._value = value # In this point, we use the initial value (without the simple quotes).
-            Selector._dict_of_selectors[key] = new_instance
-            return new_instance
+            new_instance._id = Selector._number_of_selector_ids
+            Selector._number_of_selector_ids = Selector._number_of_selector_ids + 1
+        # The hash is computed only once, when the selector is created (the selectors are immutable).
+        new_instance._hash = hash(str(new_instance))
+        Selector._dict_of_selectors[key] = new_instance
+        return new_instance
     
     def _get_attribute_name(self) -> str:
         return self._attribute_name
@@ -62,9 +75,13 @@ class Selector(object):
     def _get_value(self) -> Union[str, int, float]:
         return self._value
     
+    def _get_id(self) -> int:
+        return self._id
+    
     attribute_name = property(_get_attribute_name, None, None, "The attribute name.")
     operator = property(_get_operator, None, None, "The operator between the attribute name and the value.")
     value = property(_get_value, None, None, "The value.")
+    id = property(_get_id, None, None, "The dense integer identifier of the selector. Two selectors which exist at the same time have the same identifier if and only if they are the same object. IMPORTANT: the identifier of a selector is reused after it is deleted, so it must not be stored without the selector.")
     
     def match(self, attribute_name : str, value : Union[str, int, float, Series]) -> Union[bool, Series]:
         """Method to check whether the parameters 'attribute_name' and 'value' match with the selector. In this case, "match" means that the expression ((attribute_name == self.attribute_name) and (value self.operator self.value)) is True. IMPORTANT: if the selector operator is not supported between value and self.value, a TypeError exception is raised.
@@ -106,16 +123,19 @@ class Selector(object):
     def __eq__(self, other : 'Selector') -> bool:
         if not isinstance(other, Selector):
             raise TypeError("You are making a comparison with an object which is not an instance of the 'Selector' class or of a subclass thereof.")
-        return (self._attribute_name == other._attribute_name) and (self._operator == other._operator) and (self._value == other._value)
+        # The selectors with numeric values of different types (e.g., 23 and 23.0) are different objects, but they are equal.
+        return (self is other) or ((self._attribute_name == other._attribute_name) and (self._operator == other._operator) and (type(self._value) is not type(other._value)) and (self._value == other._value))
     
     def __ne__(self, other : 'Selector') -> bool:
         if not isinstance(other, Selector):
             raise TypeError("You are making a comparison with an object which is not an instance of the 'Selector' class or of a subclass thereof.")
-        return (self._attribute_name != other._attribute_name) or (self._operator != other._operator) or (self._value != other._value)
+        return (self is not other) and ((self._attribute_name != other._attribute_name) or (self._operator != other._operator) or (type(self._value) is type(other._value)) or (self._value != other._value))
     
     def __lt__(self, other : 'Selector') -> bool:
         if not isinstance(other, Selector):
             raise TypeError("You are making a comparison with an object which is not an instance of the 'Selector' class or of a subclass thereof.")
+        if (self is other):
+            return False
         if (self._attribute_name != other._attribute_name):
             return self._attribute_name < other._attribute_name
         elif (self._operator != other._operator):
@@ -132,6 +152,8 @@ class Selector(object):
     def __gt__(self, other : 'Selector') -> bool:
         if not isinstance(other, Selector):
             raise TypeError("You are making a comparison with an object which is not an instance of the 'Selector' class or of a subclass thereof.")
+        if (self is other):
+            return False
         if (self._attribute_name != other._attribute_name):
             return self._attribute_name > other._attribute_name
         elif (self._operator != other._operator):
@@ -148,6 +170,8 @@ class Selector(object):
     def __le__(self, other : 'Selector') -> bool:
         if not isinstance(other, Selector):
             raise TypeError("You are making a comparison with an object which is not an instance of the 'Selector' class or of a subclass thereof.")
+        if (self is other):
+            return True
         if (self._attribute_name != other._attribute_name):
             return self._attribute_name <= other._attribute_name
         elif (self._operator != other._operator):
@@ -164,6 +188,8 @@ class Selector(object):
     def __ge__(self, other : 'Selector') -> bool:
         if not isinstance(other, Selector):
             raise TypeError("You are making a comparison with an object which is not an instance of the 'Selector' class or of a subclass thereof.")
+        if (self is other):
+            return True
         if (self._attribute_name != other._attribute_name):
             return self._attribute_name >= other._attribute_name
         elif (self._operator != other._operator):
@@ -188,4 +214,15 @@ class Selector(object):
         return self._attribute_name + " " + str(self._operator) + " " + str(self_value)
     
     def __hash__(self) -> int:
-        return hash(str(self))
+        return self._hash
+    
+    def __del__(self) -> None:
+        # Release the identifier of the selector (during the interpreter shutdown, the class attributes could have been already deleted).
+        try:
+            heappush(Selector._released_selector_ids, self._id)
+        except (AttributeError, TypeError):
+            pass
+    
+    def __reduce__(self) -> tuple:
+        # A selector is unpickled through the selector pool (so, the same selector is not duplicated in the process which unpickles it).
+        return (Selector, (self._attribute_name, self._operator, self._value))
@@ -6,4 +6,13 @@ from subgroups.data_structures.bitset_qfinder import Bitset_QFinder
 from subgroups.data_structures.vertical_list import VerticalList
 from subgroups.data_structures.vertical_list_with_bitsets import VerticalListWithBitsets
 from subgroups.data_structures.vertical_list_with_sets import VerticalListWithSets
+from subgroups.data_structures.vertical_list_with_diffsets import VerticalListWithDiffsets
+from subgroups.data_structures.roaring_bitmap import RoaringBitmap
+from subgroups.data_structures.vertical_list_with_roaring_bitmaps import VerticalListWithRoaringBitmaps
 from subgroups.data_structures.subgroup_list import SubgroupList
+from subgroups.data_structures.refinement_index import RefinementIndex
+from subgroups.data_structures.numeric_attribute_index import NumericAttributeIndex
+from subgroups.data_structures.selector_index import SelectorIndex
+from subgroups.data_structures.encoded_dataset import EncodedDataset
+from subgroups.data_structures.encoded_dataset_cache import EncodedDatasetCache
+from subgroups.data_structures.quality_measure_memo import QualityMeasureMemo
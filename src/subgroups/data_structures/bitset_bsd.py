@@ -10,43 +10,41 @@ from pandas import DataFrame
 from subgroups.core.operator import Operator
 from subgroups.core.selector import Selector
 from subgroups.core.pattern import Pattern
+from subgroups.core.frozen_pattern import FrozenPattern
 from bitarray import bitarray
 
 class BitsetDictionary(dict):
-    """ Internal class to implement the dicttionaries used in the bitset. This dictionary only allows to insert a Pattern or a Selector as key. If a Selector is inserted, it is converted to a Pattern. Each entry must store a bitarray.
+    """ Internal class to implement the dicttionaries used in the bitset. This dictionary only allows to insert a Pattern, a FrozenPattern or a Selector as key. Internally, all the keys are stored as FrozenPatterns (if a Selector is inserted, it is converted to a FrozenPattern with only that selector). Each entry must store a bitarray.
     """
 
     __slots__ = ()
 
+    @staticmethod
+    def _to_key(key) -> FrozenPattern:
+        # Private method to transform a key to a FrozenPattern.
+        if (type(key) is FrozenPattern):
+            return key
+        elif (type(key) is Selector):
+            return FrozenPattern._from_sorted_tuples((key._id,), (key,), 1 << key._id)
+        elif (type(key) is Pattern):
+            return FrozenPattern.from_pattern(key)
+        else:
+            raise TypeError("The key must be a Selector, a Pattern or a FrozenPattern.")
+
     def __iter__(self):
         for key in super().__iter__():
-            yield Pattern.generate_from_str(key)
+            yield key.to_pattern()
 
     def __setitem__(self, key, value) -> None:
         if (type(value) != bitarray):
             raise TypeError("The value must be a bitarray.")
-        if (type(key) is Selector):
-            super().__setitem__(str(Pattern([key])),value)
-        elif (type(key) is Pattern):
-            super().__setitem__(str(key), value)
-        else:
-            raise TypeError("The key must be a Selector or a Pattern.")
+        super().__setitem__(BitsetDictionary._to_key(key), value)
     
     def __getitem__(self, key) -> bitarray:
-        if (type(key) is Selector):
-            return super().__getitem__(str(Pattern([key])))
-        elif (type(key) is Pattern):
-            return super().__getitem__(str(key))
-        else:
-            raise TypeError("The key must be a Selector or a Pattern.")
+        return super().__getitem__(BitsetDictionary._to_key(key))
     
     def __contains__(self, __o: object) -> bool:
-        if (type(__o) is Selector):
-            return super().__contains__(str(Pattern([__o])))
-        elif (type(__o) is Pattern):
-            return super().__contains__(str(__o))
-        else:
-            raise TypeError("The key must be a Selector or a Pattern.")
+        return super().__contains__(BitsetDictionary._to_key(__o))
 
 class BitsetBSD(object):
     """This class represents a bitset used in the BSD algorithm and its variants.
@@ -57,7 +55,7 @@ class BitsetBSD(object):
     def __init__(self):
         """Method to initialize an object of type 'BitsetBSD'.
         """
-        # For each dictionary, the key is a string representation of a pattern and the value is a bitarray that stores for each row whether it follows the pattern.
+        # For each dictionary, the key is a pattern (stored as a FrozenPattern) and the value is a bitarray that stores for each row whether it follows the pattern.
         # As we are using the BitsetDictionary class, we can use Patterns or Selectors as keys.
         self._bitset_pos = BitsetDictionary()
         self._bitset_neg = BitsetDictionary()
@@ -124,9 +122,11 @@ class BitsetBSD(object):
         # Check that each column contains only string values
         for column in columns_without_target:
             # If the column contains only string values
-            if pandas_dataframe[column].apply(lambda x: isinstance(x, str)).all():
+            # (it is enough to check the different values, which also supports categorical attributes).
+            values = pandas_dataframe[column].unique()
+            if all(isinstance(value, str) for value in values):
                 # Add to the list of selectors that column along with its values
-                selectors += [(column, value) for value in pandas_dataframe[column].unique()]
+                selectors += [(column, value) for value in values]
         # Filter the list of selectors to keep only those that are in the set of frequent selectors
         selectors = list(filter(lambda x: Selector(x[0], Operator.EQUAL, x[1]) in set_of_frequent_selectors, selectors))
         # Get the subset of the dataset where the target column has the target value (positive examples)
@@ -183,9 +183,11 @@ class BitsetBSD(object):
         selectors = []
         for column in columns_without_target:
             # If the column contains only string values
-            if pandas_dataframe[column].apply(lambda x: isinstance(x, str)).all():
+            # (it is enough to check the different values, which also supports categorical attributes).
+            values = pandas_dataframe[column].unique()
+            if all(isinstance(value, str) for value in values):
                 # Add to the list of selectors that column along with its values
-                selectors += [(column, value) for value in pandas_dataframe[column].unique()]
+                selectors += [(column, value) for value in values]
         # Get the rows that match the target value
         df_pos = pandas_dataframe[pandas_dataframe[tuple_target_attribute_value[0]] == tuple_target_attribute_value[1]]
         for selector in selectors:
@@ -10,16 +10,20 @@ from pandas import DataFrame
 import statsmodels.api as sm
 import numpy as np
 from subgroups.core.pattern import Pattern
+from subgroups.core.frozen_pattern import FrozenPattern
+from typing import Union
 
 class Bitset_QFinder(object):
     """This class represents a bitset used in the QFinder algorithm.
     """
-    __slots__ = ["_df","_TP", "_FP"]
+    __slots__ = ["_df","_TP", "_FP", "_patterns"]
 
     def __init__(self):
         self._df = DataFrame()
+        # List of the (non-empty) candidate patterns. The i-th pattern corresponds to the i-th column of the bitset.
+        self._patterns = []
 
-    def generate_bitset(self, df : DataFrame, tuple_target_attribute_value: tuple, list_of_candidate_patterns: list[Pattern]) -> None:
+    def generate_bitset(self, df : DataFrame, tuple_target_attribute_value: tuple, list_of_candidate_patterns: list[Union[Pattern, FrozenPattern]]) -> None:
         """This method generates a bitset from a dataset and a list of candidate patterns. Each column of the bitset represents a candidate pattern and each row represents an instance of the dataset. The value of each cell is True if the corresponding pattern appears in the corresponding instance and False otherwise.
 
         :param df: dataset from which the bitset is generated.
@@ -30,6 +34,7 @@ class Bitset_QFinder(object):
         self._FP = len(df) - self._TP
         df_without_target = df.drop(columns=[tuple_target_attribute_value[0]])
         pattern_matches = {}
+        self._patterns = []
         for pattern in list_of_candidate_patterns:
             entry = None
             for selector in pattern:
@@ -39,13 +44,20 @@ class Bitset_QFinder(object):
                     entry = entry & (df_without_target[selector.attribute_name] == selector.value)
             # If the pattern is empty (it does not appear in the dataset), we do not add it to the bitset.
             if entry.sum() != 0:
-                pattern_matches[str(pattern)] = entry
+                # The columns of the bitset are identified by their position (the pattern of each column is stored in 'self._patterns').
+                pattern_matches[len(self._patterns)] = entry
+                self._patterns.append(pattern if type(pattern) is FrozenPattern else FrozenPattern.from_pattern(pattern))
         self._df = DataFrame(pattern_matches)
 
     def get_non_empty_patterns(self) -> list[Pattern]:
         """Method to get the candidate patterns after removing those that do not appear in the dataset.
         """
-        return [Pattern.generate_from_str(pattern_as_str) for pattern_as_str in self._df.columns]
+        return [pattern.to_pattern() for pattern in self._patterns]
+
+    def get_non_empty_frozen_patterns(self) -> list[FrozenPattern]:
+        """Method to get the candidate patterns (as FrozenPatterns) after removing those that do not appear in the dataset.
+        """
+        return self._patterns.copy()
 
     def compute_credibility_measures(self, target_column) -> DataFrame:
         """Method to compute the credibility measures for each candidate pattern.
@@ -64,32 +76,32 @@ class Bitset_QFinder(object):
         absolute_contributions = {}
         contribution_ratios = {}
         # We create models to calculate the odds ratios and p-values for each pattern
-        for pattern in self._df.columns:
-            results = sm.GLM(target_column, self._df[pattern], family=sm.families.Binomial()).fit()
+        for column, pattern in enumerate(self._patterns):
+            results = sm.GLM(target_column, self._df[column], family=sm.families.Binomial()).fit()
             odds_ratios[pattern] = np.exp(results.params.iloc[0])
             p_values[pattern] = results.pvalues.iloc[0]
-            coverages[pattern] = len(self._df[self._df[pattern]])/(self._TP + self._FP)
+            coverages[pattern] = len(self._df[self._df[column]])/(self._TP + self._FP)
         # We calculate the absolute contribution and the contribution ratio for each pattern
-        for pattern_as_str in self._df.columns:
+        for pattern in self._patterns:
             minimum_absolute_contribution = 1
             maximum_absolute_contribution = 0
-            odds_ratio = odds_ratios[pattern_as_str]
-            pattern = Pattern.generate_from_str(pattern_as_str)
+            odds_ratio = odds_ratios[pattern]
             if len(pattern) == 1:
                 minimum_absolute_contribution = 1
                 maximum_absolute_contribution = 1
             else:
                 for selector in pattern:
-                    pattern_without_selector = pattern.copy()
-                    pattern_without_selector.remove_selector(selector)
-                    pattern_without_selector_odds_ratio = odds_ratios[str(pattern_without_selector)]
+                    pattern_without_selector = FrozenPattern([other_selector for other_selector in pattern if other_selector is not selector])
+                    pattern_without_selector_odds_ratio = odds_ratios[pattern_without_selector]
                     minimum_absolute_contribution = min(minimum_absolute_contribution, odds_ratio/pattern_without_selector_odds_ratio)
                     maximum_absolute_contribution = max(maximum_absolute_contribution, odds_ratio/pattern_without_selector_odds_ratio)
-            absolute_contributions[pattern_as_str] = minimum_absolute_contribution
+            absolute_contributions[pattern] = minimum_absolute_contribution
             if minimum_absolute_contribution == 0:
-                contribution_ratios[pattern_as_str] = np.inf
+                contribution_ratios[pattern] = np.inf
             else:
-                contribution_ratios[pattern_as_str] = maximum_absolute_contribution/minimum_absolute_contribution
+                contribution_ratios[pattern] = maximum_absolute_contribution/minimum_absolute_contribution
         # We use the Bonferroni correction for adjusted corrected p-values: each p_value is multiplied by the number of predictors
         adjusted_p_values = {pat : p_values[pat] * len(self._df.columns) for pat in p_values.keys()}
-        return DataFrame({'coverage': coverages, 'odds_ratio': odds_ratios, 'p_value': p_values, 'absolute_contribution': absolute_contributions, 'contribution_ratio': contribution_ratios, 'adjusted_p_value': adjusted_p_values})
\ No newline at end of file
+        # The rows of the resulting DataFrame are identified by the string representation of the patterns.
+        index = [str(pattern) for pattern in self._patterns]
+        return DataFrame({'coverage': list(coverages.values()), 'odds_ratio': list(odds_ratios.values()), 'p_value': list(p_values.values()), 'absolute_contribution': list(absolute_contributions.values()), 'contribution_ratio': list(contribution_ratios.values()), 'adjusted_p_value': list(adjusted_p_values.values())}, index = index)
\ No newline at end of file
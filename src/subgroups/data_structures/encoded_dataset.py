@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+
+# Contributors:
+#    Antonio López Martínez-Carrasco <antoniolopezmc1995@gmail.com>
+
+"""This file contains the implementation of the Encoded Dataset data structure.
+"""
+
+from pandas import DataFrame, Series, Categorical, Index, factorize
+from pandas.api.types import is_string_dtype
+from numpy import ndarray, empty, zeros, concatenate, bincount, argsort, cumsum, arange, uint8, uint16, uint32, int64
+from bitarray import bitarray
+from subgroups.core.operator import Operator
+from subgroups.core.selector import Selector
+from subgroups.exceptions import DatasetAttributeTypeError
+
+# Python annotations.
+from typing import Union
+from collections.abc import Iterator
+
+class EncodedDataset(object):
+    """This class represents an Encoded Dataset: an integer-coded representation of a DataFrame and a target which is built only once and which can be passed to the 'fit' method of all the algorithms (instead of the DataFrame). It contains (1) the matrix of codes (one column per attribute, including the target attribute), (2) the list of the different values of each attribute (i.e., the categories; the code of a value is its position in this list), (3) the table of selectors (one selector 'attribute = value' for each value of each attribute, except the target attribute), (4) the target mask and (5) the true positives and the false positives of each selector.
+
+    The values of each attribute are sorted in the same way as the 'groupby' method of pandas does (i.e., the algorithms generate the selectors in the same order with a DataFrame and with an Encoded Dataset). The missing values (NaN) have the code 'len(categories)', which does not correspond to any selector.
+
+    :param pandas_dataframe: the DataFrame which is encoded. It only supports nominal attributes (i.e., type 'str').
+    :param target: a tuple with 2 elements: the target attribute name and the target value.
+    """
+
+    __slots__ = ("_target", "_attribute_names", "_target_attribute_index", "_categories", "_codes", "_index", "_selectors", "_first_selector_positions", "_target_mask", "_selectors_tp", "_selectors_fp", "_TP", "_FP", "_pandas_dataframe", "_selector_bitmaps")
+
+    def __init__(self, pandas_dataframe : DataFrame, target : tuple[str, str]) -> None:
+        if type(pandas_dataframe) is not DataFrame:
+            raise TypeError("The type of the parameter 'pandas_dataframe' must be 'DataFrame'.")
+        if type(target) is not tuple:
+            raise TypeError("The type of the parameter 'target' must be 'tuple'.")
+        if target[0] not in pandas_dataframe.columns:
+            raise ValueError("The target attribute '" + str(target[0]) + "' is not in the DataFrame.")
+        for column in pandas_dataframe.columns:
+            if not is_string_dtype(pandas_dataframe[column]):
+                raise DatasetAttributeTypeError("Error in attribute '" + str(column) + "'. The Encoded Dataset only supports nominal attributes (i.e., type 'str').")
+        self._target = target
+        self._attribute_names = list(pandas_dataframe.columns)
+        self._target_attribute_index = self._attribute_names.index(target[0])
+        self._index = pandas_dataframe.index
+        # Encode each attribute (the codes of the missing values are -1 in the 'factorize' function of pandas).
+        list_of_codes = []
+        self._categories = []
+        for column in self._attribute_names:
+            codes, uniques = factorize(pandas_dataframe[column], sort = True)
+            uniques = list(uniques)
+            codes[codes == -1] = len(uniques)
+            list_of_codes.append(codes)
+            self._categories.append(uniques)
+        # Matrix of codes (we use the smallest unsigned integer type which can store all the codes, including the code of the missing values).
+        maximum_code = max([len(uniques) for uniques in self._categories], default = 0)
+        dtype = uint8 if maximum_code <= 0xFF else (uint16 if maximum_code <= 0xFFFF else uint32)
+        self._codes = empty((len(pandas_dataframe.index), len(self._attribute_names)), dtype = dtype)
+        for attribute_index, codes in enumerate(list_of_codes):
+            self._codes[:, attribute_index] = codes
+        # Target mask, TP and FP.
+        self._target_mask = (pandas_dataframe[target[0]] == target[1]).to_numpy(dtype = bool)
+        self._TP = int(self._target_mask.sum())
+        self._FP = len(self._target_mask) - self._TP
+        # Table of selectors and true positives and false positives of each selector.
+        self._generate_table_of_selectors()
+        list_of_tp = []
+        list_of_fp = []
+        for attribute_index in range(len(self._attribute_names)):
+            if attribute_index == self._target_attribute_index:
+                continue
+            number_of_values = len(self._categories[attribute_index])
+            n = bincount(self._codes[:, attribute_index], minlength = number_of_values + 1)[:number_of_values]
+            tp = bincount(self._codes[self._target_mask, attribute_index], minlength = number_of_values + 1)[:number_of_values]
+            list_of_tp.append(tp)
+            list_of_fp.append(n - tp)
+        self._selectors_tp = concatenate(list_of_tp).astype(int64) if list_of_tp else zeros(0, dtype = int64)
+        self._selectors_fp = concatenate(list_of_fp).astype(int64) if list_of_fp else zeros(0, dtype = int64)
+        # DataFrame decoded from the codes and bitmaps of the selectors (they are built the first time that they are needed).
+        self._pandas_dataframe = None
+        self._selector_bitmaps = None
+
+    def _generate_table_of_selectors(self) -> None:
+        # Private method to generate the table of selectors and the position of the first selector of each attribute from the categories.
+        self._selectors = []
+        self._first_selector_positions = []
+        for attribute_index, column in enumerate(self._attribute_names):
+            self._first_selector_positions.append(len(self._selectors))
+            if attribute_index != self._target_attribute_index:
+                self._selectors.extend([Selector(column, Operator.EQUAL, value) for value in self._categories[attribute_index]])
+        self._first_selector_positions.append(len(self._selectors))
+
+    @staticmethod
+    def _from_arrays(target : tuple[str, str], attribute_names : list[str], categories : list[list[str]], index : Index, codes : ndarray, target_mask : ndarray, selectors_tp : ndarray, selectors_fp : ndarray, selector_bitmaps : Union[ndarray, None]) -> 'EncodedDataset':
+        # Private method to create an EncodedDataset from its (already computed) arrays without scanning a DataFrame. The arrays are not copied, so they could be memory-mapped.
+        new_encoded_dataset = object.__new__(EncodedDataset)
+        new_encoded_dataset._target = target
+        new_encoded_dataset._attribute_names = attribute_names
+        new_encoded_dataset._target_attribute_index = attribute_names.index(target[0])
+        new_encoded_dataset._categories = categories
+        new_encoded_dataset._index = index
+        new_encoded_dataset._codes = codes
+        new_encoded_dataset._target_mask = target_mask
+        new_encoded_dataset._TP = int(target_mask.sum())
+        new_encoded_dataset._FP = len(target_mask) - new_encoded_dataset._TP
+        new_encoded_dataset._generate_table_of_selectors()
+        new_encoded_dataset._selectors_tp = selectors_tp
+        new_encoded_dataset._selectors_fp = selectors_fp
+        new_encoded_dataset._pandas_dataframe = None
+        new_encoded_dataset._selector_bitmaps = selector_bitmaps
+        return new_encoded_dataset
+
+    def _get_target(self) -> tuple[str, str]:
+        return self._target
+
+    def _get_attribute_names(self) -> list[str]:
+        return self._attribute_names
+
+    def _get_categories(self) -> list[list[str]]:
+        return self._categories
+
+    def _get_codes(self) -> ndarray:
+        return self._codes
+
+    def _get_selectors(self) -> list[Selector]:
+        return self._selectors
+
+    def _get_target_mask(self) -> ndarray:
+        return self._target_mask
+
+    def _get_selectors_tp(self) -> ndarray:
+        return self._selectors_tp
+
+    def _get_selectors_fp(self) -> ndarray:
+        return self._selectors_fp
+
+    def _get_TP(self) -> int:
+        return self._TP
+
+    def _get_FP(self) -> int:
+        return self._FP
+
+    def _get_number_of_rows(self) -> int:
+        return len(self._target_mask)
+
+    def _get_index(self) -> Index:
+        return self._index
+
+    target = property(_get_target, None, None, "The tuple with 2 elements: the target attribute name and the target value.")
+    attribute_names = property(_get_attribute_names, None, None, "The list of attribute names (including the target attribute).")
+    categories = property(_get_categories, None, None, "The list of the different values of each attribute (the code of a value is its position in the corresponding list).")
+    codes = property(_get_codes, None, None, "The matrix of codes (one row per instance and one column per attribute, in the same order as 'attribute_names').")
+    selectors = property(_get_selectors, None, None, "The table of selectors: one selector 'attribute = value' for each value of each attribute (except the target attribute). The position of a selector in this list is its position in the arrays 'selectors_tp' and 'selectors_fp'.")
+    target_mask = property(_get_target_mask, None, None, "The boolean array which indicates whether each instance has the target value.")
+    selectors_tp = property(_get_selectors_tp, None, None, "The array with the true positives of each selector.")
+    selectors_fp = property(_get_selectors_fp, None, None, "The array with the false positives of each selector.")
+    TP = property(_get_TP, None, None, "The true population of the dataset.")
+    FP = property(_get_FP, None, None, "The false population of the dataset.")
+    number_of_rows = property(_get_number_of_rows, None, None, "The number of instances of the dataset.")
+    index = property(_get_index, None, None, "The index of the DataFrame from which the Encoded Dataset was built.")
+
+    def get_selector_positions_of_attribute(self, attribute_name : str) -> range:
+        """Method to get the positions (in the table of selectors) of the selectors of an attribute.
+
+        :param attribute_name: the attribute name.
+        :return: the range of positions of the selectors of the attribute.
+        """
+        attribute_index = self._attribute_names.index(attribute_name)
+        return range(self._first_selector_positions[attribute_index], self._first_selector_positions[attribute_index+1])
+
+    def get_matrix_of_selector_positions(self) -> ndarray:
+        """Method to get, for each instance and for each attribute (except the target attribute), the position (in the table of selectors) of the selector which is satisfied by that instance. The missing values have the position -1.
+
+        :return: a matrix with one row per instance and one column per attribute (except the target attribute).
+        """
+        result = empty((self.number_of_rows, len(self._attribute_names) - 1), dtype = int64)
+        column = 0
+        for attribute_index in range(len(self._attribute_names)):
+            if attribute_index == self._target_attribute_index:
+                continue
+            codes = self._codes[:, attribute_index].astype(int64)
+            result[:, column] = codes + self._first_selector_positions[attribute_index]
+            result[codes == len(self._categories[attribute_index]), column] = -1
+            column = column + 1
+        return result
+
+    def get_selector_bitmaps(self) -> ndarray:
+        """Method to get the bitmaps of all the selectors of the table: a matrix with one row per selector in which the bit i (in the order of the function 'numpy.packbits', i.e., big-endian) is 1 if and only if the instance i satisfies the selector. The bitmaps are built only once, the first time that this method is called.
+
+        :return: a matrix of type 'uint8' with one row per selector and ceil(number_of_rows / 8) columns. IMPORTANT: it must not be modified.
+        """
+        if self._selector_bitmaps is None:
+            number_of_bytes = (self.number_of_rows + 7) // 8
+            self._selector_bitmaps = zeros((len(self._selectors), number_of_bytes), dtype = uint8)
+            flat_selector_bitmaps = self._selector_bitmaps.reshape(-1)
+            for attribute_index in range(len(self._attribute_names)):
+                if attribute_index == self._target_attribute_index:
+                    continue
+                number_of_values = len(self._categories[attribute_index])
+                first_position = self._first_selector_positions[attribute_index]
+                # The bit of each instance is set directly in the row of its selector (i.e., no matrix with one row per value of the attribute is built). The instances are processed by their position in the byte, so that each byte is written at most once in each step.
+                for bit in range(8):
+                    codes = self._codes[bit::8, attribute_index].astype(int64)
+                    byte_positions = arange(len(codes))
+                    not_missing = (codes < number_of_values)
+                    flat_selector_bitmaps[(first_position + codes[not_missing]) * number_of_bytes + byte_positions[not_missing]] |= uint8(0x80 >> bit)
+        return self._selector_bitmaps
+
+    def get_selector_bitarray(self, position : int) -> bitarray:
+        """Method to get the bitarray of the instances which satisfy a selector of the table.
+
+        :param position: the position of the selector in the table of selectors.
+        :return: a new bitarray (big-endian) in which the bit i is 1 if and only if the instance i satisfies the selector.
+        """
+        result = bitarray(endian = "big")
+        result.frombytes(self.get_selector_bitmaps()[position].tobytes())
+        del result[self.number_of_rows:]
+        return result
+
+    def generate_rows_of_selectors(self) -> Iterator[tuple[Selector, ndarray, ndarray]]:
+        """Method to generate, for each selector of the table (in order), the positions of the instances which satisfy it and have the target value and the positions of the instances which satisfy it and do not have the target value.
+
+        :return: an iterator over the tuples (selector, positions of the true positives, positions of the false positives). The positions are sorted.
+        """
+        for attribute_index in range(len(self._attribute_names)):
+            if attribute_index == self._target_attribute_index:
+                continue
+            number_of_values = len(self._categories[attribute_index])
+            codes = self._codes[:, attribute_index]
+            # Positions sorted by code (a stable sort keeps the positions of each code sorted).
+            order = argsort(codes, kind = "stable")
+            boundaries = cumsum(bincount(codes, minlength = number_of_values + 1))
+            start = 0
+            for code in range(number_of_values):
+                positions = order[start:boundaries[code]]
+                mask = self._target_mask[positions]
+                yield (self._selectors[self._first_selector_positions[attribute_index] + code], positions[mask], positions[~mask])
+                start = boundaries[code]
+
+    def to_dataframe(self) -> DataFrame:
+        """Method to get the DataFrame decoded from the matrix of codes. Each attribute is a pandas categorical (i.e., the values are not materialised for each instance). The DataFrame is built only once, the first time that this method is called.
+
+        :return: the decoded DataFrame. IMPORTANT: it must not be modified.
+        """
+        if self._pandas_dataframe is None:
+            columns = {}
+            for attribute_index, column in enumerate(self._attribute_names):
+                codes = self._codes[:, attribute_index].astype(int64)
+                codes[codes == len(self._categories[attribute_index])] = -1
+                columns[column] = Series(Categorical.from_codes(codes, categories = self._categories[attribute_index]), index = self._index, name = column)
+            self._pandas_dataframe = DataFrame(columns, index = self._index)
+        return self._pandas_dataframe
+
+    def check_target(self, target : tuple[str, str]) -> None:
+        """Method to check that the target passed to the 'fit' method of an algorithm is the target of this Encoded Dataset.
+
+        :param target: a tuple with 2 elements: the target attribute name and the target value.
+        """
+        if type(target) is not tuple:
+            raise TypeError("The type of the parameter 'target' must be 'tuple'.")
+        if target != self._target:
+            raise ValueError("The target " + str(target) + " is not the target of the EncodedDataset " + str(self._target) + ".")
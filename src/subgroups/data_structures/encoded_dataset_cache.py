@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+
+# Contributors:
+#    Antonio López Martínez-Carrasco <antoniolopezmc1995@gmail.com>
+
+"""This file contains the implementation of a persistent (on-disk) cache of Encoded Datasets.
+"""
+
+from subgroups.data_structures.encoded_dataset import EncodedDataset
+from pandas import DataFrame, RangeIndex, Index
+from pandas.util import hash_pandas_object
+from numpy import save, load
+from hashlib import sha256
+from tempfile import mkdtemp
+from shutil import rmtree
+import json
+import os
+
+# Python annotations.
+from typing import Union
+
+class EncodedDatasetCache(object):
+    """This class represents a persistent (on-disk) cache of Encoded Datasets. Each Encoded Dataset is stored in a subdirectory whose name is the fingerprint of the DataFrame and the target from which it was built (i.e., a hash of the content of the DataFrame and of the target). The matrix of codes, the target mask and the bitmaps of the selectors are stored in '.npy' files and they are loaded using memory-mapping, so loading an Encoded Dataset does not scan the DataFrame and does not read the whole files. When the size of the cache exceeds the maximum size, the least recently used Encoded Datasets are deleted.
+
+    IMPORTANT: the DataFrames whose index cannot be stored without pickle (i.e., an index of type 'object' whose elements are not str) are encoded, but they are not stored in the cache.
+
+    :param directory_path: the path of the directory of the cache. It is created if it does not exist.
+    :param maximum_size: the maximum size (in bytes) of the cache.
+    """
+
+    __slots__ = ("_directory_path", "_maximum_size")
+
+    # Version of the format of the files. It is part of the fingerprint, so changing it invalidates the previous cache entries.
+    _FORMAT_VERSION = 2
+
+    _METADATA_FILE_NAME = "metadata.json"
+    _ARRAY_FILE_NAMES = ("codes", "target_mask", "selectors_tp", "selectors_fp", "selector_bitmaps")
+    # Arrays which are loaded using memory-mapping (the rest of them are small).
+    _MEMORY_MAPPED_ARRAYS = ("codes", "target_mask", "selector_bitmaps")
+
+    def __init__(self, directory_path : str, maximum_size : int = 1 << 30) -> None:
+        if type(directory_path) is not str:
+            raise TypeError("The type of the parameter 'directory_path' must be 'str'.")
+        if type(maximum_size) is not int:
+            raise TypeError("The type of the parameter 'maximum_size' must be 'int'.")
+        if maximum_size <= 0:
+            raise ValueError("The parameter 'maximum_size' is not greater than 0.")
+        os.makedirs(directory_path, exist_ok = True)
+        self._directory_path = directory_path
+        self._maximum_size = maximum_size
+
+    def _get_directory_path(self) -> str:
+        return self._directory_path
+
+    def _get_maximum_size(self) -> int:
+        return self._maximum_size
+
+    def _get_size(self) -> int:
+        return sum([EncodedDatasetCache._get_entry_size(entry_path) for entry_path in self._get_entry_paths()])
+
+    directory_path = property(_get_directory_path, None, None, "The path of the directory of the cache.")
+    maximum_size = property(_get_maximum_size, None, None, "The maximum size (in bytes) of the cache.")
+    size = property(_get_size, None, None, "The current size (in bytes) of the cache.")
+
+    @staticmethod
+    def fingerprint(pandas_dataframe : DataFrame, target : tuple[str, str]) -> str:
+        """Static method to compute the fingerprint of a DataFrame and a target: a hash of the attribute names, the attribute types, the name of the index, the content (values and index) of the DataFrame and the target.
+
+        :param pandas_dataframe: the DataFrame.
+        :param target: a tuple with 2 elements: the target attribute name and the target value.
+        :return: the fingerprint (a hexadecimal str).
+        """
+        if type(pandas_dataframe) is not DataFrame:
+            raise TypeError("The type of the parameter 'pandas_dataframe' must be 'DataFrame'.")
+        if type(target) is not tuple:
+            raise TypeError("The type of the parameter 'target' must be 'tuple'.")
+        result = sha256()
+        result.update(repr((EncodedDatasetCache._FORMAT_VERSION, [str(column) for column in pandas_dataframe.columns], [str(dtype) for dtype in pandas_dataframe.dtypes], EncodedDatasetCache._index_name_to_metadata(pandas_dataframe.index), target)).encode("utf-8"))
+        result.update(hash_pandas_object(pandas_dataframe, index = True).to_numpy().tobytes())
+        return result.hexdigest()
+
+    def _get_entry_paths(self) -> list[str]:
+        # Private method to get the paths of the cache entries (the temporary directories, which start with '.', are ignored).
+        return [os.path.join(self._directory_path, name) for name in os.listdir(self._directory_path) if (not name.startswith(".")) and os.path.isdir(os.path.join(self._directory_path, name))]
+
+    @staticmethod
+    def _get_entry_size(entry_path : str) -> int:
+        # Private method to get the size (in bytes) of a cache entry.
+        return sum([os.path.getsize(os.path.join(entry_path, name)) for name in os.listdir(entry_path)])
+
+    @staticmethod
+    def _index_name_to_metadata(index : Index) -> Union[str, int, float, None]:
+        # Private method to get the name of the index of the DataFrame as a value which can be stored in JSON (the names of other types are stored as str).
+        if (index.name is None) or (type(index.name) in (str, int, float)):
+            return index.name
+        return str(index.name)
+
+    @staticmethod
+    def _index_to_metadata(index : Index, entry_path : str) -> Union[dict, None]:
+        # Private method to store the index of the DataFrame. It returns the metadata of the index or None if it cannot be stored without pickle.
+        if type(index) is RangeIndex:
+            return {"type" : "range", "start" : index.start, "stop" : index.stop, "step" : index.step, "name" : EncodedDatasetCache._index_name_to_metadata(index)}
+        values = index.to_numpy()
+        if values.dtype.kind == "O":
+            if not all([type(value) is str for value in values]):
+                return None
+            values = values.astype(str)
+        save(os.path.join(entry_path, "index.npy"), values, allow_pickle = False)
+        return {"type" : "values", "name" : EncodedDatasetCache._index_name_to_metadata(index)}
+
+    @staticmethod
+    def _index_from_metadata(metadata : dict, entry_path : str) -> Index:
+        # Private method to load the index of the DataFrame.
+        if metadata["type"] == "range":
+            return RangeIndex(metadata["start"], metadata["stop"], metadata["step"], name = metadata["name"])
+        return Index(load(os.path.join(entry_path, "index.npy"), allow_pickle = False), name = metadata["name"])
+
+    def _store(self, fingerprint : str, encoded_dataset : EncodedDataset) -> bool:
+        # Private method to store an Encoded Dataset in the cache. The files are written in a temporary directory which is renamed at the end, so a partially written entry is never loaded. It returns whether the Encoded Dataset is stored (by this call or by another process at the same time).
+        entry_path = os.path.join(self._directory_path, fingerprint)
+        try:
+            temporary_path = mkdtemp(prefix = ".", dir = self._directory_path)
+        except OSError:
+            return False
+        try:
+            index_metadata = EncodedDatasetCache._index_to_metadata(encoded_dataset.index, temporary_path)
+            if index_metadata is None:
+                rmtree(temporary_path, ignore_errors = True)
+                return False
+            arrays = {"codes" : encoded_dataset.codes, "target_mask" : encoded_dataset.target_mask, "selectors_tp" : encoded_dataset.selectors_tp, "selectors_fp" : encoded_dataset.selectors_fp, "selector_bitmaps" : encoded_dataset.get_selector_bitmaps()}
+            for name in EncodedDatasetCache._ARRAY_FILE_NAMES:
+                save(os.path.join(temporary_path, name + ".npy"), arrays[name], allow_pickle = False)
+            metadata = {"target" : list(encoded_dataset.target), "attribute_names" : encoded_dataset.attribute_names, "categories" : encoded_dataset.categories, "index" : index_metadata}
+            with open(os.path.join(temporary_path, EncodedDatasetCache._METADATA_FILE_NAME), "w", encoding = "utf-8") as metadata_file:
+                json.dump(metadata, metadata_file)
+            os.rename(temporary_path, entry_path)
+        except OSError: # For example, the disk is full or another process has stored the same entry at the same time.
+            rmtree(temporary_path, ignore_errors = True)
+            return os.path.isdir(entry_path)
+        return True
+
+    def _load(self, entry_path : str) -> EncodedDataset:
+        # Private method to load an Encoded Dataset from the cache.
+        with open(os.path.join(entry_path, EncodedDatasetCache._METADATA_FILE_NAME), "r", encoding = "utf-8") as metadata_file:
+            metadata = json.load(metadata_file)
+        arrays = {}
+        for name in EncodedDatasetCache._ARRAY_FILE_NAMES:
+            arrays[name] = load(os.path.join(entry_path, name + ".npy"), mmap_mode = "r" if name in EncodedDatasetCache._MEMORY_MAPPED_ARRAYS else None, allow_pickle = False)
+        index = EncodedDatasetCache._index_from_metadata(metadata["index"], entry_path)
+        return EncodedDataset._from_arrays(tuple(metadata["target"]), metadata["attribute_names"], metadata["categories"], index, arrays["codes"], arrays["target_mask"], arrays["selectors_tp"], arrays["selectors_fp"], arrays["selector_bitmaps"])
+
+    def _evict(self, fingerprint_to_keep : str) -> None:
+        # Private method to delete the least recently used entries (except the entry 'fingerprint_to_keep') until the size of the cache is not greater than the maximum size.
+        entries = [(os.path.getmtime(entry_path), entry_path, EncodedDatasetCache._get_entry_size(entry_path)) for entry_path in self._get_entry_paths()]
+        total_size = sum([entry[2] for entry in entries])
+        entries.sort()
+        for _, entry_path, entry_size in entries:
+            if total_size <= self._maximum_size:
+                break
+            if os.path.basename(entry_path) != fingerprint_to_keep:
+                rmtree(entry_path, ignore_errors = True)
+                total_size = total_size - entry_size
+
+    def is_cached(self, pandas_dataframe : DataFrame, target : tuple[str, str]) -> bool:
+        """Method to check whether the Encoded Dataset of a DataFrame and a target is stored in the cache.
+
+        :param pandas_dataframe: the DataFrame.
+        :param target: a tuple with 2 elements: the target attribute name and the target value.
+        :return: whether the Encoded Dataset is stored in the cache.
+        """
+        return os.path.isdir(os.path.join(self._directory_path, EncodedDatasetCache.fingerprint(pandas_dataframe, target)))
+
+    def get(self, pandas_dataframe : DataFrame, target : tuple[str, str]) -> EncodedDataset:
+        """Method to get the Encoded Dataset of a DataFrame and a target. If it is stored in the cache, it is loaded (using memory-mapping). Otherwise, it is built and stored in the cache (and the least recently used entries are deleted if the maximum size is exceeded).
+
+        :param pandas_dataframe: the DataFrame.
+        :param target: a tuple with 2 elements: the target attribute name and the target value.
+        :return: the Encoded Dataset, which can be passed to the 'fit' method of the algorithms.
+        """
+        fingerprint = EncodedDatasetCache.fingerprint(pandas_dataframe, target)
+        entry_path = os.path.join(self._directory_path, fingerprint)
+        if os.path.isdir(entry_path):
+            # The modification time of the entry is used as its last access time (for the eviction).
+            os.utime(entry_path)
+            return self._load(entry_path)
+        encoded_dataset = EncodedDataset(pandas_dataframe, target)
+        if self._store(fingerprint, encoded_dataset):
+            self._evict(fingerprint)
+        return encoded_dataset
+
+    def clear(self) -> None:
+        """Method to delete all the entries of the cache.
+        """
+        for entry_path in self._get_entry_paths():
+            rmtree(entry_path, ignore_errors = True)
@@ -9,6 +9,7 @@
 from subgroups.data_structures.fp_tree_node import FPTreeNode
 from subgroups.core.selector import Selector
 from subgroups.core.operator import Operator
+from subgroups.data_structures.encoded_dataset import EncodedDataset
 from pandas import DataFrame
 from subgroups.exceptions import InconsistentMethodParametersError
 
@@ -99,18 +100,35 @@ class FPTreeForSDMap(object):
         return result
     
     # IMPORTANT: in the original implementation of the SDMap algorithm (in Vikamine), they check 'n' (true positives + false positives) in order to prune the frequent selectors. In our implementation, we use two threshold types: (1) the true positives (tp) and the false positives (fp) separately or (2) the subgroup description size (n).
-    def generate_set_of_frequent_selectors(self, pandas_dataframe : DataFrame, target : tuple[str, Union[int, float, str]], minimum_tp : Union[int, None] = None, minimum_fp : Union[int, None] = None, minimum_n : Union[int, None] = None) -> dict[str, tuple[Selector, list[int], int]]:
+    def _generate_set_of_frequent_selectors_from_encoded_dataset(self, encoded_dataset : EncodedDataset, minimum_tp : Union[int, None], minimum_fp : Union[int, None], minimum_n : Union[int, None]) -> dict[str, tuple[Selector, list[int], int]]:
+        # Private method equivalent to 'generate_set_of_frequent_selectors', but using the true positives and the false positives of each selector which are precomputed in the EncodedDataset (the table of selectors is sorted in the same way as the result of the 'groupby' method).
+        if (minimum_tp is not None) and (minimum_fp is not None) and (minimum_n is None):
+            frequent = (encoded_dataset.selectors_tp >= minimum_tp) & (encoded_dataset.selectors_fp >= minimum_fp)
+        elif (minimum_tp is None) and (minimum_fp is None) and (minimum_n is not None):
+            frequent = (encoded_dataset.selectors_tp + encoded_dataset.selectors_fp) >= minimum_n
+        else:
+            raise InconsistentMethodParametersError("If 'minimum_tp' and 'minimum_fp' have a value of type 'int', 'minimum_n' must be None; and if 'minimum_n' has a value of type 'int', 'minimum_tp' and 'minimum_fp' must be None.")
+        final_dict_of_frequent_selectors = dict()
+        insertion_order = 0
+        for position in frequent.nonzero()[0]:
+            selector = encoded_dataset.selectors[position]
+            # IMPORTANT: we use 'repr' in order to add simple quotes to the values of type str, but not to the values of numeric types.
+            final_dict_of_frequent_selectors[selector.attribute_name+repr(selector.value)] = (selector, [ int(encoded_dataset.selectors_tp[position]), int(encoded_dataset.selectors_fp[position]) ], insertion_order)
+            insertion_order = insertion_order + 1
+        return final_dict_of_frequent_selectors
+
+    def generate_set_of_frequent_selectors(self, pandas_dataframe : Union[DataFrame, EncodedDataset], target : tuple[str, Union[int, float, str]], minimum_tp : Union[int, None] = None, minimum_fp : Union[int, None] = None, minimum_n : Union[int, None] = None) -> dict[str, tuple[Selector, list[int], int]]:
         """Method to scan the pandas DataFrame in order to generate the set of frequent selectors. Two threshold types could be used: (1) the true positives tp and the false positives fp separately or (2) the subgroup description size n (n = tp + fp). This means that: (1) if 'minimum_tp' and 'minimum_fp' have a value of type 'int', 'minimum_n' must be None; and (2) if 'minimum_n' has a value of type 'int', 'minimum_tp' and 'minimum_fp' must be None. IMPORTANT: missing values are not supported yet.
         
-        :param pandas_dataframe: the DataFrame which is scanned. IMPORTANT: missing values are not supported yet.
+        :param pandas_dataframe: the DataFrame which is scanned (or an EncodedDataset built from it with the same target). IMPORTANT: missing values are not supported yet.
         :param target: a tuple with 2 elements: the target attribute name and the target value.
         :param minimum_tp: the minimum true positives (tp) threshold.
         :param minimum_fp: the minimum false positives (fp) threshold.
         :param minimum_n: the minimum subgroup description size (n) threshold.
         :return: a dictionary in which the keys are strings (the concatenation of the selector attribute name and the selector value) and the values are tuples with 3 elements: (1) the selector, (2) a list with 2 elements: the true positives tp of it and the false positives fp of it, and (3) a number indicating the insertion order in this dictionary (starting from 0).
         """
-        if type(pandas_dataframe) is not DataFrame:
-            raise TypeError("The type of the parameter 'pandas_dataframe' must be 'DataFrame'.")
+        if (type(pandas_dataframe) is not DataFrame) and (type(pandas_dataframe) is not EncodedDataset):
+            raise TypeError("The type of the parameter 'pandas_dataframe' must be 'DataFrame' or 'EncodedDataset'.")
         if type(target) is not tuple:
             raise TypeError("The type of the parameter 'target' must be 'tuple'.")
         if (type(minimum_tp) is not int) and (minimum_tp is not None):
@@ -119,6 +137,9 @@ class FPTreeForSDMap(object):
             raise TypeError("The type of the parameter 'minimum_fp' must be 'int' or 'NoneType'.")
         if (type(minimum_n) is not int) and (minimum_n is not None):
             raise TypeError("The type of the parameter 'minimum_n' must be 'int' or 'NoneType'.")
+        if type(pandas_dataframe) is EncodedDataset:
+            pandas_dataframe.check_target(target)
+            return self._generate_set_of_frequent_selectors_from_encoded_dataset(pandas_dataframe, minimum_tp, minimum_fp, minimum_n)
         # Depending on the values of the parameters 'minimum_tp', 'minimum_fp' and 'minimum_n' ...
         if (minimum_tp is not None) and (minimum_fp is not None) and (minimum_n is None):
             # Get the target column as a mask: True if the value is equal to the target value and False otherwise.
@@ -225,40 +246,61 @@ class FPTreeForSDMap(object):
                 # Go down in the tree (the current node will be the current parent node in the next iteration).
                 current_parent_node = new_fptreenode
     
-    def build_tree(self, pandas_dataframe : DataFrame, set_of_frequent_selectors : dict[str, tuple[Selector, list[int], int]], target : tuple[str, Union[int, float, str]]) -> None:
+    def _build_tree_from_encoded_dataset(self, encoded_dataset : EncodedDataset, set_of_frequent_selectors : dict[str, tuple[Selector, list[int], int]]) -> None:
+        # Private method equivalent to the loop of the method 'build_tree', but reading the selectors of each instance from the matrix of codes of the EncodedDataset (instead of accessing to each cell of the DataFrame).
+        # For each position in the table of selectors: the sorting key (-n, insertion order) and the selector if it is frequent or None otherwise.
+        frequent_selectors_by_position = [None] * len(encoded_dataset.selectors)
+        for position, selector in enumerate(encoded_dataset.selectors):
+            # IMPORTANT: we use 'repr' in order to add simple quotes to the values of type str, but not to the values of numeric types.
+            frequent_selector = set_of_frequent_selectors.get(selector.attribute_name+repr(selector.value))
+            if frequent_selector is not None:
+                frequent_selectors_by_position[position] = ((-(frequent_selector[1][0]+frequent_selector[1][1]), frequent_selector[2]), frequent_selector[0])
+        target_mask = encoded_dataset.target_mask
+        for row, selector_positions in enumerate(encoded_dataset.get_matrix_of_selector_positions().tolist()):
+            selectors_in_the_current_row = [frequent_selectors_by_position[position] for position in selector_positions if (position >= 0) and (frequent_selectors_by_position[position] is not None)]
+            # Same order as in the method 'build_tree': 'n' (descending) and, in case of tie, the insertion order in the set of frequent selectors.
+            selectors_in_the_current_row.sort(key = lambda x : x[0])
+            # Insert.
+            self._insert_tree([x[1] for x in selectors_in_the_current_row], self._root_node, bool(target_mask[row]))
+
+    def build_tree(self, pandas_dataframe : Union[DataFrame, EncodedDataset], set_of_frequent_selectors : dict[str, tuple[Selector, list[int], int]], target : tuple[str, Union[int, float, str]]) -> None:
         """Method to build the complete FPTree from a pandas DataFrame and using the set of frequent selectors. IMPORTANT: missing values are not supported yet.
         
-        :param pandas_dataframe: the DataFrame which is scanned. IMPORTANT: missing values are not supported yet.
+        :param pandas_dataframe: the DataFrame which is scanned (or an EncodedDataset built from it with the same target). IMPORTANT: missing values are not supported yet.
         :param set_of_frequent_selectors: the set of frequent selectors generated by the method 'generate_set_of_frequent_selectors'.
         :param target: a tuple with 2 elements: the target attribute name and the target value.
         """
-        if type(pandas_dataframe) is not DataFrame:
-            raise TypeError("The type of the parameter 'pandas_dataframe' must be 'DataFrame'.")
+        if (type(pandas_dataframe) is not DataFrame) and (type(pandas_dataframe) is not EncodedDataset):
+            raise TypeError("The type of the parameter 'pandas_dataframe' must be 'DataFrame' or 'EncodedDataset'.")
         if type(set_of_frequent_selectors) is not dict:
             raise TypeError("The type of the parameter 'set_of_frequent_selectors' must be 'dict'.")
         if type(target) is not tuple:
             raise TypeError("The type of the parameter 'target' must be 'tuple'.")
-        # Iterate through the rows by index.
-        for row in pandas_dataframe.index:
-            target_value_in_the_current_row = pandas_dataframe.loc[row, target[0]]
-            selectors_in_the_current_row = []
-            # Iterate through the columns (except the target).
-            for column in pandas_dataframe.columns.drop(target[0]):
-                current_element = pandas_dataframe.loc[row, column]
-                # Add the corresponding selector from 'set_of_frequent_selectors' to 'selectors_in_the_current_row'.
-                # ===> IMPORTANT: the selector might not exist because it was pruned. In this case, a KeyError exception is raised.
-                try:
-                    # IMPORTANT: we use 'repr' in order to add simple quotes to the values of type str, but not to the values of numeric types.
-                    selectors_in_the_current_row.append( set_of_frequent_selectors[column+repr(current_element)][0] )
-                except KeyError:
-                    pass # If the exception is raised, we do nothing.
-            # We sort 'selectors_in_the_current_row' according to the value of 'n' (tp+fp) in the set of frequent selectors (CRITERION EXTRACTED FROM VIKAMINE).
-            # - In case of tie, we NEED TO MAINTAIN the order of the selectors according to the order in the set of frequent selectors. For this reason, it is necessary to sort twice.
-            # IMPORTANT: we use 'repr' in order to add simple quotes to the values of type str, but not to the values of numeric types.
-            selectors_in_the_current_row = sorted(selectors_in_the_current_row, key = lambda x : set_of_frequent_selectors[x.attribute_name+repr(x.value)][2], reverse=False) # key -> [2] : the insertion order in the dictionary.
-            selectors_in_the_current_row = sorted(selectors_in_the_current_row, key = lambda x : (set_of_frequent_selectors[x.attribute_name+repr(x.value)][1][0]+set_of_frequent_selectors[x.attribute_name+repr(x.value)][1][1]), reverse=True) # key -> 'n' : sum of tp and fp.
-            # Insert.
-            self._insert_tree(selectors_in_the_current_row, self._root_node, (target_value_in_the_current_row == target[1]))
+        if type(pandas_dataframe) is EncodedDataset:
+            pandas_dataframe.check_target(target)
+            self._build_tree_from_encoded_dataset(pandas_dataframe, set_of_frequent_selectors)
+        else:
+            # Iterate through the rows by index.
+            for row in pandas_dataframe.index:
+                target_value_in_the_current_row = pandas_dataframe.loc[row, target[0]]
+                selectors_in_the_current_row = []
+                # Iterate through the columns (except the target).
+                for column in pandas_dataframe.columns.drop(target[0]):
+                    current_element = pandas_dataframe.loc[row, column]
+                    # Add the corresponding selector from 'set_of_frequent_selectors' to 'selectors_in_the_current_row'.
+                    # ===> IMPORTANT: the selector might not exist because it was pruned. In this case, a KeyError exception is raised.
+                    try:
+                        # IMPORTANT: we use 'repr' in order to add simple quotes to the values of type str, but not to the values of numeric types.
+                        selectors_in_the_current_row.append( set_of_frequent_selectors[column+repr(current_element)][0] )
+                    except KeyError:
+                        pass # If the exception is raised, we do nothing.
+                # We sort 'selectors_in_the_current_row' according to the value of 'n' (tp+fp) in the set of frequent selectors (CRITERION EXTRACTED FROM VIKAMINE).
+                # - In case of tie, we NEED TO MAINTAIN the order of the selectors according to the order in the set of frequent selectors. For this reason, it is necessary to sort twice.
+                # IMPORTANT: we use 'repr' in order to add simple quotes to the values of type str, but not to the values of numeric types.
+                selectors_in_the_current_row = sorted(selectors_in_the_current_row, key = lambda x : set_of_frequent_selectors[x.attribute_name+repr(x.value)][2], reverse=False) # key -> [2] : the insertion order in the dictionary.
+                selectors_in_the_current_row = sorted(selectors_in_the_current_row, key = lambda x : (set_of_frequent_selectors[x.attribute_name+repr(x.value)][1][0]+set_of_frequent_selectors[x.attribute_name+repr(x.value)][1][1]), reverse=True) # key -> 'n' : sum of tp and fp.
+                # Insert.
+                self._insert_tree(selectors_in_the_current_row, self._root_node, (target_value_in_the_current_row == target[1]))
         # Finally, we create the sorted header table.
         self._sorted_header_table = []
         for key in self._header_table:
@@ -12,7 +12,7 @@ from subgroups.data_structures.fp_tree_for_sdmap import FPTreeForSDMap
 from subgroups.quality_measures.quality_measure import QualityMeasure
 
 # Python annotations.
-from typing import Union
+from typing import Union, Callable
 
 class FPTreeForSDMapStar(FPTreeForSDMap):
     """This class represents the FPTree data structure used in the SDMapStar algorithm.
@@ -34,12 +34,12 @@ class FPTreeForSDMapStar(FPTreeForSDMap):
         self._TP = TP
         self._FP = FP
 
-    def generate_conditional_fp_tree_star(self, list_of_selectors: list[Selector], min_optimistic_estimate:int, optimistic_estimate : QualityMeasure , additional_parameters : dict = dict() , minimum_tp: Union[int, None] = None, minimum_fp: Union[int, None] = None, minimum_n: Union[int, None] = None, ) -> tuple['FPTreeForSDMapStar',int]:
+    def generate_conditional_fp_tree_star(self, list_of_selectors: list[Selector], min_optimistic_estimate:int, optimistic_estimate : Union[QualityMeasure, Callable[[int, int], float]] , additional_parameters : dict = dict() , minimum_tp: Union[int, None] = None, minimum_fp: Union[int, None] = None, minimum_n: Union[int, None] = None, ) -> tuple['FPTreeForSDMapStar',int]:
         """Method to get the conditional FPTree with a list of selectors. Two threshold types could be used: (1) the true positives tp and the false positives fp separately or (2) the subgroup description size n (n = tp + fp). This means that: (1) if 'minimum_tp' and 'minimum_fp' have a value of type 'int', 'minimum_n' must be None; and (2) if 'minimum_n' has a value of type 'int', 'minimum_tp' and 'minimum_fp' must be None.
         
         :param list_of_selectors: the list of selectors which is used. IMPORTANT: we assume that the list of selectors only contains selectors.
         :param min_optimistic_estimate: the minimum optimistic estimate threshold.
-        :param optimistic_estimate: the optimistic estimate quality measure.
+        :param optimistic_estimate: the optimistic estimate quality measure, or a bound optimistic estimate (i.e., the function returned by the method 'bind' of a quality measure), in which case 'additional_parameters' is not used.
         :param additional_parameters: the additional parameters for the optimistic estimate quality measure.
         :param minimum_tp: the minimum true positives (tp) threshold.
         :param minimum_fp: the minimum false positives (fp) threshold.
@@ -82,9 +82,10 @@ class FPTreeForSDMapStar(FPTreeForSDMap):
             # Calculate the optimistic estimate.
             current_node_tp = current_node_in_the_horizontal_list.counters[0]
             current_node_fp = current_node_in_the_horizontal_list.counters[1]
-            dict_of_parameters = {QualityMeasure.TRUE_POSITIVES : current_node_tp, QualityMeasure.FALSE_POSITIVES : current_node_fp, QualityMeasure.TRUE_POPULATION : self._TP, QualityMeasure.FALSE_POPULATION : self._FP}
-            dict_of_parameters.update(additional_parameters)
-            oe = optimistic_estimate.compute(dict_of_parameters)
+            if isinstance(optimistic_estimate, QualityMeasure):
+                oe = optimistic_estimate.compute_counts(current_node_tp, current_node_fp, self._TP, self._FP, additional_parameters)
+            else: # Bound optimistic estimate.
+                oe = optimistic_estimate(current_node_tp, current_node_fp)
             if oe < min_optimistic_estimate:
                 current_node_in_the_horizontal_list = current_node_in_the_horizontal_list._node_link
                 pruned_branches = pruned_branches + 1 # We increase the number of pruned branches.
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+
+# Contributors:
+#    Antonio López Martínez-Carrasco <antoniolopezmc1995@gmail.com>
+
+"""This file contains the implementation of the Numeric Attribute Index data structure.
+"""
+
+from pandas import Series
+from pandas.api.types import is_numeric_dtype, is_integer_dtype, is_bool_dtype
+from numpy import argsort, flatnonzero, isnan, unique, searchsorted, zeros, linspace, float64, int64, nan
+from bitarray import bitarray
+from bisect import bisect_left
+from subgroups.core.operator import Operator
+from subgroups.exceptions import DatasetAttributeTypeError
+
+# Python annotations.
+from typing import Union
+
+class NumericAttributeIndex(object):
+    """This class represents a Numeric Attribute Index: an index over a numeric attribute (i.e., a pandas Series) which allows to obtain the bitarray of the rows that satisfy a threshold condition (e.g., 'attribute <= 25') without scanning the attribute. The index stores the order of the rows sorted by their values (argsort) and, for each cut point, the cumulative bitarray of the rows whose value is less than or equal to that cut point. In this way, the bitarray of a threshold condition whose value is a cut point is obtained in constant time (any other value is also supported, but its cumulative bitarray is built and stored the first time that it is needed).
+
+    IMPORTANT: the missing values (NaN) do not satisfy the operators EQUAL, LESS, GREATER, LESS_OR_EQUAL and GREATER_OR_EQUAL, and they satisfy the operator NOT_EQUAL (i.e., the same behavior as the comparisons of pandas).
+
+    :param pandas_Series: the numeric attribute which is indexed.
+    :param cut_points: the values for which the cumulative bitarrays are built in the construction of the index. If None, all the different values of the attribute are used (if there are more than 'maximum_number_of_cut_points' different values, equal-frequency cut points are used instead).
+    :param maximum_number_of_cut_points: the maximum number of cut points used when the parameter 'cut_points' is None.
+    """
+
+    __slots__ = ("_number_of_rows", "_order", "_sorted_values", "_not_missing", "_cumulative_bitarrays", "_cut_points")
+
+    def __init__(self, pandas_Series : Series, cut_points : Union[list[Union[int, float]], None] = None, maximum_number_of_cut_points : int = 256) -> None:
+        if type(pandas_Series) is not Series:
+            raise TypeError("The type of the parameter 'pandas_Series' must be 'pandas.Series'.")
+        if (cut_points is not None) and (type(cut_points) is not list):
+            raise TypeError("The type of the parameter 'cut_points' must be 'list' or 'NoneType'.")
+        if type(maximum_number_of_cut_points) is not int:
+            raise TypeError("The type of the parameter 'maximum_number_of_cut_points' must be 'int'.")
+        if maximum_number_of_cut_points <= 0:
+            raise ValueError("The parameter 'maximum_number_of_cut_points' is not greater than 0.")
+        if (not is_numeric_dtype(pandas_Series)) or is_bool_dtype(pandas_Series):
+            raise DatasetAttributeTypeError("The attribute '" + str(pandas_Series.name) + "' is not numeric.")
+        self._number_of_rows = len(pandas_Series)
+        if is_integer_dtype(pandas_Series) and (not pandas_Series.hasnans):
+            values = pandas_Series.to_numpy(dtype = int64)
+            not_missing_positions = None
+        else:
+            values = pandas_Series.to_numpy(dtype = float64, na_value = nan)
+            not_missing_positions = flatnonzero(~isnan(values))
+        # Bitarray of the rows without missing values and positions of the rows (without missing values) sorted by their values.
+        if not_missing_positions is None:
+            self._not_missing = bitarray(self._number_of_rows, endian = "big")
+            self._not_missing.setall(1)
+            self._order = argsort(values, kind = "stable")
+        else:
+            mask = zeros(self._number_of_rows, dtype = bool)
+            mask[not_missing_positions] = True
+            self._not_missing = bitarray(endian = "big")
+            self._not_missing.pack(mask.tobytes())
+            self._order = not_missing_positions[argsort(values[not_missing_positions], kind = "stable")]
+        self._sorted_values = values[self._order]
+        # Dictionary prefix length k -> bitarray of the rows in the first k positions of 'self._order' (i.e., the k rows with the lowest values).
+        self._cumulative_bitarrays = {}
+        # Compute the cut points.
+        if cut_points is None:
+            different_values = unique(self._sorted_values)
+            if len(different_values) <= maximum_number_of_cut_points:
+                cut_points = different_values.tolist()
+            else:
+                positions = linspace(0, len(self._sorted_values) - 1, maximum_number_of_cut_points).astype(int64)
+                cut_points = unique(self._sorted_values[positions]).tolist()
+        else:
+            cut_points = sorted(cut_points)
+        self._cut_points = cut_points
+        # Build the cumulative bitarrays of the cut points. Since the cut points are sorted, each bitarray is built from the previous one.
+        mask = zeros(self._number_of_rows, dtype = bool)
+        previous_prefix_length = 0
+        for cut_point in cut_points:
+            prefix_length = int(searchsorted(self._sorted_values, cut_point, side = "right"))
+            if prefix_length not in self._cumulative_bitarrays:
+                mask[self._order[previous_prefix_length:prefix_length]] = True
+                cumulative_bitarray = bitarray(endian = "big")
+                cumulative_bitarray.pack(mask.tobytes())
+                self._cumulative_bitarrays[prefix_length] = cumulative_bitarray
+                previous_prefix_length = prefix_length
+
+    def _get_number_of_rows(self) -> int:
+        return self._number_of_rows
+
+    def _get_cut_points(self) -> list[Union[int, float]]:
+        return self._cut_points
+
+    number_of_rows = property(_get_number_of_rows, None, None, "The number of rows of the attribute which is indexed.")
+    cut_points = property(_get_cut_points, None, None, "The cut points for which the cumulative bitarrays were built in the construction of the index.")
+
+    def _get_cumulative_bitarray(self, prefix_length : int) -> bitarray:
+        # Private method to get the bitarray of the 'prefix_length' rows with the lowest values. IMPORTANT: the returned bitarray must not be modified.
+        result = self._cumulative_bitarrays.get(prefix_length)
+        if result is None:
+            # We start from the nearest stored cumulative bitarray with a shorter prefix.
+            stored_prefix_lengths = sorted(self._cumulative_bitarrays)
+            index = bisect_left(stored_prefix_lengths, prefix_length)
+            start = 0 if index == 0 else stored_prefix_lengths[index-1]
+            mask = zeros(self._number_of_rows, dtype = bool)
+            mask[self._order[start:prefix_length]] = True
+            result = bitarray(endian = "big")
+            result.pack(mask.tobytes())
+            if index > 0:
+                result |= self._cumulative_bitarrays[start]
+            self._cumulative_bitarrays[prefix_length] = result
+        return result
+
+    def get_bitarray(self, operator : Operator, value : Union[int, float]) -> bitarray:
+        """Method to get the bitarray of the rows that satisfy the condition (attribute operator value).
+
+        :param operator: the operator.
+        :param value: the value. It must be of type 'int' or 'float'.
+        :return: a new bitarray of the rows that satisfy the condition.
+        """
+        if type(operator) is not Operator:
+            raise TypeError("The type of the parameter 'operator' must be 'Operator'.")
+        if (type(value) is not int) and (type(value) is not float):
+            raise TypeError("The type of the parameter 'value' must be 'int' or 'float'.")
+        if value != value: # NaN value: no condition is satisfied (except NOT_EQUAL).
+            result = bitarray(self._number_of_rows, endian = "big")
+            result.setall(operator == Operator.NOT_EQUAL)
+            return result
+        # Number of rows whose value is less than 'value' and less than or equal to 'value', respectively.
+        number_of_rows_less = int(searchsorted(self._sorted_values, value, side = "left"))
+        number_of_rows_less_or_equal = int(searchsorted(self._sorted_values, value, side = "right"))
+        if operator == Operator.LESS:
+            return self._get_cumulative_bitarray(number_of_rows_less).copy()
+        elif operator == Operator.LESS_OR_EQUAL:
+            return self._get_cumulative_bitarray(number_of_rows_less_or_equal).copy()
+        elif operator == Operator.GREATER:
+            return self._not_missing & ~self._get_cumulative_bitarray(number_of_rows_less_or_equal)
+        elif operator == Operator.GREATER_OR_EQUAL:
+            return self._not_missing & ~self._get_cumulative_bitarray(number_of_rows_less)
+        elif operator == Operator.EQUAL:
+            return self._get_cumulative_bitarray(number_of_rows_less_or_equal) & ~self._get_cumulative_bitarray(number_of_rows_less)
+        else: # Operator.NOT_EQUAL
+            return ~(self._get_cumulative_bitarray(number_of_rows_less_or_equal) & ~self._get_cumulative_bitarray(number_of_rows_less))
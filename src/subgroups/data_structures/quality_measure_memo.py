@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+# Contributors:
+#    Antonio López Martínez-Carrasco <antoniolopezmc1995@gmail.com>
+
+"""This file contains the implementation of the Quality Measure Memo data structure.
+"""
+
+from collections import OrderedDict
+from numbers import Integral
+from numpy import full, isnan, count_nonzero, float64, nan
+
+# Python annotations.
+from typing import Union, Callable
+
+class QualityMeasureMemo(object):
+    """This class represents a Quality Measure Memo: a bounded memoization table of the values of a bound quality measure (i.e., the function returned by the method 'bind' of a quality measure), whose key is the pair of subgroup parameters (tp, fp). It is used by the algorithms in which many nodes of the search space have the same subgroup parameters tp and fp (e.g., small datasets with many redundant refinements). If (TP + 1) * (FP + 1) is not greater than 'maximum_dense_size', the table is dense (i.e., a numpy array of float64 values with an entry for each possible pair (tp, fp), which is allocated when the first value is stored and in which NaN means that the value has not been computed yet). Otherwise, the table is a python dictionary with, at most, 'maximum_size' entries, in which the least recently used entry is deleted when it is full.
+
+    IMPORTANT: in the dense table, tp and fp must be int values between 0 and TP and between 0 and FP, respectively. In addition, the values of the dense table are returned as float values and a NaN value of the bound quality measure is not memoized (i.e., it is computed again every time).
+
+    :param bound_quality_measure: the bound quality measure whose values are memoized.
+    :param TP: the true population TP of the dataset.
+    :param FP: the false population FP of the dataset.
+    :param maximum_dense_size: the maximum number of entries of the dense table.
+    :param maximum_size: the maximum number of entries of the dictionary (only used when the table is not dense).
+    """
+
+    __slots__ = ("_bound_quality_measure", "_row_length", "_dense_table_length", "_dense_table", "_table", "_maximum_size", "_hits", "_misses")
+
+    def __init__(self, bound_quality_measure : Callable[[Union[int, float], Union[int, float]], float], TP : Union[int, float], FP : Union[int, float], maximum_dense_size : int = 1 << 20, maximum_size : int = 1 << 16) -> None:
+        if not callable(bound_quality_measure):
+            raise TypeError("The parameter 'bound_quality_measure' must be callable.")
+        if (not isinstance(TP, (int, float, Integral))) or (not isinstance(FP, (int, float, Integral))):
+            raise TypeError("The type of the parameters 'TP' and 'FP' must be 'int' or 'float'.")
+        if type(maximum_dense_size) is not int:
+            raise TypeError("The type of the parameter 'maximum_dense_size' must be 'int'.")
+        if type(maximum_size) is not int:
+            raise TypeError("The type of the parameter 'maximum_size' must be 'int'.")
+        if maximum_size <= 0:
+            raise ValueError("The parameter 'maximum_size' is not greater than 0.")
+        self._bound_quality_measure = bound_quality_measure
+        self._maximum_size = maximum_size
+        self._hits = 0
+        self._misses = 0
+        if isinstance(TP, Integral) and isinstance(FP, Integral) and (TP >= 0) and (FP >= 0) and ((int(TP) + 1) * (int(FP) + 1) <= maximum_dense_size):
+            # Dense table: the value of (tp, fp) is in the position tp * (FP + 1) + fp (NaN if it has not been computed yet). It is allocated when the first value is stored.
+            self._row_length = int(FP) + 1
+            self._dense_table_length = (int(TP) + 1) * self._row_length
+            self._dense_table = None
+            self._table = None
+        else:
+            self._row_length = 0
+            self._dense_table_length = 0
+            self._dense_table = None
+            self._table = OrderedDict()
+
+    def _get_hits(self) -> int:
+        return self._hits
+
+    def _get_misses(self) -> int:
+        return self._misses
+
+    def _get_is_dense(self) -> bool:
+        return self._table is None
+
+    def _get_size(self) -> int:
+        if self._table is None:
+            if self._dense_table is None:
+                return 0
+            return self._dense_table_length - int(count_nonzero(isnan(self._dense_table)))
+        return len(self._table)
+
+    hits = property(_get_hits, None, None, "The number of values which were obtained from the table.")
+    misses = property(_get_misses, None, None, "The number of values which were computed (and stored in the table).")
+    is_dense = property(_get_is_dense, None, None, "Whether the table is dense (i.e., a numpy array with an entry for each possible pair (tp, fp)).")
+    size = property(_get_size, None, None, "The number of values stored in the table.")
+
+    def __call__(self, tp : Union[int, float], fp : Union[int, float]) -> float:
+        """Method to get the value of the bound quality measure for the subgroup parameters tp and fp. It is computed only if it is not stored in the table.
+
+        :param tp: the true positives tp of the subgroup.
+        :param fp: the false positives fp of the subgroup.
+        :return: the value of the bound quality measure.
+        """
+        if self._table is None:
+            position = tp * self._row_length + fp
+            if self._dense_table is not None:
+                value = self._dense_table[position]
+                if value == value: # It is not NaN.
+                    self._hits = self._hits + 1
+                    return float(value)
+            self._misses = self._misses + 1
+            value = self._bound_quality_measure(tp, fp)
+            if self._dense_table is None:
+                self._dense_table = full(self._dense_table_length, nan, dtype = float64)
+            self._dense_table[position] = value
+            return value
+        key = (tp, fp)
+        value = self._table.get(key)
+        if value is None:
+            self._misses = self._misses + 1
+            value = self._bound_quality_measure(tp, fp)
+            self._table[key] = value
+            if len(self._table) > self._maximum_size:
+                # Delete the least recently used entry.
+                self._table.popitem(last = False)
+        else:
+            self._hits = self._hits + 1
+            self._table.move_to_end(key)
+        return value
+
+    def clear(self) -> None:
+        """Method to delete all the values stored in the table and to reset the counters of hits and misses.
+        """
+        if self._table is None:
+            # The dense table is allocated again when the next value is stored.
+            self._dense_table = None
+        else:
+            self._table.clear()
+        self._hits = 0
+        self._misses = 0
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+
+# Contributors:
+#    Antonio López Martínez-Carrasco <antoniolopezmc1995@gmail.com>
+
+"""This file contains the implementation of the Refinement Index data structure.
+"""
+
+from subgroups.core.pattern import Pattern
+from subgroups.core.frozen_pattern import FrozenPattern
+from bitarray import bitarray
+
+# Python annotations.
+from typing import Union
+
+class RefinementIndex(object):
+    """This class represents a Refinement Index: an inverted index (selector -> bitarray of candidate positions) over a list of candidate patterns, which allows to obtain all the refinements or all the generalizations of a pattern among the candidates without comparing it with each candidate. The candidates are identified by their position in the list passed by parameter and they can be removed from the index.
+
+    :param list_of_patterns: the list of candidate patterns. IMPORTANT: we assume that the list only contains patterns (i.e., instances of 'Pattern' or of 'FrozenPattern').
+    """
+
+    __slots__ = ("_local_ids", "_bitmasks", "_postings", "_empty_patterns", "_alive")
+
+    # Auxiliary bitarray used to search the positions of the bits set to 1.
+    _ONE = bitarray("1")
+
+    def __init__(self, list_of_patterns : list[Union[Pattern, FrozenPattern]]) -> None:
+        if type(list_of_patterns) is not list:
+            raise TypeError("The type of the parameter 'list_of_patterns' must be 'list'.")
+        number_of_patterns = len(list_of_patterns)
+        # Dictionary selector -> identifier of the selector in this index. The bitmasks of the index are built with these identifiers (and not with the global identifiers of the selectors), so their size only depends on the number of different selectors in the candidates. Moreover, the selectors are kept alive by this dictionary, so their identifiers are never reused while the index exists.
+        self._local_ids = {}
+        # Bitmask of each candidate pattern (with the local identifiers).
+        self._bitmasks = []
+        # List (indexed by local identifier) of bitarrays of the positions of the candidates which contain each selector.
+        self._postings = []
+        # Bitarray of the positions of the candidates which are empty patterns (they are generalizations of any pattern).
+        self._empty_patterns = bitarray(number_of_patterns)
+        self._empty_patterns.setall(0)
+        for position, pattern in enumerate(list_of_patterns):
+            if len(pattern) == 0:
+                self._empty_patterns[position] = 1
+            bitmask = 0
+            for selector in pattern:
+                local_id = self._local_ids.get(selector)
+                if local_id is None:
+                    local_id = len(self._postings)
+                    self._local_ids[selector] = local_id
+                    posting = bitarray(number_of_patterns)
+                    posting.setall(0)
+                    self._postings.append(posting)
+                self._postings[local_id][position] = 1
+                bitmask = bitmask | (1 << local_id)
+            self._bitmasks.append(bitmask)
+        # Bitarray of the positions of the candidates which have not been removed.
+        self._alive = bitarray(number_of_patterns)
+        self._alive.setall(1)
+
+    def remove(self, position : int) -> None:
+        """Method to remove a candidate from the index. If the candidate was already removed, this method does nothing.
+
+        :param position: the position of the candidate in the list passed in the construction of the index.
+        """
+        if type(position) is not int:
+            raise TypeError("The type of the parameter 'position' must be 'int'.")
+        self._alive[position] = 0
+
+    def refinements_of(self, pattern : Union[Pattern, FrozenPattern], refinement_of_itself : bool) -> list[int]:
+        """Method to get the positions of the (non-removed) candidates which are refinements of the pattern passed by parameter.
+
+        :param pattern: the pattern whose refinements are searched.
+        :param refinement_of_itself: is a pattern a refinement of itself? If True, the candidates equal to the pattern are also returned.
+        :return: the sorted list of positions of the candidates which are refinements of the pattern.
+        """
+        # A refinement must contain all the selectors of the pattern.
+        result = self._alive.copy()
+        pattern_bitmask = 0
+        for selector in pattern:
+            local_id = self._local_ids.get(selector)
+            if local_id is None:
+                return []
+            result &= self._postings[local_id]
+            pattern_bitmask = pattern_bitmask | (1 << local_id)
+        positions = list(result.search(RefinementIndex._ONE))
+        if not refinement_of_itself:
+            positions = [position for position in positions if self._bitmasks[position] != pattern_bitmask]
+        return positions
+
+    def generalizations_of(self, pattern : Union[Pattern, FrozenPattern], generalization_of_itself : bool) -> list[int]:
+        """Method to get the positions of the (non-removed) candidates which are generalizations of the pattern passed by parameter (i.e., the pattern is a refinement of them).
+
+        :param pattern: the pattern whose generalizations are searched.
+        :param generalization_of_itself: is a pattern a generalization of itself? If True, the candidates equal to the pattern are also returned.
+        :return: the sorted list of positions of the candidates which are generalizations of the pattern.
+        """
+        # A generalization contains at least one selector of the pattern (or it is the empty pattern). Only these candidates must be checked.
+        candidates = self._empty_patterns.copy()
+        pattern_bitmask = 0
+        # If the pattern has selectors which are not in any candidate, no candidate is equal to it.
+        all_the_selectors_are_in_the_index = True
+        for selector in pattern:
+            local_id = self._local_ids.get(selector)
+            if local_id is None:
+                all_the_selectors_are_in_the_index = False
+            else:
+                candidates |= self._postings[local_id]
+                pattern_bitmask = pattern_bitmask | (1 << local_id)
+        candidates &= self._alive
+        positions = []
+        for position in candidates.search(RefinementIndex._ONE):
+            candidate_bitmask = self._bitmasks[position]
+            if (candidate_bitmask & pattern_bitmask) == candidate_bitmask:
+                if (candidate_bitmask != pattern_bitmask) or (not all_the_selectors_are_in_the_index) or generalization_of_itself:
+                    positions.append(position)
+        return positions
+
+    def __len__(self) -> int:
+        return self._alive.count(1)
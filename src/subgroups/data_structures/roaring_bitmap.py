@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+
+# Contributors:
+#    Antonio López Martínez-Carrasco <antoniolopezmc1995@gmail.com>
+
+"""This file contains the implementation of a Roaring Bitmap: a compressed bitmap which splits the space of the integers in chunks of 2^16 consecutive values (i.e., by the 16 most significant bits) and which stores each non-empty chunk in the smallest of three containers: an array container (a sorted array of the 16 least significant bits of the values), a bitmap container (a bitset of 2^16 bits) or a run container (a sorted array of runs of consecutive values).
+"""
+
+from numpy import ndarray, array, fromiter, arange, frombuffer, zeros, packbits, unpackbits, flatnonzero, diff, searchsorted, concatenate, unique, repeat, cumsum, maximum, minimum, uint8, uint16, int64, bool_
+from bitarray import bitarray
+from bisect import bisect_left
+from collections.abc import Collection, Iterator
+from numbers import Integral
+
+# Python annotations.
+from typing import Union
+
+# Number of values of a chunk.
+_CHUNK_SIZE = 65536
+
+# Maximum cardinality of an array container. Beyond it, an array container (2 bytes per value) is greater than a bitmap container (8192 bytes).
+_MAXIMUM_CARDINALITY_OF_AN_ARRAY_CONTAINER = 4096
+
+class _ArrayContainer(object):
+    """Internal class to implement an array container of a Roaring Bitmap.
+
+    :param values: the sorted array (of dtype uint16) of the 16 least significant bits of the values of the chunk.
+    """
+
+    __slots__ = ("_values",)
+
+    def __init__(self, values : ndarray) -> None:
+        self._values = values
+
+    def cardinality(self) -> int:
+        return len(self._values)
+
+    def to_array(self) -> ndarray:
+        return self._values
+
+    def contains_array(self, values : ndarray) -> ndarray:
+        """Method to obtain, with only one vectorized operation, a boolean mask with the values of the array 'values' which are in the array container.
+        """
+        return _intersection_of_arrays(values, self._values, False)[1]
+
+    def size_in_bytes(self) -> int:
+        return 2 * len(self._values)
+
+class _BitmapContainer(object):
+    """Internal class to implement a bitmap container of a Roaring Bitmap.
+
+    :param bits: the bitarray (of 2^16 bits and with big endianness) of the chunk.
+    :param cardinality: the number of bits set to 1 in 'bits'.
+    """
+
+    __slots__ = ("_bits", "_cardinality")
+
+    def __init__(self, bits : bitarray, cardinality : int) -> None:
+        self._bits = bits
+        self._cardinality = cardinality
+
+    def cardinality(self) -> int:
+        return self._cardinality
+
+    def to_array(self) -> ndarray:
+        return flatnonzero(unpackbits(frombuffer(self._bits, dtype = uint8))).astype(uint16)
+
+    def contains_array(self, values : ndarray) -> ndarray:
+        """Method to obtain, with only one vectorized operation, a boolean mask with the values of the array 'values' whose bits are set to 1 in the bitmap container.
+        """
+        bytes_of_the_bitmap = frombuffer(self._bits, dtype = uint8)
+        return ((bytes_of_the_bitmap[values >> 3] >> (7 - (values & 7))) & 1).astype(bool_)
+
+    def size_in_bytes(self) -> int:
+        return _CHUNK_SIZE // 8
+
+class _RunContainer(object):
+    """Internal class to implement a run container of a Roaring Bitmap.
+
+    :param starts: the sorted array (of dtype uint16) of the first values of the runs.
+    :param ends: the array (of dtype uint16) of the last values (inclusive) of the runs.
+    """
+
+    __slots__ = ("_starts", "_ends", "_cardinality")
+
+    def __init__(self, starts : ndarray, ends : ndarray) -> None:
+        self._starts = starts
+        self._ends = ends
+        self._cardinality = int((ends.astype(int64) - starts.astype(int64)).sum()) + len(starts)
+
+    def cardinality(self) -> int:
+        return self._cardinality
+
+    def to_array(self) -> ndarray:
+        return concatenate([arange(start, end + 1, dtype = uint16) for start, end in zip(self._starts.tolist(), self._ends.tolist())])
+
+    def to_bitmap(self) -> _BitmapContainer:
+        bits = bitarray(_CHUNK_SIZE, endian = "big")
+        bits.setall(0)
+        for start, end in zip(self._starts.tolist(), self._ends.tolist()):
+            bits[start:end+1] = 1
+        return _BitmapContainer(bits, self._cardinality)
+
+    def contains_array(self, values : ndarray) -> ndarray:
+        """Method to obtain, with only one vectorized operation, a boolean mask with the values of the array 'values' which are contained in any run of the run container.
+        """
+        run_indexes = searchsorted(self._starts, values, side = "right") - 1
+        return (run_indexes >= 0) & (values <= self._ends[run_indexes])
+
+    def size_in_bytes(self) -> int:
+        return 4 * len(self._starts)
+
+def _create_container(values : ndarray) -> Union[_ArrayContainer, _BitmapContainer, _RunContainer]:
+    """Internal function to create the smallest container for the sorted array (of dtype uint16, without duplicates and non-empty) passed by parameter.
+    """
+    cardinality = len(values)
+    # Positions in which a run ends (i.e., the next value is not consecutive).
+    run_breaks = flatnonzero(diff(values.astype(int64)) != 1)
+    number_of_runs = len(run_breaks) + 1
+    size_of_the_run_container = 4 * number_of_runs
+    if (cardinality <= _MAXIMUM_CARDINALITY_OF_AN_ARRAY_CONTAINER) and (2 * cardinality <= size_of_the_run_container):
+        return _ArrayContainer(values)
+    if size_of_the_run_container < min(2 * cardinality, _CHUNK_SIZE // 8):
+        starts = concatenate((values[:1], values[run_breaks + 1]))
+        ends = concatenate((values[run_breaks], values[-1:]))
+        return _RunContainer(starts, ends)
+    if cardinality <= _MAXIMUM_CARDINALITY_OF_AN_ARRAY_CONTAINER:
+        return _ArrayContainer(values)
+    return _bitmap_container_from_array(values)
+
+def _bitmap_container_from_array(values : ndarray) -> _BitmapContainer:
+    """Internal function to create a bitmap container from the sorted array (of dtype uint16 and without duplicates) passed by parameter.
+    """
+    mask = zeros(_CHUNK_SIZE, dtype = bool_)
+    mask[values] = True
+    bits = bitarray(endian = "big")
+    bits.frombytes(packbits(mask).tobytes())
+    return _BitmapContainer(bits, len(values))
+
+def _container_from_bits(bits : bitarray) -> Union[_ArrayContainer, _BitmapContainer, None]:
+    """Internal function to create an array container or a bitmap container (depending on the cardinality) from the bitarray (of 2^16 bits) passed by parameter. If the bitarray is empty, None is returned.
+    """
+    cardinality = bits.count(1)
+    if cardinality == 0:
+        return None
+    if cardinality <= _MAXIMUM_CARDINALITY_OF_AN_ARRAY_CONTAINER:
+        return _ArrayContainer(_BitmapContainer(bits, cardinality).to_array())
+    return _BitmapContainer(bits, cardinality)
+
+def _container_from_mask(values : ndarray, mask : ndarray) -> Union[_ArrayContainer, None]:
+    """Internal function to create an array container with the values of 'values' whose positions of 'mask' are True. If there is no value, None is returned.
+    """
+    selected_values = values[mask]
+    if len(selected_values) == 0:
+        return None
+    return _ArrayContainer(selected_values)
+
+def _and_of_runs(first : _RunContainer, second : _RunContainer) -> Union[_RunContainer, None]:
+    """Internal function to compute the intersection of two run containers (the result is also a run container, because the intersection of two runs is a run). If the intersection is empty, None is returned. It is computed with vectorized operations: the runs of 'second' which overlap a run of 'first' are consecutive (those whose end is not lower than its start and whose start is not greater than its end), so they are located with a binary search and each pair of overlapping runs is intersected at once.
+    """
+    first_starts = first._starts.astype(int64)
+    first_ends = first._ends.astype(int64)
+    second_starts = second._starts.astype(int64)
+    second_ends = second._ends.astype(int64)
+    # For each run of 'first', the runs of 'second' which overlap it are those in the positions [lower_indexes[i], upper_indexes[i]).
+    lower_indexes = searchsorted(second_ends, first_starts, side = "left")
+    upper_indexes = searchsorted(second_starts, first_ends, side = "right")
+    number_of_overlaps = upper_indexes - lower_indexes
+    number_of_overlaps[number_of_overlaps < 0] = 0
+    total_number_of_overlaps = int(number_of_overlaps.sum())
+    if total_number_of_overlaps == 0:
+        return None
+    # Pairs (first_indexes[k], second_indexes[k]) of overlapping runs, in order.
+    first_indexes = repeat(arange(len(first_starts)), number_of_overlaps)
+    second_indexes = arange(total_number_of_overlaps) - repeat(cumsum(number_of_overlaps) - number_of_overlaps, number_of_overlaps) + repeat(lower_indexes, number_of_overlaps)
+    new_starts = maximum(first_starts[first_indexes], second_starts[second_indexes])
+    new_ends = minimum(first_ends[first_indexes], second_ends[second_indexes])
+    return _RunContainer(new_starts.astype(uint16), new_ends.astype(uint16))
+
+def _and_of_containers(first : Union[_ArrayContainer, _BitmapContainer, _RunContainer], second : Union[_ArrayContainer, _BitmapContainer, _RunContainer]) -> Union[_ArrayContainer, _BitmapContainer, _RunContainer, None]:
+    """Internal function to compute the intersection of two containers. If the intersection is empty, None is returned.
+    """
+    first_type = type(first)
+    second_type = type(second)
+    # The array containers are the smallest ones, so they are intersected by lookup in the other container.
+    if first_type is _ArrayContainer:
+        if second_type is _ArrayContainer:
+            return _container_from_mask(*_intersection_of_arrays(first._values, second._values))
+        return _container_from_mask(first._values, second.contains_array(first._values))
+    if second_type is _ArrayContainer:
+        return _container_from_mask(second._values, first.contains_array(second._values))
+    if (first_type is _RunContainer) and (second_type is _RunContainer):
+        return _and_of_runs(first, second)
+    # At least one of them is a bitmap container.
+    if first_type is _RunContainer:
+        first = first.to_bitmap()
+    if second_type is _RunContainer:
+        second = second.to_bitmap()
+    return _container_from_bits(first._bits & second._bits)
+
+def _intersection_of_arrays(first : ndarray, second : ndarray, swap_if_longer : bool = True) -> tuple[ndarray, ndarray]:
+    """Internal function to compute the intersection of two sorted (and non-empty) arrays without duplicates. It returns the first array (or the shortest one if 'swap_if_longer' is True) and the mask of its values which are in the other array.
+    """
+    if swap_if_longer and (len(first) > len(second)):
+        first, second = second, first
+    positions = searchsorted(second, first)
+    positions[positions == len(second)] = 0
+    return first, second[positions] == first
+
+class RoaringBitmap(object):
+    """This class represents a Roaring Bitmap: a compressed bitmap of non-negative integers which splits the space of the integers in chunks of 2^16 consecutive values and which stores each non-empty chunk in the smallest of three containers: (1) an array container (i.e., a sorted array of 16-bit values) if the chunk is sparse, (2) a bitmap container (i.e., a bitset of 2^16 bits) if the chunk is dense and (3) a run container (i.e., a sorted array of runs of consecutive values) if the values of the chunk are clustered. The intersection (AND) of two Roaring Bitmaps only intersects the containers of the chunks which are in both of them, and the cardinality of a Roaring Bitmap is the sum of the cardinalities of its containers, which are stored. IMPORTANT: a Roaring Bitmap is immutable.
+
+    :param values: the non-negative integers of the Roaring Bitmap (duplicates are ignored).
+    """
+
+    __slots__ = ("_keys", "_containers", "_cardinality")
+
+    def __init__(self, values : Collection[int] = ()) -> None:
+        # Sorted list of the chunks (i.e., the 16 most significant bits of the values) which are not empty.
+        self._keys = []
+        # List of the containers of the chunks (in the same order as the keys).
+        self._containers = []
+        values = unique(values.astype(int64) if type(values) is ndarray else fromiter(values, dtype = int64, count = len(values)))
+        if (len(values) > 0) and (values[0] < 0):
+            raise ValueError("The values of a Roaring Bitmap must be non-negative integers.")
+        # Positions in which the chunk changes.
+        chunk_breaks = (flatnonzero(diff(values >> 16)) + 1).tolist()
+        for start, end in zip([0] + chunk_breaks, chunk_breaks + [len(values)]):
+            if start == end: # The Roaring Bitmap is empty.
+                break
+            chunk_values = values[start:end]
+            self._keys.append(int(chunk_values[0]) >> 16)
+            self._containers.append(_create_container((chunk_values & 0xFFFF).astype(uint16)))
+        self._cardinality = len(values)
+
+    @staticmethod
+    def _from_keys_and_containers(keys : list[int], containers : list, cardinality : int) -> 'RoaringBitmap':
+        result = RoaringBitmap.__new__(RoaringBitmap)
+        result._keys = keys
+        result._containers = containers
+        result._cardinality = cardinality
+        return result
+
+    def _get_number_of_containers(self) -> dict[str, int]:
+        number_of_containers = {"array" : 0, "bitmap" : 0, "run" : 0}
+        for container in self._containers:
+            if type(container) is _ArrayContainer:
+                number_of_containers["array"] = number_of_containers["array"] + 1
+            elif type(container) is _BitmapContainer:
+                number_of_containers["bitmap"] = number_of_containers["bitmap"] + 1
+            else:
+                number_of_containers["run"] = number_of_containers["run"] + 1
+        return number_of_containers
+
+    def _get_size_in_bytes(self) -> int:
+        return sum(container.size_in_bytes() for container in self._containers)
+
+    number_of_containers = property(_get_number_of_containers, None, None, "Python dictionary with the number of array containers, of bitmap containers and of run containers of the Roaring Bitmap (the keys are 'array', 'bitmap' and 'run').")
+    size_in_bytes = property(_get_size_in_bytes, None, None, "The number of bytes of the data of the containers of the Roaring Bitmap (without the overhead of the python objects).")
+
+    def __and__(self, other : 'RoaringBitmap') -> 'RoaringBitmap':
+        if type(other) is not RoaringBitmap:
+            raise TypeError("The type of the parameter 'other' must be 'RoaringBitmap'.")
+        new_keys = []
+        new_containers = []
+        new_cardinality = 0
+        self_keys = self._keys
+        other_keys = other._keys
+        i = 0
+        j = 0
+        # Only the chunks which are in both Roaring Bitmaps are intersected.
+        while (i < len(self_keys)) and (j < len(other_keys)):
+            if self_keys[i] < other_keys[j]:
+                i = i + 1
+            elif self_keys[i] > other_keys[j]:
+                j = j + 1
+            else:
+                new_container = _and_of_containers(self._containers[i], other._containers[j])
+                if new_container is not None:
+                    new_keys.append(self_keys[i])
+                    new_containers.append(new_container)
+                    new_cardinality = new_cardinality + new_container.cardinality()
+                i = i + 1
+                j = j + 1
+        return RoaringBitmap._from_keys_and_containers(new_keys, new_containers, new_cardinality)
+
+    def __len__(self) -> int:
+        return self._cardinality
+
+    def __iter__(self) -> Iterator[int]:
+        for key, container in zip(self._keys, self._containers):
+            high_bits = key << 16
+            for low_bits in container.to_array().tolist():
+                yield high_bits | low_bits
+
+    def __contains__(self, value : int) -> bool:
+        # Any integer is accepted (e.g., the numpy integers).
+        if (not isinstance(value, Integral)) or (value < 0):
+            return False
+        value = int(value)
+        index = bisect_left(self._keys, value >> 16)
+        if (index == len(self._keys)) or (self._keys[index] != (value >> 16)):
+            return False
+        return bool(self._containers[index].contains_array(array([value & 0xFFFF], dtype = uint16))[0])
+
+    def __eq__(self, other : object) -> bool:
+        if not isinstance(other, RoaringBitmap):
+            return NotImplemented
+        return (self._cardinality == other._cardinality) and (self._keys == other._keys) and (list(self) == list(other))
+
+    def __str__(self) -> str:
+        return "[" + ", ".join(str(value) for value in self) + "]"
+
+    def __repr__(self) -> str:
+        return "RoaringBitmap(" + str(self) + ")"
@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+
+# Contributors:
+#    Antonio López Martínez-Carrasco <antoniolopezmc1995@gmail.com>
+
+"""This file contains the implementation of the Selector Index data structure.
+"""
+
+from pandas import DataFrame, Series
+from numpy import frombuffer, bool_, ndarray, empty, int64
+from bitarray import bitarray
+from bitarray.util import count_and
+from pandas.api.types import is_numeric_dtype, is_bool_dtype
+from subgroups.core.operator import Operator
+from subgroups.core.selector import Selector
+from subgroups.core.subgroup import Subgroup
+from subgroups.data_structures.numeric_attribute_index import NumericAttributeIndex
+
+# Python annotations.
+from collections.abc import Iterable, Iterator
+
+class SelectorIndex(object):
+    """This class represents a Selector Index: a cache of the coverage of the selectors over a pandas DataFrame. The coverage of each selector (i.e., the rows of the DataFrame in which the selector is contained) is computed only once, the first time that it is needed, and it is stored as a packed bitarray. In this way, the coverage of any pattern is the AND of the bitarrays of its selectors.
+
+    The selectors with the operators LESS, GREATER, LESS_OR_EQUAL and GREATER_OR_EQUAL over numeric attributes are resolved using a NumericAttributeIndex (one per attribute), so the attribute is sorted only once instead of being scanned for each threshold.
+
+    IMPORTANT: the DataFrame is not copied. Therefore, if it is modified after creating the index, the index is not valid anymore.
+
+    :param pandas_dataframe: the DataFrame which is indexed.
+    """
+
+    __slots__ = ("_pandas_dataframe", "_number_of_rows", "_bitarrays_of_selectors", "_all_rows", "_numeric_attribute_indexes")
+
+    # Operators which are resolved using a NumericAttributeIndex.
+    _THRESHOLD_OPERATORS = (Operator.LESS, Operator.GREATER, Operator.LESS_OR_EQUAL, Operator.GREATER_OR_EQUAL)
+
+    def __init__(self, pandas_dataframe : DataFrame) -> None:
+        if type(pandas_dataframe) is not DataFrame:
+            raise TypeError("The type of the parameter 'pandas_dataframe' must be 'pandas.DataFrame'.")
+        self._pandas_dataframe = pandas_dataframe
+        self._number_of_rows = len(pandas_dataframe)
+        # Dictionary selector -> bitarray of the rows in which the selector is contained.
+        self._bitarrays_of_selectors = {}
+        # Bitarray of the rows in which the empty pattern is contained (i.e., all the rows).
+        self._all_rows = bitarray(self._number_of_rows, endian = "big")
+        self._all_rows.setall(1)
+        # Dictionary attribute name -> NumericAttributeIndex of that attribute (they are built the first time that they are needed).
+        self._numeric_attribute_indexes = {}
+
+    def _get_pandas_dataframe(self) -> DataFrame:
+        return self._pandas_dataframe
+
+    def _get_number_of_rows(self) -> int:
+        return self._number_of_rows
+
+    pandas_dataframe = property(_get_pandas_dataframe, None, None, "The DataFrame which is indexed.")
+    number_of_rows = property(_get_number_of_rows, None, None, "The number of rows of the DataFrame which is indexed.")
+
+    @staticmethod
+    def _bitarray_from_boolean_Series(boolean_Series : Series) -> bitarray:
+        # Private method to transform a Series of booleans into a packed bitarray.
+        result = bitarray(endian = "big")
+        result.pack(boolean_Series.to_numpy(dtype = bool).tobytes())
+        return result
+
+    def _boolean_Series_from_bitarray(self, bitarray_of_rows : bitarray) -> Series:
+        # Private method to transform a bitarray into a Series of booleans with the same index as the indexed DataFrame.
+        return Series(frombuffer(bytearray(bitarray_of_rows.unpack()), dtype = bool_), index = self._pandas_dataframe.index)
+
+    def get_numeric_attribute_index(self, attribute_name : str) -> NumericAttributeIndex:
+        """Method to get the NumericAttributeIndex of a numeric attribute of the indexed DataFrame. It is built only once, the first time that it is needed.
+
+        :param attribute_name: the attribute name.
+        :return: the NumericAttributeIndex of the attribute.
+        """
+        result = self._numeric_attribute_indexes.get(attribute_name)
+        if result is None:
+            result = NumericAttributeIndex(self._pandas_dataframe[attribute_name])
+            self._numeric_attribute_indexes[attribute_name] = result
+        return result
+
+    def get_selector_bitarray(self, selector : Selector) -> bitarray:
+        """Method to get the bitarray of the rows in which the selector is contained. IMPORTANT: the returned bitarray is stored in the index, so it must not be modified. If the attribute name of the selector is not in the DataFrame, a KeyError exception is raised.
+
+        :param selector: the selector.
+        :return: the bitarray of the rows in which the selector is contained.
+        """
+        result = self._bitarrays_of_selectors.get(selector)
+        if result is None:
+            if not isinstance(selector, Selector):
+                raise TypeError("The parameter 'selector' must be an instance of the 'Selector' class or of a subclass thereof.")
+            attribute = self._pandas_dataframe[selector.attribute_name]
+            if (selector.operator in SelectorIndex._THRESHOLD_OPERATORS) and (type(selector.value) is not str) and is_numeric_dtype(attribute) and (not is_bool_dtype(attribute)):
+                result = self.get_numeric_attribute_index(selector.attribute_name).get_bitarray(selector.operator, selector.value)
+            else:
+                result = SelectorIndex._bitarray_from_boolean_Series(selector.operator.evaluate(attribute, selector.value))
+            self._bitarrays_of_selectors[selector] = result
+        return result
+
+    def get_pattern_bitarray(self, pattern : Iterable[Selector]) -> bitarray:
+        """Method to get the bitarray of the rows in which all the selectors of the pattern are contained.
+
+        :param pattern: the pattern (or any iterable of selectors, such as a FrozenPattern or a list of selectors).
+        :return: a new bitarray of the rows in which the pattern is contained.
+        """
+        result = None
+        for selector in pattern:
+            if result is None:
+                result = self.get_selector_bitarray(selector).copy()
+            else:
+                result &= self.get_selector_bitarray(selector)
+        if result is None: # The empty pattern is contained in all the rows.
+            return self._all_rows.copy()
+        return result
+
+    def count(self, pattern : Iterable[Selector]) -> int:
+        """Method to count the rows in which all the selectors of the pattern are contained.
+
+        :param pattern: the pattern (or any iterable of selectors, such as a FrozenPattern or a list of selectors).
+        :return: the number of rows in which the pattern is contained.
+        """
+        return self.get_pattern_bitarray(pattern).count(1)
+
+    def is_contained(self, pattern : Iterable[Selector]) -> Series:
+        """Method to check whether the pattern is contained in each row of the indexed DataFrame. It is equivalent to the method 'is_contained' of the class 'Pattern'.
+
+        :param pattern: the pattern (or any iterable of selectors, such as a FrozenPattern or a list of selectors).
+        :return: a Series of booleans (with the same index as the DataFrame) indicating whether the pattern is contained in each row.
+        """
+        return self._boolean_Series_from_bitarray(self.get_pattern_bitarray(pattern))
+
+    def filter_by_list_of_selectors(self, list_of_selectors : list[Selector]) -> DataFrame:
+        """Method to retrieve only the rows of the indexed DataFrame covered by all selectors included in the parameter 'list_of_selectors'. It is equivalent to the function 'filter_by_list_of_selectors' of the module 'utils.dataframe_filters'.
+
+        :param list_of_selectors: the list of selectors used in the filtering process.
+        :return: the pandas DataFrame obtained after the filtering process.
+        """
+        if type(list_of_selectors) is not list:
+            raise TypeError("The type of the parameter 'list_of_selectors' must be 'list'.")
+        return self._pandas_dataframe[self.is_contained(list_of_selectors)]
+
+    def filter(self, subgroup : Subgroup) -> tuple[Series, Series, Series]:
+        """Method to retrieve certain information of the indexed DataFrame related to a subgroup. It is equivalent to the method 'filter' of the class 'Subgroup', but the DataFrame is not copied.
+
+        :param subgroup: the subgroup.
+        :return: a tuple of the form: (Series, Series, Series). It is formed by the following elements: (1) a pandas Series of booleans indicating whether rows are covered by the description and the target, (2) a pandas Series of booleans indicating whether rows are covered by the description but not by the target, and (3) a pandas Series of booleans indicating whether rows are covered by the target.
+        """
+        if not isinstance(subgroup, Subgroup):
+            raise TypeError("The parameter 'subgroup' must be an instance of the 'Subgroup' class or of a subclass thereof.")
+        description_bitarray = self.get_pattern_bitarray(subgroup.description)
+        target_bitarray = self.get_selector_bitarray(subgroup.target)
+        return (self._boolean_Series_from_bitarray(description_bitarray & target_bitarray), \
+                self._boolean_Series_from_bitarray(description_bitarray & ~target_bitarray), \
+                self._boolean_Series_from_bitarray(target_bitarray))
+
+    def _iterate_description_bitarrays(self, list_of_subgroups : list[Subgroup]) -> Iterator[tuple[int, bitarray]]:
+        # Private generator which yields, for each subgroup, a tuple (position of the subgroup in the list, bitarray of the rows in which its description is contained).
+        # IMPORTANT: the yielded bitarrays must not be modified and the subgroups are not yielded in order.
+        # The subgroups are processed sorted by the identifiers of their selectors, so consecutive subgroups usually share a prefix. The AND of each prefix is stored in a stack and it is computed only once.
+        descriptions = []
+        for subgroup in list_of_subgroups:
+            if not isinstance(subgroup, Subgroup):
+                raise TypeError("The parameter 'list_of_subgroups' must only contain instances of the 'Subgroup' class or of a subclass thereof.")
+            descriptions.append(sorted(subgroup.description, key = Selector._get_id))
+        order = sorted(range(len(descriptions)), key = lambda position : [selector._id for selector in descriptions[position]])
+        # Stack of tuples (selector, bitarray of the prefix ending in that selector).
+        stack = []
+        for position in order:
+            description = descriptions[position]
+            # Length of the common prefix between the stack and the current description.
+            common_prefix_length = 0
+            while (common_prefix_length < len(stack)) and (common_prefix_length < len(description)) and (stack[common_prefix_length][0]._id == description[common_prefix_length]._id):
+                common_prefix_length = common_prefix_length + 1
+            del stack[common_prefix_length:]
+            for selector in description[common_prefix_length:]:
+                if len(stack) == 0:
+                    stack.append((selector, self.get_selector_bitarray(selector)))
+                else:
+                    stack.append((selector, stack[-1][1] & self.get_selector_bitarray(selector)))
+            if len(stack) == 0: # The empty pattern is contained in all the rows.
+                yield (position, self._all_rows)
+            else:
+                yield (position, stack[-1][1])
+
+    def evaluate(self, list_of_subgroups : list[Subgroup]) -> tuple[ndarray, ndarray, ndarray, ndarray]:
+        """Method to compute the subgroup parameters (i.e., tp, fp, TP and FP) of a list of subgroups in only one pass. The coverage of the selectors is shared among all the subgroups, and the coverage of the common prefixes of the descriptions is only computed once.
+
+        :param list_of_subgroups: the list of subgroups.
+        :return: a tuple of 4 numpy arrays of integers (tp, fp, TP, FP), in which the i-th element corresponds to the i-th subgroup of the list.
+        """
+        if type(list_of_subgroups) is not list:
+            raise TypeError("The type of the parameter 'list_of_subgroups' must be 'list'.")
+        number_of_subgroups = len(list_of_subgroups)
+        tp = empty(number_of_subgroups, dtype = int64)
+        fp = empty(number_of_subgroups, dtype = int64)
+        TP = empty(number_of_subgroups, dtype = int64)
+        for (position, description_bitarray) in self._iterate_description_bitarrays(list_of_subgroups):
+            target_bitarray = self.get_selector_bitarray(list_of_subgroups[position].target)
+            tp[position] = count_and(description_bitarray, target_bitarray)
+            fp[position] = description_bitarray.count(1) - tp[position]
+            TP[position] = target_bitarray.count(1)
+        FP = self._number_of_rows - TP
+        return (tp, fp, TP, FP)
+
+    def get_coverage_bitarrays(self, list_of_subgroups : list[Subgroup]) -> list[tuple[bitarray, bitarray]]:
+        """Method to compute the coverage of a list of subgroups in only one pass. The coverage of the selectors is shared among all the subgroups, and the coverage of the common prefixes of the descriptions is only computed once.
+
+        :param list_of_subgroups: the list of subgroups.
+        :return: a list of tuples (bitarray of the rows covered by the description and the target, bitarray of the rows covered by the description but not by the target), in which the i-th element corresponds to the i-th subgroup of the list.
+        """
+        if type(list_of_subgroups) is not list:
+            raise TypeError("The type of the parameter 'list_of_subgroups' must be 'list'.")
+        result = [None] * len(list_of_subgroups)
+        for (position, description_bitarray) in self._iterate_description_bitarrays(list_of_subgroups):
+            target_bitarray = self.get_selector_bitarray(list_of_subgroups[position].target)
+            result[position] = (description_bitarray & target_bitarray, description_bitarray & ~target_bitarray)
+        return result
@@ -12,7 +12,7 @@ from subgroups.core.selector import Selector
 from collections.abc import Collection
 
 # Python annotations.
-from typing import Union
+from typing import Union, Callable
 
 class VerticalList(ABC):
     """This abstract class defines the root class of all the implemented Vertical Lists (data structure used by the VLSD algorithm). Conceptually, a Vertical List is similar to a Subgroup.
@@ -97,11 +97,11 @@ class VerticalList(ABC):
         raise NotImplementedError("The 'compute_quality_value' method from the 'VerticalList' abstract class is an abstract method.")
 
     @abstractmethod
-    def join(self, other_vertical_list : 'VerticalList', quality_measure : QualityMeasure, dict_of_parameters : dict[str, Union[int, float]], return_None_if_n_is_0 : bool = False) -> Union['VerticalList', None]:
+    def join(self, other_vertical_list : 'VerticalList', quality_measure : Union[QualityMeasure, Callable[[int, int], float]], dict_of_parameters : dict[str, Union[int, float]], return_None_if_n_is_0 : bool = False) -> Union['VerticalList', None]:
         """Method to create a new Vertical List as a result of the join of two Vertical Lists. The join of two Vertical Lists implies the following: (1) the last selector of the list of selectors of the second Vertical List is added to the end of the list of selectors of the first Vertical List, and (2) the new sequences of IDs (both) are the intersection of the corresponding original ones.
         
         :param other_vertical_list: the Vertical List with which to make the join.
-        :param quality_measure: the quality measure which is used to compute the quality value of the created Vertical List.
+        :param quality_measure: the quality measure which is used to compute the quality value of the created Vertical List, or a bound quality measure (i.e., the function returned by the method 'bind' of a quality measure), in which case 'dict_of_parameters' is not used.
         :param dict_of_parameters: python dictionary which contains all the needed parameters with which to compute the Vertical List quality value. IMPORTANT: this method uses the 'tp' and 'fp' parameters of the created Vertical List, not of the dictionary of parameters passed by parameter.
         :param return_None_if_n_is_0: if the subgroup parameter n (i.e., tp + fp) of the resulting Vertical List (i.e., the join) is 0, this means that both sequence of instances are empty and, therefore, this means that the pattern represented by the Vertical List is not in any instance in the dataset. If the parameter 'return_None_if_n_is_0' is True, None will be returned instead of a Vertical List object. By default, this parameter is False.
         :return: a new Vertical List as a result of the join of this Vertical List (self) and 'other_vertical_list'.
@@ -8,13 +8,22 @@
 
 from collections.abc import Collection
 from bitarray import bitarray
+from numpy import ndarray, zeros, frombuffer, flatnonzero, uint8, uint64
 from subgroups.quality_measures.quality_measure import QualityMeasure
 from subgroups.core.selector import Selector
 from subgroups.data_structures.vertical_list import VerticalList
 from subgroups.exceptions import VerticalListSizeError
 
 # Python annotations.
-from typing import Union
+from typing import Union, Callable
+
+try:
+    from numpy import bitwise_count
+except ImportError: # numpy < 2.0.
+    from numpy import unpackbits
+    def bitwise_count(words : ndarray) -> ndarray:
+        # The number of bits set to 1 in each row is the sum of the unpacked bits of the row (the shape is not the same as the one of 'words', but the sum of each row is the same).
+        return unpackbits(words.view(uint8), axis = -1)
 
 class VerticalListWithBitsets(VerticalList):
     """This class represents a Vertical List data structure whose sequences are implemented using bitsets.
@@ -85,24 +94,21 @@ class VerticalListWithBitsets(VerticalList):
             raise TypeError("The parameter 'quality_measure' must be an instance of a subclass of the 'QualityMeasure' class.")
         if type(dict_of_parameters) is not dict:
             raise TypeError("The type of the parameter 'dict_of_parameters' must be 'dict'.")
-        new_dict_of_parameters = dict_of_parameters.copy()
-        new_dict_of_parameters[QualityMeasure.TRUE_POSITIVES] = self.tp 
-        new_dict_of_parameters[QualityMeasure.FALSE_POSITIVES] = self.fp
-        return quality_measure.compute(new_dict_of_parameters)
+        return quality_measure.compute_counts(self.tp, self.fp, dict_of_parameters.get(QualityMeasure.TRUE_POPULATION), dict_of_parameters.get(QualityMeasure.FALSE_POPULATION), dict_of_parameters)
     
-    def join(self, other_vertical_list : 'VerticalListWithBitsets', quality_measure : QualityMeasure, dict_of_parameters : dict[str, Union[int, float]], return_None_if_n_is_0 : bool = False) -> Union['VerticalListWithBitsets', None]:
+    def join(self, other_vertical_list : 'VerticalListWithBitsets', quality_measure : Union[QualityMeasure, Callable[[int, int], float]], dict_of_parameters : dict[str, Union[int, float]], return_None_if_n_is_0 : bool = False) -> Union['VerticalListWithBitsets', None]:
         """Method to create a new Vertical List as a result of the join of two Vertical Lists. The join of two Vertical Lists implies the following: (1) the last selector of the list of selectors of the second Vertical List is added to the end of the list of selectors of the first Vertical List, and (2) the new sequences of IDs (both) are the intersection of the corresponding original ones.
         
         :param other_vertical_list: the Vertical List with which to make the join.
-        :param quality_measure: the quality measure which is used to compute the quality value of the created Vertical List.
+        :param quality_measure: the quality measure which is used to compute the quality value of the created Vertical List, or a bound quality measure (i.e., the function returned by the method 'bind' of a quality measure), in which case 'dict_of_parameters' is not used.
         :param dict_of_parameters: python dictionary which contains all needed parameters with which to compute the Vertical List quality value. IMPORTANT: this method uses the 'tp' and 'fp' parameters of the created Vertical List, not of the dictionary of parameters passed by parameter.
         :param return_None_if_n_is_0: if the subgroup parameter n (i.e., tp + fp) of the resulting Vertical List (i.e., the join) is 0, this means that both sequence of instances are empty and, therefore, this means that the pattern represented by the Vertical List is not in any instance in the dataset. If the parameter 'return_None_if_n_is_0' is True, None will be returned instead of a Vertical List object. By default, this parameter is False.
         :return: a new Vertical List as a result of the join of this Vertical List (self) and 'other_vertical_list'.
         """
         if type(other_vertical_list) is not VerticalListWithBitsets:
             raise TypeError("The type of the parameter 'other_vertical_list' must be 'VerticalListWithBitsets'.")
-        if not isinstance(quality_measure, QualityMeasure):
-            raise TypeError("The parameter 'quality_measure' must be an instance of a subclass of the 'QualityMeasure' class.")
+        if (not isinstance(quality_measure, QualityMeasure)) and (not callable(quality_measure)):
+            raise TypeError("The parameter 'quality_measure' must be an instance of a subclass of the 'QualityMeasure' class or a bound quality measure.")
         if type(dict_of_parameters) is not dict:
             raise TypeError("The type of the parameter 'dict_of_parameters' must be 'dict'.")
         if type(return_None_if_n_is_0) is not bool:
@@ -122,10 +128,10 @@ class VerticalListWithBitsets(VerticalList):
             new_list_of_selectors = self._list_of_selectors.copy()
             new_list_of_selectors.append(other_vertical_list._list_of_selectors[-1])
             # Third, obtain the quality value.
-            new_dict_of_parameters = dict_of_parameters.copy()
-            new_dict_of_parameters[QualityMeasure.TRUE_POSITIVES] = new_tp 
-            new_dict_of_parameters[QualityMeasure.FALSE_POSITIVES] = new_fp
-            new_quality_value = quality_measure.compute(new_dict_of_parameters)
+            if isinstance(quality_measure, QualityMeasure):
+                new_quality_value = quality_measure.compute_counts(new_tp, new_fp, dict_of_parameters.get(QualityMeasure.TRUE_POPULATION), dict_of_parameters.get(QualityMeasure.FALSE_POPULATION), dict_of_parameters)
+            else: # Bound quality measure.
+                new_quality_value = quality_measure(new_tp, new_fp)
             # Finally, create the object.
             result = VerticalListWithBitsets(new_list_of_selectors, [], [], 0, new_quality_value)
             result._sequence_of_instances_tp = new_sequence_of_instances_tp
@@ -136,6 +142,61 @@ class VerticalListWithBitsets(VerticalList):
         # Return the result.
         return result
     
+    @staticmethod
+    def stack_sequences_of_instances(vertical_lists : list['VerticalListWithBitsets']) -> tuple[ndarray, ndarray]:
+        """Static method to stack the sequences of instances of several Vertical Lists (with the same number of dataset instances) into two 2-dimensional arrays of packed 64-bit words, so that they can be joined at once with the method 'join_batch'.
+
+        :param vertical_lists: the list of Vertical Lists. It must not be empty.
+        :return: a tuple with two numpy arrays (of dtype uint64) with one row per Vertical List: the words of the sequences of instances tp and the words of the sequences of instances fp.
+        """
+        number_of_bytes = (vertical_lists[0]._number_of_dataset_instances + 7) // 8
+        # The rows are padded with zeros up to a multiple of 8 bytes.
+        number_of_words = (number_of_bytes + 7) // 8
+        stacked_sequences_of_instances_tp = zeros((len(vertical_lists), 8 * number_of_words), dtype = uint8)
+        stacked_sequences_of_instances_fp = zeros((len(vertical_lists), 8 * number_of_words), dtype = uint8)
+        for index, vertical_list in enumerate(vertical_lists):
+            stacked_sequences_of_instances_tp[index, :number_of_bytes] = frombuffer(vertical_list._sequence_of_instances_tp, dtype = uint8)
+            stacked_sequences_of_instances_fp[index, :number_of_bytes] = frombuffer(vertical_list._sequence_of_instances_fp, dtype = uint8)
+        return (stacked_sequences_of_instances_tp.view(uint64), stacked_sequences_of_instances_fp.view(uint64))
+
+    def join_batch(self, other_vertical_lists : list['VerticalListWithBitsets'], stacked_sequences_of_instances_tp : ndarray, stacked_sequences_of_instances_fp : ndarray, quality_measure : QualityMeasure, TP : int, FP : int, additional_parameters : dict[str, Union[int, float]], minimum_quality_threshold : Union[int, float]) -> list[tuple[int, 'VerticalListWithBitsets']]:
+        """Method to join this Vertical List (self) with several Vertical Lists at once. The sequences of instances of all of them are joined with only one vectorized AND operation, the tp and the fp of all the joins are counted at once and the quality values of all the joins are computed with the method 'compute_batch' of the quality measure. Only the joins whose n (i.e., tp + fp) is greater than 0 and whose quality value is greater or equal than 'minimum_quality_threshold' become Vertical List objects. The result of each join is the same as the result of the method 'join'.
+
+        :param other_vertical_lists: the Vertical Lists with which to make the joins.
+        :param stacked_sequences_of_instances_tp: the words of the sequences of instances tp of 'other_vertical_lists' (see the method 'stack_sequences_of_instances').
+        :param stacked_sequences_of_instances_fp: the words of the sequences of instances fp of 'other_vertical_lists' (see the method 'stack_sequences_of_instances').
+        :param quality_measure: the quality measure which is used to compute the quality values of the created Vertical Lists.
+        :param TP: the true population of the dataset.
+        :param FP: the false population of the dataset.
+        :param additional_parameters: the additional parameters (i.e., those parameters which are not tp, fp, TP and FP) of the quality measure.
+        :param minimum_quality_threshold: the minimum quality value of the created Vertical Lists.
+        :return: a list of tuples with the position (in 'other_vertical_lists') of each Vertical List whose join is created and the created Vertical List, in the same order as 'other_vertical_lists'.
+        """
+        # First, count the tp and the fp of all the joins at once (the words of this Vertical List are broadcast to all the rows).
+        sequence_of_instances_tp_of_self, sequence_of_instances_fp_of_self = VerticalListWithBitsets.stack_sequences_of_instances([self])
+        new_tp_array = bitwise_count(stacked_sequences_of_instances_tp & sequence_of_instances_tp_of_self).sum(axis = 1)
+        new_fp_array = bitwise_count(stacked_sequences_of_instances_fp & sequence_of_instances_fp_of_self).sum(axis = 1)
+        # Second, obtain all the quality values at once and select the joins which are created.
+        new_quality_values = quality_measure.compute_batch(new_tp_array, new_fp_array, TP, FP, additional_parameters)
+        created_joins = flatnonzero(((new_tp_array + new_fp_array) > 0) & (new_quality_values >= minimum_quality_threshold)).tolist()
+        # Finally, create the Vertical List objects (their bitsets are computed again with the AND operator of bitarray, which is cheaper than converting the rows of words to bitarrays).
+        result = []
+        new_tp_list = new_tp_array.tolist()
+        new_fp_list = new_fp_array.tolist()
+        new_quality_values_list = new_quality_values.tolist()
+        for index in created_joins:
+            other_vertical_list = other_vertical_lists[index]
+            new_list_of_selectors = self._list_of_selectors.copy()
+            new_list_of_selectors.append(other_vertical_list._list_of_selectors[-1])
+            new_vertical_list = VerticalListWithBitsets(new_list_of_selectors, [], [], 0, new_quality_values_list[index])
+            new_vertical_list._sequence_of_instances_tp = self._sequence_of_instances_tp & other_vertical_list._sequence_of_instances_tp
+            new_vertical_list._sequence_of_instances_fp = self._sequence_of_instances_fp & other_vertical_list._sequence_of_instances_fp
+            new_vertical_list._tp = new_tp_list[index]
+            new_vertical_list._fp = new_fp_list[index]
+            new_vertical_list._number_of_dataset_instances = self._number_of_dataset_instances
+            result.append((index, new_vertical_list))
+        return result
+
     def __str__(self) -> str:
         # List of selectors.
         list_of_selectors_as_str = "["
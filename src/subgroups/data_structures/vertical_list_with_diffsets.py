@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+
+# Contributors:
+#    Antonio López Martínez-Carrasco <antoniolopezmc1995@gmail.com>
+
+"""This file contains the implementation of a Vertical List data structure whose sequences are implemented using diffsets (i.e., python sets with the difference with respect to the sequences of the parent Vertical List, as in the dEclat algorithm) or using python sets, depending on which of them is smaller.
+"""
+
+from collections.abc import Collection
+from subgroups.quality_measures.quality_measure import QualityMeasure
+from subgroups.core.selector import Selector
+from subgroups.data_structures.vertical_list import VerticalList
+from subgroups.exceptions import VerticalListSizeError
+
+# Python annotations.
+from typing import Union, Callable
+
+class VerticalListWithDiffsets(VerticalList):
+    """This class represents a Vertical List data structure whose sequences are implemented using diffsets (as in the dEclat algorithm). A Vertical List created with the __init__ method stores its sequences of IDs as python sets (i.e., tidsets). However, a Vertical List created with the 'join' method can only store the IDs of the instances which are covered by its parent (i.e., the first Vertical List of the join), but not by it (i.e., diffsets), and its counters tp and fp are derived by subtraction. In dense datasets, the diffsets are much smaller than the tidsets deep in the search space, but the opposite happens with the selectors which cover few instances. For this reason, a Vertical List created with the 'join' method stores diffsets only if they are smaller than the tidsets (the Vertical Lists with the same parent can be joined regardless of what they store). IMPORTANT: only Vertical Lists with the same parent can be joined (i.e., both are created with the __init__ method or both are created by the join of the same Vertical List with others), which is always the case in the VLSD algorithm.
+
+    :param list_of_selectors: the list of selectors represented by the Vertical List.
+    :param sequence_of_instances_tp: the sequence of IDs of the dataset instances which are covered by the selectors ('list_of_selectors') and also by the target. The number of elements in this sequence would be the true positives tp of the equivalent subgroup with the same list of selectors and with the same target.
+    :param sequence_of_instances_fp: the sequence of IDs of the dataset instances which are covered by the selectors ('list_of_selectors'), but not by the target. The number of elements in this sequence would be the false positives fp of the equivalent subgroup with the same list of selectors and with the same target.
+    :param number_of_dataset_instances: number of instances of the dataset.
+    :param quality_value: the Vertical List quality value.
+    """
+
+    __slots__ = ("_parent", "_is_diffset")
+
+    def __init__(self, list_of_selectors : list[Selector], sequence_of_instances_tp : Collection[int], sequence_of_instances_fp : Collection[int], number_of_dataset_instances : int, quality_value : Union[int, float]) -> None:
+        # Call to __init__ method of the parent class.
+        super().__init__(list_of_selectors, sequence_of_instances_tp, sequence_of_instances_fp, number_of_dataset_instances, quality_value)
+        # sequence of instances tp (in this case, it is a tidset).
+        self._sequence_of_instances_tp = set(sequence_of_instances_tp)
+        self._tp = len(sequence_of_instances_tp)
+        # sequence of instances fp (in this case, it is a tidset).
+        self._sequence_of_instances_fp = set(sequence_of_instances_fp)
+        self._fp = len(sequence_of_instances_fp)
+        # A Vertical List created with the __init__ method does not have a parent.
+        self._parent = None
+        self._is_diffset = False
+
+    def _get_parent(self) -> Union['VerticalListWithDiffsets', None]:
+        return self._parent
+
+    def _get_is_diffset(self) -> bool:
+        return self._is_diffset
+
+    parent = property(_get_parent, None, None, "The Vertical List from which this Vertical List was created with the 'join' method (or None if it was created with the __init__ method).")
+    is_diffset = property(_get_is_diffset, None, None, "Whether the Vertical List stores diffsets (i.e., the IDs of the dataset instances which are covered by the parent, but not by this Vertical List) instead of the sequences of instances.")
+
+    @property
+    def sequence_of_instances_tp(self) -> set[int]:
+        # The tidset is rebuilt from the tidset of the parent (it is only needed when the results are reported).
+        if self._is_diffset:
+            return self._parent.sequence_of_instances_tp - self._sequence_of_instances_tp
+        return self._sequence_of_instances_tp
+
+    @property
+    def sequence_of_instances_fp(self) -> set[int]:
+        # The tidset is rebuilt from the tidset of the parent (it is only needed when the results are reported).
+        if self._is_diffset:
+            return self._parent.sequence_of_instances_fp - self._sequence_of_instances_fp
+        return self._sequence_of_instances_fp
+
+    @property
+    def tp(self) -> int:
+        return self._tp
+
+    @property
+    def fp(self) -> int:
+        return self._fp
+
+    @property
+    def n(self) -> int:
+        return self._tp + self._fp
+
+    def compute_quality_value(self, quality_measure : QualityMeasure, dict_of_parameters : dict[str, Union[int, float]]) -> float:
+        """Method to compute the Vertical List quality value using the dictionary of parameters passed by parameter. This method uses the parameters 'tp' and 'fp' of the Vertical List, not of the dictionary of parameters passed by parameter. IMPORTANT: this method does not modify the Vertical List.
+
+        :param quality_measure: the quality measure which is used.
+        :param dict_of_parameters: python dictionary which contains all needed parameters with which to compute the Vertical List quality value. IMPORTANT: this method uses the 'tp' and 'fp' parameters of the Vertical List, not of the dictionary of parameters passed by parameter.
+        :return: the computed value for the Vertical List quality value.
+        """
+        if not isinstance(quality_measure, QualityMeasure):
+            raise TypeError("The parameter 'quality_measure' must be an instance of a subclass of the 'QualityMeasure' class.")
+        if type(dict_of_parameters) is not dict:
+            raise TypeError("The type of the parameter 'dict_of_parameters' must be 'dict'.")
+        return quality_measure.compute_counts(self.tp, self.fp, dict_of_parameters.get(QualityMeasure.TRUE_POPULATION), dict_of_parameters.get(QualityMeasure.FALSE_POPULATION), dict_of_parameters)
+
+    def join(self, other_vertical_list : 'VerticalListWithDiffsets', quality_measure : Union[QualityMeasure, Callable[[int, int], float]], dict_of_parameters : dict[str, Union[int, float]], return_None_if_n_is_0 : bool = False) -> Union['VerticalListWithDiffsets', None]:
+        """Method to create a new Vertical List as a result of the join of two Vertical Lists. The join of two Vertical Lists implies the following: (1) the last selector of the list of selectors of the second Vertical List is added to the end of the list of selectors of the first Vertical List, and (2) the new sequences of IDs (both) are the intersection of the corresponding original ones. In this case, this Vertical List (self) is the parent of the new Vertical List, which stores the difference with respect to the sequences of self (i.e., the diffsets) if they are smaller than its sequences (i.e., the tidsets). Since both Vertical Lists are subsets of the same parent, the new sequences are computed as follows (t is a tidset and d is a diffset): d(xy) = t(x) - t(y), d(xy) = t(x) & d(y), t(xy) = t(y) - d(x) and d(xy) = d(y) - d(x).
+
+        :param other_vertical_list: the Vertical List with which to make the join. It must have the same parent as this Vertical List (self).
+        :param quality_measure: the quality measure which is used to compute the quality value of the created Vertical List, or a bound quality measure (i.e., the function returned by the method 'bind' of a quality measure), in which case 'dict_of_parameters' is not used.
+        :param dict_of_parameters: python dictionary which contains all needed parameters with which to compute the Vertical List quality value. IMPORTANT: this method uses the 'tp' and 'fp' parameters of the created Vertical List, not of the dictionary of parameters passed by parameter.
+        :param return_None_if_n_is_0: if the subgroup parameter n (i.e., tp + fp) of the resulting Vertical List (i.e., the join) is 0, this means that both sequence of instances are empty and, therefore, this means that the pattern represented by the Vertical List is not in any instance in the dataset. If the parameter 'return_None_if_n_is_0' is True, None will be returned instead of a Vertical List object. By default, this parameter is False.
+        :return: a new Vertical List as a result of the join of this Vertical List (self) and 'other_vertical_list'.
+        """
+        if type(other_vertical_list) is not VerticalListWithDiffsets:
+            raise TypeError("The type of the parameter 'other_vertical_list' must be 'VerticalListWithDiffsets'.")
+        if (not isinstance(quality_measure, QualityMeasure)) and (not callable(quality_measure)):
+            raise TypeError("The parameter 'quality_measure' must be an instance of a subclass of the 'QualityMeasure' class or a bound quality measure.")
+        if type(dict_of_parameters) is not dict:
+            raise TypeError("The type of the parameter 'dict_of_parameters' must be 'dict'.")
+        if type(return_None_if_n_is_0) is not bool:
+            raise TypeError("The type of the parameter 'return_None_if_n_is_0' must be 'bool'.")
+        if (self._number_of_dataset_instances != other_vertical_list._number_of_dataset_instances):
+            raise VerticalListSizeError("Vertical Lists with different 'number_of_dataset_instances' value cannot be joined.")
+        if (self._parent is not other_vertical_list._parent):
+            raise ValueError("Only Vertical Lists with the same parent can be joined.")
+        # Initially, the result is None.
+        result = None
+        # First, compute the new sequences.
+        if not self._is_diffset:
+            if not other_vertical_list._is_diffset:
+                # d(xy) = t(x) - t(y).
+                new_sequence_of_instances_tp = self._sequence_of_instances_tp - other_vertical_list._sequence_of_instances_tp
+                new_sequence_of_instances_fp = self._sequence_of_instances_fp - other_vertical_list._sequence_of_instances_fp
+            else:
+                # d(xy) = t(x) & d(y).
+                new_sequence_of_instances_tp = self._sequence_of_instances_tp & other_vertical_list._sequence_of_instances_tp
+                new_sequence_of_instances_fp = self._sequence_of_instances_fp & other_vertical_list._sequence_of_instances_fp
+            new_is_diffset = True
+            # The counters are derived by subtraction.
+            new_tp = self._tp - len(new_sequence_of_instances_tp)
+            new_fp = self._fp - len(new_sequence_of_instances_fp)
+            # If the diffsets are greater than the tidsets, the tidsets are stored: t(xy) = t(x) - d(xy).
+            if (len(new_sequence_of_instances_tp) + len(new_sequence_of_instances_fp)) > (new_tp + new_fp):
+                new_sequence_of_instances_tp = self._sequence_of_instances_tp - new_sequence_of_instances_tp
+                new_sequence_of_instances_fp = self._sequence_of_instances_fp - new_sequence_of_instances_fp
+                new_is_diffset = False
+        else:
+            if not other_vertical_list._is_diffset:
+                # t(xy) = t(y) - d(x).
+                new_sequence_of_instances_tp = other_vertical_list._sequence_of_instances_tp - self._sequence_of_instances_tp
+                new_sequence_of_instances_fp = other_vertical_list._sequence_of_instances_fp - self._sequence_of_instances_fp
+                new_is_diffset = False
+                new_tp = len(new_sequence_of_instances_tp)
+                new_fp = len(new_sequence_of_instances_fp)
+            else:
+                # d(xy) = d(y) - d(x).
+                new_sequence_of_instances_tp = other_vertical_list._sequence_of_instances_tp - self._sequence_of_instances_tp
+                new_sequence_of_instances_fp = other_vertical_list._sequence_of_instances_fp - self._sequence_of_instances_fp
+                new_is_diffset = True
+                # The counters are derived by subtraction.
+                new_tp = self._tp - len(new_sequence_of_instances_tp)
+                new_fp = self._fp - len(new_sequence_of_instances_fp)
+        # Continue if the parameter 'return_None_if_n_is_0' is False OR n is greater than 0. In other case, return None.
+        if (not return_None_if_n_is_0) or ((new_tp + new_fp) > 0):
+            # Second, add the last element of 'other_vertical_list'.
+            new_list_of_selectors = self._list_of_selectors.copy()
+            new_list_of_selectors.append(other_vertical_list._list_of_selectors[-1])
+            # Third, obtain the quality value.
+            if isinstance(quality_measure, QualityMeasure):
+                new_quality_value = quality_measure.compute_counts(new_tp, new_fp, dict_of_parameters.get(QualityMeasure.TRUE_POPULATION), dict_of_parameters.get(QualityMeasure.FALSE_POPULATION), dict_of_parameters)
+            else: # Bound quality measure.
+                new_quality_value = quality_measure(new_tp, new_fp)
+            # Finally, create the object.
+            result = VerticalListWithDiffsets(new_list_of_selectors, [], [], 0, new_quality_value)
+            result._sequence_of_instances_tp = new_sequence_of_instances_tp
+            result._sequence_of_instances_fp = new_sequence_of_instances_fp
+            result._tp = new_tp
+            result._fp = new_fp
+            result._number_of_dataset_instances = self._number_of_dataset_instances
+            result._parent = self
+            result._is_diffset = new_is_diffset
+        # Return the result.
+        return result
+
+    def __str__(self) -> str:
+        # List of selectors.
+        list_of_selectors_as_str = "[" + ", ".join(str(e) for e in self._list_of_selectors) + "]"
+        # Sequences of instances (they are the tidsets, not the diffsets).
+        sequence_of_instances_tp_as_str = "[" + ", ".join(str(x) for x in sorted(self.sequence_of_instances_tp)) + "]"
+        sequence_of_instances_fp_as_str = "[" + ", ".join(str(x) for x in sorted(self.sequence_of_instances_fp)) + "]"
+        # Return.
+        return "List of selectors: " + list_of_selectors_as_str + \
+            ", Sequence of instances (tp): " + sequence_of_instances_tp_as_str + \
+            ", Sequence of instances (fp): " + sequence_of_instances_fp_as_str + \
+            ", Quality value: " + str(self._quality_value)
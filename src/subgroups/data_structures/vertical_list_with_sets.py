@@ -13,7 +13,7 @@ from subgroups.data_structures.vertical_list import VerticalList
 from subgroups.exceptions import VerticalListSizeError
 
 # Python annotations.
-from typing import Union
+from typing import Union, Callable
 
 class VerticalListWithSets(VerticalList):
     """This class represents a Vertical List data structure whose sequences are implemented using python sets.
@@ -68,24 +68,21 @@ class VerticalListWithSets(VerticalList):
             raise TypeError("The parameter 'quality_measure' must be an instance of a subclass of the 'QualityMeasure' class.")
         if type(dict_of_parameters) is not dict:
             raise TypeError("The type of the parameter 'dict_of_parameters' must be 'dict'.")
-        new_dict_of_parameters = dict_of_parameters.copy()
-        new_dict_of_parameters[QualityMeasure.TRUE_POSITIVES] = self.tp 
-        new_dict_of_parameters[QualityMeasure.FALSE_POSITIVES] = self.fp
-        return quality_measure.compute(new_dict_of_parameters)
+        return quality_measure.compute_counts(self.tp, self.fp, dict_of_parameters.get(QualityMeasure.TRUE_POPULATION), dict_of_parameters.get(QualityMeasure.FALSE_POPULATION), dict_of_parameters)
     
-    def join(self, other_vertical_list : 'VerticalListWithSets', quality_measure : QualityMeasure, dict_of_parameters : dict[str, Union[int, float]], return_None_if_n_is_0 : bool = False) -> Union['VerticalListWithSets', None]:
+    def join(self, other_vertical_list : 'VerticalListWithSets', quality_measure : Union[QualityMeasure, Callable[[int, int], float]], dict_of_parameters : dict[str, Union[int, float]], return_None_if_n_is_0 : bool = False) -> Union['VerticalListWithSets', None]:
         """Method to create a new Vertical List as a result of the join of two Vertical Lists. The join of two Vertical Lists implies the following: (1) the last selector of the list of selectors of the second Vertical List is added to the end of the list of selectors of the first Vertical List, and (2) the new sequences of IDs (both) are the intersection of the corresponding original ones.
         
         :param other_vertical_list: the Vertical List with which to make the join.
-        :param quality_measure: the quality measure which is used to compute the quality value of the created Vertical List.
+        :param quality_measure: the quality measure which is used to compute the quality value of the created Vertical List, or a bound quality measure (i.e., the function returned by the method 'bind' of a quality measure), in which case 'dict_of_parameters' is not used.
         :param dict_of_parameters: python dictionary which contains all needed parameters with which to compute the Vertical List quality value. IMPORTANT: this method uses the 'tp' and 'fp' parameters of the created Vertical List, not of the dictionary of parameters passed by parameter.
         :param return_None_if_n_is_0: if the subgroup parameter n (i.e., tp + fp) of the resulting Vertical List (i.e., the join) is 0, this means that both sequence of instances are empty and, therefore, this means that the pattern represented by the Vertical List is not in any instance in the dataset. If the parameter 'return_None_if_n_is_0' is True, None will be returned instead of a Vertical List object. By default, this parameter is False.
         :return: a new Vertical List as a result of the join of this Vertical List (self) and 'other_vertical_list'.
         """
         if type(other_vertical_list) is not VerticalListWithSets:
             raise TypeError("The type of the parameter 'other_vertical_list' must be 'VerticalListWithSets'.")
-        if not isinstance(quality_measure, QualityMeasure):
-            raise TypeError("The parameter 'quality_measure' must be an instance of a subclass of the 'QualityMeasure' class.")
+        if (not isinstance(quality_measure, QualityMeasure)) and (not callable(quality_measure)):
+            raise TypeError("The parameter 'quality_measure' must be an instance of a subclass of the 'QualityMeasure' class or a bound quality measure.")
         if type(dict_of_parameters) is not dict:
             raise TypeError("The type of the parameter 'dict_of_parameters' must be 'dict'.")
         if type(return_None_if_n_is_0) is not bool:
@@ -105,10 +102,10 @@ class VerticalListWithSets(VerticalList):
             new_list_of_selectors = self._list_of_selectors.copy()
             new_list_of_selectors.append(other_vertical_list._list_of_selectors[-1])
             # Third, obtain the quality value.
-            new_dict_of_parameters = dict_of_parameters.copy()
-            new_dict_of_parameters[QualityMeasure.TRUE_POSITIVES] = new_tp 
-            new_dict_of_parameters[QualityMeasure.FALSE_POSITIVES] = new_fp
-            new_quality_value = quality_measure.compute(new_dict_of_parameters)
+            if isinstance(quality_measure, QualityMeasure):
+                new_quality_value = quality_measure.compute_counts(new_tp, new_fp, dict_of_parameters.get(QualityMeasure.TRUE_POPULATION), dict_of_parameters.get(QualityMeasure.FALSE_POPULATION), dict_of_parameters)
+            else: # Bound quality measure.
+                new_quality_value = quality_measure(new_tp, new_fp)
             # Finally, create the object.
             result = VerticalListWithSets(new_list_of_selectors, [], [], 0, new_quality_value)
             result._sequence_of_instances_tp = new_sequence_of_instances_tp
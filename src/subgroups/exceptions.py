@@ -33,3 +33,7 @@ class DuplicateFpTreeNodeError(RuntimeError):
 class VerticalListSizeError(ValueError):
     """This exception is raised when comparing Vertical Lists with different dataset sizes.
     """
+
+class InvalidExpressionError(ValueError):
+    """This exception is raised when the expression of a quality measure is not valid (e.g., it has a syntax error or it contains elements which are not allowed).
+    """
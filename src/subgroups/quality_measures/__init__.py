@@ -1,6 +1,7 @@
 from subgroups.quality_measures.quality_measure import QualityMeasure
 from subgroups.quality_measures.binomial_test import BinomialTest
 from subgroups.quality_measures.binomial_test_optimistic_estimate_1 import BinomialTestOptimisticEstimate1
+from subgroups.quality_measures.binomial_test_optimistic_estimate_2 import BinomialTestOptimisticEstimate2
 from subgroups.quality_measures.coverage import Coverage
 from subgroups.quality_measures.piatetsky_shapiro import PiatetskyShapiro
 from subgroups.quality_measures.piatetsky_shapiro_optimistic_estimate_1 import PiatetskyShapiroOptimisticEstimate1
@@ -13,7 +14,15 @@ from subgroups.quality_measures.support import Support
 from subgroups.quality_measures.wracc import WRAcc
 from subgroups.quality_measures.absolute_wracc import AbsoluteWRAcc
 from subgroups.quality_measures.wracc_optimistic_estimate_1 import WRAccOptimisticEstimate1
+from subgroups.quality_measures.wracc_optimistic_estimate_2 import WRAccOptimisticEstimate2
 from subgroups.quality_measures.specificity import Specificity
 from subgroups.quality_measures.irr import IRR
 from subgroups.quality_measures.f1_score import F1Score
 from subgroups.quality_measures.youden import Youden
+from subgroups.quality_measures.qg_optimistic_estimate_1 import QgOptimisticEstimate1
+from subgroups.quality_measures.irr_optimistic_estimate_1 import IRROptimisticEstimate1
+from subgroups.quality_measures.f1_score_optimistic_estimate_1 import F1ScoreOptimisticEstimate1
+from subgroups.quality_measures.youden_optimistic_estimate_1 import YoudenOptimisticEstimate1
+from subgroups.quality_measures.ppv_optimistic_estimate_1 import PPVOptimisticEstimate1
+from subgroups.quality_measures.sensitivity_optimistic_estimate_1 import SensitivityOptimisticEstimate1
+from subgroups.quality_measures.expression_quality_measure import ExpressionQualityMeasure
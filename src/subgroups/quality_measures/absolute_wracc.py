@@ -8,9 +8,10 @@
 
 from subgroups.quality_measures.quality_measure import QualityMeasure
 from subgroups.quality_measures.wracc import WRAcc
+from numpy import ndarray, absolute, float64
 
 # Python annotations.
-from typing import Union
+from typing import Union, Callable
 
 class AbsoluteWRAcc(WRAcc):
     """This class defines the AbsoluteWRAcc quality measure. This new quality measure always returns the absolute value of the original WRAcc quality measure.
@@ -32,6 +33,29 @@ class AbsoluteWRAcc(WRAcc):
         """
         return abs( super().compute(dict_of_parameters) )
     
+    def compute_counts(self, tp : Union[int, float], fp : Union[int, float], TP : Union[int, float], FP : Union[int, float], additional_parameters : Union[dict[str, Union[int, float]], None] = None) -> float:
+        """Method to compute the AbsoluteWRAcc quality measure from the subgroup parameters passed by position (i.e., without building a python dictionary). IMPORTANT: the parameters are not checked.
+        
+        :param tp: the true positives tp of the subgroup.
+        :param fp: the false positives fp of the subgroup.
+        :param TP: the true population TP of the dataset.
+        :param FP: the false population FP of the dataset.
+        :param additional_parameters: the additional parameters of this quality measure (not used).
+        :return: the computed value for the AbsoluteWRAcc quality measure.
+        """
+        return abs( super().compute_counts(tp, fp, TP, FP, additional_parameters) )
+    
+    def _compute_batch(self, tp : ndarray, fp : ndarray, TP : float64, FP : float64, additional_parameters : dict[str, Union[int, float]]) -> ndarray:
+        # Private method with the vectorized formula of the AbsoluteWRAcc quality measure (see the method 'compute_batch').
+        return absolute( super()._compute_batch(tp, fp, TP, FP, additional_parameters) )
+    
+    def bind(self, TP : Union[int, float], FP : Union[int, float], **additional_parameters : Union[int, float]) -> Callable[[Union[int, float], Union[int, float]], float]:
+        """Method to bind the AbsoluteWRAcc quality measure to the subgroup parameters TP and FP of a dataset (see the method 'bind' of the class 'QualityMeasure'). The values which only depend on TP and FP are computed only once (see the WRAcc quality measure)."""
+        bound_wracc = super().bind(TP, FP, **additional_parameters)
+        def bound_absolute_wracc(tp : Union[int, float], fp : Union[int, float]) -> float:
+            return abs( bound_wracc(tp, fp) )
+        return bound_absolute_wracc
+    
     def get_name(self) -> str:
         """Method to get the quality measure name (equal to the class name).
         """
@@ -9,9 +9,10 @@
 from subgroups.quality_measures.quality_measure import QualityMeasure
 from subgroups.exceptions import SubgroupParameterNotFoundError
 from math import sqrt
+from numpy import ndarray, float64, sqrt as numpy_sqrt
 
 # Python annotations.
-from typing import Union
+from typing import Union, Callable
 
 class BinomialTest(QualityMeasure):
     """This class defines the Binomial Test quality measure.
@@ -45,12 +46,44 @@ class BinomialTest(QualityMeasure):
         fp = dict_of_parameters[QualityMeasure.FALSE_POSITIVES]
         TP = dict_of_parameters[QualityMeasure.TRUE_POPULATION]
         FP = dict_of_parameters[QualityMeasure.FALSE_POPULATION]
+        return self.compute_counts(tp, fp, TP, FP, dict_of_parameters)
+    
+    def compute_counts(self, tp : Union[int, float], fp : Union[int, float], TP : Union[int, float], FP : Union[int, float], additional_parameters : Union[dict[str, Union[int, float]], None] = None) -> float:
+        """Method to compute the BinomialTest quality measure from the subgroup parameters passed by position (i.e., without building a python dictionary). IMPORTANT: the parameters are not checked.
+        
+        :param tp: the true positives tp of the subgroup.
+        :param fp: the false positives fp of the subgroup.
+        :param TP: the true population TP of the dataset.
+        :param FP: the false population FP of the dataset.
+        :param additional_parameters: the additional parameters of this quality measure (not used).
+        :return: the computed value for the BinomialTest quality measure.
+        """
         n = tp + fp
         N = TP + FP
         p = tp / n # p = tp / ( tp + fp )
         p0 = TP / N # p0 = TP / ( TP + FP )
         return ( ( (p-p0)*sqrt(n) ) / ( sqrt(p0*(1-p0)) ) ) * sqrt( N / ( N - n ) )
     
+    def _compute_batch(self, tp : ndarray, fp : ndarray, TP : float64, FP : float64, additional_parameters : dict[str, Union[int, float]]) -> ndarray:
+        # Private method with the vectorized formula of the BinomialTest quality measure (see the method 'compute_batch').
+        n = tp + fp
+        N = TP + FP
+        p = tp / n
+        p0 = TP / N
+        return ( ( (p-p0)*numpy_sqrt(n) ) / ( numpy_sqrt(p0*(1-p0)) ) ) * numpy_sqrt( N / ( N - n ) )
+    
+    def bind(self, TP : Union[int, float], FP : Union[int, float], **additional_parameters : Union[int, float]) -> Callable[[Union[int, float], Union[int, float]], float]:
+        """Method to bind the BinomialTest quality measure to the subgroup parameters TP and FP of a dataset (see the method 'bind' of the class 'QualityMeasure'). The values which only depend on TP and FP (N = TP + FP, p0 = TP / N and sqrt(p0 * (1 - p0))) are computed only once."""
+        N = TP + FP
+        if N == 0: # The values which depend on TP and FP cannot be precomputed.
+            return super().bind(TP, FP, **additional_parameters)
+        p0 = TP / N # p0 = TP / ( TP + FP )
+        sqrt_p0_1_p0 = sqrt(p0*(1-p0))
+        def bound_binomial_test(tp : Union[int, float], fp : Union[int, float]) -> float:
+            n = tp + fp
+            return ( ( ((tp / n)-p0)*sqrt(n) ) / ( sqrt_p0_1_p0 ) ) * sqrt( N / ( N - n ) )
+        return bound_binomial_test
+    
     def get_name(self) -> str:
         """Method to get the quality measure name (equal to the class name).
         """
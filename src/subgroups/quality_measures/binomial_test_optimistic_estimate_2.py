@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+# Contributors:
+#    Antonio López Martínez-Carrasco <antoniolopezmc1995@gmail.com>
+
+"""This file contains the implementation of an Optimistic Estimate of the Binomial Test quality measure.
+"""
+
+from subgroups.quality_measures.quality_measure import QualityMeasure
+from subgroups.exceptions import SubgroupParameterNotFoundError
+from math import sqrt
+from subgroups.quality_measures.binomial_test import BinomialTest
+from numpy import ndarray, float64, sqrt as numpy_sqrt
+
+# Python annotations.
+from typing import Union, Callable
+
+class BinomialTestOptimisticEstimate2(QualityMeasure):
+    """This class defines an Optimistic Estimate of the Binomial Test quality measure. It is the maximum of the BinomialTest quality measure over all the possible refinements of a subgroup (i.e., over all the pairs (tp', fp') with tp' <= tp and fp' <= fp), which is reached when tp' = tp and fp' = 0: ( ( (1 - p0) * sqrt(tp) ) / sqrt(p0 * (1 - p0)) ) * sqrt(N / (N - tp)). Unlike BinomialTestOptimisticEstimate1 (which bounds sqrt(n) * (p - p0)), this optimistic estimate also takes into account the normalization factors of the BinomialTest quality measure.
+    """
+    
+    _singleton = None
+    __slots__ = ()
+    
+    def __new__(cls) -> 'BinomialTestOptimisticEstimate2':
+        if BinomialTestOptimisticEstimate2._singleton is None:
+            BinomialTestOptimisticEstimate2._singleton = object().__new__(cls)
+        return BinomialTestOptimisticEstimate2._singleton
+    
+    def compute(self, dict_of_parameters : dict[str, Union[int, float]]) -> float:
+        """Method to compute the BinomialTestOptimisticEstimate2 quality measure (you can also call to the instance for this purpose).
+        
+        :param dict_of_parameters: python dictionary which contains all the necessary parameters used to compute this quality measure.
+        :return: the computed value for the BinomialTestOptimisticEstimate2 quality measure.
+        """
+        if type(dict_of_parameters) is not dict:
+            raise TypeError("The type of the parameter 'dict_of_parameters' must be 'dict'.")
+        if (QualityMeasure.TRUE_POSITIVES not in dict_of_parameters):
+            raise SubgroupParameterNotFoundError("The subgroup parameter 'tp' is not in 'dict_of_parameters'.")
+        if (QualityMeasure.TRUE_POPULATION not in dict_of_parameters):
+            raise SubgroupParameterNotFoundError("The subgroup parameter 'TP' is not in 'dict_of_parameters'.")
+        if (QualityMeasure.FALSE_POPULATION not in dict_of_parameters):
+            raise SubgroupParameterNotFoundError("The subgroup parameter 'FP' is not in 'dict_of_parameters'.")
+        tp = dict_of_parameters[QualityMeasure.TRUE_POSITIVES]
+        TP = dict_of_parameters[QualityMeasure.TRUE_POPULATION]
+        FP = dict_of_parameters[QualityMeasure.FALSE_POPULATION]
+        return self.compute_counts(tp, None, TP, FP, dict_of_parameters)
+    
+    def compute_counts(self, tp : Union[int, float], fp : Union[int, float], TP : Union[int, float], FP : Union[int, float], additional_parameters : Union[dict[str, Union[int, float]], None] = None) -> float:
+        """Method to compute the BinomialTestOptimisticEstimate2 quality measure from the subgroup parameters passed by position (i.e., without building a python dictionary). IMPORTANT: the parameters are not checked.
+        
+        :param tp: the true positives tp of the subgroup.
+        :param fp: the false positives fp of the subgroup.
+        :param TP: the true population TP of the dataset.
+        :param FP: the false population FP of the dataset.
+        :param additional_parameters: the additional parameters of this quality measure (not used).
+        :return: the computed value for the BinomialTestOptimisticEstimate2 quality measure.
+        """
+        N = TP + FP
+        p0 = TP / N
+        return ( ( (1-p0)*sqrt(tp) ) / ( sqrt(p0*(1-p0)) ) ) * sqrt( N / ( N - tp ) ) # BinomialTest(tp, 0)
+    
+    def _compute_batch(self, tp : ndarray, fp : ndarray, TP : float64, FP : float64, additional_parameters : dict[str, Union[int, float]]) -> ndarray:
+        # Private method with the vectorized formula of the BinomialTestOptimisticEstimate2 quality measure (see the method 'compute_batch').
+        N = TP + FP
+        p0 = TP / N
+        return ( ( (1-p0)*numpy_sqrt(tp) ) / ( numpy_sqrt(p0*(1-p0)) ) ) * numpy_sqrt( N / ( N - tp ) )
+    
+    def bind(self, TP : Union[int, float], FP : Union[int, float], **additional_parameters : Union[int, float]) -> Callable[[Union[int, float], Union[int, float]], float]:
+        """Method to bind the BinomialTestOptimisticEstimate2 quality measure to the subgroup parameters TP and FP of a dataset (see the method 'bind' of the class 'QualityMeasure'). The values which only depend on TP and FP (N = TP + FP, 1 - p0 and sqrt(p0 * (1 - p0))) are computed only once."""
+        N = TP + FP
+        if N == 0: # The values which depend on TP and FP cannot be precomputed.
+            return super().bind(TP, FP, **additional_parameters)
+        p0 = TP / N
+        one_minus_p0 = 1-p0
+        sqrt_p0_1_p0 = sqrt(p0*(1-p0))
+        def bound_binomial_test_optimistic_estimate_2(tp : Union[int, float], fp : Union[int, float]) -> float:
+            return ( ( one_minus_p0*sqrt(tp) ) / ( sqrt_p0_1_p0 ) ) * sqrt( N / ( N - tp ) )
+        return bound_binomial_test_optimistic_estimate_2
+    
+    def get_name(self) -> str:
+        """Method to get the quality measure name (equal to the class name).
+        """
+        return "BinomialTestOptimisticEstimate2"
+    
+    def optimistic_estimate_of(self) -> dict[str, QualityMeasure]:
+        """Method to get a python dictionary with the quality measures of which this one is an optimistic estimate.
+        
+        :return: a python dictionary in which the keys are the quality measure names and the values are the instances of those quality measures.
+        """
+        return dict({BinomialTest().get_name() : BinomialTest()})
+
+    def __call__(self, dict_of_parameters : dict[str, Union[int, float]]) -> float:
+        """Compute the BinomialTestOptimisticEstimate2 quality measure.
+        
+        :param dict_of_parameters: python dictionary which contains all the needed parameters with which to compute this quality measure.
+        :return: the computed value for the BinomialTestOptimisticEstimate2 quality measure.
+        """
+        return self.compute(dict_of_parameters)
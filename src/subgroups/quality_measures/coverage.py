@@ -8,9 +8,10 @@
 
 from subgroups.quality_measures.quality_measure import QualityMeasure
 from subgroups.exceptions import SubgroupParameterNotFoundError
+from numpy import ndarray, float64
 
 # Python annotations.
-from typing import Union
+from typing import Union, Callable
 
 class Coverage(QualityMeasure):
     """This class defines the Coverage quality measure.
@@ -44,8 +45,31 @@ class Coverage(QualityMeasure):
         fp = dict_of_parameters[QualityMeasure.FALSE_POSITIVES]
         TP = dict_of_parameters[QualityMeasure.TRUE_POPULATION]
         FP = dict_of_parameters[QualityMeasure.FALSE_POPULATION]
+        return self.compute_counts(tp, fp, TP, FP, dict_of_parameters)
+    
+    def compute_counts(self, tp : Union[int, float], fp : Union[int, float], TP : Union[int, float], FP : Union[int, float], additional_parameters : Union[dict[str, Union[int, float]], None] = None) -> float:
+        """Method to compute the Coverage quality measure from the subgroup parameters passed by position (i.e., without building a python dictionary). IMPORTANT: the parameters are not checked.
+        
+        :param tp: the true positives tp of the subgroup.
+        :param fp: the false positives fp of the subgroup.
+        :param TP: the true population TP of the dataset.
+        :param FP: the false population FP of the dataset.
+        :param additional_parameters: the additional parameters of this quality measure (not used).
+        :return: the computed value for the Coverage quality measure.
+        """
         return ( tp + fp ) / ( TP + FP )
     
+    def _compute_batch(self, tp : ndarray, fp : ndarray, TP : float64, FP : float64, additional_parameters : dict[str, Union[int, float]]) -> ndarray:
+        # Private method with the vectorized formula of the Coverage quality measure (see the method 'compute_batch').
+        return ( tp + fp ) / ( TP + FP )
+    
+    def bind(self, TP : Union[int, float], FP : Union[int, float], **additional_parameters : Union[int, float]) -> Callable[[Union[int, float], Union[int, float]], float]:
+        """Method to bind the Coverage quality measure to the subgroup parameters TP and FP of a dataset (see the method 'bind' of the class 'QualityMeasure'). The values which only depend on TP and FP (N = TP + FP) are computed only once."""
+        N = TP + FP
+        def bound_coverage(tp : Union[int, float], fp : Union[int, float]) -> float:
+            return ( tp + fp ) / N
+        return bound_coverage
+    
     def get_name(self) -> str:
         """Method to get the quality measure name (equal to the class name).
         """
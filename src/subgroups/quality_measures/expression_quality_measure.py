@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+
+# Contributors:
+#    Antonio López Martínez-Carrasco <antoniolopezmc1995@gmail.com>
+
+"""This file contains the implementation of the Expression Quality Measure, a quality measure defined by an arithmetic expression over the subgroup parameters.
+"""
+
+from subgroups.quality_measures.quality_measure import QualityMeasure
+from subgroups.exceptions import ParameterNotFoundError, SubgroupParameterNotFoundError, InvalidExpressionError
+from ast import parse, walk, unparse, copy_location, fix_missing_locations, NodeTransformer, AST, Expression, Lambda, arguments, arg, Name, Constant, Load, BinOp, UnaryOp, Call, Add, Sub, Mult, Div, Pow, UAdd, USub
+from copy import deepcopy
+from math import sqrt, log, exp
+from numpy import ndarray, float64, sqrt as numpy_sqrt, log as numpy_log, exp as numpy_exp, absolute, minimum, maximum, float_power
+
+# Python annotations.
+from typing import Union, Callable, Any
+
+# Subgroup parameters which can be used in the expressions (in the order of the positional parameters of the compiled functions).
+_SUBGROUP_PARAMETERS = (QualityMeasure.TRUE_POSITIVES, QualityMeasure.FALSE_POSITIVES, QualityMeasure.TRUE_POPULATION, QualityMeasure.FALSE_POPULATION)
+
+# Functions which can be used in the expressions: name -> (number of arguments, scalar implementation, numpy implementation).
+_FUNCTIONS = {
+    "sqrt" : (1, sqrt, numpy_sqrt),
+    "log" : (1, log, numpy_log),
+    "exp" : (1, exp, numpy_exp),
+    "abs" : (1, abs, absolute),
+    "min" : (2, min, minimum),
+    "max" : (2, max, maximum)
+}
+
+def _scalar_power(base : Union[int, float], exponent : Union[int, float]) -> float:
+    # Private function to compute the operator ** of the expressions with float values, so that a large exponent raises an OverflowError instead of computing an unbounded int value.
+    return float(base) ** float(exponent)
+
+# Implementations of the operator ** of the expressions (scalar implementation, numpy implementation).
+_POWER = (_scalar_power, float_power)
+
+# Types of the nodes of the abstract syntax tree which can be used in the expressions.
+_ALLOWED_NODES = (Expression, BinOp, UnaryOp, Call, Name, Constant, Load, Add, Sub, Mult, Div, Pow, UAdd, USub)
+
+def _parse_expression(expression : str) -> tuple[Expression, tuple[str, ...]]:
+    # Private function to parse and to check an expression. It returns the abstract syntax tree and the names of the additional parameters (in order of appearance).
+    try:
+        tree = parse(expression.strip(), mode = "eval")
+    except SyntaxError as e:
+        raise InvalidExpressionError("The expression '" + expression + "' is not a valid python expression (" + str(e.msg) + ").") from None
+    function_names = set()
+    variable_names = set()
+    for node in walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise InvalidExpressionError("The element '" + type(node).__name__ + "' is not allowed in the expression of a quality measure.")
+        if isinstance(node, Constant) and ((type(node.value) is not int) and (type(node.value) is not float)):
+            raise InvalidExpressionError("The constant " + repr(node.value) + " is not allowed in the expression of a quality measure (only int and float constants are allowed).")
+        if isinstance(node, Call):
+            if (not isinstance(node.func, Name)) or (node.func.id not in _FUNCTIONS):
+                raise InvalidExpressionError("Only the functions " + ", ".join(_FUNCTIONS) + " are allowed in the expression of a quality measure.")
+            if node.keywords or (len(node.args) != _FUNCTIONS[node.func.id][0]):
+                raise InvalidExpressionError("The function '" + node.func.id + "' must receive " + str(_FUNCTIONS[node.func.id][0]) + " positional argument(s).")
+            function_names.add(id(node.func))
+    additional_parameter_names = []
+    for node in walk(tree):
+        if isinstance(node, Name) and (id(node) not in function_names):
+            if (node.id in _FUNCTIONS) or node.id.startswith("_"):
+                raise InvalidExpressionError("The name '" + node.id + "' cannot be used as a parameter in the expression of a quality measure.")
+            if (node.id not in _SUBGROUP_PARAMETERS) and (node.id not in variable_names):
+                additional_parameter_names.append(node.id)
+            variable_names.add(node.id)
+    return tree, tuple(additional_parameter_names)
+
+class _NameReplacer(NodeTransformer):
+    # Private class to replace the parameters of an expression with other expressions (e.g., constants).
+
+    def __init__(self, replacements : dict[str, AST]) -> None:
+        self._replacements = replacements
+
+    def visit_Name(self, node : Name) -> AST:
+        if node.id in self._replacements:
+            return copy_location(deepcopy(self._replacements[node.id]), node)
+        return node
+
+    def visit_Call(self, node : Call) -> AST:
+        # The function names are not replaced.
+        node.args = [self.visit(argument) for argument in node.args]
+        return node
+
+class _PowerReplacer(NodeTransformer):
+    # Private class to replace the operator ** of an expression with a call to the function '_power' (see the variable '_POWER').
+
+    def visit_BinOp(self, node : BinOp) -> AST:
+        self.generic_visit(node)
+        if isinstance(node.op, Pow):
+            return copy_location(Call(func = Name(id = "_power", ctx = Load()), args = [node.left, node.right], keywords = []), node)
+        return node
+
+def _compile_function(tree : Expression, parameter_names : tuple[str, ...], vectorized : bool) -> Callable[..., Any]:
+    # Private function to compile an expression into a python function whose positional parameters are 'parameter_names' (with the numpy implementations of the functions and of the operator ** if 'vectorized' is True).
+    body = _PowerReplacer().visit(deepcopy(tree.body))
+    lambda_tree = Expression(body = Lambda(args = arguments(posonlyargs = [], args = [arg(arg = name) for name in parameter_names], kwonlyargs = [], kw_defaults = [], defaults = []), body = body))
+    functions = {function_name : _FUNCTIONS[function_name][2 if vectorized else 1] for function_name in _FUNCTIONS}
+    functions["_power"] = _POWER[1 if vectorized else 0]
+    return eval(compile(fix_missing_locations(lambda_tree), "<quality measure expression>", "eval"), {"__builtins__" : {}, **functions})
+
+class ExpressionQualityMeasure(QualityMeasure):
+    """This class defines a quality measure from an arithmetic expression over the subgroup parameters tp, fp, TP and FP (e.g., "(tp+fp)/(TP+FP) * (tp/(tp+fp) - TP/(TP+FP))"). The expression is compiled only once into a python function (used by the methods 'compute', 'compute_counts' and 'bind') and into a numpy vectorized function (used by the method 'compute_batch').
+
+    The expressions can only contain int and float constants, the operators +, -, *, / and ** (which is always computed with float values), and the functions sqrt, log, exp, abs, min (2 arguments) and max (2 arguments). Any other name in the expression (e.g., 'g') is an additional parameter of the quality measure, which must be passed like the additional parameters of the other quality measures.
+
+    :param name: the quality measure name.
+    :param expression: the arithmetic expression which defines the quality measure.
+    :param optimistic_estimate_of: the quality measures of which this one is an optimistic estimate (an empty list by default).
+    """
+
+    __slots__ = ("_name", "_expression", "_tree", "_subgroup_parameter_names", "_additional_parameter_names", "_scalar_function", "_batch_function", "_optimistic_estimate_of")
+
+    def __init__(self, name : str, expression : str, optimistic_estimate_of : Union[list[QualityMeasure], None] = None) -> None:
+        if type(name) is not str:
+            raise TypeError("The type of the parameter 'name' must be 'str'.")
+        if type(expression) is not str:
+            raise TypeError("The type of the parameter 'expression' must be 'str'.")
+        if (type(optimistic_estimate_of) is not list) and (optimistic_estimate_of is not None):
+            raise TypeError("The type of the parameter 'optimistic_estimate_of' must be 'list' or 'NoneType'.")
+        if (optimistic_estimate_of is not None) and (not all(isinstance(quality_measure, QualityMeasure) for quality_measure in optimistic_estimate_of)):
+            raise TypeError("The elements of the parameter 'optimistic_estimate_of' must be instances of a subclass of the 'QualityMeasure' class.")
+        self._name = name
+        self._expression = expression
+        self._tree, self._additional_parameter_names = _parse_expression(expression)
+        used_names = {node.id for node in walk(self._tree) if isinstance(node, Name)}
+        self._subgroup_parameter_names = tuple(subgroup_parameter for subgroup_parameter in _SUBGROUP_PARAMETERS if subgroup_parameter in used_names)
+        parameter_names = _SUBGROUP_PARAMETERS + self._additional_parameter_names
+        self._scalar_function = _compile_function(self._tree, parameter_names, False)
+        self._batch_function = _compile_function(self._tree, parameter_names, True)
+        if optimistic_estimate_of is None:
+            self._optimistic_estimate_of = dict()
+        else:
+            self._optimistic_estimate_of = {quality_measure.get_name() : quality_measure for quality_measure in optimistic_estimate_of}
+
+    def _get_expression(self) -> str:
+        return self._expression
+
+    def _get_additional_parameter_names(self) -> tuple[str, ...]:
+        return self._additional_parameter_names
+
+    expression = property(_get_expression, None, None, "The arithmetic expression which defines the quality measure.")
+    additional_parameter_names = property(_get_additional_parameter_names, None, None, "The names of the additional parameters (i.e., those parameters which are not tp, fp, TP and FP) used in the expression.")
+
+    def compute(self, dict_of_parameters : dict[str, Union[int, float]]) -> float:
+        """Method to compute the quality measure (you can also call to the instance for this purpose). IMPORTANT: only the subgroup parameters and the additional parameters used in the expression are needed.
+
+        :param dict_of_parameters: python dictionary which contains all the necessary parameters used to compute this quality measure.
+        :return: the computed value for the quality measure.
+        """
+        if type(dict_of_parameters) is not dict:
+            raise TypeError("The type of the parameter 'dict_of_parameters' must be 'dict'.")
+        for subgroup_parameter in self._subgroup_parameter_names:
+            if subgroup_parameter not in dict_of_parameters:
+                raise SubgroupParameterNotFoundError("The subgroup parameter '" + subgroup_parameter + "' is not in 'dict_of_parameters'.")
+        for additional_parameter in self._additional_parameter_names:
+            if additional_parameter not in dict_of_parameters:
+                raise ParameterNotFoundError("The parameter '" + additional_parameter + "' is not in 'dict_of_parameters'.")
+        tp = dict_of_parameters.get(QualityMeasure.TRUE_POSITIVES)
+        fp = dict_of_parameters.get(QualityMeasure.FALSE_POSITIVES)
+        TP = dict_of_parameters.get(QualityMeasure.TRUE_POPULATION)
+        FP = dict_of_parameters.get(QualityMeasure.FALSE_POPULATION)
+        return self.compute_counts(tp, fp, TP, FP, dict_of_parameters)
+
+    def _get_additional_parameter_values(self, additional_parameters : Union[dict[str, Union[int, float]], None]) -> list[Union[int, float]]:
+        # Private method to get the values of the additional parameters used in the expression (in order).
+        try:
+            return [additional_parameters[name] for name in self._additional_parameter_names]
+        except (KeyError, TypeError):
+            raise ParameterNotFoundError("The parameters " + str(list(self._additional_parameter_names)) + " must be in 'additional_parameters'.") from None
+
+    def compute_counts(self, tp : Union[int, float], fp : Union[int, float], TP : Union[int, float], FP : Union[int, float], additional_parameters : Union[dict[str, Union[int, float]], None] = None) -> float:
+        """Method to compute the quality measure from the subgroup parameters passed by position (i.e., without building a python dictionary). IMPORTANT: the parameters are not checked.
+
+        :param tp: the true positives tp of the subgroup.
+        :param fp: the false positives fp of the subgroup.
+        :param TP: the true population TP of the dataset.
+        :param FP: the false population FP of the dataset.
+        :param additional_parameters: python dictionary which contains the additional parameters used in the expression, or None if there are not additional parameters.
+        :return: the computed value for the quality measure.
+        """
+        if not self._additional_parameter_names:
+            return self._scalar_function(tp, fp, TP, FP)
+        return self._scalar_function(tp, fp, TP, FP, *self._get_additional_parameter_values(additional_parameters))
+
+    def _compute_batch(self, tp : ndarray, fp : ndarray, TP : float64, FP : float64, additional_parameters : dict[str, Union[int, float]]) -> ndarray:
+        # Private method to compute the quality measure for several subgroups at once with the version of the expression whose functions are numpy functions (see the method 'compute_batch').
+        additional_parameter_values = [float64(value) for value in self._get_additional_parameter_values(additional_parameters)]
+        return self._batch_function(tp, fp, TP, FP, *additional_parameter_values)
+
+    def bind(self, TP : Union[int, float], FP : Union[int, float], **additional_parameters : Union[int, float]) -> Callable[[Union[int, float], Union[int, float]], float]:
+        """Method to bind the quality measure to the subgroup parameters TP and FP of a dataset and to its additional parameters (i.e., the returned function only receives the subgroup parameters tp and fp). The expression is compiled again with TP, FP and the additional parameters as constants, so the python compiler computes only once the subexpressions which only depend on them.
+
+        :param TP: the true population TP of the dataset.
+        :param FP: the false population FP of the dataset.
+        :param additional_parameters: the additional parameters used in the expression, passed as keyword arguments.
+        :return: a function which receives the subgroup parameters tp and fp and returns the computed value for the quality measure. IMPORTANT: the parameters are not checked.
+        """
+        replacements = dict(zip(self._additional_parameter_names, self._get_additional_parameter_values(additional_parameters)))
+        replacements[QualityMeasure.TRUE_POPULATION] = TP
+        replacements[QualityMeasure.FALSE_POPULATION] = FP
+        if not all((type(value) is int) or (type(value) is float) for value in replacements.values()): # Only the python numbers can be constants of the expression.
+            return super().bind(TP, FP, **additional_parameters)
+        tree = _NameReplacer({name : Constant(value = value) for name, value in replacements.items()}).visit(deepcopy(self._tree))
+        return _compile_function(tree, (QualityMeasure.TRUE_POSITIVES, QualityMeasure.FALSE_POSITIVES), False)
+
+    def derive_optimistic_estimate(self, name : Union[str, None] = None) -> 'ExpressionQualityMeasure':
+        """Method to derive a tp-only optimistic estimate of the quality measure by substitution: the value of the quality measure for the best possible refinement of a subgroup (i.e., a refinement which keeps all the true positives and has no false positives), which is obtained by replacing fp with 0 in the expression. If tp is 0, fp is replaced with min(fp, 1) instead (i.e., the best refinement which is not empty), so that the optimistic estimate is defined for all the subgroups. IMPORTANT: the result is only an optimistic estimate if the quality measure is non-decreasing in tp and non-increasing in fp (e.g., WRAcc, F1 Score or Youden), and this condition is not checked.
+
+        :param name: the name of the optimistic estimate. By default, the quality measure name followed by 'OptimisticEstimate'.
+        :return: the derived optimistic estimate, whose method 'optimistic_estimate_of' returns this quality measure.
+        """
+        if (type(name) is not str) and (name is not None):
+            raise TypeError("The type of the parameter 'name' must be 'str' or 'NoneType'.")
+        if name is None:
+            name = self._name + "OptimisticEstimate"
+        # fp is replaced with min(fp, 1 - min(tp, 1)), which is 0 if tp > 0 and min(fp, 1) if tp = 0.
+        tree = _NameReplacer({QualityMeasure.FALSE_POSITIVES : parse("min(fp, 1 - min(tp, 1))", mode = "eval").body}).visit(deepcopy(self._tree))
+        return ExpressionQualityMeasure(name, unparse(tree), optimistic_estimate_of = [self])
+
+    def get_name(self) -> str:
+        """Method to get the quality measure name (the name passed to the constructor).
+        """
+        return self._name
+
+    def optimistic_estimate_of(self) -> dict[str, QualityMeasure]:
+        """Method to get a python dictionary with the quality measures of which this one is an optimistic estimate.
+
+        :return: a python dictionary in which the keys are the quality measure names and the values are the instances of those quality measures.
+        """
+        return dict(self._optimistic_estimate_of)
+
+    def __call__(self, dict_of_parameters : dict[str, Union[int, float]]) -> float:
+        """Compute the quality measure.
+
+        :param dict_of_parameters: python dictionary which contains all the needed parameters with which to compute this quality measure.
+        :return: the computed value for the quality measure.
+        """
+        return self.compute(dict_of_parameters)
+
+    def __reduce__(self) -> tuple:
+        # The compiled functions cannot be pickled, so the quality measure is created again from its expression.
+        return (ExpressionQualityMeasure, (self._name, self._expression, list(self._optimistic_estimate_of.values())))
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+# Contributors:
+#    Antonio López Martínez-Carrasco <antoniolopezmc1995@gmail.com>
+
+"""This file contains the implementation of an Optimistic Estimate of the F1 Score quality measure.
+"""
+
+from subgroups.quality_measures.quality_measure import QualityMeasure
+from subgroups.exceptions import SubgroupParameterNotFoundError
+from subgroups.quality_measures.f1_score import F1Score
+from numpy import ndarray, float64
+
+# Python annotations.
+from typing import Union, Callable
+
+class F1ScoreOptimisticEstimate1(QualityMeasure):
+    """This class defines an Optimistic Estimate of the F1 Score quality measure. It is the value of the F1Score quality measure for the best possible refinement of a subgroup (i.e., a refinement which keeps all the true positives tp and which does not have false positives): 2 * tp / (tp + TP). Therefore, it only depends on tp (it does not use fp).
+    """
+    
+    _singleton = None
+    __slots__ = ()
+    
+    def __new__(cls) -> 'F1ScoreOptimisticEstimate1':
+        if F1ScoreOptimisticEstimate1._singleton is None:
+            F1ScoreOptimisticEstimate1._singleton = object().__new__(cls)
+        return F1ScoreOptimisticEstimate1._singleton
+    
+    def compute(self, dict_of_parameters : dict[str, Union[int, float]]) -> float:
+        """Method to compute the F1ScoreOptimisticEstimate1 quality measure (you can also call to the instance for this purpose).
+        
+        :param dict_of_parameters: python dictionary which contains all the necessary parameters used to compute this quality measure.
+        :return: the computed value for the F1ScoreOptimisticEstimate1 quality measure.
+        """
+        if type(dict_of_parameters) is not dict:
+            raise TypeError("The type of the parameter 'dict_of_parameters' must be 'dict'.")
+        if (QualityMeasure.TRUE_POSITIVES not in dict_of_parameters):
+            raise SubgroupParameterNotFoundError("The subgroup parameter 'tp' is not in 'dict_of_parameters'.")
+        if (QualityMeasure.TRUE_POPULATION not in dict_of_parameters):
+            raise SubgroupParameterNotFoundError("The subgroup parameter 'TP' is not in 'dict_of_parameters'.")
+        tp = dict_of_parameters[QualityMeasure.TRUE_POSITIVES]
+        TP = dict_of_parameters[QualityMeasure.TRUE_POPULATION]
+        return self.compute_counts(tp, None, TP, None, dict_of_parameters)
+    
+    def compute_counts(self, tp : Union[int, float], fp : Union[int, float], TP : Union[int, float], FP : Union[int, float], additional_parameters : Union[dict[str, Union[int, float]], None] = None) -> float:
+        """Method to compute the F1ScoreOptimisticEstimate1 quality measure from the subgroup parameters passed by position (i.e., without building a python dictionary). IMPORTANT: the parameters are not checked.
+        
+        :param tp: the true positives tp of the subgroup.
+        :param fp: the false positives fp of the subgroup (not used).
+        :param TP: the true population TP of the dataset.
+        :param FP: the false population FP of the dataset.
+        :param additional_parameters: the additional parameters of this quality measure (not used).
+        :return: the computed value for the F1ScoreOptimisticEstimate1 quality measure.
+        """
+        return (2*tp) / (tp+TP)
+    
+    def _compute_batch(self, tp : ndarray, fp : ndarray, TP : float64, FP : float64, additional_parameters : dict[str, Union[int, float]]) -> ndarray:
+        # Private method with the vectorized formula of the F1ScoreOptimisticEstimate1 quality measure (see the method 'compute_batch').
+        return (2*tp) / (tp+TP)
+    
+    def bind(self, TP : Union[int, float], FP : Union[int, float], **additional_parameters : Union[int, float]) -> Callable[[Union[int, float], Union[int, float]], float]:
+        """Method to bind the F1ScoreOptimisticEstimate1 quality measure to the subgroup parameters TP and FP of a dataset (see the method 'bind' of the class 'QualityMeasure')."""
+        def bound_f1_score_optimistic_estimate_1(tp : Union[int, float], fp : Union[int, float]) -> float:
+            return (2*tp) / (tp+TP)
+        return bound_f1_score_optimistic_estimate_1
+    
+    def get_name(self) -> str:
+        """Method to get the quality measure name (equal to the class name).
+        """
+        return "F1ScoreOptimisticEstimate1"
+    
+    def optimistic_estimate_of(self) -> dict[str, QualityMeasure]:
+        """Method to get a python dictionary with the quality measures of which this one is an optimistic estimate.
+        
+        :return: a python dictionary in which the keys are the quality measure names and the values are the instances of those quality measures.
+        """
+        return dict({F1Score().get_name() : F1Score()})
+    
+    def __call__(self, dict_of_parameters : dict[str, Union[int, float]]) -> float:
+        """Compute the F1ScoreOptimisticEstimate1 quality measure.
+        
+        :param dict_of_parameters: python dictionary which contains all the needed parameters with which to compute this quality measure.
+        :return: the computed value for the F1ScoreOptimisticEstimate1 quality measure.
+        """
+        return self.compute(dict_of_parameters)
@@ -8,9 +8,10 @@
 
 from subgroups.quality_measures.quality_measure import QualityMeasure
 from subgroups.exceptions import SubgroupParameterNotFoundError
+from numpy import ndarray, float64
 
 # Python annotations.
-from typing import Union
+from typing import Union, Callable
 
 class IRR(QualityMeasure):
     """This class defines the Incremental Response Rate (IRR) quality measure.
@@ -41,8 +42,30 @@ class IRR(QualityMeasure):
         tp = dict_of_parameters[QualityMeasure.TRUE_POSITIVES]
         fp = dict_of_parameters[QualityMeasure.FALSE_POSITIVES]
         FP = dict_of_parameters[QualityMeasure.FALSE_POPULATION]
+        return self.compute_counts(tp, fp, None, FP, dict_of_parameters)
+    
+    def compute_counts(self, tp : Union[int, float], fp : Union[int, float], TP : Union[int, float], FP : Union[int, float], additional_parameters : Union[dict[str, Union[int, float]], None] = None) -> float:
+        """Method to compute the IRR quality measure from the subgroup parameters passed by position (i.e., without building a python dictionary). IMPORTANT: the parameters are not checked.
+        
+        :param tp: the true positives tp of the subgroup.
+        :param fp: the false positives fp of the subgroup.
+        :param TP: the true population TP of the dataset.
+        :param FP: the false population FP of the dataset.
+        :param additional_parameters: the additional parameters of this quality measure (not used).
+        :return: the computed value for the IRR quality measure.
+        """
         return (tp/(tp+fp)) - 1 + ((FP-fp)/FP) # PPV - (1 - Specificity)
     
+    def _compute_batch(self, tp : ndarray, fp : ndarray, TP : float64, FP : float64, additional_parameters : dict[str, Union[int, float]]) -> ndarray:
+        # Private method with the vectorized formula of the IRR quality measure (see the method 'compute_batch').
+        return (tp/(tp+fp)) - 1 + ((FP-fp)/FP)
+    
+    def bind(self, TP : Union[int, float], FP : Union[int, float], **additional_parameters : Union[int, float]) -> Callable[[Union[int, float], Union[int, float]], float]:
+        """Method to bind the IRR quality measure to the subgroup parameters TP and FP of a dataset (see the method 'bind' of the class 'QualityMeasure')."""
+        def bound_irr(tp : Union[int, float], fp : Union[int, float]) -> float:
+            return (tp/(tp+fp)) - 1 + ((FP-fp)/FP)
+        return bound_irr
+    
     def get_name(self) -> str:
         """Method to get the quality measure name (equal to the class name).
         """
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+# Contributors:
+#    Antonio López Martínez-Carrasco <antoniolopezmc1995@gmail.com>
+
+"""This file contains the implementation of an Optimistic Estimate of the Impact Relative Risk (IRR) quality measure.
+"""
+
+from subgroups.quality_measures.quality_measure import QualityMeasure
+from subgroups.exceptions import SubgroupParameterNotFoundError
+from subgroups.quality_measures.irr import IRR
+from numpy import ndarray, float64
+
+# Python annotations.
+from typing import Union, Callable
+
+class IRROptimisticEstimate1(QualityMeasure):
+    """This class defines an Optimistic Estimate of the Impact Relative Risk (IRR) quality measure. It is the value of the IRR quality measure for the best possible refinement of a subgroup (i.e., a refinement which keeps all the true positives tp and which does not have false positives): 1 if tp > 0 and 0 otherwise. Therefore, it only depends on tp (it does not use fp).
+    """
+    
+    _singleton = None
+    __slots__ = ()
+    
+    def __new__(cls) -> 'IRROptimisticEstimate1':
+        if IRROptimisticEstimate1._singleton is None:
+            IRROptimisticEstimate1._singleton = object().__new__(cls)
+        return IRROptimisticEstimate1._singleton
+    
+    def compute(self, dict_of_parameters : dict[str, Union[int, float]]) -> float:
+        """Method to compute the IRROptimisticEstimate1 quality measure (you can also call to the instance for this purpose).
+        
+        :param dict_of_parameters: python dictionary which contains all the necessary parameters used to compute this quality measure.
+        :return: the computed value for the IRROptimisticEstimate1 quality measure.
+        """
+        if type(dict_of_parameters) is not dict:
+            raise TypeError("The type of the parameter 'dict_of_parameters' must be 'dict'.")
+        if (QualityMeasure.TRUE_POSITIVES not in dict_of_parameters):
+            raise SubgroupParameterNotFoundError("The subgroup parameter 'tp' is not in 'dict_of_parameters'.")
+        tp = dict_of_parameters[QualityMeasure.TRUE_POSITIVES]
+        return self.compute_counts(tp, None, None, None, dict_of_parameters)
+    
+    def compute_counts(self, tp : Union[int, float], fp : Union[int, float], TP : Union[int, float], FP : Union[int, float], additional_parameters : Union[dict[str, Union[int, float]], None] = None) -> float:
+        """Method to compute the IRROptimisticEstimate1 quality measure from the subgroup parameters passed by position (i.e., without building a python dictionary). IMPORTANT: the parameters are not checked.
+        
+        :param tp: the true positives tp of the subgroup.
+        :param fp: the false positives fp of the subgroup (not used).
+        :param TP: the true population TP of the dataset.
+        :param FP: the false population FP of the dataset.
+        :param additional_parameters: the additional parameters of this quality measure (not used).
+        :return: the computed value for the IRROptimisticEstimate1 quality measure.
+        """
+        return 1.0 if tp > 0 else 0.0
+    
+    def _compute_batch(self, tp : ndarray, fp : ndarray, TP : float64, FP : float64, additional_parameters : dict[str, Union[int, float]]) -> ndarray:
+        # Private method with the vectorized formula of the IRROptimisticEstimate1 quality measure (see the method 'compute_batch').
+        return (tp > 0).astype(float64)
+    
+    def bind(self, TP : Union[int, float], FP : Union[int, float], **additional_parameters : Union[int, float]) -> Callable[[Union[int, float], Union[int, float]], float]:
+        """Method to bind the IRROptimisticEstimate1 quality measure to the subgroup parameters TP and FP of a dataset (see the method 'bind' of the class 'QualityMeasure')."""
+        def bound_irr_optimistic_estimate_1(tp : Union[int, float], fp : Union[int, float]) -> float:
+            return 1.0 if tp > 0 else 0.0
+        return bound_irr_optimistic_estimate_1
+    
+    def get_name(self) -> str:
+        """Method to get the quality measure name (equal to the class name).
+        """
+        return "IRROptimisticEstimate1"
+    
+    def optimistic_estimate_of(self) -> dict[str, QualityMeasure]:
+        """Method to get a python dictionary with the quality measures of which this one is an optimistic estimate.
+        
+        :return: a python dictionary in which the keys are the quality measure names and the values are the instances of those quality measures.
+        """
+        return dict({IRR().get_name() : IRR()})
+    
+    def __call__(self, dict_of_parameters : dict[str, Union[int, float]]) -> float:
+        """Compute the IRROptimisticEstimate1 quality measure.
+        
+        :param dict_of_parameters: python dictionary which contains all the needed parameters with which to compute this quality measure.
+        :return: the computed value for the IRROptimisticEstimate1 quality measure.
+        """
+        return self.compute(dict_of_parameters)
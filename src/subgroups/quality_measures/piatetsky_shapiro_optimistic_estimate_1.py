@@ -9,9 +9,10 @@
 from subgroups.quality_measures.quality_measure import QualityMeasure
 from subgroups.exceptions import SubgroupParameterNotFoundError
 from subgroups.quality_measures.piatetsky_shapiro import PiatetskyShapiro
+from numpy import ndarray, float64
 
 # Python annotations.
-from typing import Union
+from typing import Union, Callable
 
 class PiatetskyShapiroOptimisticEstimate1(QualityMeasure): # SOURCE: https://link.springer.com/chapter/10.1007%2F978-3-540-87479-9_47
     """This class defines an Optimistic Estimate of the Piatetsky-Shapiro quality measure.
@@ -45,8 +46,34 @@ class PiatetskyShapiroOptimisticEstimate1(QualityMeasure): # SOURCE: https://lin
         fp = dict_of_parameters[QualityMeasure.FALSE_POSITIVES]
         TP = dict_of_parameters[QualityMeasure.TRUE_POPULATION]
         FP = dict_of_parameters[QualityMeasure.FALSE_POPULATION]
+        return self.compute_counts(tp, fp, TP, FP, dict_of_parameters)
+    
+    def compute_counts(self, tp : Union[int, float], fp : Union[int, float], TP : Union[int, float], FP : Union[int, float], additional_parameters : Union[dict[str, Union[int, float]], None] = None) -> float:
+        """Method to compute the PiatetskyShapiroOptimisticEstimate1 quality measure from the subgroup parameters passed by position (i.e., without building a python dictionary). IMPORTANT: the parameters are not checked.
+        
+        :param tp: the true positives tp of the subgroup.
+        :param fp: the false positives fp of the subgroup.
+        :param TP: the true population TP of the dataset.
+        :param FP: the false population FP of the dataset.
+        :param additional_parameters: the additional parameters of this quality measure (not used).
+        :return: the computed value for the PiatetskyShapiroOptimisticEstimate1 quality measure.
+        """
         return (tp+fp) * ( 1 - ( TP / (TP+FP) ) ) # n * (1 - p0)
     
+    def _compute_batch(self, tp : ndarray, fp : ndarray, TP : float64, FP : float64, additional_parameters : dict[str, Union[int, float]]) -> ndarray:
+        # Private method with the vectorized formula of the PiatetskyShapiroOptimisticEstimate1 quality measure (see the method 'compute_batch').
+        return (tp+fp) * ( 1 - ( TP / (TP+FP) ) )
+    
+    def bind(self, TP : Union[int, float], FP : Union[int, float], **additional_parameters : Union[int, float]) -> Callable[[Union[int, float], Union[int, float]], float]:
+        """Method to bind the PiatetskyShapiroOptimisticEstimate1 quality measure to the subgroup parameters TP and FP of a dataset (see the method 'bind' of the class 'QualityMeasure'). The values which only depend on TP and FP (1 - p0) are computed only once."""
+        N = TP + FP
+        if N == 0: # The values which depend on TP and FP cannot be precomputed.
+            return super().bind(TP, FP, **additional_parameters)
+        one_minus_p0 = 1 - ( TP / N )
+        def bound_piatetsky_shapiro_optimistic_estimate_1(tp : Union[int, float], fp : Union[int, float]) -> float:
+            return (tp+fp) * one_minus_p0
+        return bound_piatetsky_shapiro_optimistic_estimate_1
+    
     def get_name(self) -> str:
         """Method to get the quality measure name (equal to the class name).
         """
@@ -8,9 +8,10 @@
 
 from subgroups.quality_measures.quality_measure import QualityMeasure
 from subgroups.exceptions import ParameterNotFoundError, SubgroupParameterNotFoundError
+from numpy import ndarray, float64
 
 # Python annotations.
-from typing import Union
+from typing import Union, Callable
 
 class Qg(QualityMeasure):
     """This class defines the Qg quality measure.
@@ -41,9 +42,40 @@ class Qg(QualityMeasure):
             raise ParameterNotFoundError("The generalisation parameter 'g' is not in 'dict_of_parameters'.")
         tp = dict_of_parameters[QualityMeasure.TRUE_POSITIVES]
         fp = dict_of_parameters[QualityMeasure.FALSE_POSITIVES]
-        g = dict_of_parameters["g"]
+        return self.compute_counts(tp, fp, None, None, dict_of_parameters)
+    
+    def compute_counts(self, tp : Union[int, float], fp : Union[int, float], TP : Union[int, float], FP : Union[int, float], additional_parameters : Union[dict[str, Union[int, float]], None] = None) -> float:
+        """Method to compute the Qg quality measure from the subgroup parameters passed by position (i.e., without building a python dictionary). IMPORTANT: the parameters are not checked.
+        
+        :param tp: the true positives tp of the subgroup.
+        :param fp: the false positives fp of the subgroup.
+        :param TP: the true population TP of the dataset.
+        :param FP: the false population FP of the dataset.
+        :param additional_parameters: the additional parameters of this quality measure (i.e., a python dictionary which contains the parameter 'g').
+        :return: the computed value for the Qg quality measure.
+        """
+        # The generalisation parameter 'g' is the only parameter which is checked (it is not a subgroup parameter, so it could be missing).
+        if (additional_parameters is None) or ("g" not in additional_parameters):
+            raise ParameterNotFoundError("The generalisation parameter 'g' is not in 'additional_parameters'.")
+        g = additional_parameters["g"]
         return tp / ( fp + g )
     
+    def _compute_batch(self, tp : ndarray, fp : ndarray, TP : float64, FP : float64, additional_parameters : dict[str, Union[int, float]]) -> ndarray:
+        # Private method with the vectorized formula of the Qg quality measure (see the method 'compute_batch').
+        if "g" not in additional_parameters:
+            raise ParameterNotFoundError("The generalisation parameter 'g' is not in 'additional_parameters'.")
+        g = float64(additional_parameters["g"])
+        return tp / ( fp + g )
+    
+    def bind(self, TP : Union[int, float], FP : Union[int, float], **additional_parameters : Union[int, float]) -> Callable[[Union[int, float], Union[int, float]], float]:
+        """Method to bind the Qg quality measure to the subgroup parameters TP and FP of a dataset and to the generalisation parameter 'g' (see the method 'bind' of the class 'QualityMeasure')."""
+        if "g" not in additional_parameters:
+            raise ParameterNotFoundError("The generalisation parameter 'g' is not in 'additional_parameters'.")
+        g = additional_parameters["g"]
+        def bound_qg(tp : Union[int, float], fp : Union[int, float]) -> float:
+            return tp / ( fp + g )
+        return bound_qg
+    
     def get_name(self) -> str:
         """Method to get the quality measure name (equal to the class name).
         """
@@ -7,9 +7,10 @@
 """
 
 from abc import ABC, abstractmethod
+from numpy import ndarray, asarray, fromiter, errstate, broadcast_to, float64, nan
 
 # Python annotations.
-from typing import Union, ClassVar
+from typing import Union, ClassVar, Callable
 
 class QualityMeasure(ABC):
     """This abstract class defines the root class of all the implemented quality measures.
@@ -52,6 +53,74 @@ class QualityMeasure(ABC):
         """
         raise NotImplementedError("The 'compute' method from the 'QualityMeasure' abstract class is an abstract method.")
     
+    def compute_counts(self, tp : Union[int, float], fp : Union[int, float], TP : Union[int, float], FP : Union[int, float], additional_parameters : Union[dict[str, Union[int, float]], None] = None) -> float:
+        """Method to compute the corresponding quality measure from the subgroup parameters passed by position (i.e., without building a python dictionary). This method is used by the algorithms in their inner loops. IMPORTANT: the parameters are not checked.
+        
+        The implemented quality measures override this method with the direct computation (and their method 'compute' only checks the python dictionary and calls to this method). This default implementation builds the python dictionary and calls to the method 'compute', so that the quality measures which only implement the method 'compute' can also be used by the algorithms.
+        
+        :param tp: the true positives tp of the subgroup.
+        :param fp: the false positives fp of the subgroup.
+        :param TP: the true population TP of the dataset.
+        :param FP: the false population FP of the dataset.
+        :param additional_parameters: python dictionary which contains the additional parameters (i.e., those parameters which are not tp, fp, TP and FP) used to compute this quality measure, or None if there are not additional parameters.
+        :return: the computed value for the corresponding quality measure.
+        """
+        dict_of_parameters = {QualityMeasure.TRUE_POSITIVES : tp, QualityMeasure.FALSE_POSITIVES : fp, QualityMeasure.TRUE_POPULATION : TP, QualityMeasure.FALSE_POPULATION : FP}
+        if additional_parameters:
+            dict_of_parameters.update(additional_parameters)
+            # The subgroup parameters have priority over the additional parameters.
+            dict_of_parameters.update({QualityMeasure.TRUE_POSITIVES : tp, QualityMeasure.FALSE_POSITIVES : fp, QualityMeasure.TRUE_POPULATION : TP, QualityMeasure.FALSE_POPULATION : FP})
+        return self.compute(dict_of_parameters)
+    
+    def compute_batch(self, tp_array : ndarray, fp_array : ndarray, TP : Union[int, float], FP : Union[int, float], additional_parameters : Union[dict[str, Union[int, float]], None] = None) -> ndarray:
+        """Method to compute (vectorized) the corresponding quality measure for several subgroups at once (e.g., for all the candidate subgroups of a level of the search space). It receives the same parameters as the method 'compute_counts', but with arrays of tp and fp. IMPORTANT: the parameters are not checked.
+        
+        The implemented quality measures override the private method '_compute_batch' with the formula of the quality measure as a numpy expression (it receives tp, fp, TP and FP as float64 values, and the divisions by zero do not raise warnings). This default implementation calls to the method 'compute_counts' for each subgroup, so that the quality measures which do not override it can also be used.
+        
+        :param tp_array: the true positives tp of each subgroup.
+        :param fp_array: the false positives fp of each subgroup.
+        :param TP: the true population TP of the dataset.
+        :param FP: the false population FP of the dataset.
+        :param additional_parameters: python dictionary which contains the additional parameters (i.e., those parameters which are not tp, fp, TP and FP) used to compute this quality measure, or None if there are not additional parameters.
+        :return: a numpy array (float64) with the computed value for the corresponding quality measure of each subgroup. The undefined values (e.g., 0/0) are NaN.
+        """
+        tp = asarray(tp_array, dtype = float64)
+        fp = asarray(fp_array, dtype = float64)
+        with errstate(divide = "ignore", invalid = "ignore", over = "ignore"):
+            result = asarray(self._compute_batch(tp, fp, float64(TP), float64(FP), additional_parameters if additional_parameters is not None else {}), dtype = float64)
+        # The formulas which do not depend on tp and fp return only one value.
+        if result.shape != tp.shape:
+            result = broadcast_to(result, tp.shape).copy()
+        return result
+    
+    def _compute_batch(self, tp : ndarray, fp : ndarray, TP : float64, FP : float64, additional_parameters : dict[str, Union[int, float]]) -> ndarray:
+        # Private method with the vectorized computation of the quality measure (see the method 'compute_batch'). By default, the method 'compute_counts' is called for each subgroup with python numbers (so that the divisions by zero raise a ZeroDivisionError exception, whose value is NaN).
+        TP = float(TP)
+        FP = float(FP)
+        return fromiter((self._compute_counts_or_nan(tp_i, fp_i, TP, FP, additional_parameters) for tp_i, fp_i in zip(tp.tolist(), fp.tolist())), dtype = float64, count = len(tp))
+    
+    def _compute_counts_or_nan(self, tp : Union[int, float], fp : Union[int, float], TP : Union[int, float], FP : Union[int, float], additional_parameters : dict[str, Union[int, float]]) -> float:
+        # Private method used by the default implementation of the method '_compute_batch'. The undefined values (i.e., a division by zero) are NaN.
+        try:
+            return self.compute_counts(tp, fp, TP, FP, additional_parameters)
+        except ZeroDivisionError:
+            return nan
+    
+    def bind(self, TP : Union[int, float], FP : Union[int, float], **additional_parameters : Union[int, float]) -> Callable[[Union[int, float], Union[int, float]], float]:
+        """Method to bind the corresponding quality measure to the subgroup parameters TP and FP of a dataset and to its additional parameters. Since TP, FP and the additional parameters do not change during the execution of an algorithm, the algorithms bind their quality measures once and they use the returned function in their inner loops.
+        
+        The implemented quality measures override this method in order to compute only once the values which only depend on TP and FP (e.g., p0 = TP / (TP + FP)). This default implementation returns a function which calls to the method 'compute_counts'.
+        
+        :param TP: the true population TP of the dataset.
+        :param FP: the false population FP of the dataset.
+        :param additional_parameters: the additional parameters (i.e., those parameters which are not tp, fp, TP and FP) used to compute this quality measure, passed as keyword arguments.
+        :return: a function which receives the subgroup parameters tp and fp and returns the computed value for the corresponding quality measure. IMPORTANT: the parameters are not checked.
+        """
+        compute_counts = self.compute_counts
+        def bound_quality_measure(tp : Union[int, float], fp : Union[int, float]) -> float:
+            return compute_counts(tp, fp, TP, FP, additional_parameters)
+        return bound_quality_measure
+    
     @abstractmethod
     def get_name(self) -> str:
         """Method to get the quality measure name (equal to the class name).
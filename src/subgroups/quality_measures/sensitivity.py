@@ -8,9 +8,10 @@
 
 from subgroups.quality_measures.quality_measure import QualityMeasure
 from subgroups.exceptions import SubgroupParameterNotFoundError
+from numpy import ndarray, float64
 
 # Python annotations.
-from typing import Union
+from typing import Union, Callable
 
 class Sensitivity(QualityMeasure):
     """This class defines the Sensitivity quality measure. This quality measure is also called as Recall or True Positive Rate.
@@ -38,8 +39,30 @@ class Sensitivity(QualityMeasure):
             raise SubgroupParameterNotFoundError("The subgroup parameter 'TP' is not in 'dict_of_parameters'.")
         tp = dict_of_parameters[QualityMeasure.TRUE_POSITIVES]
         TP = dict_of_parameters[QualityMeasure.TRUE_POPULATION]
+        return self.compute_counts(tp, None, TP, None, dict_of_parameters)
+    
+    def compute_counts(self, tp : Union[int, float], fp : Union[int, float], TP : Union[int, float], FP : Union[int, float], additional_parameters : Union[dict[str, Union[int, float]], None] = None) -> float:
+        """Method to compute the Sensitivity quality measure from the subgroup parameters passed by position (i.e., without building a python dictionary). IMPORTANT: the parameters are not checked.
+        
+        :param tp: the true positives tp of the subgroup.
+        :param fp: the false positives fp of the subgroup.
+        :param TP: the true population TP of the dataset.
+        :param FP: the false population FP of the dataset.
+        :param additional_parameters: the additional parameters of this quality measure (not used).
+        :return: the computed value for the Sensitivity quality measure.
+        """
         return tp / TP # tp / (tp + fn)
     
+    def _compute_batch(self, tp : ndarray, fp : ndarray, TP : float64, FP : float64, additional_parameters : dict[str, Union[int, float]]) -> ndarray:
+        # Private method with the vectorized formula of the Sensitivity quality measure (see the method 'compute_batch').
+        return tp / TP
+    
+    def bind(self, TP : Union[int, float], FP : Union[int, float], **additional_parameters : Union[int, float]) -> Callable[[Union[int, float], Union[int, float]], float]:
+        """Method to bind the Sensitivity quality measure to the subgroup parameters TP and FP of a dataset (see the method 'bind' of the class 'QualityMeasure')."""
+        def bound_sensitivity(tp : Union[int, float], fp : Union[int, float]) -> float:
+            return tp / TP
+        return bound_sensitivity
+    
     def get_name(self) -> str:
         """Method to get the quality measure name (equal to the class name).
         """
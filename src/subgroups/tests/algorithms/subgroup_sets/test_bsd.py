@@ -16,6 +16,9 @@ from subgroups.core.selector import Selector
 from subgroups.core.subgroup import Subgroup
 from subgroups.quality_measures.wracc import WRAcc
 from subgroups.quality_measures.wracc_optimistic_estimate_1 import WRAccOptimisticEstimate1
+from subgroups.quality_measures.support import Support
+from subgroups.quality_measures.coverage import Coverage
+from subgroups.quality_measures.qg import Qg
 import unittest
 
 
@@ -114,4 +117,44 @@ class TestBSD(unittest.TestCase):
         self.assertIn(Subgroup.generate_from_str("Description: [coke = 'yes'], Target: diaper = 'yes'"), list_of_subgroups)
         self.assertIn(Subgroup.generate_from_str("Description: [beer = 'yes'], Target: diaper = 'yes'"), list_of_subgroups)
         file_to_read.close()
-        remove("./results.txt")
\ No newline at end of file
+        remove("./results.txt")
+
+    def test_BSD_memoize_quality_values(self) -> None:
+        df = DataFrame({'bread': {0: 'yes', 1: 'yes', 2: 'no', 3: 'yes', 4: 'yes', 5: 'yes', 6: 'yes'}, 'milk': {0: 'yes', 1: 'no', 2: 'yes', 3: 'yes', 4: 'yes', 5: 'yes', 6: 'yes'}, 'beer': {0: 'no', 1: 'yes', 2: 'yes', 3: 'yes', 4: 'no', 5: 'yes', 6: 'no'}, 'coke': {0: 'no', 1: 'no', 2: 'yes', 3: 'no', 4: 'yes', 5: 'no', 6: 'yes'}, 'diaper': {0: 'no', 1: 'yes', 2: 'yes', 3: 'yes', 4: 'yes', 5: 'yes', 6: 'yes'}})
+        target = ("diaper", "yes")
+        bsd = BSD(min_support=0,quality_measure=WRAcc(),optimistic_estimate = WRAccOptimisticEstimate1(), num_subgroups=8,max_depth=100)
+        bsd.fit(df, target)
+        self.assertIsNone(bsd.quality_measure_memo)
+        bsd_with_memo = BSD(min_support=0,quality_measure=WRAcc(),optimistic_estimate = WRAccOptimisticEstimate1(), num_subgroups=8,max_depth=100, memoize_quality_values=True)
+        bsd_with_memo.fit(df, target)
+        self.assertEqual(bsd_with_memo.selected_subgroups, bsd.selected_subgroups)
+        self.assertEqual(bsd_with_memo.visited_subgroups, bsd.visited_subgroups)
+        self.assertEqual(bsd_with_memo.quality_measure_memo.hits + bsd_with_memo.quality_measure_memo.misses, bsd_with_memo.optimistic_estimate_memo.hits + bsd_with_memo.optimistic_estimate_memo.misses)
+        self.assertGreater(bsd_with_memo.quality_measure_memo.hits, 0)
+
+    def test_BSD_additional_quality_measures(self) -> None:
+        df = DataFrame({'att1': ['v3', 'v2', 'v1', 'v3', 'v4', 'v4'], 'att2': ['1', '2', '3', '3', '5', '6'], 'att3': ['B', 'A', 'A', 'B', 'A', 'B'], 'class': ['0', '1', '0', '0', '1', '1']})
+        additional_quality_measures = [Support(), Coverage(), Qg()]
+        alg = BSD(0, WRAcc(), WRAccOptimisticEstimate1(), 5, 3, write_results_in_file=True, file_path="./results.txt", additional_quality_measures=additional_quality_measures, additional_parameters_for_the_additional_quality_measures={"tp" : 10, "g" : 0.5})
+        self.assertEqual(alg.additional_quality_measures, additional_quality_measures)
+        self.assertEqual(alg.additional_parameters_for_the_additional_quality_measures, {"g" : 0.5})
+        alg.fit(df, ("class", "1"))
+        number_of_lines = 0
+        with open("./results.txt", "r") as file_to_read:
+            for line in file_to_read:
+                number_of_lines = number_of_lines + 1
+                fields = [field.split(" = ") for field in line.strip().split(" ; ")[1:]]
+                names = [field[0] for field in fields]
+                values = dict(fields)
+                tp, fp, TP, FP = int(values["tp"]), int(values["fp"]), int(values["TP"]), int(values["FP"])
+                # The additional quality measures are written just after the quality measure.
+                index = names.index("Quality Measure WRAcc")
+                self.assertEqual(names[index+1:index+4], ["Quality Measure Support", "Quality Measure Coverage", "Quality Measure Qg"])
+                self.assertAlmostEqual(float(values["Quality Measure Support"]), Support().compute_counts(tp, fp, TP, FP))
+                self.assertAlmostEqual(float(values["Quality Measure Coverage"]), Coverage().compute_counts(tp, fp, TP, FP))
+                self.assertAlmostEqual(float(values["Quality Measure Qg"]), Qg().compute_counts(tp, fp, TP, FP, {"g" : 0.5}))
+        self.assertGreater(number_of_lines, 0)
+        remove("./results.txt")
+        self.assertRaises(TypeError, BSD, 0, WRAcc(), WRAccOptimisticEstimate1(), 5, 3, additional_quality_measures=Support())
+        self.assertRaises(TypeError, BSD, 0, WRAcc(), WRAccOptimisticEstimate1(), 5, 3, additional_quality_measures=[Support(), 1])
+        self.assertRaises(TypeError, BSD, 0, WRAcc(), WRAccOptimisticEstimate1(), 5, 3, additional_quality_measures=[Support()], additional_parameters_for_the_additional_quality_measures=[0.5])
@@ -15,6 +15,8 @@ from subgroups.exceptions import InconsistentMethodParametersError, DatasetAttri
 from subgroups.data_structures.fp_tree_for_sdmap import FPTreeForSDMap
 from subgroups.core.subgroup import Subgroup
 from os import remove
+from subgroups.quality_measures.support import Support
+from subgroups.quality_measures.coverage import Coverage
 import unittest
 
 class TestSDMapStar(unittest.TestCase):
@@ -486,4 +488,45 @@ class TestSDMapStar(unittest.TestCase):
         self.assertEqual(sdmap.unselected_subgroups, 0)
         self.assertEqual(sdmap.visited_nodes, 13)
         self.assertEqual(sdmap.conditional_pruned_branches, 1)
-       
\ No newline at end of file
+       
+    def test_SDMapStar_memoize_quality_values(self) -> None:
+        df = DataFrame({"a1" : ["a","b","c","c"], "a2" : ["q","q","s","q"], "a3" : ["f","g","h","k"], "class" : ["n","y","n","y"]})
+        target = ("class", "y")
+        sdmap = SDMapStar(WRAcc(), WRAccOptimisticEstimate1(), -1, minimum_n=0, num_subgroups=10)
+        sdmap.fit(df, target)
+        self.assertIsNone(sdmap.quality_measure_memo)
+        self.assertIsNone(sdmap.optimistic_estimate_memo)
+        sdmap_with_memo = SDMapStar(WRAcc(), WRAccOptimisticEstimate1(), -1, minimum_n=0, num_subgroups=10, memoize_quality_values=True)
+        sdmap_with_memo.fit(df, target)
+        self.assertEqual(sdmap_with_memo.selected_subgroups, sdmap.selected_subgroups)
+        self.assertEqual(sdmap_with_memo.k_subgroups, sdmap.k_subgroups)
+        self.assertEqual(sdmap_with_memo.conditional_pruned_branches, sdmap.conditional_pruned_branches)
+        self.assertGreater(sdmap_with_memo.quality_measure_memo.hits, 0)
+        self.assertGreater(sdmap_with_memo.optimistic_estimate_memo.hits, 0)
+
+    def test_SDMapStar_additional_quality_measures(self) -> None:
+        df = DataFrame({'att1': ['v3', 'v2', 'v1', 'v3', 'v4', 'v4'], 'att2': ['1', '2', '3', '3', '5', '6'], 'att3': ['B', 'A', 'A', 'B', 'A', 'B'], 'class': ['0', '1', '0', '0', '1', '1']})
+        additional_quality_measures = [Support(), Coverage(), Qg()]
+        alg = SDMapStar(WRAcc(), WRAccOptimisticEstimate1(), -1, minimum_n=0, num_subgroups=5, write_results_in_file=True, file_path="./results.txt", additional_quality_measures=additional_quality_measures, additional_parameters_for_the_additional_quality_measures={"tp" : 10, "g" : 0.5})
+        self.assertEqual(alg.additional_quality_measures, additional_quality_measures)
+        self.assertEqual(alg.additional_parameters_for_the_additional_quality_measures, {"g" : 0.5})
+        alg.fit(df, ("class", "1"))
+        number_of_lines = 0
+        with open("./results.txt", "r") as file_to_read:
+            for line in file_to_read:
+                number_of_lines = number_of_lines + 1
+                fields = [field.split(" = ") for field in line.strip().split(" ; ")[1:]]
+                names = [field[0] for field in fields]
+                values = dict(fields)
+                tp, fp, TP, FP = int(values["tp"]), int(values["fp"]), int(values["TP"]), int(values["FP"])
+                # The additional quality measures are written just after the quality measure.
+                index = names.index("Quality Measure WRAcc")
+                self.assertEqual(names[index+1:index+4], ["Quality Measure Support", "Quality Measure Coverage", "Quality Measure Qg"])
+                self.assertAlmostEqual(float(values["Quality Measure Support"]), Support().compute_counts(tp, fp, TP, FP))
+                self.assertAlmostEqual(float(values["Quality Measure Coverage"]), Coverage().compute_counts(tp, fp, TP, FP))
+                self.assertAlmostEqual(float(values["Quality Measure Qg"]), Qg().compute_counts(tp, fp, TP, FP, {"g" : 0.5}))
+        self.assertGreater(number_of_lines, 0)
+        remove("./results.txt")
+        self.assertRaises(TypeError, SDMapStar, WRAcc(), WRAccOptimisticEstimate1(), -1, minimum_n=0, additional_quality_measures=Support())
+        self.assertRaises(TypeError, SDMapStar, WRAcc(), WRAccOptimisticEstimate1(), -1, minimum_n=0, additional_quality_measures=[Support(), 1])
+        self.assertRaises(TypeError, SDMapStar, WRAcc(), WRAccOptimisticEstimate1(), -1, minimum_n=0, additional_quality_measures=[Support()], additional_parameters_for_the_additional_quality_measures=[0.5])
@@ -10,10 +10,19 @@ from pandas import DataFrame
 from subgroups.algorithms.subgroup_sets.vlsd import VLSD
 from subgroups.quality_measures.wracc import WRAcc
 from subgroups.quality_measures.wracc_optimistic_estimate_1 import WRAccOptimisticEstimate1
+from subgroups.quality_measures.wracc_optimistic_estimate_2 import WRAccOptimisticEstimate2
 from subgroups.quality_measures.qg import Qg
+from subgroups.quality_measures.f1_score import F1Score
+from subgroups.quality_measures.f1_score_optimistic_estimate_1 import F1ScoreOptimisticEstimate1
 from subgroups.exceptions import DatasetAttributeTypeError
 from subgroups.core.subgroup import Subgroup
 from os import remove
+from subgroups.quality_measures.support import Support
+from subgroups.quality_measures.coverage import Coverage
+from random import Random
+from itertools import combinations
+from math import inf, nextafter
+from numpy import float64
 import unittest
 
 class TestVLSD(unittest.TestCase):
@@ -322,3 +331,257 @@ class TestVLSD(unittest.TestCase):
         vlsd_3 = VLSD(WRAcc(), 0.1, WRAccOptimisticEstimate1(), 0.1, additional_parameters_for_the_quality_measure={"tp" : 10, "fp" : 20, "TP" : 100, "FP" : 200, "a" : 0.1}, additional_parameters_for_the_optimistic_estimate={"tp" : 10, "fp" : 20, "TP" : 100, "FP" : 200, "b" : 0.1})
         self.assertEqual(len(vlsd_3._additional_parameters_for_the_quality_measure), 1)
         self.assertEqual(len(vlsd_3._additional_parameters_for_the_optimistic_estimate), 1)
+
+    def test_VLSD_fit_method_with_tp_only_optimistic_estimate(self) -> None:
+        df = DataFrame({"a1" : ["a","b","c","c","b","a"], "a2" : ["q","q","s","q","s","s"], "a3" : ["f","g","h","k","g","f"], "class" : ["n","y","n","y","y","n"]})
+        target = ("class", "y")
+        # The pruning with the optimistic estimate does not change the result.
+        vlsd_1 = VLSD(F1Score(), 0.5, F1ScoreOptimisticEstimate1(), 0.5, write_results_in_file=True, file_path="./results_1.txt")
+        vlsd_1.fit(df, target)
+        vlsd_2 = VLSD(F1Score(), 0.5, F1ScoreOptimisticEstimate1(), -1, write_results_in_file=True, file_path="./results_2.txt")
+        vlsd_2.fit(df, target)
+        self.assertEqual(vlsd_1.selected_subgroups, vlsd_2.selected_subgroups)
+        with open("./results_1.txt", "r") as file_1, open("./results_2.txt", "r") as file_2:
+            self.assertEqual(sorted(file_1.readlines()), sorted(file_2.readlines()))
+        self.assertLessEqual(vlsd_1.visited_nodes, vlsd_2.visited_nodes)
+        remove("./results_1.txt")
+        remove("./results_2.txt")
+
+    def test_VLSD_additional_quality_measures(self) -> None:
+        df = DataFrame({'att1': ['v3', 'v2', 'v1', 'v3', 'v4', 'v4'], 'att2': ['1', '2', '3', '3', '5', '6'], 'att3': ['B', 'A', 'A', 'B', 'A', 'B'], 'class': ['0', '1', '0', '0', '1', '1']})
+        additional_quality_measures = [Support(), Coverage(), Qg()]
+        alg = VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1, write_results_in_file=True, file_path="./results.txt", additional_quality_measures=additional_quality_measures, additional_parameters_for_the_additional_quality_measures={"tp" : 10, "g" : 0.5})
+        self.assertEqual(alg.additional_quality_measures, additional_quality_measures)
+        self.assertEqual(alg.additional_parameters_for_the_additional_quality_measures, {"g" : 0.5})
+        alg.fit(df, ("class", "1"))
+        number_of_lines = 0
+        with open("./results.txt", "r") as file_to_read:
+            for line in file_to_read:
+                number_of_lines = number_of_lines + 1
+                fields = [field.split(" = ") for field in line.strip().split(" ; ")[1:]]
+                names = [field[0] for field in fields]
+                values = dict(fields)
+                tp, fp, TP, FP = int(values["tp"]), int(values["fp"]), int(values["TP"]), int(values["FP"])
+                # The additional quality measures are written just after the quality measure.
+                index = names.index("Quality Measure WRAcc")
+                self.assertEqual(names[index+1:index+4], ["Quality Measure Support", "Quality Measure Coverage", "Quality Measure Qg"])
+                self.assertAlmostEqual(float(values["Quality Measure Support"]), Support().compute_counts(tp, fp, TP, FP))
+                self.assertAlmostEqual(float(values["Quality Measure Coverage"]), Coverage().compute_counts(tp, fp, TP, FP))
+                self.assertAlmostEqual(float(values["Quality Measure Qg"]), Qg().compute_counts(tp, fp, TP, FP, {"g" : 0.5}))
+        self.assertGreater(number_of_lines, 0)
+        remove("./results.txt")
+        # The values are also computed without a file: they are yielded by the 'iter_fit' method and included in the best subgroups of the top-k mode.
+        TP, FP = 3, 3
+        for num_subgroups, n_jobs in [(0, 1), (0, 2), (5, 1)]:
+            alg = VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1, additional_quality_measures=additional_quality_measures, additional_parameters_for_the_additional_quality_measures={"g" : 0.5}, num_subgroups=num_subgroups, n_jobs=n_jobs)
+            number_of_results = 0
+            for _, _, tp, fp, _, _, additional_quality_measure_values in alg.iter_fit(df, ("class", "1")):
+                number_of_results = number_of_results + 1
+                self.assertEqual(list(additional_quality_measure_values), ["Support", "Coverage", "Qg"])
+                self.assertEqual(additional_quality_measure_values["Coverage"], Coverage().compute_counts(tp, fp, TP, FP))
+                self.assertEqual(additional_quality_measure_values["Qg"], Qg().compute_counts(tp, fp, TP, FP, {"g" : 0.5}))
+            self.assertEqual(number_of_results, alg.selected_subgroups if (num_subgroups == 0) else num_subgroups)
+        for _, _, tp, fp, additional_quality_measure_values in alg.k_subgroups:
+            self.assertEqual(additional_quality_measure_values["Support"], Support().compute_counts(tp, fp, TP, FP))
+        # Without additional quality measures, the values are an empty dictionary.
+        self.assertTrue(all(additional_quality_measure_values == dict() for _, _, _, _, _, _, additional_quality_measure_values in VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1).iter_fit(df, ("class", "1"))))
+        self.assertRaises(TypeError, VLSD, WRAcc(), -1, WRAccOptimisticEstimate1(), -1, additional_quality_measures=Support())
+        self.assertRaises(TypeError, VLSD, WRAcc(), -1, WRAccOptimisticEstimate1(), -1, additional_quality_measures=[Support(), 1])
+        self.assertRaises(TypeError, VLSD, WRAcc(), -1, WRAccOptimisticEstimate1(), -1, additional_quality_measures=[Support()], additional_parameters_for_the_additional_quality_measures=[0.5])
+
+    def test_VLSD_iter_fit_method(self) -> None:
+        df = DataFrame({'att1': ['v3', 'v2', 'v1', 'v3', 'v4', 'v4'], 'att2': ['1', '2', '3', '3', '5', '6'], 'att3': ['B', 'A', 'A', 'B', 'A', 'B'], 'class': ['0', '1', '0', '0', '1', '1']})
+        target = ("class", "1")
+        vlsd_1 = VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1, write_results_in_file=True, file_path="./results.txt")
+        vlsd_1.fit(df, target)
+        with open("./results.txt", "r") as file_to_read:
+            written_results = dict()
+            for line in file_to_read:
+                fields = line.strip().split(" ; ")
+                values = dict(field.split(" = ") for field in fields[3:])
+                written_results[fields[0]] = (float(values["Quality Measure WRAcc"]), int(values["tp"]), int(values["fp"]))
+        remove("./results.txt")
+        # The same subgroups are yielded without writing them in a file.
+        vlsd_2 = VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1)
+        yielded_results = dict()
+        for subgroup, quality_measure_value, tp, fp, sequence_of_instances_tp, sequence_of_instances_fp, _ in vlsd_2.iter_fit(df, target):
+            self.assertIsNone(sequence_of_instances_tp)
+            self.assertIsNone(sequence_of_instances_fp)
+            yielded_results[str(subgroup)] = (quality_measure_value, tp, fp)
+        self.assertEqual(yielded_results, written_results)
+        self.assertEqual(vlsd_2.selected_subgroups, vlsd_1.selected_subgroups)
+        self.assertEqual(vlsd_2.visited_nodes, vlsd_1.visited_nodes)
+        # The sequences of instances.
+        vlsd_3 = VLSD(WRAcc(), 0, WRAccOptimisticEstimate1(), 0)
+        for subgroup, quality_measure_value, tp, fp, sequence_of_instances_tp, sequence_of_instances_fp, _ in vlsd_3.iter_fit(df, target, include_sequences_of_instances = True):
+            self.assertEqual(sequence_of_instances_tp.count(1), tp)
+            self.assertEqual(sequence_of_instances_fp.count(1), fp)
+        # The file is closed if the iteration is stopped before the end.
+        vlsd_4 = VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1, write_results_in_file=True, file_path="./results.txt")
+        iterator = vlsd_4.iter_fit(df, target)
+        next(iterator)
+        self.assertIsNotNone(vlsd_4._file)
+        iterator.close()
+        self.assertIsNone(vlsd_4._file)
+        with open("./results.txt", "r") as file_to_read:
+            self.assertEqual(len(file_to_read.readlines()), 1)
+        remove("./results.txt")
+        # The parameters are checked when the method is called.
+        self.assertRaises(TypeError, vlsd_2.iter_fit, df, ["class", "1"])
+        self.assertRaises(TypeError, vlsd_2.iter_fit, df, target, include_sequences_of_instances = 1)
+
+    def test_VLSD_top_k_mode(self) -> None:
+        df = DataFrame({'att1': ['v3', 'v2', 'v1', 'v3', 'v4', 'v4', 'v1', 'v2'], 'att2': ['1', '2', '3', '3', '5', '6', '5', '2'], 'att3': ['B', 'A', 'A', 'B', 'A', 'B', 'B', 'A'], 'class': ['0', '1', '0', '0', '1', '1', '1', '0']})
+        target = ("class", "1")
+        # All the subgroups.
+        vlsd = VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1)
+        all_qualities = sorted([quality_measure_value for _, quality_measure_value, _, _, _, _, _ in vlsd.iter_fit(df, target)], reverse=True)
+        for num_subgroups in [1, 3, 5, 1000]:
+            vlsd_top_k = VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1, sort_criterion_in_s1=VLSD.SORT_CRITERION_QUALITY_DESCENDING, sort_criterion_in_other_sizes=VLSD.SORT_CRITERION_QUALITY_DESCENDING, write_results_in_file=True, file_path="./results.txt", num_subgroups=num_subgroups)
+            self.assertEqual(vlsd_top_k.num_subgroups, num_subgroups)
+            vlsd_top_k.fit(df, target)
+            self.assertEqual([quality_measure_value for _, quality_measure_value, _, _, _ in vlsd_top_k.k_subgroups], all_qualities[:num_subgroups])
+            self.assertLessEqual(vlsd_top_k.visited_nodes, vlsd.visited_nodes)
+            for subgroup, quality_measure_value, tp, fp, _ in vlsd_top_k.k_subgroups:
+                self.assertEqual(WRAcc().compute_counts(tp, fp, 4, 4), quality_measure_value)
+            # Only the best subgroups are written in the file (sorted in descending order by quality).
+            with open("./results.txt", "r") as file_to_read:
+                written_subgroups = [line.split(" ; ")[0] for line in file_to_read]
+            self.assertEqual(written_subgroups, [str(subgroup) for subgroup, _, _, _, _ in vlsd_top_k.k_subgroups])
+            remove("./results.txt")
+            # The same subgroups are yielded by the 'iter_fit' method.
+            vlsd_top_k = VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1, sort_criterion_in_s1=VLSD.SORT_CRITERION_QUALITY_DESCENDING, sort_criterion_in_other_sizes=VLSD.SORT_CRITERION_QUALITY_DESCENDING, num_subgroups=num_subgroups)
+            self.assertEqual([str(subgroup) for subgroup, _, _, _, _, _, _ in vlsd_top_k.iter_fit(df, target)], written_subgroups)
+        # The threshold for the quality measure is also applied in top-k mode.
+        vlsd_top_k = VLSD(WRAcc(), 0.1, WRAccOptimisticEstimate1(), 0.1, num_subgroups=1000)
+        vlsd_top_k.fit(df, target)
+        self.assertEqual([quality_measure_value for _, quality_measure_value, _, _, _ in vlsd_top_k.k_subgroups], [quality_measure_value for quality_measure_value in all_qualities if quality_measure_value >= 0.1])
+        self.assertRaises(TypeError, VLSD, WRAcc(), -1, WRAccOptimisticEstimate1(), -1, num_subgroups=1.5)
+        self.assertRaises(ValueError, VLSD, WRAcc(), -1, WRAccOptimisticEstimate1(), -1, num_subgroups=-1)
+
+    def test_VLSD_batched_joins(self) -> None:
+        # A dataset large enough to join the Vertical Lists with bitsets in batches.
+        random_generator = Random(5)
+        number_of_rows = VLSD._MINIMUM_NUMBER_OF_DATASET_INSTANCES_FOR_BATCHED_JOINS + 500
+        df = DataFrame({"att" + str(index) : [random_generator.choice(["a", "b", "c", "d", "e", "f"]) for _ in range(number_of_rows)] for index in range(5)})
+        df["class"] = [random_generator.choice(["0", "1"]) for _ in range(number_of_rows)]
+        target = ("class", "1")
+        for num_subgroups in [0, 10]:
+            vlsd_1 = VLSD(WRAcc(), 0, WRAccOptimisticEstimate1(), 0.0001, sort_criterion_in_s1 = VLSD.SORT_CRITERION_QUALITY_DESCENDING, sort_criterion_in_other_sizes = VLSD.SORT_CRITERION_QUALITY_DESCENDING, vertical_lists_implementation = VLSD.VERTICAL_LISTS_WITH_SETS, num_subgroups = num_subgroups)
+            results_1 = [(str(subgroup), quality_measure_value, tp, fp) for subgroup, quality_measure_value, tp, fp, _, _, _ in vlsd_1.iter_fit(df, target)]
+            vlsd_2 = VLSD(WRAcc(), 0, WRAccOptimisticEstimate1(), 0.0001, sort_criterion_in_s1 = VLSD.SORT_CRITERION_QUALITY_DESCENDING, sort_criterion_in_other_sizes = VLSD.SORT_CRITERION_QUALITY_DESCENDING, vertical_lists_implementation = VLSD.VERTICAL_LISTS_WITH_BITSETS, num_subgroups = num_subgroups)
+            results_2 = [(str(subgroup), quality_measure_value, tp, fp) for subgroup, quality_measure_value, tp, fp, _, _, _ in vlsd_2.iter_fit(df, target)]
+            self.assertEqual(results_1, results_2)
+            self.assertEqual((vlsd_1.selected_subgroups, vlsd_1.unselected_subgroups), (vlsd_2.selected_subgroups, vlsd_2.unselected_subgroups))
+        self.assertGreater(len(results_1), 0)
+
+    def test_VLSD_parallel_search(self) -> None:
+        df = DataFrame({'att1': ['v3', 'v2', 'v1', 'v3', 'v4', 'v4', 'v1', 'v2'], 'att2': ['1', '2', '3', '3', '5', '6', '5', '2'], 'att3': ['B', 'A', 'A', 'B', 'A', 'B', 'B', 'A'], 'att4': ['x', 'y', 'x', 'y', 'x', 'y', 'x', 'x'], 'class': ['0', '1', '0', '0', '1', '1', '1', '0']})
+        target = ("class", "1")
+        vlsd_1 = VLSD(WRAcc(), 0, WRAccOptimisticEstimate1(), -1, write_results_in_file=True, file_path="./results_1.txt", additional_quality_measures=[Qg()], additional_parameters_for_the_additional_quality_measures={"g" : 0.5})
+        vlsd_1.fit(df, target)
+        vlsd_2 = VLSD(WRAcc(), 0, WRAccOptimisticEstimate1(), -1, write_results_in_file=True, file_path="./results_2.txt", additional_quality_measures=[Qg()], additional_parameters_for_the_additional_quality_measures={"g" : 0.5}, n_jobs=2)
+        self.assertEqual(vlsd_2.n_jobs, 2)
+        vlsd_2.fit(df, target)
+        # The same results (in the same order) and the same counters.
+        with open("./results_1.txt", "r") as file_1, open("./results_2.txt", "r") as file_2:
+            self.assertEqual(file_1.readlines(), file_2.readlines())
+        self.assertEqual(vlsd_1.selected_subgroups, vlsd_2.selected_subgroups)
+        self.assertEqual(vlsd_1.unselected_subgroups, vlsd_2.unselected_subgroups)
+        remove("./results_1.txt")
+        remove("./results_2.txt")
+        # The 'iter_fit' method.
+        vlsd_3 = VLSD(WRAcc(), 0, WRAccOptimisticEstimate1(), -1, n_jobs=2)
+        self.assertEqual([str(subgroup) for subgroup, _, _, _, _, _, _ in vlsd_3.iter_fit(df, target)], [str(subgroup) for subgroup, _, _, _, _, _, _ in VLSD(WRAcc(), 0, WRAccOptimisticEstimate1(), -1).iter_fit(df, target)])
+        # In top-k mode, the best subgroups are the same.
+        vlsd_4 = VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1, num_subgroups=5)
+        vlsd_4.fit(df, target)
+        vlsd_5 = VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1, num_subgroups=5, n_jobs=2)
+        vlsd_5.fit(df, target)
+        self.assertEqual([quality_measure_value for _, quality_measure_value, _, _, _ in vlsd_4.k_subgroups], [quality_measure_value for _, quality_measure_value, _, _, _ in vlsd_5.k_subgroups])
+        # The counters are the same as in the sequential execution, with and without top-k mode (the searches, whose sizes are different, are run in a different order than the sequential one).
+        random_generator = Random(3)
+        random_df = DataFrame({**{"att" + str(attribute) : [random_generator.choice(["a", "b", "c", "d"]) for _ in range(60)] for attribute in range(5)}, "class" : [random_generator.choice(["n", "y"]) for _ in range(60)]})
+        for num_subgroups in [0, 5]:
+            vlsd_sequential = VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1, num_subgroups=num_subgroups, write_results_in_file=True, file_path="./results_1.txt")
+            vlsd_sequential.fit(random_df, ("class", "y"))
+            vlsd_parallel = VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1, num_subgroups=num_subgroups, write_results_in_file=True, file_path="./results_2.txt", n_jobs=2)
+            vlsd_parallel.fit(random_df, ("class", "y"))
+            with open("./results_1.txt", "r") as file_1, open("./results_2.txt", "r") as file_2:
+                self.assertEqual(file_1.readlines(), file_2.readlines())
+            self.assertEqual((vlsd_sequential.selected_subgroups, vlsd_sequential.unselected_subgroups, vlsd_sequential.visited_nodes), (vlsd_parallel.selected_subgroups, vlsd_parallel.unselected_subgroups, vlsd_parallel.visited_nodes))
+            remove("./results_1.txt")
+            remove("./results_2.txt")
+        # The sequences of instances are only sent back from the processes of the pool when they are needed.
+        for num_subgroups in [0, 5]:
+            results_1 = [(str(subgroup), quality_measure_value, tp, fp, sequence_of_instances_tp, sequence_of_instances_fp) for subgroup, quality_measure_value, tp, fp, sequence_of_instances_tp, sequence_of_instances_fp, _ in VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1, num_subgroups=num_subgroups).iter_fit(df, target, include_sequences_of_instances = True)]
+            results_2 = [(str(subgroup), quality_measure_value, tp, fp, sequence_of_instances_tp, sequence_of_instances_fp) for subgroup, quality_measure_value, tp, fp, sequence_of_instances_tp, sequence_of_instances_fp, _ in VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1, num_subgroups=num_subgroups, n_jobs=2).iter_fit(df, target, include_sequences_of_instances = True)]
+            self.assertEqual(results_1, results_2)
+            results_3 = list(VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1, num_subgroups=num_subgroups, n_jobs=2).iter_fit(df, target))
+            self.assertEqual([(str(result[0]), result[1], result[2], result[3]) for result in results_3], [result[:4] for result in results_1])
+            self.assertTrue(all((result[4] is None) and (result[5] is None) for result in results_3))
+        # There are more searches than the maximum number of pending searches (2 * n_jobs).
+        vlsd_6 = VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1, n_jobs=2)
+        vlsd_7 = VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1)
+        self.assertEqual([str(subgroup) for subgroup, _, _, _, _, _, _ in vlsd_6.iter_fit(df, target)], [str(subgroup) for subgroup, _, _, _, _, _, _ in vlsd_7.iter_fit(df, target)])
+        self.assertEqual((vlsd_6.selected_subgroups, vlsd_6.unselected_subgroups), (vlsd_7.selected_subgroups, vlsd_7.unselected_subgroups))
+        self.assertGreater(len(vlsd_7._indexes_in_M), 2 * 2 + 1)
+        self.assertRaises(TypeError, VLSD, WRAcc(), -1, WRAccOptimisticEstimate1(), -1, n_jobs=2.0)
+        self.assertRaises(ValueError, VLSD, WRAcc(), -1, WRAccOptimisticEstimate1(), -1, n_jobs=0)
+        self.assertRaises(ValueError, VLSD, WRAcc(), -1, WRAccOptimisticEstimate1(), -1, n_jobs=-2)
+
+    def test_VLSD_vertical_lists_with_diffsets(self) -> None:
+        df = DataFrame({'att1': ['v3', 'v2', 'v1', 'v3', 'v4', 'v4', 'v1', 'v2'], 'att2': ['1', '2', '3', '3', '5', '6', '5', '2'], 'att3': ['B', 'A', 'A', 'B', 'A', 'B', 'B', 'A'], 'att4': ['x', 'y', 'x', 'y', 'x', 'y', 'x', 'x'], 'class': ['0', '1', '0', '0', '1', '1', '1', '0']})
+        target = ("class", "1")
+        vlsd_1 = VLSD(WRAcc(), 0, WRAccOptimisticEstimate1(), -1, vertical_lists_implementation = VLSD.VERTICAL_LISTS_WITH_SETS)
+        results_1 = [(str(subgroup), quality_measure_value, tp, fp, sequence_of_instances_tp, sequence_of_instances_fp) for subgroup, quality_measure_value, tp, fp, sequence_of_instances_tp, sequence_of_instances_fp, _ in vlsd_1.iter_fit(df, target, include_sequences_of_instances = True)]
+        vlsd_2 = VLSD(WRAcc(), 0, WRAccOptimisticEstimate1(), -1, vertical_lists_implementation = VLSD.VERTICAL_LISTS_WITH_DIFFSETS)
+        results_2 = [(str(subgroup), quality_measure_value, tp, fp, sequence_of_instances_tp, sequence_of_instances_fp) for subgroup, quality_measure_value, tp, fp, sequence_of_instances_tp, sequence_of_instances_fp, _ in vlsd_2.iter_fit(df, target, include_sequences_of_instances = True)]
+        self.assertEqual(results_1, results_2)
+        self.assertEqual(vlsd_1.visited_nodes, vlsd_2.visited_nodes)
+        # With several processes.
+        vlsd_3 = VLSD(WRAcc(), 0, WRAccOptimisticEstimate1(), -1, vertical_lists_implementation = VLSD.VERTICAL_LISTS_WITH_DIFFSETS, n_jobs = 2)
+        self.assertEqual([(str(subgroup), tp, fp) for subgroup, _, tp, fp, _, _, _ in vlsd_3.iter_fit(df, target)], [(result[0], result[2], result[3]) for result in results_1])
+
+    def test_VLSD_vertical_lists_with_roaring_bitmaps(self) -> None:
+        df = DataFrame({'att1': ['v3', 'v2', 'v1', 'v3', 'v4', 'v4', 'v1', 'v2'], 'att2': ['1', '2', '3', '3', '5', '6', '5', '2'], 'att3': ['B', 'A', 'A', 'B', 'A', 'B', 'B', 'A'], 'att4': ['x', 'y', 'x', 'y', 'x', 'y', 'x', 'x'], 'class': ['0', '1', '0', '0', '1', '1', '1', '0']})
+        target = ("class", "1")
+        vlsd_1 = VLSD(WRAcc(), 0, WRAccOptimisticEstimate1(), -1, vertical_lists_implementation = VLSD.VERTICAL_LISTS_WITH_SETS)
+        results_1 = [(str(subgroup), quality_measure_value, tp, fp, sorted(sequence_of_instances_tp), sorted(sequence_of_instances_fp)) for subgroup, quality_measure_value, tp, fp, sequence_of_instances_tp, sequence_of_instances_fp, _ in vlsd_1.iter_fit(df, target, include_sequences_of_instances = True)]
+        vlsd_2 = VLSD(WRAcc(), 0, WRAccOptimisticEstimate1(), -1, vertical_lists_implementation = VLSD.VERTICAL_LISTS_WITH_ROARING_BITMAPS)
+        results_2 = [(str(subgroup), quality_measure_value, tp, fp, list(sequence_of_instances_tp), list(sequence_of_instances_fp)) for subgroup, quality_measure_value, tp, fp, sequence_of_instances_tp, sequence_of_instances_fp, _ in vlsd_2.iter_fit(df, target, include_sequences_of_instances = True)]
+        self.assertEqual(results_1, results_2)
+        self.assertEqual(vlsd_1.visited_nodes, vlsd_2.visited_nodes)
+        # With several processes.
+        vlsd_3 = VLSD(WRAcc(), 0, WRAccOptimisticEstimate1(), -1, vertical_lists_implementation = VLSD.VERTICAL_LISTS_WITH_ROARING_BITMAPS, n_jobs = 2)
+        self.assertEqual([(str(subgroup), tp, fp) for subgroup, _, tp, fp, _, _, _ in vlsd_3.iter_fit(df, target)], [(result[0], result[2], result[3]) for result in results_1])
+
+    def test_VLSD_matrix_M_without_threshold(self) -> None:
+        df = DataFrame({'att1': ['v3', 'v2', 'v1', 'v3', 'v4', 'v4', 'v1', 'v2'], 'att2': ['1', '2', '3', '3', '5', '6', '5', '2'], 'att3': ['B', 'A', 'A', 'B', 'A', 'B', 'B', 'A'], 'class': ['0', '1', '0', '0', '1', '1', '1', '0']})
+        target = ("class", "1")
+        # Without threshold, the subgroups which are visited are all the combinations of selectors which appear in some instance of the dataset (the empty positions of M are never reached).
+        expected_visited_nodes = len({tuple((attribute, row[attribute]) for attribute in attributes) for _, row in df.iterrows() for size in [1, 2, 3] for attributes in combinations(['att1', 'att2', 'att3'], size)})
+        for vertical_lists_implementation in VLSD.VERTICAL_LISTS_IMPLEMENTATION:
+            vlsd = VLSD(WRAcc(), -inf, WRAccOptimisticEstimate1(), -inf, vertical_lists_implementation = vertical_lists_implementation)
+            results = list(vlsd.iter_fit(df, target))
+            self.assertEqual(vlsd.visited_nodes, expected_visited_nodes)
+            self.assertEqual(vlsd.selected_subgroups, expected_visited_nodes)
+            self.assertTrue(all((tp + fp) > 0 for _, _, tp, fp, _, _, _ in results))
+
+    def test_VLSD_matrix_M_float32(self) -> None:
+        random_generator = Random(5)
+        df = DataFrame({"att1" : [random_generator.choice(["a", "b", "c"]) for _ in range(80)], "att2" : [random_generator.choice(["d", "e", "f"]) for _ in range(80)], "att3" : [random_generator.choice(["g", "h"]) for _ in range(80)], "class" : [random_generator.choice(["n", "y"]) for _ in range(80)]})
+        target = ("class", "y")
+        TP = sum(df["class"] == "y")
+        FP = len(df.index) - TP
+        vlsd = VLSD(WRAcc(), -inf, WRAccOptimisticEstimate2(), -inf)
+        all_subgroups_of_size_2 = {str(subgroup) : WRAccOptimisticEstimate2().compute_counts(tp, fp, TP, FP) for subgroup, _, tp, fp, _, _, _ in vlsd.iter_fit(df, target) if len(subgroup.description) == 2}
+        # The values in M are float32, but no node is pruned (or visited) because of the rounding: the threshold is equal to and slightly greater than each exact quality value.
+        # --> IMPORTANT: the threshold is set as a float64 value (e.g., as in top-k mode), so that it is not rounded to float32 when it is compared with M.
+        for quality_value in set(all_subgroups_of_size_2.values()):
+            for threshold in [quality_value, nextafter(quality_value, inf)]:
+                for vertical_lists_implementation in VLSD.VERTICAL_LISTS_IMPLEMENTATION:
+                    vlsd = VLSD(WRAcc(), -inf, WRAccOptimisticEstimate2(), threshold, vertical_lists_implementation = vertical_lists_implementation)
+                    vlsd._oe_minimum_threshold = float64(threshold)
+                    subgroups_of_size_2 = {str(subgroup) for subgroup, _, _, _, _, _, _ in vlsd.iter_fit(df, target) if len(subgroup.description) == 2}
+                    self.assertEqual(subgroups_of_size_2, {subgroup for subgroup, value in all_subgroups_of_size_2.items() if value >= threshold})
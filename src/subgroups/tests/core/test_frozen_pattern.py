@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+# Contributors:
+#    Antonio López Martínez-Carrasco <antoniolopezmc1995@gmail.com>
+
+"""Tests of the functionality contained in the file 'core/frozen_pattern.py'.
+"""
+
+from subgroups.core.frozen_pattern import FrozenPattern
+from subgroups.core.pattern import Pattern
+from subgroups.core.selector import Selector
+from subgroups.core.operator import Operator
+import unittest
+
+class TestFrozenPattern(unittest.TestCase):
+
+    def test_FrozenPattern_general(self) -> None:
+        selector_1 = Selector("name", Operator.EQUAL, "name1")
+        selector_2 = Selector("age", Operator.LESS, 25)
+        selector_3 = Selector("att2", Operator.GREATER_OR_EQUAL, 25)
+        frozen_pattern_1 = FrozenPattern([selector_1, selector_2, selector_3, selector_2])
+        self.assertEqual(len(frozen_pattern_1), 3)
+        self.assertEqual(list(frozen_pattern_1.ids), sorted([selector_1.id, selector_2.id, selector_3.id]))
+        self.assertIn(selector_1, frozen_pattern_1)
+        self.assertNotIn(Selector("att2", Operator.GREATER_OR_EQUAL, 128), frozen_pattern_1)
+        self.assertEqual(str(frozen_pattern_1), "[age < 25, att2 >= 25, name = 'name1']")
+        self.assertEqual(frozen_pattern_1.to_pattern(), Pattern([selector_1, selector_2, selector_3]))
+        self.assertEqual(FrozenPattern.from_pattern(Pattern([selector_3, selector_1, selector_2])), frozen_pattern_1)
+        self.assertEqual(FrozenPattern([]), FrozenPattern.from_pattern(Pattern([])))
+        self.assertEqual(str(FrozenPattern([])), "[]")
+
+    def test_FrozenPattern_hash_and_extend(self) -> None:
+        selector_1 = Selector("a", Operator.EQUAL, "x")
+        selector_2 = Selector("b", Operator.EQUAL, "y")
+        selector_3 = Selector("c", Operator.EQUAL, "z")
+        frozen_pattern_1 = FrozenPattern([selector_1, selector_2])
+        frozen_pattern_2 = FrozenPattern([selector_2, selector_1])
+        self.assertEqual(hash(frozen_pattern_1), hash(frozen_pattern_2))
+        self.assertEqual(frozen_pattern_1, frozen_pattern_2)
+        dictionary = {frozen_pattern_1 : 1}
+        self.assertIn(frozen_pattern_2, dictionary)
+        self.assertEqual(len({frozen_pattern_1, frozen_pattern_2}), 1)
+        frozen_pattern_3 = frozen_pattern_1.extend(selector_3)
+        self.assertEqual(len(frozen_pattern_1), 2)
+        self.assertEqual(len(frozen_pattern_3), 3)
+        self.assertEqual(frozen_pattern_3, FrozenPattern([selector_3, selector_2, selector_1]))
+        self.assertNotEqual(frozen_pattern_1, frozen_pattern_3)
+        self.assertNotIn(frozen_pattern_3, dictionary)
+        self.assertIs(frozen_pattern_3.extend(selector_1), frozen_pattern_3)
+        self.assertEqual(FrozenPattern([]).extend(selector_1), FrozenPattern([selector_1]))
+        self.assertTrue(frozen_pattern_1.is_refinement(frozen_pattern_3, False))
+        self.assertFalse(frozen_pattern_3.is_refinement(frozen_pattern_1, True))
+        self.assertTrue(frozen_pattern_1.is_refinement(frozen_pattern_2, True))
+        self.assertFalse(frozen_pattern_1.is_refinement(frozen_pattern_2, False))
+        self.assertFalse(FrozenPattern([selector_3]).is_refinement(frozen_pattern_1, True))
+        self.assertTrue(FrozenPattern([]).is_refinement(frozen_pattern_1, False))
+        self.assertRaises(TypeError, FrozenPattern, (selector_1, selector_2))
+        self.assertRaises(TypeError, frozen_pattern_1.extend, "a = 'x'")
+        self.assertRaises(TypeError, frozen_pattern_1.__eq__, Pattern([selector_1, selector_2]))
@@ -126,6 +126,28 @@ class TestPattern(unittest.TestCase):
         self.assertTrue(s1.description.is_refinement(s1.description, refinement_of_itself = True))
         self.assertTrue(s2.description.is_refinement(s2.description, refinement_of_itself = True))
 
+    def test_Pattern_bitmask(self) -> None:
+        s1 = Selector("a1", Operator.EQUAL, "v1")
+        s2 = Selector("a2", Operator.EQUAL, "v2")
+        s3 = Selector("a3", Operator.EQUAL, "v3")
+        p = Pattern([s1, s2])
+        self.assertEqual(p.bitmask, (1 << s1.id) | (1 << s2.id))
+        self.assertEqual(Pattern([]).bitmask, 0)
+        # The bitmask is updated when the pattern is modified.
+        p_copy = p.copy()
+        p.add_selector(s3)
+        self.assertEqual(p.bitmask, (1 << s1.id) | (1 << s2.id) | (1 << s3.id))
+        self.assertEqual(p_copy.bitmask, (1 << s1.id) | (1 << s2.id))
+        p.add_selector(s3)
+        self.assertEqual(p.bitmask, (1 << s1.id) | (1 << s2.id) | (1 << s3.id))
+        p.remove_selector(s1)
+        self.assertEqual(p.bitmask, (1 << s2.id) | (1 << s3.id))
+        p.remove_selector(s1)
+        self.assertEqual(p.bitmask, (1 << s2.id) | (1 << s3.id))
+        p.remove_selector_by_index(0)
+        self.assertEqual(p.bitmask, Pattern([p.get_selector(0)]).bitmask)
+        self.assertTrue(p.is_refinement(p_copy, refinement_of_itself = False) == ((p.bitmask & p_copy.bitmask) == p.bitmask))
+
     def test_Pattern_contains_method(self) -> None:
         p = Pattern.generate_from_str("[]")
         e = Selector("a7", Operator.EQUAL, "v7")
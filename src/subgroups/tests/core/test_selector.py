@@ -9,6 +9,7 @@
 from subgroups.core.selector import Selector
 from weakref import WeakValueDictionary
 from subgroups.core.operator import Operator
+import pickle
 import unittest
 
 class TestSelector(unittest.TestCase):
@@ -389,3 +390,45 @@ class TestSelector(unittest.TestCase):
         self.assertLessEqual(selector1, selector5)
         self.assertLessEqual(selector1, selector5)
         self.assertLess(selector1, selector5)
+    
+    def test_Selector_ids_and_hashes(self) -> None:
+        selector1 = Selector("a", Operator.EQUAL, "value")
+        selector2 = Selector("a", Operator.EQUAL, "value")
+        selector3 = Selector("a", Operator.EQUAL, 23)
+        selector4 = Selector("a", Operator.EQUAL, 23.0)
+        self.assertEqual(type(selector1.id), int)
+        self.assertEqual(selector1.id, selector2.id)
+        self.assertNotEqual(selector1.id, selector3.id)
+        self.assertNotEqual(selector3.id, selector4.id)
+        self.assertEqual(hash(selector1), hash(str(selector1)))
+        self.assertEqual(hash(selector3), hash(str(selector3)))
+        # The identifier of a deleted selector is released and reused, so the number of identifiers does not grow when selectors are created and deleted.
+        selector1_id = selector1.id
+        del selector1
+        del selector2
+        self.assertEqual(len(Selector._dict_of_selectors), 2)
+        self.assertIn(selector1_id, Selector._released_selector_ids)
+        number_of_selector_ids = Selector._number_of_selector_ids
+        for index in range(1000):
+            selector5 = Selector("b", Operator.EQUAL, index)
+            del selector5
+        self.assertLessEqual(Selector._number_of_selector_ids, number_of_selector_ids + 1)
+        # The identifiers of the selectors which exist at the same time are different.
+        selectors = [Selector("b", Operator.EQUAL, index) for index in range(100)]
+        self.assertEqual(len({selector.id for selector in selectors}), 100)
+        # The selectors with numeric values of different types are different objects, but they are equal (as before the identifiers).
+        self.assertIsNot(selector3, selector4)
+        self.assertEqual(selector3, selector4)
+        self.assertFalse(selector3 != selector4)
+        self.assertNotEqual(Selector("a", Operator.EQUAL, 23), Selector("a", Operator.EQUAL, "23"))
+        self.assertNotEqual(Selector("a", Operator.EQUAL, 23), Selector("a", Operator.EQUAL, 24.0))
+        # Selectors with a NaN value are also interned.
+        self.assertIs(Selector("a", Operator.EQUAL, float("nan")), Selector("a", Operator.EQUAL, float("nan")))
+
+    def test_Selector_pickle(self) -> None:
+        selector1 = Selector("a", Operator.EQUAL, "x")
+        selector2 = Selector("b", Operator.LESS_OR_EQUAL, 2.5)
+        # The unpickled selectors are obtained from the selector pool.
+        self.assertIs(pickle.loads(pickle.dumps(selector1)), selector1)
+        self.assertIs(pickle.loads(pickle.dumps(selector2)), selector2)
+        self.assertEqual(pickle.loads(pickle.dumps([selector1, selector2])), [selector1, selector2])
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+# Contributors:
+#    Antonio López Martínez-Carrasco <antoniolopezmc1995@gmail.com>
+
+"""Tests of the functionality contained in the file 'data_structures/encoded_dataset.py'.
+"""
+
+from subgroups.data_structures.encoded_dataset import EncodedDataset
+from subgroups.algorithms.subgroup_sets.vlsd import VLSD
+from subgroups.algorithms.subgroup_sets.sdmap import SDMap
+from subgroups.algorithms.subgroup_sets.sdmapstar import SDMapStar
+from subgroups.quality_measures.wracc import WRAcc
+from subgroups.quality_measures.wracc_optimistic_estimate_1 import WRAccOptimisticEstimate1
+from subgroups.core.operator import Operator
+from subgroups.core.selector import Selector
+from subgroups.exceptions import DatasetAttributeTypeError
+from pandas import DataFrame
+from numpy import uint8
+from os import remove
+from random import Random
+import unittest
+
+class TestEncodedDataset(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.df = DataFrame({"a" : ["x", "y", "x", "x", "z"], "target" : ["p", "n", "p", "n", "p"], "b" : ["1", "1", "2", "1", "2"]}, index = [10, 20, 30, 40, 50])
+
+    def test_EncodedDataset_general(self) -> None:
+        self.assertRaises(TypeError, EncodedDataset, [1, 2], ("target", "p"))
+        self.assertRaises(TypeError, EncodedDataset, self.df, ["target", "p"])
+        self.assertRaises(ValueError, EncodedDataset, self.df, ("c", "p"))
+        self.assertRaises(DatasetAttributeTypeError, EncodedDataset, DataFrame({"a" : [1, 2], "target" : ["p", "n"]}), ("target", "p"))
+        encoded_dataset = EncodedDataset(self.df, ("target", "p"))
+        self.assertEqual(encoded_dataset.number_of_rows, 5)
+        self.assertEqual(encoded_dataset.attribute_names, ["a", "target", "b"])
+        self.assertEqual(encoded_dataset.categories, [["x", "y", "z"], ["n", "p"], ["1", "2"]])
+        self.assertEqual(encoded_dataset.codes.dtype, uint8)
+        self.assertEqual(encoded_dataset.codes.tolist(), [[0, 1, 0], [1, 0, 0], [0, 1, 1], [0, 0, 0], [2, 1, 1]])
+        self.assertEqual(encoded_dataset.selectors, [Selector("a", Operator.EQUAL, "x"), Selector("a", Operator.EQUAL, "y"), Selector("a", Operator.EQUAL, "z"), Selector("b", Operator.EQUAL, "1"), Selector("b", Operator.EQUAL, "2")])
+        self.assertEqual(encoded_dataset.target_mask.tolist(), [True, False, True, False, True])
+        self.assertEqual(encoded_dataset.TP, 3)
+        self.assertEqual(encoded_dataset.FP, 2)
+        self.assertEqual(encoded_dataset.selectors_tp.tolist(), [2, 0, 1, 1, 2])
+        self.assertEqual(encoded_dataset.selectors_fp.tolist(), [1, 1, 0, 2, 0])
+        self.assertEqual(list(encoded_dataset.get_selector_positions_of_attribute("b")), [3, 4])
+        self.assertEqual(list(encoded_dataset.get_selector_positions_of_attribute("target")), [])
+        self.assertEqual(encoded_dataset.get_matrix_of_selector_positions().tolist(), [[0, 3], [1, 3], [0, 4], [0, 3], [2, 4]])
+        rows_of_selectors = [(selector, list(positions_tp), list(positions_fp)) for selector, positions_tp, positions_fp in encoded_dataset.generate_rows_of_selectors()]
+        self.assertEqual(rows_of_selectors[0], (Selector("a", Operator.EQUAL, "x"), [0, 2], [3]))
+        self.assertEqual(rows_of_selectors[3], (Selector("b", Operator.EQUAL, "1"), [0], [1, 3]))
+        decoded_df = encoded_dataset.to_dataframe()
+        self.assertIs(decoded_df, encoded_dataset.to_dataframe())
+        self.assertEqual(list(decoded_df.index), [10, 20, 30, 40, 50])
+        self.assertEqual(decoded_df.astype(str).to_dict("list"), self.df.to_dict("list"))
+        encoded_dataset.check_target(("target", "p"))
+        self.assertRaises(ValueError, encoded_dataset.check_target, ("target", "n"))
+
+    def test_EncodedDataset_missing_values(self) -> None:
+        df = DataFrame({"a" : ["x", None, "x"], "target" : ["p", "n", "p"]})
+        encoded_dataset = EncodedDataset(df, ("target", "p"))
+        self.assertEqual(encoded_dataset.codes[:, 0].tolist(), [0, 1, 0])
+        self.assertEqual(encoded_dataset.selectors, [Selector("a", Operator.EQUAL, "x")])
+        self.assertEqual(encoded_dataset.get_matrix_of_selector_positions().tolist(), [[0], [-1], [0]])
+        self.assertTrue(encoded_dataset.to_dataframe()["a"].isna().tolist()[1])
+
+    def test_EncodedDataset_selector_bitmaps(self) -> None:
+        # High-cardinality attribute with missing values and a number of rows which is not a multiple of 8.
+        random_generator = Random(0)
+        df = DataFrame({"a" : [random_generator.choice([None] + [str(value) for value in range(300)]) for _ in range(1003)], "b" : [random_generator.choice(["x", "y"]) for _ in range(1003)], "target" : [random_generator.choice(["p", "n"]) for _ in range(1003)]})
+        encoded_dataset = EncodedDataset(df, ("target", "p"))
+        selector_bitmaps = encoded_dataset.get_selector_bitmaps()
+        self.assertIs(selector_bitmaps, encoded_dataset.get_selector_bitmaps())
+        self.assertEqual(selector_bitmaps.shape, (len(encoded_dataset.selectors), 126))
+        for position, selector in enumerate(encoded_dataset.selectors):
+            expected_instances = [index for index, value in enumerate(df[selector.attribute_name]) if value == selector.value]
+            self.assertEqual(list(encoded_dataset.get_selector_bitarray(position).search(1)), expected_instances)
+        # The padding bits are 0.
+        self.assertEqual(int((selector_bitmaps[:, -1] & uint8(0x1F)).sum()), 0)
+
+    def test_EncodedDataset_in_algorithms(self) -> None:
+        df = DataFrame({"a" : ["x", "y", "x", "x", "z", "y", "z", "x"], "b" : ["1", "1", "2", "1", "2", "2", "1", "2"], "c" : ["u", "v", "u", "u", "v", "u", "v", "v"], "target" : ["p", "n", "p", "n", "p", "n", "p", "p"]})
+        encoded_dataset = EncodedDataset(df, ("target", "p"))
+        file_path = "./tmp_encoded_dataset_results.txt"
+        algorithms = [lambda : VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1, write_results_in_file = True, file_path = file_path),
+                      lambda : SDMap(WRAcc(), -1, minimum_n = 1, write_results_in_file = True, file_path = file_path),
+                      lambda : SDMapStar(WRAcc(), WRAccOptimisticEstimate1(), -1, minimum_tp = 1, minimum_fp = 0, write_results_in_file = True, file_path = file_path)]
+        for create_algorithm in algorithms:
+            results = []
+            for data in [df, encoded_dataset]:
+                algorithm = create_algorithm()
+                algorithm.fit(data, ("target", "p"))
+                with open(file_path, "r") as file:
+                    results.append(sorted(file.readlines()))
+            self.assertEqual(results[0], results[1])
+            self.assertGreater(len(results[0]), 0)
+        self.assertRaises(ValueError, VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1).fit, encoded_dataset, ("target", "n"))
+        remove(file_path)
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+# Contributors:
+#    Antonio López Martínez-Carrasco <antoniolopezmc1995@gmail.com>
+
+"""Tests of the functionality contained in the file 'data_structures/encoded_dataset_cache.py'.
+"""
+
+from subgroups.data_structures.encoded_dataset_cache import EncodedDatasetCache
+from subgroups.data_structures.encoded_dataset import EncodedDataset
+from subgroups.algorithms.subgroup_sets.vlsd import VLSD
+from subgroups.quality_measures.wracc import WRAcc
+from subgroups.quality_measures.wracc_optimistic_estimate_1 import WRAccOptimisticEstimate1
+from pandas import DataFrame
+from numpy import memmap
+from unittest.mock import patch
+from shutil import rmtree
+import os
+import unittest
+
+class TestEncodedDatasetCache(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.directory_path = "./tmp_encoded_dataset_cache"
+        self.df = DataFrame({"a" : ["x", "y", "x", "x", "z", "y", "z", "x", "y"], "b" : ["1", "1", "2", "1", "2", "2", "1", "2", "1"], "target" : ["p", "n", "p", "n", "p", "n", "p", "p", "n"]}, index = [3, 1, 4, 15, 9, 2, 6, 5, 35])
+
+    def tearDown(self) -> None:
+        rmtree(self.directory_path, ignore_errors = True)
+
+    def test_EncodedDatasetCache_fingerprint(self) -> None:
+        fingerprint = EncodedDatasetCache.fingerprint(self.df, ("target", "p"))
+        self.assertEqual(fingerprint, EncodedDatasetCache.fingerprint(self.df.copy(), ("target", "p")))
+        self.assertNotEqual(fingerprint, EncodedDatasetCache.fingerprint(self.df, ("target", "n")))
+        modified_df = self.df.copy()
+        modified_df.loc[3, "a"] = "y"
+        self.assertNotEqual(fingerprint, EncodedDatasetCache.fingerprint(modified_df, ("target", "p")))
+        self.assertNotEqual(fingerprint, EncodedDatasetCache.fingerprint(self.df.reset_index(drop = True), ("target", "p")))
+        self.assertRaises(TypeError, EncodedDatasetCache.fingerprint, [1, 2], ("target", "p"))
+
+    def test_EncodedDatasetCache_get(self) -> None:
+        self.assertRaises(TypeError, EncodedDatasetCache, 1)
+        self.assertRaises(ValueError, EncodedDatasetCache, self.directory_path, 0)
+        cache = EncodedDatasetCache(self.directory_path)
+        self.assertEqual(cache.size, 0)
+        self.assertFalse(cache.is_cached(self.df, ("target", "p")))
+        encoded_dataset = cache.get(self.df, ("target", "p"))
+        self.assertTrue(cache.is_cached(self.df, ("target", "p")))
+        self.assertGreater(cache.size, 0)
+        loaded_encoded_dataset = cache.get(self.df, ("target", "p"))
+        # The big arrays are memory-mapped.
+        self.assertIsInstance(loaded_encoded_dataset.codes, memmap)
+        self.assertIsInstance(loaded_encoded_dataset.get_selector_bitmaps(), memmap)
+        self.assertEqual(loaded_encoded_dataset.target, encoded_dataset.target)
+        self.assertEqual(loaded_encoded_dataset.attribute_names, encoded_dataset.attribute_names)
+        self.assertEqual(loaded_encoded_dataset.categories, encoded_dataset.categories)
+        self.assertEqual(loaded_encoded_dataset.codes.tolist(), encoded_dataset.codes.tolist())
+        self.assertEqual(loaded_encoded_dataset.selectors, encoded_dataset.selectors)
+        self.assertEqual(loaded_encoded_dataset.selectors_tp.tolist(), encoded_dataset.selectors_tp.tolist())
+        self.assertEqual(loaded_encoded_dataset.selectors_fp.tolist(), encoded_dataset.selectors_fp.tolist())
+        self.assertEqual((loaded_encoded_dataset.TP, loaded_encoded_dataset.FP), (5, 4))
+        self.assertEqual(list(loaded_encoded_dataset.index), list(self.df.index))
+        self.assertEqual(loaded_encoded_dataset.to_dataframe().astype(str).to_dict("list"), self.df.to_dict("list"))
+        for position in range(len(encoded_dataset.selectors)):
+            self.assertEqual(loaded_encoded_dataset.get_selector_bitarray(position), encoded_dataset.get_selector_bitarray(position))
+        # The algorithms obtain the same results.
+        results = []
+        for data in [self.df, loaded_encoded_dataset]:
+            vlsd = VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1)
+            vlsd.fit(data, ("target", "p"))
+            results.append((vlsd.selected_subgroups, vlsd.unselected_subgroups, vlsd.visited_nodes))
+        self.assertEqual(results[0], results[1])
+        cache.clear()
+        self.assertEqual(cache.size, 0)
+
+    def test_EncodedDatasetCache_eviction(self) -> None:
+        cache = EncodedDatasetCache(self.directory_path)
+        cache.get(self.df, ("target", "p"))
+        entry_size = cache.size
+        # Only two entries fit in the cache.
+        cache = EncodedDatasetCache(self.directory_path, 2 * entry_size + entry_size // 2)
+        cache.get(self.df, ("target", "n"))
+        os.utime(os.path.join(self.directory_path, EncodedDatasetCache.fingerprint(self.df, ("target", "p"))), (0, 0)) # The least recently used.
+        cache.get(self.df.iloc[::-1], ("target", "p"))
+        self.assertFalse(cache.is_cached(self.df, ("target", "p")))
+        self.assertTrue(cache.is_cached(self.df, ("target", "n")))
+        self.assertTrue(cache.is_cached(self.df.iloc[::-1], ("target", "p")))
+
+    def test_EncodedDatasetCache_index_not_stored(self) -> None:
+        cache = EncodedDatasetCache(self.directory_path)
+        df = DataFrame({"a" : ["x", "y"], "target" : ["p", "n"]}, index = [(1, 2), (3, 4)])
+        self.assertIsInstance(cache.get(df, ("target", "p")), EncodedDataset)
+        self.assertFalse(cache.is_cached(df, ("target", "p")))
+        self.assertEqual(cache.size, 0)
+
+    def test_EncodedDatasetCache_index_name(self) -> None:
+        cache = EncodedDatasetCache(self.directory_path)
+        for df in [self.df.rename_axis("id"), self.df.reset_index(drop = True).rename_axis("id"), self.df.rename_axis(7)]:
+            cache.get(df, ("target", "p"))
+            loaded_encoded_dataset = cache.get(df, ("target", "p"))
+            self.assertEqual(loaded_encoded_dataset.index.name, df.index.name)
+            self.assertEqual(loaded_encoded_dataset.to_dataframe().index.name, df.index.name)
+        # The name of the index is part of the fingerprint.
+        self.assertNotEqual(EncodedDatasetCache.fingerprint(self.df, ("target", "p")), EncodedDatasetCache.fingerprint(self.df.rename_axis("id"), ("target", "p")))
+
+    def test_EncodedDatasetCache_store_error(self) -> None:
+        cache = EncodedDatasetCache(self.directory_path)
+        # If the files cannot be written (e.g., the disk is full), the Encoded Dataset is returned, but it is not stored.
+        with patch("subgroups.data_structures.encoded_dataset_cache.save", side_effect = OSError("No space left on device")):
+            self.assertIsInstance(cache.get(self.df, ("target", "p")), EncodedDataset)
+        self.assertFalse(cache.is_cached(self.df, ("target", "p")))
+        self.assertEqual(os.listdir(self.directory_path), [])
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+# Contributors:
+#    Antonio López Martínez-Carrasco <antoniolopezmc1995@gmail.com>
+
+"""Tests of the functionality contained in the file 'data_structures/numeric_attribute_index.py'.
+"""
+
+from subgroups.data_structures.numeric_attribute_index import NumericAttributeIndex
+from subgroups.data_structures.selector_index import SelectorIndex
+from subgroups.core.operator import Operator
+from subgroups.core.selector import Selector
+from subgroups.core.pattern import Pattern
+from subgroups.exceptions import DatasetAttributeTypeError
+from pandas import Series, DataFrame
+from bitarray import bitarray
+from numpy import nan
+import unittest
+
+class TestNumericAttributeIndex(unittest.TestCase):
+
+    def _check_against_pandas(self, series : Series, numeric_attribute_index : NumericAttributeIndex, values : list) -> None:
+        for operator in Operator:
+            for value in values:
+                expected = bitarray(list(operator.evaluate(series, value)), endian = "big")
+                self.assertEqual(numeric_attribute_index.get_bitarray(operator, value), expected, msg = str(operator) + " " + str(value))
+
+    def test_NumericAttributeIndex_general(self) -> None:
+        self.assertRaises(TypeError, NumericAttributeIndex, [1, 2, 3])
+        self.assertRaises(TypeError, NumericAttributeIndex, Series([1, 2, 3]), cut_points = 2)
+        self.assertRaises(ValueError, NumericAttributeIndex, Series([1, 2, 3]), maximum_number_of_cut_points = 0)
+        self.assertRaises(DatasetAttributeTypeError, NumericAttributeIndex, Series(["a", "b"]))
+        self.assertRaises(DatasetAttributeTypeError, NumericAttributeIndex, Series([True, False]))
+        numeric_attribute_index = NumericAttributeIndex(Series([3, 7, 5, 1, 7]))
+        self.assertEqual(numeric_attribute_index.number_of_rows, 5)
+        self.assertEqual(numeric_attribute_index.cut_points, [1, 3, 5, 7])
+        self.assertEqual(numeric_attribute_index.get_bitarray(Operator.LESS_OR_EQUAL, 5), bitarray("10110"))
+        self.assertEqual(numeric_attribute_index.get_bitarray(Operator.GREATER, 5), bitarray("01001"))
+        self.assertRaises(TypeError, numeric_attribute_index.get_bitarray, "<=", 5)
+        self.assertRaises(TypeError, numeric_attribute_index.get_bitarray, Operator.LESS, "5")
+        # The returned bitarrays are new objects.
+        numeric_attribute_index.get_bitarray(Operator.LESS, 5).setall(1)
+        self.assertEqual(numeric_attribute_index.get_bitarray(Operator.LESS, 5), bitarray("10010"))
+
+    def test_NumericAttributeIndex_parity_with_pandas(self) -> None:
+        series_int = Series([3, 7, 5, 1, 7, -2, 0, 5])
+        self._check_against_pandas(series_int, NumericAttributeIndex(series_int), [-5, -2, 0, 1, 2, 5, 6.5, 7, 8, nan])
+        series_float = Series([0.5, nan, 2.25, -1.0, 2.25, nan, 10.0])
+        self._check_against_pandas(series_float, NumericAttributeIndex(series_float), [-3, -1.0, 0, 0.5, 2.25, 3.0, 10, 11.5, nan])
+        # Explicit and equal-frequency cut points (values which are not cut points are also supported).
+        self._check_against_pandas(series_float, NumericAttributeIndex(series_float, cut_points = [2.25, 0.0]), [-1.0, 0.5, 1, 2.25, 10.0])
+        series_many = Series([float((i * 37) % 101) for i in range(300)])
+        numeric_attribute_index = NumericAttributeIndex(series_many, maximum_number_of_cut_points = 8)
+        self.assertLessEqual(len(numeric_attribute_index.cut_points), 8)
+        self._check_against_pandas(series_many, numeric_attribute_index, [0.0, 13.5, 50.0, 77.0, 100.0, 101.0])
+
+    def test_NumericAttributeIndex_in_SelectorIndex(self) -> None:
+        df = DataFrame({"a" : ["x", "y", "x", "x", "z"], "c" : [3, 7, 5, 1, 7], "d" : [1.5, nan, 0.5, 2.5, 1.5]}, index = [10, 20, 30, 40, 50])
+        selector_index = SelectorIndex(df)
+        self.assertEqual(selector_index.get_selector_bitarray(Selector("c", Operator.LESS, 5)), bitarray("10010"))
+        self.assertEqual(selector_index.get_selector_bitarray(Selector("c", Operator.GREATER_OR_EQUAL, 5)), bitarray("01101"))
+        self.assertEqual(selector_index.get_selector_bitarray(Selector("d", Operator.GREATER, 1.0)), bitarray("10011"))
+        self.assertEqual(selector_index.get_selector_bitarray(Selector("d", Operator.LESS_OR_EQUAL, 1.5)), bitarray("10101"))
+        self.assertIs(selector_index.get_numeric_attribute_index("c"), selector_index.get_numeric_attribute_index("c"))
+        self.assertEqual(selector_index.count(Pattern([Selector("c", Operator.LESS_OR_EQUAL, 5)])), 3)
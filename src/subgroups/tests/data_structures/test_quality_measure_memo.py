@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+# Contributors:
+#    Antonio López Martínez-Carrasco <antoniolopezmc1995@gmail.com>
+
+"""Tests of the functionality contained in the file 'data_structures/quality_measure_memo.py'.
+"""
+
+from subgroups.data_structures.quality_measure_memo import QualityMeasureMemo
+from subgroups.quality_measures.wracc import WRAcc
+from subgroups.quality_measures.qg import Qg
+import unittest
+
+class TestQualityMeasureMemo(unittest.TestCase):
+
+    def test_quality_measure_memo_dense(self) -> None:
+        bound_wracc = WRAcc().bind(40, 60)
+        memo = QualityMeasureMemo(bound_wracc, 40, 60)
+        self.assertTrue(memo.is_dense)
+        self.assertEqual(memo.size, 0)
+        # The dense table is allocated when the first value is stored.
+        self.assertIsNone(memo._dense_table)
+        self.assertEqual(memo(10, 5), bound_wracc(10, 5))
+        self.assertEqual(len(memo._dense_table), 41 * 61)
+        self.assertEqual((memo.hits, memo.misses), (0, 1))
+        self.assertEqual(memo(10, 5), bound_wracc(10, 5))
+        self.assertEqual(memo(0, 60), bound_wracc(0, 60))
+        self.assertEqual(memo(40, 0), bound_wracc(40, 0))
+        self.assertEqual((memo.hits, memo.misses), (1, 3))
+        self.assertEqual(memo.size, 3)
+        # The errors are not memoized.
+        self.assertRaises(ZeroDivisionError, memo, 0, 0)
+        self.assertEqual(memo.size, 3)
+        memo.clear()
+        self.assertEqual((memo.hits, memo.misses, memo.size), (0, 0, 0))
+        self.assertIsNone(memo._dense_table)
+        self.assertEqual(memo(10, 5), bound_wracc(10, 5))
+        # The NaN values are not memoized.
+        memo_of_nan = QualityMeasureMemo(lambda tp, fp: float("nan"), 40, 60)
+        memo_of_nan(1, 1)
+        memo_of_nan(1, 1)
+        self.assertEqual((memo_of_nan.hits, memo_of_nan.misses, memo_of_nan.size), (0, 2, 0))
+
+    def test_quality_measure_memo_lru(self) -> None:
+        bound_qg = Qg().bind(40, 60, g = 1)
+        memo = QualityMeasureMemo(bound_qg, 40, 60, maximum_dense_size = 100, maximum_size = 2)
+        self.assertFalse(memo.is_dense)
+        self.assertEqual(memo(1, 1), bound_qg(1, 1))
+        self.assertEqual(memo(2, 2), bound_qg(2, 2))
+        self.assertEqual(memo(1, 1), bound_qg(1, 1)) # (1, 1) is now the most recently used entry.
+        self.assertEqual(memo(3, 3), bound_qg(3, 3)) # (2, 2) is deleted.
+        self.assertEqual((memo.hits, memo.misses, memo.size), (1, 3, 2))
+        self.assertEqual(memo(1, 1), bound_qg(1, 1))
+        self.assertEqual(memo(2, 2), bound_qg(2, 2))
+        self.assertEqual((memo.hits, memo.misses, memo.size), (2, 4, 2))
+        # The table is not dense with non-integer TP and FP.
+        self.assertFalse(QualityMeasureMemo(bound_qg, 40.5, 60).is_dense)
+
+    def test_quality_measure_memo_parameters(self) -> None:
+        self.assertRaises(TypeError, QualityMeasureMemo, 1, 40, 60)
+        self.assertRaises(TypeError, QualityMeasureMemo, WRAcc().bind(40, 60), "40", 60)
+        self.assertRaises(TypeError, QualityMeasureMemo, WRAcc().bind(40, 60), 40, 60, maximum_dense_size = 1.5)
+        self.assertRaises(ValueError, QualityMeasureMemo, WRAcc().bind(40, 60), 40, 60, maximum_size = 0)
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+# Contributors:
+#    Antonio López Martínez-Carrasco <antoniolopezmc1995@gmail.com>
+
+"""Tests of the functionality contained in the file 'data_structures/refinement_index.py'.
+"""
+
+from subgroups.data_structures.refinement_index import RefinementIndex
+from subgroups.core.pattern import Pattern
+from subgroups.core.frozen_pattern import FrozenPattern
+import unittest
+
+class TestRefinementIndex(unittest.TestCase):
+
+    def test_refinement_index_1(self) -> None:
+        list_of_patterns = [Pattern.generate_from_str("[a = 'x']"), \
+                            Pattern.generate_from_str("[a = 'x', b = 'y']"), \
+                            Pattern.generate_from_str("[b = 'y']"), \
+                            Pattern.generate_from_str("[a = 'x', b = 'y', c = 'z']"), \
+                            Pattern.generate_from_str("[]"), \
+                            Pattern.generate_from_str("[a = 'x', b = 'y']"), \
+                            FrozenPattern.from_pattern(Pattern.generate_from_str("[c = 'z']"))]
+        refinement_index = RefinementIndex(list_of_patterns)
+        self.assertEqual(len(refinement_index), 7)
+        pattern = Pattern.generate_from_str("[a = 'x', b = 'y']")
+        self.assertEqual(refinement_index.refinements_of(pattern, refinement_of_itself = True), [1, 3, 5])
+        self.assertEqual(refinement_index.refinements_of(pattern, refinement_of_itself = False), [3])
+        self.assertEqual(refinement_index.generalizations_of(pattern, generalization_of_itself = True), [0, 1, 2, 4, 5])
+        self.assertEqual(refinement_index.generalizations_of(pattern, generalization_of_itself = False), [0, 2, 4])
+        self.assertEqual(refinement_index.refinements_of(Pattern([]), refinement_of_itself = False), [0, 1, 2, 3, 5, 6])
+        self.assertEqual(refinement_index.refinements_of(Pattern.generate_from_str("[d = 'w']"), refinement_of_itself = True), [])
+        self.assertEqual(refinement_index.generalizations_of(Pattern.generate_from_str("[d = 'w']"), generalization_of_itself = True), [4])
+        # The results must be the same as those obtained using the method 'is_refinement'.
+        for query in list_of_patterns:
+            for refinement_of_itself in [True, False]:
+                expected_refinements = [index for index in range(len(list_of_patterns)) if query.is_refinement(list_of_patterns[index], refinement_of_itself)]
+                expected_generalizations = [index for index in range(len(list_of_patterns)) if list_of_patterns[index].is_refinement(query, refinement_of_itself)]
+                self.assertEqual(refinement_index.refinements_of(query, refinement_of_itself), expected_refinements)
+                self.assertEqual(refinement_index.generalizations_of(query, refinement_of_itself), expected_generalizations)
+        # Removed candidates are not returned.
+        refinement_index.remove(1)
+        refinement_index.remove(4)
+        refinement_index.remove(4)
+        self.assertEqual(len(refinement_index), 5)
+        self.assertEqual(refinement_index.refinements_of(pattern, refinement_of_itself = True), [3, 5])
+        self.assertEqual(refinement_index.generalizations_of(pattern, generalization_of_itself = True), [0, 2, 5])
+        self.assertRaises(TypeError, RefinementIndex, tuple(list_of_patterns))
+        self.assertRaises(TypeError, refinement_index.remove, "1")
+
+    def test_refinement_index_2(self) -> None:
+        # The index does not depend on the candidate patterns after it is built (their selectors could be deleted and their identifiers reused by other selectors).
+        refinement_index = RefinementIndex([Pattern.generate_from_str("[ri2_a = 'x']"), Pattern.generate_from_str("[ri2_a = 'x', ri2_b = 'y']")])
+        other_patterns = [Pattern.generate_from_str("[ri2_c = '" + str(index) + "']") for index in range(10)]
+        for other_pattern in other_patterns:
+            self.assertEqual(refinement_index.refinements_of(other_pattern, refinement_of_itself = True), [])
+            self.assertEqual(refinement_index.generalizations_of(other_pattern, generalization_of_itself = True), [])
+        self.assertEqual(refinement_index.refinements_of(Pattern.generate_from_str("[ri2_a = 'x']"), refinement_of_itself = False), [1])
+        # A pattern with selectors which are not in the index is never equal to a candidate.
+        self.assertEqual(refinement_index.generalizations_of(Pattern.generate_from_str("[ri2_a = 'x', ri2_c = '0']"), generalization_of_itself = False), [0])
+        self.assertEqual(refinement_index.generalizations_of(Pattern.generate_from_str("[ri2_a = 'x', ri2_b = 'y', ri2_c = '0']"), generalization_of_itself = False), [0, 1])
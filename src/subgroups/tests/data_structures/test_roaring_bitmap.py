@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+# Contributors:
+#    Antonio López Martínez-Carrasco <antoniolopezmc1995@gmail.com>
+
+"""Tests of the functionality contained in the file 'data_structures/roaring_bitmap.py'.
+"""
+
+from subgroups.data_structures.roaring_bitmap import RoaringBitmap
+from numpy import array, int64, uint16
+from random import Random
+import pickle
+import unittest
+
+class TestRoaringBitmap(unittest.TestCase):
+
+    def test_roaring_bitmap_1(self) -> None:
+        empty_roaring_bitmap = RoaringBitmap()
+        self.assertEqual(len(empty_roaring_bitmap), 0)
+        self.assertEqual(list(empty_roaring_bitmap), [])
+        self.assertEqual(str(empty_roaring_bitmap), "[]")
+        roaring_bitmap = RoaringBitmap([5, 3, 3, 65536 + 7, 2**20])
+        self.assertEqual(len(roaring_bitmap), 4)
+        self.assertEqual(list(roaring_bitmap), [3, 5, 65543, 1048576])
+        self.assertEqual(str(roaring_bitmap), "[3, 5, 65543, 1048576]")
+        self.assertTrue(65543 in roaring_bitmap)
+        self.assertFalse(4 in roaring_bitmap)
+        self.assertFalse(-3 in roaring_bitmap)
+        self.assertEqual(roaring_bitmap.number_of_containers, {"array" : 3, "bitmap" : 0, "run" : 0})
+        self.assertEqual(RoaringBitmap(array([5, 3, 65543, 1048576])), roaring_bitmap)
+        self.assertEqual(len(roaring_bitmap & empty_roaring_bitmap), 0)
+        self.assertRaises(ValueError, RoaringBitmap, [3, -1])
+        self.assertRaises(TypeError, roaring_bitmap.__and__, {3, 5})
+
+    def test_roaring_bitmap_2(self) -> None:
+        # The smallest container is chosen for each chunk.
+        dense_values = list(range(0, 65536, 2))
+        clustered_values = list(range(65536, 65536 + 10000))
+        sparse_values = list(range(2 * 65536, 2 * 65536 + 1000, 3))
+        roaring_bitmap = RoaringBitmap(dense_values + clustered_values + sparse_values)
+        self.assertEqual(roaring_bitmap.number_of_containers, {"array" : 1, "bitmap" : 1, "run" : 1})
+        self.assertEqual(roaring_bitmap.size_in_bytes, 8192 + 4 + 2 * len(sparse_values))
+        self.assertEqual(len(roaring_bitmap), len(dense_values) + len(clustered_values) + len(sparse_values))
+        # A Roaring Bitmap is smaller than a bitset with the same values.
+        self.assertLess(RoaringBitmap(sparse_values).size_in_bytes, (2 * 65536 + 1000) // 8)
+
+    def test_roaring_bitmap_3(self) -> None:
+        # The AND operator, with all the combinations of containers, is the same as the intersection of python sets.
+        random_generator = Random(11)
+        def generate_values() -> set[int]:
+            values = set()
+            for chunk in random_generator.sample(range(4), random_generator.randint(0, 4)):
+                kind_of_chunk = random_generator.choice(["sparse", "dense", "clustered"])
+                if kind_of_chunk == "sparse":
+                    values.update((chunk << 16) + random_generator.randrange(65536) for _ in range(random_generator.randint(1, 3000)))
+                elif kind_of_chunk == "dense":
+                    values.update((chunk << 16) + value for value in range(65536) if random_generator.random() < 0.5)
+                else:
+                    for _ in range(random_generator.randint(1, 20)):
+                        start = random_generator.randrange(65536)
+                        values.update((chunk << 16) + value for value in range(start, min(65536, start + random_generator.randint(1, 5000))))
+            return values
+        for _ in range(30):
+            values_1 = generate_values()
+            values_2 = generate_values()
+            roaring_bitmap_1 = RoaringBitmap(values_1)
+            roaring_bitmap_2 = RoaringBitmap(values_2)
+            self.assertEqual(list(roaring_bitmap_1), sorted(values_1))
+            intersection = roaring_bitmap_1 & roaring_bitmap_2
+            self.assertEqual(len(intersection), len(values_1 & values_2))
+            self.assertEqual(list(intersection), sorted(values_1 & values_2))
+            self.assertEqual(list(intersection & roaring_bitmap_1), sorted(values_1 & values_2))
+        # Pickle.
+        self.assertEqual(pickle.loads(pickle.dumps(roaring_bitmap_1)), roaring_bitmap_1)
+
+    def test_roaring_bitmap_4(self) -> None:
+        # The AND operator of two run containers with many runs (which are intersected with vectorized operations).
+        random_generator = Random(17)
+        def generate_runs() -> set[int]:
+            values = set()
+            start = random_generator.randrange(10)
+            while start < 65536:
+                end = min(65536, start + random_generator.randint(1, 200))
+                values.update(range(start, end))
+                start = end + random_generator.randint(1, 200)
+            return values
+        for _ in range(5):
+            values_1 = generate_runs()
+            values_2 = generate_runs()
+            roaring_bitmap_1 = RoaringBitmap(values_1)
+            roaring_bitmap_2 = RoaringBitmap(values_2)
+            self.assertEqual(roaring_bitmap_1.number_of_containers, {"array" : 0, "bitmap" : 0, "run" : 1})
+            self.assertEqual(list(roaring_bitmap_1 & roaring_bitmap_2), sorted(values_1 & values_2))
+        # Runs which touch only at their limits and disjoint runs.
+        touching_1 = RoaringBitmap(list(range(0, 5000)) + list(range(10000, 20000)))
+        touching_2 = RoaringBitmap(list(range(4999, 10000)) + list(range(19999, 30000)))
+        self.assertEqual(list(touching_1 & touching_2), [4999, 19999])
+        self.assertEqual(len(RoaringBitmap(range(0, 5000)) & RoaringBitmap(range(5000, 10000))), 0)
+        # Membership of numpy integers.
+        roaring_bitmap = RoaringBitmap(range(100, 6000))
+        self.assertTrue(int64(150) in roaring_bitmap)
+        self.assertTrue(uint16(5999) in roaring_bitmap)
+        self.assertFalse(int64(6000) in roaring_bitmap)
+        self.assertFalse(int64(-1) in roaring_bitmap)
+        self.assertFalse(150.0 in roaring_bitmap)
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+# Contributors:
+#    Antonio López Martínez-Carrasco <antoniolopezmc1995@gmail.com>
+
+"""Tests of the functionality contained in the file 'data_structures/selector_index.py'.
+"""
+
+from subgroups.data_structures.selector_index import SelectorIndex
+from subgroups.core.operator import Operator
+from subgroups.core.selector import Selector
+from subgroups.core.pattern import Pattern
+from subgroups.core.subgroup import Subgroup
+from subgroups.utils.dataframe_filters import filter_by_list_of_selectors
+from pandas import DataFrame
+from bitarray import bitarray
+import unittest
+
+class TestSelectorIndex(unittest.TestCase):
+
+    def setUp(self) -> None:
+        # We use a non-default index in order to check that the results are aligned with the DataFrame.
+        self.df = DataFrame({"a" : ["x", "y", "x", "x", "z"], "b" : ["1", "1", "2", "1", "2"], "c" : [3, 7, 5, 1, 7], "t" : ["p", "n", "p", "n", "p"]}, index = [10, 20, 30, 40, 50])
+
+    def test_SelectorIndex_bitarrays(self) -> None:
+        self.assertRaises(TypeError, SelectorIndex, [1, 2])
+        selector_index = SelectorIndex(self.df)
+        self.assertEqual(selector_index.number_of_rows, 5)
+        self.assertIs(selector_index.pandas_dataframe, self.df)
+        self.assertEqual(selector_index.get_selector_bitarray(Selector("a", Operator.EQUAL, "x")), bitarray("10110"))
+        self.assertEqual(selector_index.get_selector_bitarray(Selector("c", Operator.GREATER_OR_EQUAL, 5)), bitarray("01101"))
+        # The bitarrays of the selectors are cached.
+        self.assertIs(selector_index.get_selector_bitarray(Selector("a", Operator.EQUAL, "x")), selector_index.get_selector_bitarray(Selector("a", Operator.EQUAL, "x")))
+        self.assertEqual(selector_index.get_pattern_bitarray(Pattern([])), bitarray("11111"))
+        self.assertEqual(selector_index.get_pattern_bitarray(Pattern.generate_from_str("[a = 'x', b = '1']")), bitarray("10010"))
+        self.assertEqual(selector_index.count(Pattern.generate_from_str("[a = 'x', b = '1']")), 2)
+        self.assertEqual(selector_index.count([Selector("a", Operator.NOT_EQUAL, "x"), Selector("c", Operator.EQUAL, 7)]), 2)
+        # The returned bitarrays do not modify the cached ones.
+        selector_index.get_pattern_bitarray(Pattern.generate_from_str("[a = 'x']")).setall(0)
+        self.assertEqual(selector_index.get_selector_bitarray(Selector("a", Operator.EQUAL, "x")), bitarray("10110"))
+        self.assertRaises(KeyError, selector_index.get_selector_bitarray, Selector("d", Operator.EQUAL, "x"))
+
+    def test_SelectorIndex_equivalences(self) -> None:
+        selector_index = SelectorIndex(self.df)
+        for pattern in [Pattern([]), Pattern.generate_from_str("[a = 'x']"), Pattern.generate_from_str("[a = 'x', b = '1']"), Pattern.generate_from_str("[b = '2', c > 4]")]:
+            self.assertTrue(selector_index.is_contained(pattern).equals(pattern.is_contained(self.df)))
+            self.assertTrue(selector_index.filter_by_list_of_selectors(list(pattern)).equals(filter_by_list_of_selectors(self.df, list(pattern))))
+            subgroup = Subgroup(pattern, Selector("t", Operator.EQUAL, "p"))
+            for (result, expected_result) in zip(selector_index.filter(subgroup), subgroup.filter(self.df)):
+                self.assertEqual(result.tolist(), expected_result.tolist())
+                self.assertTrue(result.index.equals(self.df.index))
+        self.assertRaises(TypeError, selector_index.filter, Pattern([]))
+        self.assertRaises(TypeError, selector_index.filter_by_list_of_selectors, Pattern([]))
+
+    def test_SelectorIndex_evaluate(self) -> None:
+        selector_index = SelectorIndex(self.df)
+        list_of_subgroups = [Subgroup(Pattern.generate_from_str("[a = 'x', b = '1']"), Selector("t", Operator.EQUAL, "p")), \
+                             Subgroup(Pattern([]), Selector("t", Operator.EQUAL, "p")), \
+                             Subgroup(Pattern.generate_from_str("[a = 'x']"), Selector("t", Operator.EQUAL, "p")), \
+                             Subgroup(Pattern.generate_from_str("[a = 'x', b = '2']"), Selector("t", Operator.EQUAL, "n")), \
+                             Subgroup(Pattern.generate_from_str("[a = 'x', b = '1']"), Selector("t", Operator.EQUAL, "n")), \
+                             Subgroup(Pattern.generate_from_str("[b = '2', c > 4]"), Selector("t", Operator.EQUAL, "p"))]
+        tp, fp, TP, FP = selector_index.evaluate(list_of_subgroups)
+        coverage_bitarrays = selector_index.get_coverage_bitarrays(list_of_subgroups)
+        self.assertEqual(len(coverage_bitarrays), len(list_of_subgroups))
+        for index, subgroup in enumerate(list_of_subgroups):
+            expected_tp_Series, expected_fp_Series, expected_target_Series = subgroup.filter(self.df)
+            self.assertEqual(tp[index], expected_tp_Series.sum())
+            self.assertEqual(fp[index], expected_fp_Series.sum())
+            self.assertEqual(TP[index], expected_target_Series.sum())
+            self.assertEqual(FP[index], len(self.df) - expected_target_Series.sum())
+            self.assertEqual(coverage_bitarrays[index][0].tolist(), expected_tp_Series.tolist())
+            self.assertEqual(coverage_bitarrays[index][1].tolist(), expected_fp_Series.tolist())
+        self.assertEqual(len(selector_index.evaluate([])[0]), 0)
+        self.assertRaises(TypeError, selector_index.evaluate, tuple(list_of_subgroups))
+        self.assertRaises(TypeError, selector_index.evaluate, [Pattern([])])
@@ -91,6 +91,10 @@ class TestVerticalListWithBitsets(unittest.TestCase):
         self.assertEqual(join_4.fp, 1)
         self.assertEqual(join_4.n, 1)
         self.assertEqual(join_4.quality_value, (1/3))
+        # Join with a bound quality measure (the dictionary of parameters is not used).
+        join_5 = vl_3.join(vl_4, Coverage().bind(TP, FP), {}, return_None_if_n_is_0 = False)
+        self.assertEqual(join_5.list_of_selectors, join_4.list_of_selectors)
+        self.assertEqual(join_5.quality_value, (1/3))
 
     def test_vertical_list_2(self) -> None:
         TP = 24
@@ -125,3 +129,27 @@ class TestVerticalListWithBitsets(unittest.TestCase):
         self.assertEqual(str(vl_4), "List of selectors: [" + str(Selector("at2", Operator.EQUAL, "z")) + "], Sequence of instances (tp): [], Sequence of instances (fp): [2], Quality value: 0")
         self.assertEqual(str(vl_5), "List of selectors: [], Sequence of instances (tp): [], Sequence of instances (fp): [1, 2], Quality value: 1")
         self.assertEqual(str(vl_6), "List of selectors: [" + str(Selector("at1", Operator.EQUAL, "a")) + ", " + str(Selector("at2", Operator.EQUAL, "b")) + ", " + str(Selector("at3", Operator.NOT_EQUAL, "c")) + "], Sequence of instances (tp): [1], Sequence of instances (fp): [0, 3], Quality value: 5")
+
+    def test_vertical_list_join_batch(self) -> None:
+        TP = 40
+        FP = 60
+        # 100 instances (i.e., two words with padding) and the instances 0-39 have the target.
+        vl_1 = VerticalListWithBitsets([Selector("at1", Operator.EQUAL, "a")], list(range(0, 40, 2)), list(range(40, 100, 2)), 100, -45)
+        other_vls = [VerticalListWithBitsets([Selector("at2", Operator.EQUAL, "b")], list(range(0, 40, 3)), list(range(40, 100, 3)), 100, -45), \
+                     VerticalListWithBitsets([Selector("at2", Operator.EQUAL, "c")], list(range(1, 40, 2)), list(range(41, 100, 2)), 100, -45), \
+                     VerticalListWithBitsets([Selector("at2", Operator.EQUAL, "d")], [0, 2, 99], [98], 100, -45), \
+                     VerticalListWithBitsets([Selector("at3", Operator.EQUAL, "e")], list(range(40)), list(range(40, 100)), 100, -45)]
+        stacked_sequences_of_instances_tp, stacked_sequences_of_instances_fp = VerticalListWithBitsets.stack_sequences_of_instances(other_vls)
+        self.assertEqual(stacked_sequences_of_instances_tp.shape, (4, 2))
+        # Without threshold, all the joins with n > 0 are created (the join with "at2 = 'c'" is empty).
+        result = vl_1.join_batch(other_vls, stacked_sequences_of_instances_tp, stacked_sequences_of_instances_fp, Support(), TP, FP, {}, 0)
+        self.assertEqual([index for index, _ in result], [0, 2, 3])
+        for index, vl in result:
+            expected_vl = vl_1.join(other_vls[index], Support(), {"TP" : TP, "FP" : FP})
+            self.assertEqual(vl.list_of_selectors, expected_vl.list_of_selectors)
+            self.assertEqual(vl.sequence_of_instances_tp, expected_vl.sequence_of_instances_tp)
+            self.assertEqual(vl.sequence_of_instances_fp, expected_vl.sequence_of_instances_fp)
+            self.assertEqual((vl.tp, vl.fp, vl.quality_value), (expected_vl.tp, expected_vl.fp, expected_vl.quality_value))
+        # With threshold, only the joins with quality enough are created.
+        result = vl_1.join_batch(other_vls, stacked_sequences_of_instances_tp, stacked_sequences_of_instances_fp, Support(), TP, FP, {}, 0.1)
+        self.assertEqual([(index, vl.tp, vl.fp) for index, vl in result], [(3, 20, 30)])
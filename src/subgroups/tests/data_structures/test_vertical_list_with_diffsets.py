@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+# Contributors:
+#    Antonio López Martínez-Carrasco <antoniolopezmc1995@gmail.com>
+
+"""Tests of the functionality contained in the file 'data_structures/vertical_list_with_diffsets.py'.
+"""
+
+from subgroups.data_structures.vertical_list_with_diffsets import VerticalListWithDiffsets
+from subgroups.data_structures.vertical_list_with_sets import VerticalListWithSets
+from subgroups.core.operator import Operator
+from subgroups.core.selector import Selector
+from subgroups.quality_measures.support import Support
+from subgroups.quality_measures.wracc import WRAcc
+from subgroups.exceptions import VerticalListSizeError
+from random import Random
+import unittest
+
+class TestVerticalListWithDiffsets(unittest.TestCase):
+
+    def test_vertical_list_with_diffsets_1(self) -> None:
+        TP = 3
+        FP = 3
+        vl_1 = VerticalListWithDiffsets([Selector("at1", Operator.EQUAL, "a")], [0, 1, 2], [3, 4], 6, -45)
+        vl_2 = VerticalListWithDiffsets([Selector("at2", Operator.EQUAL, "b")], [0, 2], [4, 5], 6, -45)
+        vl_3 = VerticalListWithDiffsets([Selector("at3", Operator.EQUAL, "c")], [1, 2], [3, 4, 5], 6, -45)
+        self.assertIsNone(vl_1.parent)
+        self.assertEqual(vl_1.sequence_of_instances_tp, {0, 1, 2})
+        self.assertFalse(vl_1.is_diffset)
+        self.assertEqual((vl_1.tp, vl_1.fp, vl_1.n), (3, 2, 5))
+        self.assertEqual(vl_1.compute_quality_value(Support(), {"tp" : 1000, "fp" : 1000, "TP" : TP, "FP" : FP}), 3/6) # The parameters "tp" and "fp" of the dictionary of parameters should not be considered in the method.
+        # Level 2: the diffset is the difference between the tidsets.
+        vl_12 = vl_1.join(vl_2, Support(), {"TP" : TP, "FP" : FP})
+        vl_13 = vl_1.join(vl_3, Support().bind(TP, FP), {})
+        self.assertIs(vl_12.parent, vl_1)
+        self.assertEqual(vl_12.list_of_selectors, [Selector("at1", Operator.EQUAL, "a"), Selector("at2", Operator.EQUAL, "b")])
+        self.assertTrue(vl_12.is_diffset)
+        self.assertEqual((vl_12._sequence_of_instances_tp, vl_12._sequence_of_instances_fp), ({1}, {3}))
+        self.assertEqual((vl_12.sequence_of_instances_tp, vl_12.sequence_of_instances_fp), ({0, 2}, {4}))
+        self.assertEqual((vl_12.tp, vl_12.fp, vl_12.quality_value), (2, 1, 2/6))
+        self.assertTrue(vl_13.is_diffset)
+        self.assertEqual((vl_13._sequence_of_instances_tp, vl_13._sequence_of_instances_fp), ({0}, set()))
+        self.assertEqual((vl_13.tp, vl_13.fp, vl_13.quality_value), (2, 2, 2/6))
+        # Level 3: the diffset is the difference between the diffsets.
+        vl_123 = vl_12.join(vl_13, Support(), {"TP" : TP, "FP" : FP})
+        self.assertIs(vl_123.parent, vl_12)
+        self.assertTrue(vl_123.is_diffset)
+        self.assertEqual((vl_123._sequence_of_instances_tp, vl_123._sequence_of_instances_fp), ({0}, set()))
+        self.assertEqual((vl_123.sequence_of_instances_tp, vl_123.sequence_of_instances_fp), ({2}, {4}))
+        self.assertEqual((vl_123.tp, vl_123.fp), (1, 1))
+        self.assertEqual(str(vl_123), "List of selectors: [at1 = 'a', at2 = 'b', at3 = 'c'], Sequence of instances (tp): [2], Sequence of instances (fp): [4], Quality value: " + str(1/6))
+        # An empty join: the tidsets are stored, because they are smaller than the diffsets.
+        vl_4 = VerticalListWithDiffsets([Selector("at4", Operator.EQUAL, "d")], [], [5], 6, -45)
+        self.assertIsNone(vl_1.join(vl_4, Support(), {"TP" : TP, "FP" : FP}, return_None_if_n_is_0 = True))
+        vl_14 = vl_1.join(vl_4, Support(), {"TP" : TP, "FP" : FP})
+        self.assertFalse(vl_14.is_diffset)
+        self.assertEqual((vl_14._sequence_of_instances_tp, vl_14._sequence_of_instances_fp, vl_14.n), (set(), set(), 0))
+        # Joins between a Vertical List with diffsets and a Vertical List with tidsets.
+        vl_124 = vl_12.join(vl_14, Support(), {"TP" : TP, "FP" : FP})
+        self.assertFalse(vl_124.is_diffset)
+        self.assertEqual((vl_124.sequence_of_instances_tp, vl_124.sequence_of_instances_fp, vl_124.n), (set(), set(), 0))
+        vl_142 = vl_14.join(vl_12, Support(), {"TP" : TP, "FP" : FP})
+        self.assertEqual((vl_142.sequence_of_instances_tp, vl_142.sequence_of_instances_fp, vl_142.n), (set(), set(), 0))
+        # Errors.
+        self.assertRaises(TypeError, vl_1.join, VerticalListWithSets([Selector("at2", Operator.EQUAL, "b")], [0, 2], [4, 5], 6, -45), Support(), {})
+        self.assertRaises(TypeError, vl_1.join, vl_2, 1, {})
+        self.assertRaises(TypeError, vl_1.join, vl_2, Support(), [])
+        self.assertRaises(TypeError, vl_1.join, vl_2, Support(), {}, return_None_if_n_is_0 = 1)
+        self.assertRaises(VerticalListSizeError, vl_1.join, VerticalListWithDiffsets([Selector("at2", Operator.EQUAL, "b")], [0], [], 7, -45), Support(), {})
+        self.assertRaises(ValueError, vl_12.join, vl_2, Support(), {}) # Different parents.
+        self.assertRaises(ValueError, vl_12.join, vl_2.join(vl_3, Support(), {"TP" : TP, "FP" : FP}), Support(), {}) # Different parents.
+
+    def test_vertical_list_with_diffsets_2(self) -> None:
+        # The same counters and tidsets as with the sets implementation in a random search space.
+        random_generator = Random(7)
+        number_of_dataset_instances = 200
+        TP = 90
+        FP = 110
+        bound_wracc = WRAcc().bind(TP, FP)
+        tidsets = []
+        for index in range(6):
+            # Dense and sparse selectors, so that both diffsets and tidsets are stored.
+            density = 0.8 if index % 2 == 0 else 0.3
+            covered_instances = [instance for instance in range(number_of_dataset_instances) if random_generator.random() < density]
+            tidsets.append(([instance for instance in covered_instances if instance < TP], [instance for instance in covered_instances if instance >= TP]))
+        selectors = [Selector("at" + str(index), Operator.EQUAL, "a") for index in range(6)]
+        level_with_diffsets = [VerticalListWithDiffsets([selector], tp, fp, number_of_dataset_instances, 0.0) for selector, (tp, fp) in zip(selectors, tidsets)]
+        level_with_sets = [VerticalListWithSets([selector], tp, fp, number_of_dataset_instances, 0.0) for selector, (tp, fp) in zip(selectors, tidsets)]
+        # Depth-first search joining each Vertical List with its right siblings.
+        stored_representations = set()
+        def search(siblings_with_diffsets : list, siblings_with_sets : list) -> int:
+            number_of_joins = 0
+            for index_x in range(len(siblings_with_diffsets)):
+                children_with_diffsets = []
+                children_with_sets = []
+                for index_y in range(index_x+1, len(siblings_with_diffsets)):
+                    child_with_diffsets = siblings_with_diffsets[index_x].join(siblings_with_diffsets[index_y], bound_wracc, {})
+                    child_with_sets = siblings_with_sets[index_x].join(siblings_with_sets[index_y], bound_wracc, {})
+                    self.assertEqual(child_with_diffsets.list_of_selectors, child_with_sets.list_of_selectors)
+                    self.assertEqual((child_with_diffsets.tp, child_with_diffsets.fp), (child_with_sets.tp, child_with_sets.fp))
+                    self.assertEqual(child_with_diffsets.quality_value, child_with_sets.quality_value)
+                    self.assertEqual(child_with_diffsets.sequence_of_instances_tp, child_with_sets.sequence_of_instances_tp)
+                    self.assertEqual(child_with_diffsets.sequence_of_instances_fp, child_with_sets.sequence_of_instances_fp)
+                    stored_representations.add(child_with_diffsets.is_diffset)
+                    children_with_diffsets.append(child_with_diffsets)
+                    children_with_sets.append(child_with_sets)
+                    number_of_joins = number_of_joins + 1
+                number_of_joins = number_of_joins + search(children_with_diffsets, children_with_sets)
+            return number_of_joins
+        self.assertEqual(search(level_with_diffsets, level_with_sets), 2**6 - 6 - 1)
+        self.assertEqual(stored_representations, {True, False})
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+
+# Contributors:
+#    Antonio López Martínez-Carrasco <antoniolopezmc1995@gmail.com>
+
+"""Tests of the functionality contained in the file 'data_structures/vertical_list_with_roaring_bitmaps.py'.
+"""
+
+from subgroups.data_structures.vertical_list_with_roaring_bitmaps import VerticalListWithRoaringBitmaps
+from subgroups.data_structures.vertical_list_with_sets import VerticalListWithSets
+from subgroups.data_structures.roaring_bitmap import RoaringBitmap
+from subgroups.core.operator import Operator
+from subgroups.core.selector import Selector
+from subgroups.quality_measures.support import Support
+from subgroups.exceptions import VerticalListSizeError
+import unittest
+
+class TestVerticalListWithRoaringBitmaps(unittest.TestCase):
+
+    def test_vertical_list_with_roaring_bitmaps_1(self) -> None:
+        TP = 3
+        FP = 3
+        vl_1 = VerticalListWithRoaringBitmaps([Selector("at1", Operator.EQUAL, "a")], [0, 1, 2], [3, 4], 6, -45)
+        vl_2 = VerticalListWithRoaringBitmaps([Selector("at2", Operator.EQUAL, "b")], [0, 2], [4, 5], 6, -45)
+        vl_3 = VerticalListWithRoaringBitmaps([Selector("at3", Operator.EQUAL, "c")], [], [5], 6, -45)
+        self.assertEqual(vl_1.sequence_of_instances_tp, RoaringBitmap([0, 1, 2]))
+        self.assertEqual((vl_1.tp, vl_1.fp, vl_1.n), (3, 2, 5))
+        self.assertEqual(vl_1.compute_quality_value(Support(), {"tp" : 1000, "fp" : 1000, "TP" : TP, "FP" : FP}), 3/6) # The parameters "tp" and "fp" of the dictionary of parameters should not be considered in the method.
+        vl_12 = vl_1.join(vl_2, Support(), {"TP" : TP, "FP" : FP})
+        self.assertEqual(vl_12.list_of_selectors, [Selector("at1", Operator.EQUAL, "a"), Selector("at2", Operator.EQUAL, "b")])
+        self.assertEqual((list(vl_12.sequence_of_instances_tp), list(vl_12.sequence_of_instances_fp)), ([0, 2], [4]))
+        self.assertEqual((vl_12.tp, vl_12.fp, vl_12.quality_value), (2, 1, 2/6))
+        self.assertEqual(str(vl_12), "List of selectors: [at1 = 'a', at2 = 'b'], Sequence of instances (tp): [0, 2], Sequence of instances (fp): [4], Quality value: " + str(2/6))
+        self.assertEqual(vl_12.join(vl_12, Support().bind(TP, FP), {}).n, 3)
+        # An empty join.
+        self.assertIsNone(vl_1.join(vl_3, Support(), {"TP" : TP, "FP" : FP}, return_None_if_n_is_0 = True))
+        self.assertEqual(vl_1.join(vl_3, Support(), {"TP" : TP, "FP" : FP}).n, 0)
+        # Errors.
+        self.assertRaises(TypeError, vl_1.join, VerticalListWithSets([Selector("at2", Operator.EQUAL, "b")], [0, 2], [4, 5], 6, -45), Support(), {})
+        self.assertRaises(TypeError, vl_1.join, vl_2, 1, {})
+        self.assertRaises(TypeError, vl_1.join, vl_2, Support(), [])
+        self.assertRaises(TypeError, vl_1.join, vl_2, Support(), {}, return_None_if_n_is_0 = 1)
+        self.assertRaises(VerticalListSizeError, vl_1.join, VerticalListWithRoaringBitmaps([Selector("at2", Operator.EQUAL, "b")], [0], [], 7, -45), Support(), {})
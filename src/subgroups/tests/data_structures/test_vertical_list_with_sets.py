@@ -91,6 +91,10 @@ class TestVerticalListWithSets(unittest.TestCase):
         self.assertEqual(join_4.fp, 1)
         self.assertEqual(join_4.n, 1)
         self.assertEqual(join_4.quality_value, (1/3))
+        # Join with a bound quality measure (the dictionary of parameters is not used).
+        join_5 = vl_3.join(vl_4, Coverage().bind(TP, FP), {}, return_None_if_n_is_0 = False)
+        self.assertEqual(join_5.list_of_selectors, join_4.list_of_selectors)
+        self.assertEqual(join_5.quality_value, (1/3))
 
     def test_vertical_list_2(self) -> None:
         TP = 24
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+# Contributors:
+#    Antonio López Martínez-Carrasco <antoniolopezmc1995@gmail.com>
+
+"""Tests of the functionality contained in the file 'quality_measures/expression_quality_measure.py'.
+"""
+
+from subgroups.quality_measures.expression_quality_measure import ExpressionQualityMeasure
+from subgroups.quality_measures.wracc import WRAcc
+from subgroups.quality_measures.wracc_optimistic_estimate_2 import WRAccOptimisticEstimate2
+from subgroups.quality_measures.qg import Qg
+from subgroups.algorithms.subgroup_sets.vlsd import VLSD
+from subgroups.exceptions import InvalidExpressionError, ParameterNotFoundError, SubgroupParameterNotFoundError
+from pandas import DataFrame
+from numpy import array
+from math import isnan, sqrt
+import pickle
+import unittest
+
+class TestExpressionQualityMeasure(unittest.TestCase):
+
+    def test_expression_quality_measure_compute(self) -> None:
+        wracc = ExpressionQualityMeasure("MyWRAcc", "(tp+fp)/(TP+FP) * (tp/(tp+fp) - TP/(TP+FP))")
+        self.assertEqual(wracc.get_name(), "MyWRAcc")
+        self.assertEqual(wracc.optimistic_estimate_of(), dict())
+        self.assertEqual(wracc.additional_parameter_names, ())
+        TP, FP = 40, 60
+        bound_wracc = wracc.bind(TP, FP)
+        for (tp, fp) in [(10, 5), (3, 20), (0, 7), (40, 20)]:
+            value = WRAcc().compute_counts(tp, fp, TP, FP)
+            self.assertEqual(wracc({"tp" : tp, "fp" : fp, "TP" : TP, "FP" : FP}), value)
+            self.assertEqual(wracc.compute_counts(tp, fp, TP, FP), value)
+            self.assertEqual(bound_wracc(tp, fp), value)
+        result = wracc.compute_batch(array([10, 3, 0]), array([5, 20, 0]), TP, FP)
+        self.assertEqual(list(result[:2]), [WRAcc().compute_counts(10, 5, TP, FP), WRAcc().compute_counts(3, 20, TP, FP)])
+        self.assertTrue(isnan(result[2]))
+        self.assertRaises(TypeError, wracc, 3)
+        self.assertRaises(SubgroupParameterNotFoundError, wracc, {"tp" : 10, "fp" : 5, "TP" : TP})
+        # Functions and additional parameters.
+        qg = ExpressionQualityMeasure("MyQg", "tp / (fp + g)")
+        self.assertEqual(qg.additional_parameter_names, ("g",))
+        self.assertEqual(qg({"tp" : 10, "fp" : 5, "g" : 0.5}), Qg()({"tp" : 10, "fp" : 5, "g" : 0.5}))
+        self.assertEqual(qg.bind(TP, FP, g = 0.5)(10, 5), Qg().compute_counts(10, 5, TP, FP, {"g" : 0.5}))
+        self.assertEqual(list(qg.compute_batch([10], [5], TP, FP, {"g" : 0.5})), [10 / 5.5])
+        self.assertRaises(ParameterNotFoundError, qg, {"tp" : 10, "fp" : 5})
+        self.assertRaises(ParameterNotFoundError, qg.bind, TP, FP)
+        self.assertRaises(ParameterNotFoundError, qg.compute_batch, [10], [5], TP, FP)
+        functions = ExpressionQualityMeasure("Functions", "sqrt(tp) + abs(-fp) + max(tp, fp) - min(tp, fp) + log(exp(1))")
+        self.assertAlmostEqual(functions.compute_counts(9, 4, TP, FP), 3 + 4 + 9 - 4 + 1)
+        self.assertAlmostEqual(functions.compute_batch([9], [4], TP, FP)[0], 3 + 4 + 9 - 4 + 1)
+        # The operator ** is computed with float values (i.e., a large exponent raises an OverflowError instead of computing an unbounded int value).
+        power = ExpressionQualityMeasure("Power", "(tp/(TP+FP))**g + tp**2")
+        self.assertEqual(power.compute_counts(10, 5, TP, FP, {"g" : 2}), 0.1**2 + 100)
+        self.assertEqual(power.bind(TP, FP, g = 2)(10, 5), 0.1**2 + 100)
+        self.assertEqual(list(power.compute_batch(array([10]), array([5]), TP, FP, {"g" : 2})), [0.1**2 + 100])
+        self.assertEqual(ExpressionQualityMeasure("Power", "tp**tp").compute_batch(array([100]), array([5]), TP, FP)[0], 1e200)
+        self.assertRaises(OverflowError, ExpressionQualityMeasure("Power", "tp**(9**9**9)").compute_counts, 2, 5, TP, FP)
+        self.assertRaises(OverflowError, ExpressionQualityMeasure("Power", "tp**(9**9**9)").bind(TP, FP), 2, 5)
+        # An expression which does not use tp and fp.
+        constant = ExpressionQualityMeasure("Constant", "TP / (TP+FP)")
+        self.assertEqual(constant({"TP" : TP, "FP" : FP}), 0.4)
+        self.assertEqual(list(constant.compute_batch([1, 2, 3], [1, 1, 1], TP, FP)), [0.4, 0.4, 0.4])
+        # The quality measure can be pickled.
+        self.assertEqual(pickle.loads(pickle.dumps(qg)).bind(TP, FP, g = 0.5)(10, 5), qg.bind(TP, FP, g = 0.5)(10, 5))
+
+    def test_expression_quality_measure_invalid_expressions(self) -> None:
+        self.assertRaises(TypeError, ExpressionQualityMeasure, 1, "tp")
+        self.assertRaises(TypeError, ExpressionQualityMeasure, "a", 1)
+        self.assertRaises(TypeError, ExpressionQualityMeasure, "a", "tp", WRAcc())
+        self.assertRaises(TypeError, ExpressionQualityMeasure, "a", "tp", [1])
+        for expression in ["tp +", "__import__('os')", "tp.real", "lambda: tp", "tp if fp else TP", "tp < fp", "'tp'", "True", "foo(tp)", "sqrt(tp, fp)", "max(tp)", "sqrt", "_tp", "[tp]"]:
+            self.assertRaises(InvalidExpressionError, ExpressionQualityMeasure, "a", expression)
+
+    def test_expression_quality_measure_optimistic_estimate(self) -> None:
+        wracc = ExpressionQualityMeasure("MyWRAcc", "(tp+fp)/(TP+FP) * (tp/(tp+fp) - TP/(TP+FP))")
+        optimistic_estimate = wracc.derive_optimistic_estimate()
+        self.assertEqual(optimistic_estimate.get_name(), "MyWRAccOptimisticEstimate")
+        self.assertIs(optimistic_estimate.optimistic_estimate_of()["MyWRAcc"], wracc)
+        self.assertEqual(wracc.derive_optimistic_estimate("OE").get_name(), "OE")
+        self.assertRaises(TypeError, wracc.derive_optimistic_estimate, 1)
+        for (tp, fp) in [(10, 5), (3, 20), (40, 20)]:
+            self.assertAlmostEqual(optimistic_estimate.compute_counts(tp, fp, 40, 60), WRAccOptimisticEstimate2().compute_counts(tp, fp, 40, 60))
+        # If tp is 0, the best refinement has fp = 1.
+        self.assertEqual(optimistic_estimate.compute_counts(0, 7, 40, 60), wracc.compute_counts(0, 1, 40, 60))
+        self.assertEqual(list(optimistic_estimate.compute_batch([0, 10], [7, 5], 40, 60)), [wracc.compute_counts(0, 1, 40, 60), optimistic_estimate.compute_counts(10, 5, 40, 60)])
+        # The derived optimistic estimate can be used by the algorithms.
+        df = DataFrame({"a1" : ["a","b","c","c","b","a"], "a2" : ["q","q","s","q","s","s"], "a3" : ["f","g","h","k","g","f"], "class" : ["n","y","n","y","y","n"]})
+        vlsd_1 = VLSD(wracc, 0.05, optimistic_estimate, 0.05)
+        vlsd_1.fit(df, ("class", "y"))
+        vlsd_2 = VLSD(WRAcc(), 0.05, WRAccOptimisticEstimate2(), 0.05)
+        vlsd_2.fit(df, ("class", "y"))
+        self.assertEqual(vlsd_1.selected_subgroups, vlsd_2.selected_subgroups)
+        self.assertEqual(vlsd_1.visited_nodes, vlsd_2.visited_nodes)
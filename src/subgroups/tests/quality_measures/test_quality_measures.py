@@ -16,6 +16,8 @@ from subgroups.quality_measures.sensitivity import Sensitivity
 from subgroups.quality_measures.ppv import PPV
 from subgroups.quality_measures.wracc_optimistic_estimate_1 import WRAccOptimisticEstimate1
 from subgroups.quality_measures.binomial_test_optimistic_estimate_1 import BinomialTestOptimisticEstimate1
+from subgroups.quality_measures.wracc_optimistic_estimate_2 import WRAccOptimisticEstimate2
+from subgroups.quality_measures.binomial_test_optimistic_estimate_2 import BinomialTestOptimisticEstimate2
 from subgroups.quality_measures.piatetsky_shapiro import PiatetskyShapiro
 from subgroups.quality_measures.piatetsky_shapiro_optimistic_estimate_1 import PiatetskyShapiroOptimisticEstimate1
 from subgroups.quality_measures.piatetsky_shapiro_optimistic_estimate_2 import PiatetskyShapiroOptimisticEstimate2
@@ -25,7 +27,15 @@ from subgroups.quality_measures.specificity import Specificity
 from subgroups.quality_measures.irr import IRR
 from subgroups.quality_measures.f1_score import F1Score
 from subgroups.quality_measures.youden import Youden
-from math import sqrt
+from subgroups.quality_measures.qg_optimistic_estimate_1 import QgOptimisticEstimate1
+from subgroups.quality_measures.irr_optimistic_estimate_1 import IRROptimisticEstimate1
+from subgroups.quality_measures.f1_score_optimistic_estimate_1 import F1ScoreOptimisticEstimate1
+from subgroups.quality_measures.youden_optimistic_estimate_1 import YoudenOptimisticEstimate1
+from subgroups.quality_measures.ppv_optimistic_estimate_1 import PPVOptimisticEstimate1
+from subgroups.quality_measures.sensitivity_optimistic_estimate_1 import SensitivityOptimisticEstimate1
+from subgroups.exceptions import ParameterNotFoundError, SubgroupParameterNotFoundError
+from math import sqrt, isnan
+from numpy import array, ndarray
 import unittest
 
 class TestQualityMeasures(unittest.TestCase):
@@ -245,3 +255,149 @@ class TestQualityMeasures(unittest.TestCase):
         self.assertRaises(TypeError, F1Score().compute, 3)
         self.assertRaises(TypeError, Youden(), 3)
         self.assertRaises(TypeError, Youden().compute, 3)
+
+    def test_quality_measures_compute_counts(self) -> None:
+        quality_measures = [Support(), Coverage(), WRAcc(), BinomialTest(), Sensitivity(), PPV(), WRAccOptimisticEstimate1(), BinomialTestOptimisticEstimate1(), \
+                            PiatetskyShapiro(), PiatetskyShapiroOptimisticEstimate1(), PiatetskyShapiroOptimisticEstimate2(), NPV(), AbsoluteWRAcc(), Specificity(), IRR(), F1Score(), Youden(), \
+                            WRAccOptimisticEstimate2(), BinomialTestOptimisticEstimate2()]
+        for (tp, fp, TP, FP) in [(10, 5, 40, 60), (3, 20, 40, 60), (0, 7, 40, 60), (40, 20, 40, 60)]:
+            dict_of_parameters = {QualityMeasure.TRUE_POSITIVES : tp, QualityMeasure.FALSE_POSITIVES : fp, QualityMeasure.TRUE_POPULATION : TP, QualityMeasure.FALSE_POPULATION : FP}
+            for quality_measure in quality_measures:
+                self.assertEqual(quality_measure.compute_counts(tp, fp, TP, FP), quality_measure.compute(dict_of_parameters))
+            dict_of_parameters["g"] = 1
+            self.assertEqual(Qg().compute_counts(tp, fp, TP, FP, {"g" : 1}), Qg().compute(dict_of_parameters))
+        # Default implementation of the method 'compute_counts' (a quality measure which only implements the method 'compute').
+        class OnlyCompute(QualityMeasure):
+            def compute(self, dict_of_parameters : dict) -> float:
+                return dict_of_parameters[QualityMeasure.TRUE_POSITIVES] - dict_of_parameters[QualityMeasure.FALSE_POSITIVES] + dict_of_parameters.get("a", 0)
+            def get_name(self) -> str:
+                return "OnlyCompute"
+            def optimistic_estimate_of(self) -> dict:
+                return dict()
+            def __call__(self, dict_of_parameters : dict) -> float:
+                return self.compute(dict_of_parameters)
+        self.assertEqual(OnlyCompute().compute_counts(10, 4, 40, 60), 6)
+        self.assertEqual(OnlyCompute().compute_counts(10, 4, 40, 60, {"a" : 1}), 7)
+        self.assertEqual(OnlyCompute().compute_counts(10, 4, 40, 60, {"a" : 1, QualityMeasure.TRUE_POSITIVES : 100}), 7)
+
+    def test_quality_measures_compute_batch(self) -> None:
+        quality_measures = [Support(), Coverage(), WRAcc(), BinomialTest(), Sensitivity(), PPV(), WRAccOptimisticEstimate1(), BinomialTestOptimisticEstimate1(), \
+                            PiatetskyShapiro(), PiatetskyShapiroOptimisticEstimate1(), PiatetskyShapiroOptimisticEstimate2(), NPV(), AbsoluteWRAcc(), Specificity(), IRR(), F1Score(), Youden(), \
+                            WRAccOptimisticEstimate2(), BinomialTestOptimisticEstimate2()]
+        tp_array = array([10, 3, 0, 40, 7])
+        fp_array = array([5, 20, 7, 20, 0])
+        for quality_measure in quality_measures:
+            result = quality_measure.compute_batch(tp_array, fp_array, 40, 60)
+            self.assertIs(type(result), ndarray)
+            self.assertEqual(len(result), 5)
+            for index in range(5):
+                self.assertAlmostEqual(result[index], quality_measure.compute_counts(int(tp_array[index]), int(fp_array[index]), 40, 60))
+        result = Qg().compute_batch(tp_array, fp_array, 40, 60, {"g" : 1})
+        for index in range(5):
+            self.assertAlmostEqual(result[index], Qg().compute_counts(int(tp_array[index]), int(fp_array[index]), 40, 60, {"g" : 1}))
+        self.assertRaises(ParameterNotFoundError, Qg().compute_batch, tp_array, fp_array, 40, 60)
+        # The undefined values (0/0) are NaN.
+        self.assertTrue(isnan(PPV().compute_batch([0], [0], 40, 60)[0]))
+        self.assertTrue(isnan(WRAcc().compute_batch([0], [0], 40, 60)[0]))
+        self.assertTrue(isnan(NPV().compute_batch([40], [60], 40, 60)[0]))
+        # Default implementation of the method 'compute_batch' (a quality measure which does not override it).
+        class OnlyComputeCounts(QualityMeasure):
+            def compute(self, dict_of_parameters : dict) -> float:
+                return self.compute_counts(dict_of_parameters["tp"], dict_of_parameters["fp"], dict_of_parameters["TP"], dict_of_parameters["FP"])
+            def compute_counts(self, tp, fp, TP, FP, additional_parameters = None) -> float:
+                return tp / (tp + fp)
+            def get_name(self) -> str:
+                return "OnlyComputeCounts"
+            def optimistic_estimate_of(self) -> dict:
+                return dict()
+            def __call__(self, dict_of_parameters : dict) -> float:
+                return self.compute(dict_of_parameters)
+        result = OnlyComputeCounts().compute_batch([1, 0, 3], [1, 0, 0], 40, 60)
+        self.assertEqual(result[0], 0.5)
+        self.assertTrue(isnan(result[1]))
+        self.assertEqual(result[2], 1.0)
+
+    def test_quality_measures_bind(self) -> None:
+        quality_measures = [Support(), Coverage(), WRAcc(), BinomialTest(), Sensitivity(), PPV(), WRAccOptimisticEstimate1(), BinomialTestOptimisticEstimate1(), \
+                            PiatetskyShapiro(), PiatetskyShapiroOptimisticEstimate1(), PiatetskyShapiroOptimisticEstimate2(), NPV(), AbsoluteWRAcc(), Specificity(), IRR(), F1Score(), Youden(), \
+                            WRAccOptimisticEstimate2(), BinomialTestOptimisticEstimate2()]
+        for quality_measure in quality_measures:
+            bound_quality_measure = quality_measure.bind(40, 60)
+            for (tp, fp) in [(10, 5), (3, 20), (0, 7), (40, 20)]:
+                self.assertEqual(bound_quality_measure(tp, fp), quality_measure.compute_counts(tp, fp, 40, 60))
+            # The values which depend on TP and FP are not precomputed if TP + FP is 0.
+            self.assertTrue(callable(quality_measure.bind(0, 0)))
+        self.assertEqual(Qg().bind(40, 60, g = 2)(10, 5), Qg().compute_counts(10, 5, 40, 60, {"g" : 2}))
+        self.assertRaises(ParameterNotFoundError, Qg().bind, 40, 60)
+        # Default implementation of the method 'bind' (a quality measure which does not override it).
+        class OnlyCompute(QualityMeasure):
+            def compute(self, dict_of_parameters : dict) -> float:
+                return dict_of_parameters[QualityMeasure.TRUE_POSITIVES] / dict_of_parameters[QualityMeasure.TRUE_POPULATION] + dict_of_parameters.get("a", 0)
+            def get_name(self) -> str:
+                return "OnlyCompute"
+            def optimistic_estimate_of(self) -> dict:
+                return dict()
+            def __call__(self, dict_of_parameters : dict) -> float:
+                return self.compute(dict_of_parameters)
+        self.assertEqual(OnlyCompute().bind(40, 60)(10, 5), 0.25)
+        self.assertEqual(OnlyCompute().bind(40, 60, a = 1)(10, 5), 1.25)
+
+    def test_quality_measures_tp_only_optimistic_estimates(self) -> None:
+        pairs = [(Qg(), QgOptimisticEstimate1()), (IRR(), IRROptimisticEstimate1()), (F1Score(), F1ScoreOptimisticEstimate1()), \
+                 (Youden(), YoudenOptimisticEstimate1()), (PPV(), PPVOptimisticEstimate1()), (Sensitivity(), SensitivityOptimisticEstimate1())]
+        TP, FP = 40, 60
+        for (quality_measure, optimistic_estimate) in pairs:
+            # Singleton and registration.
+            self.assertIs(optimistic_estimate, type(optimistic_estimate)())
+            self.assertEqual(optimistic_estimate.get_name(), type(optimistic_estimate).__name__)
+            self.assertIs(optimistic_estimate.optimistic_estimate_of()[quality_measure.get_name()], quality_measure)
+            bound_optimistic_estimate = optimistic_estimate.bind(TP, FP, g = 0.5)
+            for (tp, fp) in [(10, 5), (3, 20), (0, 7), (40, 20), (40, 0)]:
+                dict_of_parameters = {"tp" : tp, "fp" : fp, "TP" : TP, "FP" : FP, "g" : 0.5}
+                value = optimistic_estimate(dict_of_parameters)
+                self.assertEqual(value, optimistic_estimate.compute_counts(tp, fp, TP, FP, dict_of_parameters))
+                self.assertEqual(value, bound_optimistic_estimate(tp, fp))
+                self.assertEqual(value, optimistic_estimate.compute_batch(array([tp]), array([fp]), TP, FP, {"g" : 0.5})[0])
+                # The optimistic estimate only depends on tp.
+                self.assertEqual(value, optimistic_estimate.compute_counts(tp, 0, TP, FP, dict_of_parameters))
+                # It is an upper bound of the quality of every refinement (tp' <= tp and fp' <= fp) ...
+                for refinement_tp in range(0, tp+1):
+                    for refinement_fp in range(0, fp+1):
+                        if refinement_tp + refinement_fp > 0:
+                            self.assertLessEqual(quality_measure.compute_counts(refinement_tp, refinement_fp, TP, FP, dict_of_parameters), value + 1e-12)
+                # ... and it is tight (i.e., the best possible refinement reaches it).
+                if tp > 0:
+                    self.assertAlmostEqual(quality_measure.compute_counts(tp, 0, TP, FP, dict_of_parameters), value)
+        self.assertEqual(QgOptimisticEstimate1()({"tp" : 10, "g" : 0.5}), 20)
+        self.assertEqual(IRROptimisticEstimate1()({"tp" : 0}), 0)
+        self.assertEqual(F1ScoreOptimisticEstimate1()({"tp" : 10, "TP" : 40}), 0.4)
+        self.assertRaises(TypeError, YoudenOptimisticEstimate1(), 3)
+        self.assertRaises(SubgroupParameterNotFoundError, SensitivityOptimisticEstimate1(), {"tp" : 10})
+        self.assertRaises(SubgroupParameterNotFoundError, PPVOptimisticEstimate1(), {"fp" : 10})
+        self.assertRaises(ParameterNotFoundError, QgOptimisticEstimate1(), {"tp" : 10})
+        self.assertRaises(ParameterNotFoundError, QgOptimisticEstimate1().bind, TP, FP)
+        self.assertRaises(ParameterNotFoundError, QgOptimisticEstimate1().compute_batch, array([1]), array([1]), TP, FP)
+
+    def test_quality_measures_optimistic_estimates_2(self) -> None:
+        pairs = [(WRAcc(), WRAccOptimisticEstimate1(), WRAccOptimisticEstimate2()), (BinomialTest(), BinomialTestOptimisticEstimate1(), BinomialTestOptimisticEstimate2())]
+        TP, FP = 40, 60
+        for (quality_measure, optimistic_estimate_1, optimistic_estimate_2) in pairs:
+            self.assertIs(optimistic_estimate_2.optimistic_estimate_of()[quality_measure.get_name()], quality_measure)
+            for (tp, fp) in [(10, 5), (3, 20), (0, 7), (40, 20), (1, 0)]:
+                value = optimistic_estimate_2({"tp" : tp, "fp" : fp, "TP" : TP, "FP" : FP})
+                # It is an upper bound of the quality of every refinement (tp' <= tp and fp' <= fp) ...
+                for refinement_tp in range(0, tp+1):
+                    for refinement_fp in range(0, fp+1):
+                        if refinement_tp + refinement_fp > 0:
+                            self.assertLessEqual(quality_measure.compute_counts(refinement_tp, refinement_fp, TP, FP), value + 1e-12)
+                # ... and it is reached by the best possible refinement.
+                if tp > 0:
+                    self.assertEqual(quality_measure.compute_counts(tp, 0, TP, FP), value)
+        # WRAccOptimisticEstimate2 is tighter than WRAccOptimisticEstimate1.
+        for (tp, fp) in [(10, 5), (3, 20), (40, 20), (1, 0)]:
+            self.assertLessEqual(WRAccOptimisticEstimate2().compute_counts(tp, fp, TP, FP), WRAccOptimisticEstimate1().compute_counts(tp, fp, TP, FP))
+        self.assertEqual(WRAccOptimisticEstimate2()({"tp" : 10, "fp" : 5, "TP" : TP, "FP" : FP}), (10/100)*(1-0.4))
+        # The optimistic estimates 2 do not need the subgroup parameter fp.
+        self.assertEqual(WRAccOptimisticEstimate2()({"tp" : 10, "TP" : TP, "FP" : FP}), (10/100)*(1-0.4))
+        self.assertEqual(BinomialTestOptimisticEstimate2()({"tp" : 10, "TP" : TP, "FP" : FP}), BinomialTest().compute_counts(10, 0, TP, FP))
+        self.assertRaises(SubgroupParameterNotFoundError, WRAccOptimisticEstimate2(), {"fp" : 5, "TP" : TP, "FP" : FP})
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+# Contributors:
+#    Antonio López Martínez-Carrasco <antoniolopezmc1995@gmail.com>
+
+"""Tests of the functionality contained in the file 'utils/discretization.py'.
+"""
+
+from subgroups.utils.discretization import equal_frequency_cut_points, entropy_cut_points, Discretizer
+from subgroups.algorithms.subgroup_sets.vlsd import VLSD
+from subgroups.quality_measures.wracc import WRAcc
+from subgroups.quality_measures.wracc_optimistic_estimate_1 import WRAccOptimisticEstimate1
+from pandas import DataFrame, CategoricalDtype
+from numpy import nan
+import unittest
+
+class TestDiscretization(unittest.TestCase):
+
+    def test_equal_frequency_cut_points(self) -> None:
+        self.assertRaises(TypeError, equal_frequency_cut_points, [1, 2, 3], 2.0)
+        self.assertRaises(ValueError, equal_frequency_cut_points, [1, 2, 3], 0)
+        self.assertEqual(equal_frequency_cut_points([1, 2, 3, 4, 5, 6, 7, 8], 4), [2.75, 4.5, 6.25])
+        self.assertEqual(equal_frequency_cut_points([1, 2, nan, 3, 4, nan], 2), [2.5])
+        self.assertEqual(equal_frequency_cut_points([5, 5, 5, 5], 3), [])
+        self.assertEqual(equal_frequency_cut_points([1, 2, 3], 1), [])
+        self.assertEqual(equal_frequency_cut_points([nan, nan], 3), [])
+
+    def test_entropy_cut_points(self) -> None:
+        self.assertRaises(ValueError, entropy_cut_points, [1, 2, 3], [True, False])
+        values = list(range(1, 21))
+        self.assertEqual(entropy_cut_points(values, [value > 10 for value in values]), [10.0])
+        self.assertEqual(entropy_cut_points(values + [nan], [value > 10 for value in values] + [True]), [10.0])
+        # Pure target and noise: no cut point is accepted.
+        self.assertEqual(entropy_cut_points(values, [True] * 20), [])
+        self.assertEqual(entropy_cut_points([1, 2, 3, 4], [True, False, True, False]), [])
+        # Three intervals.
+        values = list(range(1, 61))
+        self.assertEqual(entropy_cut_points(values, [20 < value <= 40 for value in values]), [20.0, 40.0])
+
+    def test_Discretizer(self) -> None:
+        self.assertRaises(ValueError, Discretizer, "equal_width")
+        self.assertRaises(TypeError, Discretizer, "equal_frequency", 2.0)
+        self.assertRaises(ValueError, Discretizer, "equal_frequency", 0)
+        df = DataFrame({"a" : [1, 2, 3, 4, 5, 6, 7, 8], "b" : [0.5, 0.5, 1.5, nan, 2.5, 2.5, 3.5, 3.5], "c" : ["x", "y", "x", "y", "x", "y", "x", "y"], "t" : ["n", "n", "n", "n", "p", "p", "p", "p"]}, index = [10, 11, 12, 13, 14, 15, 16, 17])
+        self.assertRaises(ValueError, Discretizer("entropy").fit, df)
+        discretizer = Discretizer("equal_frequency", 2)
+        result = discretizer.fit_transform(df, ("t", "p"))
+        self.assertEqual(discretizer.cut_points, {"a" : [4.5], "b" : [2.5]})
+        self.assertEqual(list(result.index), list(df.index))
+        self.assertIsInstance(result["a"].dtype, CategoricalDtype)
+        self.assertEqual(list(result["a"]), ["(-inf;4.5]"] * 4 + ["(4.5;+inf)"] * 4)
+        self.assertEqual(list(result["b"].astype(object).fillna("NaN")), ["(-inf;2.5]", "(-inf;2.5]", "(-inf;2.5]", "NaN", "(-inf;2.5]", "(-inf;2.5]", "(2.5;+inf)", "(2.5;+inf)"])
+        self.assertEqual(list(result["c"]), list(df["c"]))
+        self.assertEqual(list(result["t"]), list(df["t"]))
+        # The original DataFrame is not modified.
+        self.assertEqual(df["a"].dtype.kind, "i")
+        # Entropy-based discretization (the target attribute is not discretized).
+        discretizer = Discretizer("entropy")
+        df_entropy = DataFrame({"a" : list(range(1, 21)), "t" : ["n"] * 10 + ["p"] * 10})
+        result = discretizer.fit_transform(df_entropy, ("t", "p"))
+        self.assertEqual(discretizer.cut_points, {"a" : [10.0]})
+        self.assertEqual(list(result["a"].cat.categories), ["(-inf;10.0]", "(10.0;+inf)"])
+
+    def test_Discretizer_with_algorithms(self) -> None:
+        # The discretized DataFrame is directly supported by the algorithms and the result is the same as with str attributes.
+        df = DataFrame({"a" : [1, 2, 3, 4, 5, 6, 7, 8, 9, 10], "b" : [5, 3, 5, 1, 2, 4, 5, 1, 3, 2], "t" : ["n", "n", "p", "n", "p", "p", "n", "p", "p", "p"]})
+        discretized_df = Discretizer("equal_frequency", 3).fit_transform(df, ("t", "p"))
+        str_df = discretized_df.astype({"a" : str, "b" : str})
+        results = []
+        for data in [discretized_df, str_df]:
+            vlsd = VLSD(WRAcc(), -1, WRAccOptimisticEstimate1(), -1)
+            vlsd.fit(data, ("t", "p"))
+            results.append(vlsd.selected_subgroups)
+        self.assertEqual(results[0], results[1])
+        self.assertGreater(results[0], 0)
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+
+# Contributors:
+#    Antonio López Martínez-Carrasco <antoniolopezmc1995@gmail.com>
+
+"""Tests of the functionality contained in the file 'utils/subgroup_parser.py'.
+"""
+
+from subgroups.utils.subgroup_parser import SubgroupParser
+from subgroups.core.selector import Selector
+from subgroups.core.pattern import Pattern
+from subgroups.core.subgroup import Subgroup
+import unittest
+
+class TestSubgroupParser(unittest.TestCase):
+
+    def test_subgroup_parser_general(self):
+        subgroup_parser = SubgroupParser()
+        for selector_as_str in ["a = 'x'", "a = x", "age < 25", "age >= 25.5", "b != 'y z'"]:
+            self.assertEqual(subgroup_parser.parse_selector(selector_as_str), Selector.generate_from_str(selector_as_str))
+        for pattern_as_str in ["[]", "[a = 'x']", "[b = 'y', a = 'x', a = 'x']", "[age < 25, name = 'name1', name = name1, att2 >= 25]"]:
+            self.assertEqual(subgroup_parser.parse_pattern(pattern_as_str), Pattern.generate_from_str(pattern_as_str))
+        lines = ["Description: [a = 'x', b = 'y'], Target: t = 'p'\n", "Description: [], Target: t = 'p'\n", "Description: [b = 'y'], Target: t = 'n'"]
+        list_of_subgroups = list(subgroup_parser.parse_subgroups(lines))
+        self.assertEqual(len(list_of_subgroups), 3)
+        for subgroup, line in zip(list_of_subgroups, lines):
+            self.assertEqual(subgroup, Subgroup.generate_from_str(line.rstrip("\n")))
+        # The selector substrings are only parsed once.
+        number_of_parsed_selectors = len(subgroup_parser)
+        subgroup_parser.parse_subgroup("Description: [a = 'x', b = 'y'], Target: t = 'n'")
+        self.assertEqual(len(subgroup_parser), number_of_parsed_selectors)
+        self.assertRaises(TypeError, subgroup_parser.parse_pattern, 1)
+        self.assertRaises(TypeError, subgroup_parser.parse_subgroup, 1)
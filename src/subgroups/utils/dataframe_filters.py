@@ -20,7 +20,7 @@ def filter_by_list_of_selectors(pandas_dataframe : DataFrame, list_of_selectors
         raise TypeError("The type of the parameter 'pandas_dataframe' must be 'pandas.DataFrame'.")
     if type(list_of_selectors) is not list:
         raise TypeError("The type of the parameter 'list_of_selectors' must be 'list'.")
-    final_result = Series([True] * len(pandas_dataframe)) # The empty list of selectors is contained in all the rows of a pandas DataFrame.
+    final_result = Series(True, index = pandas_dataframe.index) # The empty list of selectors is contained in all the rows of a pandas DataFrame.
     # For each selector, we process the whole corresponding attribute (i.e., the complete Series).
     # If all the boolean values of 'final_result' are False, we can stop the process.
     current_index = 0
@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+
+# Contributors:
+#    Antonio López Martínez-Carrasco <antoniolopezmc1995@gmail.com>
+
+"""This file contains the implementation of the discretization of numeric attributes. The discretized attributes are represented by pandas categoricals (i.e., integer codes and a small list of interval labels), which are directly supported by the algorithms of this library (as nominal attributes) without materialising a str for each row.
+"""
+
+from pandas import DataFrame, Series, Categorical
+from pandas.api.types import is_numeric_dtype, is_bool_dtype
+from numpy import ndarray, asarray, isnan, argsort, unique, quantile, linspace, searchsorted, cumsum, flatnonzero, log2, where, min_scalar_type, float64, int64
+from subgroups.exceptions import DatasetAttributeTypeError
+
+# Python annotations.
+from typing import Union
+
+def equal_frequency_cut_points(values : ndarray, number_of_bins : int) -> list[float]:
+    """Function to compute the cut points which split the values in (approximately) equal-frequency intervals. The missing values (NaN) are ignored.
+
+    :param values: the numeric values.
+    :param number_of_bins: the (maximum) number of intervals. Repeated cut points are only returned once, so the number of intervals could be lower.
+    :return: the sorted list of cut points. Each interval is of the form (previous cut point, cut point].
+    """
+    if type(number_of_bins) is not int:
+        raise TypeError("The type of the parameter 'number_of_bins' must be 'int'.")
+    if number_of_bins <= 0:
+        raise ValueError("The parameter 'number_of_bins' is not greater than 0.")
+    values = asarray(values, dtype = float64)
+    values = values[~isnan(values)]
+    if (len(values) == 0) or (number_of_bins == 1):
+        return []
+    cut_points = unique(quantile(values, linspace(0, 1, number_of_bins + 1)[1:-1]))
+    # The last cut point must not be the maximum value (otherwise, the last interval would be empty).
+    return [float(cut_point) for cut_point in cut_points if cut_point < values.max()]
+
+def _entropy(positives : ndarray, totals : ndarray) -> ndarray:
+    # Private function to compute (vectorized) the entropy of binary class distributions.
+    p = positives / totals
+    q = 1.0 - p
+    p_log_p = where(p > 0, p * log2(where(p > 0, p, 1.0)), 0.0)
+    q_log_q = where(q > 0, q * log2(where(q > 0, q, 1.0)), 0.0)
+    return -(p_log_p + q_log_q)
+
+def _entropy_cut_points(sorted_values : ndarray, sorted_target : ndarray, result : list[float]) -> None:
+    # Private function to search recursively the cut points of the Fayyad and Irani's method in a (sorted) subset of values.
+    number_of_values = len(sorted_values)
+    if number_of_values < 2:
+        return
+    # Candidate boundaries: positions i such that sorted_values[i-1] < sorted_values[i] (the split is between both values).
+    boundaries = flatnonzero(sorted_values[1:] != sorted_values[:-1]) + 1
+    if len(boundaries) == 0:
+        return
+    cumulative_positives = cumsum(sorted_target, dtype = int64)
+    total_positives = int(cumulative_positives[-1])
+    if (total_positives == 0) or (total_positives == number_of_values): # Pure subset.
+        return
+    # Class information entropy of all the candidate splits at once.
+    left_totals = boundaries.astype(float64)
+    left_positives = cumulative_positives[boundaries - 1].astype(float64)
+    right_totals = number_of_values - left_totals
+    right_positives = total_positives - left_positives
+    left_entropies = _entropy(left_positives, left_totals)
+    right_entropies = _entropy(right_positives, right_totals)
+    split_entropies = (left_totals * left_entropies + right_totals * right_entropies) / number_of_values
+    best = int(split_entropies.argmin())
+    # MDL stopping criterion (binary class).
+    entropy = float(_entropy(asarray([total_positives], dtype = float64), asarray([number_of_values], dtype = float64))[0])
+    gain = entropy - float(split_entropies[best])
+    left_number_of_classes = 1 + int(0 < left_positives[best] < left_totals[best])
+    right_number_of_classes = 1 + int(0 < right_positives[best] < right_totals[best])
+    delta = log2(3 ** 2 - 2) - (2 * entropy - left_number_of_classes * float(left_entropies[best]) - right_number_of_classes * float(right_entropies[best]))
+    if gain <= (log2(number_of_values - 1) + delta) / number_of_values:
+        return
+    boundary = int(boundaries[best])
+    _entropy_cut_points(sorted_values[:boundary], sorted_target[:boundary], result)
+    result.append(float(sorted_values[boundary - 1]))
+    _entropy_cut_points(sorted_values[boundary:], sorted_target[boundary:], result)
+
+def entropy_cut_points(values : ndarray, target_mask : ndarray) -> list[float]:
+    """Function to compute the cut points of the supervised entropy-based discretization with the MDL stopping criterion (Fayyad and Irani, 1993). The missing values (NaN) are ignored.
+
+    :param values: the numeric values.
+    :param target_mask: a boolean array (with the same length as 'values') which indicates whether each row has the target value.
+    :return: the sorted list of cut points. Each interval is of the form (previous cut point, cut point].
+    """
+    values = asarray(values, dtype = float64)
+    target_mask = asarray(target_mask, dtype = bool)
+    if len(values) != len(target_mask):
+        raise ValueError("The parameters 'values' and 'target_mask' must have the same length.")
+    not_missing = ~isnan(values)
+    values = values[not_missing]
+    target_mask = target_mask[not_missing]
+    order = argsort(values, kind = "stable")
+    result = []
+    _entropy_cut_points(values[order], target_mask[order], result)
+    return result
+
+def _interval_labels(cut_points : list[float]) -> list[str]:
+    # Private function to generate the labels of the intervals defined by the cut points. IMPORTANT: the labels do not contain the substring ', ' (comma and whitespace), because it is the separator of the selectors in the str representation of a pattern.
+    bounds = ["-inf"] + [repr(cut_point) for cut_point in cut_points] + ["+inf"]
+    return ["(" + bounds[index] + ";" + bounds[index+1] + ("]" if index < len(cut_points) else ")") for index in range(len(bounds) - 1)]
+
+class Discretizer(object):
+    """This class represents a discretizer of the numeric attributes of a DataFrame. Each numeric attribute is transformed into a pandas categorical whose categories are interval labels (e.g., '(-inf;2.5]', '(2.5;7.0]' and '(7.0;+inf)'). The categoricals only store an integer code per row, and they are supported by all the algorithms of this library as nominal attributes. The non-numeric attributes and the target attribute are not transformed. The missing values (NaN) remain as missing values.
+
+    :param method: the discretization method: 'equal_frequency' (unsupervised) or 'entropy' (supervised, with the MDL stopping criterion; it requires the target).
+    :param number_of_bins: the (maximum) number of intervals of each attribute. It is only used with the method 'equal_frequency'.
+    """
+
+    __slots__ = ("_method", "_number_of_bins", "_cut_points")
+
+    METHOD_EQUAL_FREQUENCY = "equal_frequency"
+    METHOD_ENTROPY = "entropy"
+
+    def __init__(self, method : str = METHOD_EQUAL_FREQUENCY, number_of_bins : int = 5) -> None:
+        if (method != Discretizer.METHOD_EQUAL_FREQUENCY) and (method != Discretizer.METHOD_ENTROPY):
+            raise ValueError("The value of the parameter 'method' is not valid. See the documentation.")
+        if type(number_of_bins) is not int:
+            raise TypeError("The type of the parameter 'number_of_bins' must be 'int'.")
+        if number_of_bins <= 0:
+            raise ValueError("The parameter 'number_of_bins' is not greater than 0.")
+        self._method = method
+        self._number_of_bins = number_of_bins
+        # Dictionary attribute name -> list of cut points (it is filled in the 'fit' method).
+        self._cut_points = {}
+
+    def _get_method(self) -> str:
+        return self._method
+
+    def _get_number_of_bins(self) -> int:
+        return self._number_of_bins
+
+    def _get_cut_points(self) -> dict[str, list[float]]:
+        return self._cut_points
+
+    method = property(_get_method, None, None, "The discretization method.")
+    number_of_bins = property(_get_number_of_bins, None, None, "The (maximum) number of intervals of each attribute (only used with the method 'equal_frequency').")
+    cut_points = property(_get_cut_points, None, None, "The dictionary attribute name -> list of cut points computed in the 'fit' method.")
+
+    def fit(self, pandas_dataframe : DataFrame, target : Union[tuple[str, str], None] = None) -> 'Discretizer':
+        """Method to compute the cut points of each numeric attribute of the DataFrame.
+
+        :param pandas_dataframe: the DataFrame whose numeric attributes are discretized.
+        :param target: a tuple with 2 elements: the target attribute name and the target value. The target attribute is not discretized. It is mandatory with the method 'entropy'.
+        :return: the discretizer itself.
+        """
+        if type(pandas_dataframe) is not DataFrame:
+            raise TypeError("The type of the parameter 'pandas_dataframe' must be 'DataFrame'.")
+        if (target is not None) and (type(target) is not tuple):
+            raise TypeError("The type of the parameter 'target' must be 'tuple' or 'NoneType'.")
+        if (target is None) and (self._method == Discretizer.METHOD_ENTROPY):
+            raise ValueError("The parameter 'target' is mandatory with the method 'entropy'.")
+        target_mask = None
+        if target is not None:
+            target_mask = (pandas_dataframe[target[0]] == target[1]).to_numpy(dtype = bool)
+        self._cut_points = {}
+        for column in pandas_dataframe.columns:
+            if ((target is not None) and (column == target[0])) or (not is_numeric_dtype(pandas_dataframe[column])) or is_bool_dtype(pandas_dataframe[column]):
+                continue
+            values = pandas_dataframe[column].to_numpy(dtype = float64, na_value = float("nan"))
+            if self._method == Discretizer.METHOD_EQUAL_FREQUENCY:
+                self._cut_points[column] = equal_frequency_cut_points(values, self._number_of_bins)
+            else:
+                self._cut_points[column] = entropy_cut_points(values, target_mask)
+        return self
+
+    def transform(self, pandas_dataframe : DataFrame) -> DataFrame:
+        """Method to discretize the numeric attributes of the DataFrame using the cut points computed in the 'fit' method. The DataFrame passed by parameter is not modified.
+
+        :param pandas_dataframe: the DataFrame whose numeric attributes are discretized. It must contain all the attributes used in the 'fit' method.
+        :return: a new DataFrame in which the discretized attributes are pandas categoricals.
+        """
+        if type(pandas_dataframe) is not DataFrame:
+            raise TypeError("The type of the parameter 'pandas_dataframe' must be 'DataFrame'.")
+        columns = {}
+        for column in pandas_dataframe.columns:
+            if column not in self._cut_points:
+                columns[column] = pandas_dataframe[column]
+                continue
+            if (not is_numeric_dtype(pandas_dataframe[column])) or is_bool_dtype(pandas_dataframe[column]):
+                raise DatasetAttributeTypeError("The attribute '" + str(column) + "' is not numeric.")
+            cut_points = self._cut_points[column]
+            values = pandas_dataframe[column].to_numpy(dtype = float64, na_value = float("nan"))
+            # The code of a value is the number of cut points lower than it (i.e., the index of its interval). The missing values have the code -1.
+            codes = searchsorted(asarray(cut_points, dtype = float64), values, side = "left")
+            codes[isnan(values)] = -1
+            codes = codes.astype(min_scalar_type(-(len(cut_points) + 1)))
+            # The unused intervals are removed (the algorithms assume that each value of an attribute appears in the DataFrame).
+            categorical = Categorical.from_codes(codes, categories = _interval_labels(cut_points)).remove_unused_categories()
+            columns[column] = Series(categorical, index = pandas_dataframe.index, name = column)
+        return DataFrame(columns, index = pandas_dataframe.index)
+
+    def fit_transform(self, pandas_dataframe : DataFrame, target : Union[tuple[str, str], None] = None) -> DataFrame:
+        """Method to compute the cut points of each numeric attribute of the DataFrame and to discretize them.
+
+        :param pandas_dataframe: the DataFrame whose numeric attributes are discretized.
+        :param target: a tuple with 2 elements: the target attribute name and the target value. The target attribute is not discretized. It is mandatory with the method 'entropy'.
+        :return: a new DataFrame in which the discretized attributes are pandas categoricals.
+        """
+        return self.fit(pandas_dataframe, target).transform(pandas_dataframe)
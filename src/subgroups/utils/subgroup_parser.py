@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+# Contributors:
+#    Antonio López Martínez-Carrasco <antoniolopezmc1995@gmail.com>
+
+"""This file contains the implementation of a parser used to generate a large number of selectors, patterns and subgroups from their string representations.
+"""
+
+from subgroups.core.selector import Selector
+from subgroups.core.pattern import Pattern
+from subgroups.core.subgroup import Subgroup
+
+# Python annotations.
+from collections.abc import Iterable, Iterator
+
+class SubgroupParser(object):
+    """This class represents a parser which generates selectors, patterns and subgroups from their string representations. The result is the same as the one obtained with the methods 'generate_from_str' of the classes 'Selector', 'Pattern' and 'Subgroup', but each different selector substring is only parsed once (the parser stores the selector generated from each substring). For this reason, the same parser should be used to parse all the lines of a file.
+    """
+
+    __slots__ = ("_dict_of_selectors")
+
+    def __init__(self) -> None:
+        # Dictionary selector substring -> selector generated from it.
+        self._dict_of_selectors = {}
+
+    def parse_selector(self, input_str : str) -> Selector:
+        """Method to generate a Selector from a str. We assume the format defined in the method 'generate_from_str' of the class 'Selector'.
+
+        :param input_str: the str from which to generate the Selector.
+        :return: the Selector generated from the str.
+        """
+        selector = self._dict_of_selectors.get(input_str)
+        if selector is None:
+            selector = Selector.generate_from_str(input_str)
+            self._dict_of_selectors[input_str] = selector
+        return selector
+
+    def parse_pattern(self, input_str : str) -> Pattern:
+        """Method to generate a Pattern from a str. We assume the format defined in the method 'generate_from_str' of the class 'Pattern'.
+
+        :param input_str: the str from which to generate the Pattern.
+        :return: the Pattern generated from the str.
+        """
+        if type(input_str) is not str:
+            raise TypeError("The type of the parameter 'input_str' must be 'str'.")
+        if (input_str == "[]"):
+            return Pattern([])
+        # Delete the initial '[' and the final ']', and split using the separator ', ' (comma and whitespace).
+        return Pattern(list(map(self.parse_selector, input_str[1:-1].split(", "))))
+
+    def parse_subgroup(self, input_str : str) -> Subgroup:
+        """Method to generate a Subgroup from a str. We assume the format defined in the method 'generate_from_str' of the class 'Subgroup'.
+
+        :param input_str: the str from which to generate the Subgroup.
+        :return: the Subgroup generated from the str.
+        """
+        if type(input_str) is not str:
+            raise TypeError("The type of the parameter 'input_str' must be 'str'.")
+        description_str, _, target_str = input_str.partition(", Target: ")
+        return Subgroup(self.parse_pattern(description_str[13:]), self.parse_selector(target_str)) # [13:] -> Delete the initial string "Description: ".
+
+    def parse_subgroups(self, iterable_of_str : Iterable[str]) -> Iterator[Subgroup]:
+        """Method to generate the subgroups from an iterable of strs (for example, the lines of a file). The subgroups are generated lazily (i.e., one by one).
+
+        :param iterable_of_str: the iterable of strs from which to generate the subgroups. A final line break in each str is ignored.
+        :return: an iterator over the generated subgroups.
+        """
+        for input_str in iterable_of_str:
+            yield self.parse_subgroup(input_str.rstrip("\n"))
+
+    def __len__(self) -> int:
+        return len(self._dict_of_selectors)